@@ -8,7 +8,11 @@ from __future__ import annotations
 from flask import Flask
 
 from app.api import api_bp, init_websockets
+from app.cli import prices_cli
+from app.services.data_providers import set_provider
+from app.services.trading_scheduler import TradingScheduler
 from app.utils.auth import load_user_from_request
+from app.utils.constants import SchedulerConstants
 
 
 def create_app(config: object | None = None) -> Flask:
@@ -40,7 +44,29 @@ def create_app(config: object | None = None) -> Flask:
     # Initialize websockets
     init_websockets(app)
 
+    # Register the price archive commands, e.g. "flask --app app prices export"
+    app.cli.add_command(prices_cli)
+
     # Register before_request handler to load the current user
     app.before_request(load_user_from_request)
 
+    # Select the market data provider, e.g. "replay" to run offline
+    if app.config.get("DATA_PROVIDER"):
+        set_provider(
+            app.config["DATA_PROVIDER"],
+            **app.config.get("DATA_PROVIDER_OPTIONS", {}),
+        )
+
+    # Start the in-process trading scheduler if enabled
+    if app.config.get("TRADING_SCHEDULER_ENABLED", False):
+        scheduler: TradingScheduler = TradingScheduler(
+            app,
+            interval=app.config.get(
+                "TRADING_SCHEDULER_INTERVAL",
+                SchedulerConstants.DEFAULT_TICK_INTERVAL,
+            ),
+        )
+        scheduler.start()
+        app.trading_scheduler = scheduler  # Store reference in app for easy access
+
     return app
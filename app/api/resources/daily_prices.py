@@ -16,20 +16,29 @@ from flask_restx import Model, Namespace, OrderedModel, Resource, fields
 from app.models.stock_daily_price import StockDailyPrice
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from app.models import Stock, StockDailyPrice
 
 from app.api.schemas.daily_price import (
     daily_price_bulk_schema,
     daily_price_delete_schema,
     daily_price_input_schema,
+    daily_price_rows,
     daily_price_schema,
     daily_prices_schema,
 )
 from app.services.daily_price_service import DailyPriceService
+from app.services.price_archive_service import PriceArchiveService
 from app.services.session_manager import SessionManager
 from app.services.stock_service import StockService
+from app.utils.archive_utils import (
+    read_archive,
+    stream_archive,
+    validate_archive_format,
+)
 from app.utils.auth import admin_required
-from app.utils.constants import ApiConstants, PaginationConstants
+from app.utils.constants import ApiConstants, ExportConstants, PaginationConstants
 from app.utils.current_datetime import get_current_date
 from app.utils.errors import (
     BusinessLogicError,
@@ -37,6 +46,11 @@ from app.utils.errors import (
     StockPriceError,
     ValidationError,
 )
+from app.utils.export_utils import (
+    export_response,
+    stream_export,
+    validate_export_format,
+)
 
 # Create namespace
 api = Namespace("daily-prices", description="Daily stock price operations")
@@ -125,6 +139,9 @@ pagination_model: Model | OrderedModel = api.model(
         "total_pages": fields.Integer(description="Total number of pages"),
         "has_next": fields.Boolean(description="Whether there is a next page"),
         "has_prev": fields.Boolean(description="Whether there is a previous page"),
+        "next_cursor": fields.String(
+            description="Cursor of the next page when paging by cursor",
+        ),
     },
 )
 
@@ -193,6 +210,12 @@ class DailyPriceList(Resource):
         type=int,
         default=PaginationConstants.DEFAULT_PER_PAGE,
     )
+    @api.param(
+        "cursor",
+        "Page by date from the next_cursor of the previous page, empty for the "
+        "first page (replaces page and the total counts)",
+        type=str,
+    )
     def get(self) -> any:
         """Get a list of daily price records with optional filtering."""
         try:
@@ -210,6 +233,7 @@ class DailyPriceList(Resource):
                 default=PaginationConstants.DEFAULT_PER_PAGE,
                 type=int,
             )
+            cursor: str | None = request.args.get("cursor")
 
             # Convert date strings to date objects
             start_date: date | None = None
@@ -226,7 +250,7 @@ class DailyPriceList(Resource):
                 }, ApiConstants.HTTP_BAD_REQUEST
 
             # Use the service to get filtered and paginated data
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Get paginated and filtered prices
                 paginated_result: dict[str, any] = (
                     DailyPriceService.get_filtered_daily_prices(
@@ -240,17 +264,14 @@ class DailyPriceList(Resource):
                         else None,
                         page=page,
                         per_page=per_page,
+                        cursor=cursor,
+                        serializer=daily_price_rows,
                     )
                 )
 
-                # Serialize data
-                prices_data: list[dict[str, any]] = daily_prices_schema.dump(
-                    paginated_result["items"],
-                )
-
                 # Format the response with consistent structure
                 result: dict[str, any] = {
-                    "items": prices_data,
+                    "items": paginated_result["items"],
                     "pagination": paginated_result["pagination"],
                 }
 
@@ -711,7 +732,7 @@ class PriceAnalysis(Resource):
     def get(self, stock_id: int) -> any:
         """Get comprehensive price analysis for a stock."""
         try:
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Verify stock exists
                 stock: Stock = StockService.get_or_404(session, stock_id)
 
@@ -732,3 +753,189 @@ class PriceAnalysis(Resource):
                 "error": True,
                 "message": f"An unexpected error occurred: {e!s}",
             }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
+@api.route("/stock/<int:stock_id>/export")
+@api.param("stock_id", "Stock ID")
+class DailyPriceExport(Resource):
+    """API resource for streaming the daily price history of a stock."""
+
+    @api.doc("export_daily_prices")
+    @api.param(
+        "format",
+        "Export format (ndjson or csv)",
+        type=str,
+        default=ExportConstants.DEFAULT_FORMAT,
+    )
+    @api.param("start_date", "Start date (YYYY-MM-DD)", type=str)
+    @api.param("end_date", "End date (YYYY-MM-DD)", type=str)
+    @api.response(200, "Streamed price history")
+    @api.response(400, "Bad Request")
+    @api.response(404, "Stock Not Found")
+    def get(self, stock_id: int) -> any:
+        """Stream the full daily price history of a stock as NDJSON or CSV."""
+        try:
+            export_format: str = validate_export_format(request.args.get("format"))
+
+            # Parse dates
+            start_date_str: str | None = request.args.get("start_date")
+            end_date_str: str | None = request.args.get("end_date")
+            try:
+                start_date: date | None = (
+                    date.fromisoformat(start_date_str) if start_date_str else None
+                )
+                end_date: date | None = (
+                    date.fromisoformat(end_date_str) if end_date_str else None
+                )
+            except ValueError:
+                return {
+                    "error": True,
+                    "message": StockPriceError.INVALID_DATE_FORMAT,
+                }, ApiConstants.HTTP_BAD_REQUEST
+
+            # Verify stock exists before the response starts streaming
+            with SessionManager(read_only=True) as session:
+                symbol: str = StockService.get_or_404(session, stock_id).symbol
+
+        except ResourceNotFoundError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except ValidationError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+
+        def generate() -> Iterator[str]:
+            # The session stays open while the response is streamed
+            with SessionManager(read_only=True) as session:
+                yield from stream_export(
+                    DailyPriceService.stream_daily_price_partitions(
+                        session,
+                        stock_id,
+                        start_date,
+                        end_date,
+                    ),
+                    DailyPriceService.EXPORT_COLUMNS,
+                    export_format,
+                )
+
+        return export_response(generate(), export_format, f"{symbol}_daily")
+
+
+@api.route("/archive")
+class DailyPriceArchive(Resource):
+    """API resource for bulk transfer of daily prices as columnar archives."""
+
+    @api.doc("export_daily_price_archive")
+    @api.param("symbols", "Comma-separated stock symbols", type=str, required=True)
+    @api.param(
+        "format",
+        "Archive format (parquet or arrow)",
+        type=str,
+        default=ExportConstants.ARCHIVE_DEFAULT_FORMAT,
+    )
+    @api.param("start_date", "Start date (YYYY-MM-DD)", type=str)
+    @api.param("end_date", "End date (YYYY-MM-DD)", type=str)
+    @api.response(200, "Streamed price archive")
+    @api.response(400, "Bad Request")
+    @api.response(404, "Stock Not Found")
+    def get(self) -> any:
+        """Stream the daily prices of several stocks as Parquet or Arrow IPC."""
+        try:
+            export_format: str = validate_archive_format(request.args.get("format"))
+
+            # Parse dates
+            start_date_str: str | None = request.args.get("start_date")
+            end_date_str: str | None = request.args.get("end_date")
+            try:
+                start_date: date | None = (
+                    date.fromisoformat(start_date_str) if start_date_str else None
+                )
+                end_date: date | None = (
+                    date.fromisoformat(end_date_str) if end_date_str else None
+                )
+            except ValueError:
+                return {
+                    "error": True,
+                    "message": StockPriceError.INVALID_DATE_FORMAT,
+                }, ApiConstants.HTTP_BAD_REQUEST
+
+            # Verify the stocks exist before the response starts streaming
+            with SessionManager(read_only=True) as session:
+                stocks: dict[str, int] = PriceArchiveService.resolve_stocks(
+                    session,
+                    request.args.get("symbols", "").split(","),
+                )
+
+        except ResourceNotFoundError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except ValidationError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+
+        def generate() -> Iterator[bytes]:
+            # The session stays open while the response is streamed
+            with SessionManager(read_only=True) as session:
+                yield from stream_archive(
+                    PriceArchiveService.stream_price_partitions(
+                        session,
+                        "daily",
+                        list(stocks.values()),
+                        start_date,
+                        end_date,
+                    ),
+                    PriceArchiveService.archive_columns("daily"),
+                    export_format,
+                )
+
+        return export_response(generate(), export_format, "daily_prices")
+
+    @api.doc("import_daily_price_archive")
+    @api.param(
+        "format",
+        "Archive format (parquet or arrow)",
+        type=str,
+        default=ExportConstants.ARCHIVE_DEFAULT_FORMAT,
+    )
+    @api.param(
+        "update_existing",
+        "Overwrite existing records instead of skipping them",
+        type=bool,
+        default=False,
+    )
+    @api.response(200, "Success")
+    @api.response(400, "Bad Request")
+    @api.response(404, "Stock Not Found")
+    @jwt_required()
+    @admin_required
+    def post(self) -> any:
+        """Import daily prices from a Parquet or Arrow IPC archive in the body."""
+        try:
+            export_format: str = validate_archive_format(request.args.get("format"))
+            update_existing: bool = (
+                request.args.get("update_existing", "false").lower() == "true"
+            )
+
+            with SessionManager() as session:
+                counts: dict[str, int] = PriceArchiveService.import_price_batches(
+                    session,
+                    "daily",
+                    read_archive(request.get_data(), export_format),
+                    update_existing=update_existing,
+                )
+
+            return {
+                "success": True,
+                "message": f"Imported {sum(counts.values())} daily price records",
+                "count": sum(counts.values()),
+                "counts": counts,
+            }, ApiConstants.HTTP_OK
+
+        except ResourceNotFoundError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except ValidationError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except BusinessLogicError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except Exception as e:
+            current_app.logger.exception("Error importing daily price archive")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
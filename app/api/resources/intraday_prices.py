@@ -7,28 +7,44 @@ including retrieving, creating, updating, and deleting intraday price records.
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from flask import current_app, request
 from flask_jwt_extended import jwt_required
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 from app.api.schemas.intraday_price import (
     intraday_price_delete_schema,
     intraday_price_input_schema,
+    intraday_price_rows,
     intraday_price_schema,
     intraday_prices_schema,
 )
 from app.models import IntradayInterval, Stock, StockIntradayPrice
 from app.services.intraday_price_service import IntradayPriceService
+from app.services.price_archive_service import PriceArchiveService
 from app.services.session_manager import SessionManager
 from app.services.stock_service import StockService
+from app.utils.archive_utils import (
+    read_archive,
+    stream_archive,
+    validate_archive_format,
+)
 from app.utils.auth import admin_required
-from app.utils.constants import ApiConstants, PaginationConstants
+from app.utils.constants import ApiConstants, ExportConstants, PaginationConstants
 from app.utils.errors import (
     BusinessLogicError,
     ResourceNotFoundError,
     ValidationError,
 )
+from app.utils.export_utils import (
+    export_response,
+    stream_export,
+    validate_export_format,
+)
 
 # Create namespace
 api = Namespace("intraday-prices", description="Intraday stock price operations")
@@ -159,6 +175,12 @@ class IntradayPriceList(Resource):
         type=int,
         default=PaginationConstants.DEFAULT_PER_PAGE,
     )
+    @api.param(
+        "cursor",
+        "Page by timestamp from the next_cursor of the previous page, empty for "
+        "the first page (replaces page and the total counts)",
+        type=str,
+    )
     def get(self) -> any:
         """Get a list of intraday price records with optional filtering."""
         try:
@@ -179,6 +201,7 @@ class IntradayPriceList(Resource):
                 default=PaginationConstants.DEFAULT_PER_PAGE,
                 type=int,
             )
+            cursor: str | None = request.args.get("cursor")
 
             # Parse datetime arguments
             start_time = None
@@ -208,7 +231,7 @@ class IntradayPriceList(Resource):
                     }, ApiConstants.HTTP_BAD_REQUEST
 
             # Build query and apply filters
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Create filter options dictionary
                 filter_options: dict[str, any] = {
                     "stock_id": stock_id,
@@ -224,18 +247,21 @@ class IntradayPriceList(Resource):
                         filter_options=filter_options,
                         page=page,
                         per_page=per_page,
+                        cursor=cursor,
+                        serializer=intraday_price_rows,
                     )
                 )
 
-                # Serialize data
-                prices_data: list[dict[str, any]] = intraday_prices_schema.dump(
-                    paginated_result["items"],
-                    many=True,
-                )
-
                 result: dict[str, any] = {
-                    "items": prices_data,
+                    "items": paginated_result["items"],
                     "pagination": {
+                        "per_page": paginated_result["per_page"],
+                        "next_cursor": paginated_result["next_cursor"],
+                        "has_next": paginated_result["has_next"],
+                        "has_prev": paginated_result["has_prev"],
+                    }
+                    if cursor is not None
+                    else {
                         "page": paginated_result["page"],
                         "per_page": paginated_result["per_page"],
                         "total_items": paginated_result["total"],
@@ -700,3 +726,205 @@ class UpdateLatestIntradayPrice(Resource):
                 "error": True,
                 "message": f"An unexpected error occurred: {e!s}",
             }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
+@api.route("/stock/<int:stock_id>/export")
+@api.param("stock_id", "Stock ID")
+class IntradayPriceExport(Resource):
+    """API resource for streaming the intraday price history of a stock."""
+
+    @api.doc("export_intraday_prices")
+    @api.param(
+        "format",
+        "Export format (ndjson or csv)",
+        type=str,
+        default=ExportConstants.DEFAULT_FORMAT,
+    )
+    @api.param(
+        "interval",
+        "Time interval in minutes (1, 5, 15, 30, 60), all intervals if omitted",
+        type=int,
+    )
+    @api.param("start_time", "Start time (YYYY-MM-DD HH:MM:SS)", type=str)
+    @api.param("end_time", "End time (YYYY-MM-DD HH:MM:SS)", type=str)
+    @api.response(200, "Streamed price history")
+    @api.response(400, "Bad Request")
+    @api.response(404, "Stock not found")
+    def get(self, stock_id: int) -> any:
+        """Stream the full intraday price history of a stock as NDJSON or CSV."""
+        try:
+            export_format: str = validate_export_format(request.args.get("format"))
+            interval: int | None = request.args.get("interval", type=int)
+
+            # Parse time parameters
+            start_time_str: str | None = request.args.get("start_time")
+            end_time_str: str | None = request.args.get("end_time")
+            try:
+                start_time: datetime | None = (
+                    datetime.fromisoformat(start_time_str) if start_time_str else None
+                )
+                end_time: datetime | None = (
+                    datetime.fromisoformat(end_time_str) if end_time_str else None
+                )
+            except ValueError:
+                return {
+                    "error": True,
+                    "message": "Invalid time format. Expected ISO format "
+                    "(YYYY-MM-DD HH:MM:SS).",
+                }, ApiConstants.HTTP_BAD_REQUEST
+
+            # Verify stock exists before the response starts streaming
+            with SessionManager(read_only=True) as session:
+                symbol: str = StockService.get_or_404(session, stock_id).symbol
+
+        except ResourceNotFoundError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except ValidationError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+
+        def generate() -> Iterator[str]:
+            # The session stays open while the response is streamed
+            with SessionManager(read_only=True) as session:
+                yield from stream_export(
+                    IntradayPriceService.stream_intraday_price_partitions(
+                        session,
+                        stock_id,
+                        interval,
+                        start_time,
+                        end_time,
+                    ),
+                    IntradayPriceService.EXPORT_COLUMNS,
+                    export_format,
+                )
+
+        return export_response(generate(), export_format, f"{symbol}_intraday")
+
+
+@api.route("/archive")
+class IntradayPriceArchive(Resource):
+    """API resource for bulk transfer of intraday prices as columnar archives."""
+
+    @api.doc("export_intraday_price_archive")
+    @api.param("symbols", "Comma-separated stock symbols", type=str, required=True)
+    @api.param(
+        "format",
+        "Archive format (parquet or arrow)",
+        type=str,
+        default=ExportConstants.ARCHIVE_DEFAULT_FORMAT,
+    )
+    @api.param(
+        "interval",
+        "Time interval in minutes (1, 5, 15, 30, 60), all intervals if omitted",
+        type=int,
+    )
+    @api.param("start_time", "Start time (YYYY-MM-DD HH:MM:SS)", type=str)
+    @api.param("end_time", "End time (YYYY-MM-DD HH:MM:SS)", type=str)
+    @api.response(200, "Streamed price archive")
+    @api.response(400, "Bad Request")
+    @api.response(404, "Stock not found")
+    def get(self) -> any:
+        """Stream the intraday prices of several stocks as Parquet or Arrow IPC."""
+        try:
+            export_format: str = validate_archive_format(request.args.get("format"))
+            interval: int | None = request.args.get("interval", type=int)
+
+            # Parse time parameters
+            start_time_str: str | None = request.args.get("start_time")
+            end_time_str: str | None = request.args.get("end_time")
+            try:
+                start_time: datetime | None = (
+                    datetime.fromisoformat(start_time_str) if start_time_str else None
+                )
+                end_time: datetime | None = (
+                    datetime.fromisoformat(end_time_str) if end_time_str else None
+                )
+            except ValueError:
+                return {
+                    "error": True,
+                    "message": "Invalid time format. Expected ISO format "
+                    "(YYYY-MM-DD HH:MM:SS).",
+                }, ApiConstants.HTTP_BAD_REQUEST
+
+            # Verify the stocks exist before the response starts streaming
+            with SessionManager(read_only=True) as session:
+                stocks: dict[str, int] = PriceArchiveService.resolve_stocks(
+                    session,
+                    request.args.get("symbols", "").split(","),
+                )
+
+        except ResourceNotFoundError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except ValidationError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+
+        def generate() -> Iterator[bytes]:
+            # The session stays open while the response is streamed
+            with SessionManager(read_only=True) as session:
+                yield from stream_archive(
+                    PriceArchiveService.stream_price_partitions(
+                        session,
+                        "intraday",
+                        list(stocks.values()),
+                        start_time,
+                        end_time,
+                        interval,
+                    ),
+                    PriceArchiveService.archive_columns("intraday"),
+                    export_format,
+                )
+
+        return export_response(generate(), export_format, "intraday_prices")
+
+    @api.doc("import_intraday_price_archive")
+    @api.param(
+        "format",
+        "Archive format (parquet or arrow)",
+        type=str,
+        default=ExportConstants.ARCHIVE_DEFAULT_FORMAT,
+    )
+    @api.param(
+        "update_existing",
+        "Overwrite existing records instead of skipping them",
+        type=bool,
+        default=False,
+    )
+    @api.response(200, "Success")
+    @api.response(400, "Bad Request")
+    @api.response(404, "Stock not found")
+    @jwt_required()
+    @admin_required
+    def post(self) -> any:
+        """Import intraday prices from a Parquet or Arrow IPC archive in the body."""
+        try:
+            export_format: str = validate_archive_format(request.args.get("format"))
+            update_existing: bool = (
+                request.args.get("update_existing", "false").lower() == "true"
+            )
+
+            with SessionManager() as session:
+                counts: dict[str, int] = PriceArchiveService.import_price_batches(
+                    session,
+                    "intraday",
+                    read_archive(request.get_data(), export_format),
+                    update_existing=update_existing,
+                )
+
+            return {
+                "success": True,
+                "message": f"Imported {sum(counts.values())} intraday price records",
+                "count": sum(counts.values()),
+                "counts": counts,
+            }, ApiConstants.HTTP_OK
+
+        except ResourceNotFoundError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except ValidationError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except BusinessLogicError as e:
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except Exception as e:
+            current_app.logger.exception("Error importing intraday price archive")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
@@ -14,7 +14,7 @@ from flask_restx import Model, Namespace, OrderedModel, Resource, fields
 if TYPE_CHECKING:
     from app.models import Stock
 
-from app.api.schemas.stock import stock_input_schema, stock_schema, stocks_schema
+from app.api.schemas.stock import stock_input_schema, stock_rows, stock_schema
 from app.services.session_manager import SessionManager
 from app.services.stock_service import StockService
 from app.utils.auth import admin_required
@@ -141,18 +141,16 @@ class StockList(Resource):
                 type=int,
             )
 
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Get filtered and paginated stocks using the StockService
                 result: dict[str, any] = StockService.get_filtered_stocks(
                     session=session,
                     filters=request.args,
                     page=page,
                     per_page=per_page,
+                    serializer=stock_rows,
                 )
 
-                # Serialize the results
-                result["items"] = stocks_schema.dump(result["items"])
-
                 return result, ApiConstants.HTTP_OK
 
         except ValidationError as e:
@@ -354,9 +352,13 @@ class StockSearch(Resource):
                 50,
             )  # Cap at 50 results
 
-            with SessionManager() as session:
-                stocks: list[Stock] = StockService.search_stocks(session, query, limit)
-                results: list[dict[str, any]] = stocks_schema.dump(stocks)
+            with SessionManager(read_only=True) as session:
+                results: list[dict[str, any]] = StockService.search_stocks(
+                    session,
+                    query,
+                    limit,
+                    serializer=stock_rows,
+                )
 
                 return {"results": results, "count": len(results)}, ApiConstants.HTTP_OK
         except Exception as e:
@@ -7,10 +7,14 @@ WebSocket documentation.
 
 from __future__ import annotations
 
-from flask import request
+from flask import current_app, request
+from flask_jwt_extended import jwt_required
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields
 
 from app.services.system_service import SystemService
+from app.utils.auth import admin_required
+from app.utils.constants import ApiConstants
+from app.utils.errors import ValidationError
 
 # Create namespace
 api: Namespace = Namespace("system", description="System information and operations")
@@ -34,6 +38,30 @@ info_model: Model | OrderedModel = api.model(
     },
 )
 
+price_refresh_input_model: Model | OrderedModel = api.model(
+    "PriceRefreshInput",
+    {
+        "stock_ids": fields.List(
+            fields.Integer,
+            description="Stock IDs to refresh; all active stocks if omitted",
+        ),
+    },
+)
+
+price_refresh_model: Model | OrderedModel = api.model(
+    "PriceRefresh",
+    {
+        "stocks": fields.Integer(description="Number of stocks refreshed"),
+        "batches": fields.Integer(description="Number of multi-ticker batches"),
+        "failed": fields.Integer(description="Number of stocks with failures"),
+        "retries": fields.Integer(description="Number of retried fetches"),
+        "throttled_seconds": fields.Float(
+            description="Seconds fetches waited on the rate limiter",
+        ),
+        "seconds": fields.Float(description="Duration of the refresh"),
+    },
+)
+
 websocket_test_model: Model | OrderedModel = api.model(
     "WebSocketTest",
     {
@@ -107,6 +135,59 @@ class Info(Resource):
         return SystemService.get_system_info()
 
 
+@api.route("/scheduler")
+class Scheduler(Resource):
+    """Resource for trading scheduler statistics."""
+
+    @api.doc("get_scheduler_stats")
+    def get(self) -> dict[str, any]:
+        """Get trading scheduler counters and the tick latency histogram."""
+        return SystemService.get_scheduler_stats()
+
+
+@api.route("/price-cache")
+class PriceCacheStats(Resource):
+    """Resource for price cache statistics."""
+
+    @api.doc("get_price_cache_stats")
+    def get(self) -> dict[str, any]:
+        """Get size and hit statistics of the price cache."""
+        return SystemService.get_price_cache_stats()
+
+
+@api.route("/price-refresh")
+class PriceRefresh(Resource):
+    """Resource for refreshing the prices of many stocks."""
+
+    @api.doc("refresh_prices")
+    @api.expect(price_refresh_input_model)
+    @api.response(ApiConstants.HTTP_OK, "Prices refreshed", price_refresh_model)
+    @api.response(ApiConstants.HTTP_BAD_REQUEST, "Invalid input")
+    @api.response(ApiConstants.HTTP_UNAUTHORIZED, "Unauthorized")
+    @api.response(ApiConstants.HTTP_FORBIDDEN, "Admin privileges required")
+    @jwt_required()
+    @admin_required
+    def post(self) -> tuple[dict[str, any], int]:
+        """Refresh daily and intraday prices concurrently. Requires admin."""
+        stock_ids: list[int] | None = (request.json or {}).get("stock_ids")
+        try:
+            if stock_ids is not None and not all(
+                isinstance(stock_id, int) for stock_id in stock_ids
+            ):
+                msg = "stock_ids must be a list of integers"
+                raise ValidationError(msg)
+            return SystemService.refresh_prices(stock_ids), ApiConstants.HTTP_OK
+        except ValidationError as e:
+            current_app.logger.exception("Validation error refreshing prices")
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except Exception as e:
+            current_app.logger.exception("Error refreshing prices")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
 @api.route("/websocket-test")
 class WebSocketTest(Resource):
     """Resource for testing WebSocket functionality."""
@@ -169,6 +250,16 @@ class WebSocketDocs(Resource):
                 ),
                 "rooms": ["price_updates"],
             },
+            {
+                "name": "price_refresh_progress",
+                "description": "Emitted as a price refresh of many stocks progresses",
+                "direction": "server-to-client",
+                "payload": (
+                    '{"status": "started|running|completed", '
+                    '"completed": 10, "total": 50, "details": {...}}'
+                ),
+                "rooms": ["price_refresh"],
+            },
             {
                 "name": "test",
                 "description": "Test event for verifying WebSocket connectivity",
@@ -249,6 +340,12 @@ class WebSocketDocs(Resource):
                 "subscribe_event": "join_price_updates",
                 "events": ["price_update"],
             },
+            {
+                "name": "price_refresh",
+                "description": "Room for progress of price refreshes",
+                "subscribe_event": "join_price_refresh",
+                "events": ["price_refresh_progress"],
+            },
             {
                 "name": "test",
                 "description": "Room for testing WebSocket connectivity",
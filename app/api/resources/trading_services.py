@@ -13,8 +13,10 @@ if TYPE_CHECKING:
     from app.models import Stock, StockDailyPrice, TradingService, User
 
 from app.api.schemas.trading_service import (
+    portfolio_backtest_schema,
     service_create_schema,
     service_schema,
+    service_sweep_schema,
     service_update_schema,
     services_schema,
 )
@@ -24,7 +26,7 @@ from app.services.session_manager import SessionManager
 from app.services.stock_service import StockService
 from app.services.trading_service import TradingServiceService
 from app.services.trading_strategy_service import TradingStrategyService
-from app.utils.auth import get_current_user, require_ownership
+from app.utils.auth import admin_required, get_current_user, require_ownership
 from app.utils.constants import (
     ApiConstants,
     PaginationConstants,
@@ -1010,6 +1012,214 @@ class ServiceBacktest(Resource):
             }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
 
 
+@api.route("/<int:service_id>/backtest/intraday")
+@api.param("service_id", "The trading service identifier")
+@api.response(ApiConstants.HTTP_NOT_FOUND, "Service not found")
+class ServiceIntradayBacktest(Resource):
+    """Run a backtest for a trading service on intraday bars."""
+
+    @api.doc(
+        "backtest_service_intraday",
+        params={
+            "days": "Number of calendar days to backtest (default: 5)",
+            "interval": "Bar interval in minutes (default: 1)",
+        },
+    )
+    @api.response(ApiConstants.HTTP_OK, "Success")
+    @api.response(ApiConstants.HTTP_BAD_REQUEST, "Invalid request")
+    @api.response(ApiConstants.HTTP_UNAUTHORIZED, "Unauthorized")
+    @api.response(ApiConstants.HTTP_NOT_FOUND, "Service not found")
+    @jwt_required()
+    @require_ownership("service", id_parameter="service_id")
+    def post(self, service_id: int) -> tuple[dict[str, any], int]:
+        """Run a backtest for a trading service on intraday bars."""
+        try:
+            days: int = request.args.get("days", 5, type=int)
+            interval: int = request.args.get("interval", 1, type=int)
+
+            with SessionManager() as session:
+                # Get current user
+                user: User | None = get_current_user(session)
+                validate_user_authentication(user)
+
+                # Run backtest using the BacktestService
+                backtest_results: dict[str, any] = BacktestService.backtest_intraday(
+                    session,
+                    service_id,
+                    days,
+                    interval,
+                )
+                return backtest_results, ApiConstants.HTTP_OK
+
+        except ValidationError as e:
+            current_app.logger.warning("Validation error in intraday backtest: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except ResourceNotFoundError as e:
+            current_app.logger.warning("Service not found: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except AuthorizationError as e:
+            current_app.logger.warning(
+                "Authorization error running intraday backtest: %s",
+                e,
+            )
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_UNAUTHORIZED
+        except Exception as e:
+            current_app.logger.exception("Error running intraday backtest")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
+@api.route("/backtest/portfolio")
+class PortfolioBacktest(Resource):
+    """Run a backtest across several stocks with one shared balance."""
+
+    @api.doc("backtest_portfolio")
+    @api.expect(
+        api.model(
+            "PortfolioBacktest",
+            {
+                "symbols": fields.List(
+                    fields.String,
+                    required=True,
+                    description="Stock ticker symbols to trade",
+                ),
+                "initial_balance": fields.Float(
+                    required=True,
+                    description="Initial cash balance shared by all positions",
+                ),
+                "days": fields.Integer(
+                    description="Number of days to backtest (default: 90)",
+                ),
+                "buy_threshold": fields.Float(description="Buy threshold percentage"),
+                "allocation_percent": fields.Float(
+                    description="Percentage of available cash to spend per buy",
+                ),
+            },
+        ),
+    )
+    @api.response(ApiConstants.HTTP_OK, "Success")
+    @api.response(ApiConstants.HTTP_BAD_REQUEST, "Invalid request")
+    @api.response(ApiConstants.HTTP_UNAUTHORIZED, "Unauthorized")
+    @api.response(ApiConstants.HTTP_NOT_FOUND, "Stock not found")
+    @jwt_required()
+    def post(self) -> tuple[dict[str, any], int]:
+        """Backtest the trading strategy across several stocks at once."""
+        try:
+            data: dict[str, any] = request.json or {}
+
+            # Validate input data
+            validated_data: dict[str, any] = portfolio_backtest_schema.load(data)
+
+            with SessionManager() as session:
+                # Get current user
+                user: User | None = get_current_user(session)
+                validate_user_authentication(user)
+
+                # Run backtest using the BacktestService
+                backtest_results: dict[str, any] = BacktestService.backtest_portfolio(
+                    session,
+                    **validated_data,
+                )
+                return backtest_results, ApiConstants.HTTP_OK
+
+        except ValidationError as e:
+            current_app.logger.warning("Validation error in portfolio backtest: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except ResourceNotFoundError as e:
+            current_app.logger.warning("Stock not found: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except AuthorizationError as e:
+            current_app.logger.warning(
+                "Authorization error in portfolio backtest: %s",
+                e,
+            )
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_UNAUTHORIZED
+        except Exception as e:
+            current_app.logger.exception("Error running portfolio backtest")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
+@api.route("/<int:service_id>/backtest/sweep")
+@api.param("service_id", "The trading service identifier")
+@api.response(ApiConstants.HTTP_NOT_FOUND, "Service not found")
+class ServiceBacktestSweep(Resource):
+    """Backtest a grid of strategy parameters for a trading service."""
+
+    @api.doc("sweep_service_backtest")
+    @api.expect(
+        api.model(
+            "BacktestSweep",
+            {
+                "days": fields.Integer(
+                    description="Number of days to backtest (default: 90)",
+                ),
+                "buy_thresholds": fields.List(
+                    fields.Float,
+                    description="Buy threshold percentages to try",
+                ),
+                "allocation_percents": fields.List(
+                    fields.Float,
+                    description="Allocation percentages to try",
+                ),
+                "sort_by": fields.String(
+                    description="Metric to rank results by (default: sharpe_ratio)",
+                ),
+            },
+        ),
+    )
+    @api.response(ApiConstants.HTTP_OK, "Success")
+    @api.response(ApiConstants.HTTP_BAD_REQUEST, "Invalid request")
+    @api.response(ApiConstants.HTTP_UNAUTHORIZED, "Unauthorized")
+    @api.response(ApiConstants.HTTP_NOT_FOUND, "Service not found")
+    @jwt_required()
+    @require_ownership("service", id_parameter="service_id")
+    def post(self, service_id: int) -> tuple[dict[str, any], int]:
+        """Backtest every combination of the given strategy parameters.
+
+        Sells act on indicator signals only, as in live trading, so the sell
+        threshold is not swept.
+        """
+        try:
+            data: dict[str, any] = request.json or {}
+
+            # Validate input data
+            validated_data: dict[str, any] = service_sweep_schema.load(data)
+
+            with SessionManager() as session:
+                # Get current user
+                user: User | None = get_current_user(session)
+                validate_user_authentication(user)
+
+                # Run the sweep using the BacktestService
+                sweep_results: dict[str, any] = BacktestService.sweep_parameters(
+                    session,
+                    service_id,
+                    **validated_data,
+                )
+                return sweep_results, ApiConstants.HTTP_OK
+
+        except ValidationError as e:
+            current_app.logger.warning("Validation error in backtest sweep: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_BAD_REQUEST
+        except ResourceNotFoundError as e:
+            current_app.logger.warning("Service not found: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_NOT_FOUND
+        except AuthorizationError as e:
+            current_app.logger.warning("Authorization error in backtest sweep: %s", e)
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_UNAUTHORIZED
+        except Exception as e:
+            current_app.logger.exception("Error running backtest sweep")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
 @api.route("/<int:service_id>/execute-strategy")
 @api.param("service_id", "The trading service identifier")
 @api.response(ApiConstants.HTTP_NOT_FOUND, "Service not found")
@@ -1066,3 +1276,40 @@ class ServiceExecuteStrategy(Resource):
                 "error": True,
                 "message": f"An unexpected error occurred: {e!s}",
             }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
+
+
+@api.route("/execute-all")
+class ServiceExecuteAll(Resource):
+    """Execute trading strategies for all active services."""
+
+    @api.doc("execute_all_strategies")
+    @api.response(ApiConstants.HTTP_OK, "Success")
+    @api.response(ApiConstants.HTTP_UNAUTHORIZED, "Unauthorized")
+    @jwt_required()
+    @admin_required
+    def post(self) -> tuple[dict[str, any], int]:
+        """Execute trading strategies for every active service in one batch."""
+        try:
+            with SessionManager() as session:
+                # Get current user
+                user: User | None = get_current_user(session)
+                validate_user_authentication(user)
+
+                # Execute strategies using the TradingStrategyService
+                result: dict[str, any] = TradingStrategyService.execute_all_strategies(
+                    session,
+                )
+                return result, ApiConstants.HTTP_OK
+
+        except AuthorizationError as e:
+            current_app.logger.warning(
+                "Authorization error executing strategies: %s",
+                e,
+            )
+            return {"error": True, "message": str(e)}, ApiConstants.HTTP_UNAUTHORIZED
+        except Exception as e:
+            current_app.logger.exception("Error executing trading strategies")
+            return {
+                "error": True,
+                "message": f"An unexpected error occurred: {e!s}",
+            }, ApiConstants.HTTP_INTERNAL_SERVER_ERROR
@@ -16,8 +16,8 @@ from app.api.schemas.trading_transaction import (
     transaction_cancel_schema,
     transaction_complete_schema,
     transaction_create_schema,
+    transaction_rows,
     transaction_schema,
-    transactions_schema,
 )
 from app.models.enums import TransactionState
 from app.services.session_manager import SessionManager
@@ -34,7 +34,6 @@ from app.utils.errors import (
     ResourceNotFoundError,
     ValidationError,
 )
-from app.utils.query_utils import apply_pagination
 
 # Set up logging
 logger: logging.Logger = logging.getLogger(__name__)
@@ -230,6 +229,9 @@ pagination_model: Model | OrderedModel = api.model(
         "has_prev": fields.Boolean(
             description="Whether there is a previous page",
         ),
+        "next_cursor": fields.String(
+            description="Cursor of the next page when paging by cursor",
+        ),
     },
 )
 
@@ -263,6 +265,10 @@ class TransactionList(Resource):
             "state": "Filter by transaction state (OPEN, CLOSED, CANCELLED)",
             "sort": "Sort field (e.g., created_at, purchase_date)",
             "order": "Sort order (asc or desc, default: desc)",
+            "cursor": (
+                "Page by purchase date from the next_cursor of the previous "
+                "page, empty for the first page (replaces page and the totals)"
+            ),
         },
     )
     @api.marshal_with(transaction_list_model)
@@ -272,13 +278,17 @@ class TransactionList(Resource):
     def get(self) -> tuple[dict[str, any], int]:
         """List all transactions for the current user."""
         try:
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Get current user
                 user: User | None = get_current_user(session)
                 validate_user_authentication(user)
 
                 # Build filters from request parameters
-                filters: dict[str, any] = {}
+                filters: dict[str, any] = {
+                    "user_id": user.id,
+                    "sort": request.args.get("sort", "purchase_date"),
+                    "order": request.args.get("order", "desc"),
+                }
 
                 service_id: str | None = request.args.get("service_id")
                 if service_id and service_id.isdigit():
@@ -288,31 +298,24 @@ class TransactionList(Resource):
                 if state and TransactionState.is_valid(state):
                     filters["state"] = state
 
-                # Get user's transactions with filters using service layer
-                all_transactions: list[TradingTransaction] = (
-                    TransactionService.get_transactions_for_user(
-                        session,
-                        user.id,
-                        filters,
-                    )
-                )
-
-                # Sort transactions
-                sort_field: str = request.args.get("sort", "purchase_date")
-                sort_order: str = request.args.get("order", "desc")
-
-                sorted_transactions: list[TradingTransaction] = (
-                    TransactionService.sort_transactions(
-                        all_transactions,
-                        sort_field,
-                        sort_order,
-                    )
+                # Filter, sort and paginate the user's transactions in the database
+                result: dict[str, any] = TransactionService.get_filtered_transactions(
+                    session,
+                    filters,
+                    page=request.args.get(
+                        "page",
+                        default=PaginationConstants.DEFAULT_PAGE,
+                        type=int,
+                    ),
+                    per_page=request.args.get(
+                        "page_size",
+                        default=PaginationConstants.DEFAULT_PER_PAGE,
+                        type=int,
+                    ),
+                    cursor=request.args.get("cursor"),
+                    serializer=transaction_rows,
                 )
 
-                # Apply pagination and prepare response
-                result: dict[str, any] = apply_pagination(sorted_transactions)
-                result["items"] = transactions_schema.dump(result["items"])
-
                 return result, ApiConstants.HTTP_OK
 
         except ValidationError as e:
@@ -665,6 +668,10 @@ class ServiceTransactions(Resource):
             "state": "Filter by transaction state (OPEN, CLOSED, CANCELLED)",
             "sort": "Sort field (e.g., created_at, shares)",
             "order": "Sort order (asc or desc, default: desc)",
+            "cursor": (
+                "Page by purchase date from the next_cursor of the previous "
+                "page, empty for the first page (replaces page and the totals)"
+            ),
         },
     )
     @api.marshal_with(transaction_list_model)
@@ -679,45 +686,35 @@ class ServiceTransactions(Resource):
     ) -> tuple[dict[str, any], int]:
         """Get all transactions for a specific trading service."""
         try:
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Parse query parameters
                 state: str | None = request.args.get("state")
                 if state and not TransactionState.is_valid(state):
                     validate_transaction_state(state)
 
-                # Get transactions for this service using service layer
-                if state:
-                    transactions: list[TradingTransaction] = (
-                        TransactionService.get_by_service(
-                            session,
-                            service_id,
-                            state,
-                        )
-                    )
-                else:
-                    transactions: list[TradingTransaction] = (
-                        TransactionService.get_by_service(
-                            session,
-                            service_id,
-                        )
-                    )
-
-                # Sort transactions
-                sort_field: str = request.args.get("sort", "purchase_date")
-                sort_order: str = request.args.get("order", "desc")
-
-                sorted_transactions: list[TradingTransaction] = (
-                    TransactionService.sort_transactions(
-                        transactions,
-                        sort_field,
-                        sort_order,
-                    )
+                # Filter, sort and paginate the transactions in the database
+                result: dict[str, any] = TransactionService.get_filtered_transactions(
+                    session,
+                    {
+                        "service_id": service_id,
+                        "state": state,
+                        "sort": request.args.get("sort", "purchase_date"),
+                        "order": request.args.get("order", "desc"),
+                    },
+                    page=request.args.get(
+                        "page",
+                        default=PaginationConstants.DEFAULT_PAGE,
+                        type=int,
+                    ),
+                    per_page=request.args.get(
+                        "page_size",
+                        default=PaginationConstants.DEFAULT_PER_PAGE,
+                        type=int,
+                    ),
+                    cursor=request.args.get("cursor"),
+                    serializer=transaction_rows,
                 )
 
-                # Apply pagination and prepare response
-                result: dict[str, any] = apply_pagination(sorted_transactions)
-                result["items"] = transactions_schema.dump(result["items"])
-
                 return result, ApiConstants.HTTP_OK
 
         except ValidationError as e:
@@ -831,7 +828,7 @@ class TransactionMetrics(Resource):
     ) -> tuple[dict[str, any], int]:
         """Get metrics for transactions of a service."""
         try:
-            with SessionManager() as session:
+            with SessionManager(read_only=True) as session:
                 # Check if service exists using service layer
                 # (require_ownership decorator already verifies ownership)
                 service: TradingService | None = TransactionService.get_service_by_id(
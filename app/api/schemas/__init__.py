@@ -12,6 +12,7 @@ from app.api.schemas.daily_price import (
     daily_price_bulk_schema,
     daily_price_delete_schema,
     daily_price_input_schema,
+    daily_price_rows,
     daily_price_schema,
     daily_prices_schema,
 )
@@ -19,21 +20,25 @@ from app.api.schemas.intraday_price import (
     intraday_price_bulk_schema,
     intraday_price_delete_schema,
     intraday_price_input_schema,
+    intraday_price_rows,
     intraday_price_schema,
     intraday_prices_schema,
 )
 from app.api.schemas.stock import (
     stock_delete_schema,
     stock_input_schema,
+    stock_rows,
     stock_schema,
     stocks_schema,
 )
 from app.api.schemas.trading_service import (
     decision_response_schema,
+    portfolio_backtest_schema,
     service_action_schema,
     service_create_schema,
     service_delete_schema,
     service_schema,
+    service_sweep_schema,
     service_update_schema,
     services_schema,
 )
@@ -42,6 +47,7 @@ from app.api.schemas.trading_transaction import (
     transaction_complete_schema,
     transaction_create_schema,
     transaction_delete_schema,
+    transaction_rows,
     transaction_schema,
     transactions_schema,
 )
@@ -89,6 +95,7 @@ __all__: list[str] = [
     "daily_price_bulk_schema",
     "daily_price_delete_schema",
     "daily_price_input_schema",
+    "daily_price_rows",
     "daily_price_schema",
     "daily_prices_schema",
     "decision_response_schema",
@@ -96,23 +103,28 @@ __all__: list[str] = [
     "intraday_price_bulk_schema",
     "intraday_price_delete_schema",
     "intraday_price_input_schema",
+    "intraday_price_rows",
     "intraday_price_schema",
     "intraday_prices_schema",
     "password_change_schema",
+    "portfolio_backtest_schema",
     "service_action_schema",
     "service_create_schema",
     "service_delete_schema",
     "service_schema",
+    "service_sweep_schema",
     "service_update_schema",
     "services_schema",
     "stock_delete_schema",
     "stock_input_schema",
+    "stock_rows",
     "stock_schema",
     "stocks_schema",
     "transaction_cancel_schema",
     "transaction_complete_schema",
     "transaction_create_schema",
     "transaction_delete_schema",
+    "transaction_rows",
     "transaction_schema",
     "transactions_schema",
     "user_create_schema",
@@ -19,11 +19,13 @@ from marshmallow import (
     validates_schema,
 )
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+from sqlalchemy import case, select
 
 from app.api.schemas import Schema
-from app.models import PriceSource, StockDailyPrice
+from app.models import PriceSource, Stock, StockDailyPrice
 from app.utils.current_datetime import get_current_date
 from app.utils.errors import StockPriceError
+from app.utils.row_serializer import RowSerializer
 
 
 # Base price schema with common validations
@@ -222,3 +224,41 @@ daily_prices_schema = StockDailyPriceSchema(many=True)
 daily_price_input_schema = DailyPriceInputSchema()
 daily_price_delete_schema = DailyPriceDeleteSchema()
 daily_price_bulk_schema = DailyPriceBulkSchema()
+
+# Read-only list responses, with the computed fields of the schema in SQL
+daily_price_rows: RowSerializer = RowSerializer(
+    {
+        "id": StockDailyPrice.id,
+        "stock_id": StockDailyPrice.stock_id,
+        "price_date": StockDailyPrice.price_date,
+        "open_price": StockDailyPrice.open_price,
+        "high_price": StockDailyPrice.high_price,
+        "low_price": StockDailyPrice.low_price,
+        "close_price": StockDailyPrice.close_price,
+        "adj_close": StockDailyPrice.adj_close,
+        "volume": StockDailyPrice.volume,
+        "source": StockDailyPrice.source,
+        "change": StockDailyPrice.close_price - StockDailyPrice.open_price,
+        "change_percent": case(
+            (
+                StockDailyPrice.open_price != 0,
+                (StockDailyPrice.close_price - StockDailyPrice.open_price)
+                / StockDailyPrice.open_price
+                * 100,
+            ),
+        ),
+        "trading_range": StockDailyPrice.high_price - StockDailyPrice.low_price,
+        "trading_range_percent": case(
+            (
+                StockDailyPrice.low_price != 0,
+                (StockDailyPrice.high_price - StockDailyPrice.low_price)
+                / StockDailyPrice.low_price
+                * 100,
+            ),
+        ),
+        "is_real_data": StockDailyPrice.source.in_(PriceSource.real_values()),
+        "stock_symbol": select(Stock.symbol)
+        .where(Stock.id == StockDailyPrice.stock_id)
+        .scalar_subquery(),
+    },
+)
@@ -20,11 +20,13 @@ from marshmallow import (
     validates_schema,
 )
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+from sqlalchemy import case, select
 
 from app.api.schemas import Schema
-from app.models import IntradayInterval, PriceSource, StockIntradayPrice
+from app.models import IntradayInterval, PriceSource, Stock, StockIntradayPrice
 from app.utils.current_datetime import get_current_datetime
 from app.utils.errors import StockPriceError
+from app.utils.row_serializer import RowSerializer
 
 # Constants for intraday price validation
 DEFAULT_INTRADAY_INTERVAL: str = "1m"
@@ -219,3 +221,34 @@ intraday_prices_schema = StockIntradayPriceSchema(many=True)
 intraday_price_input_schema = StockIntradayPriceInputSchema()
 intraday_price_delete_schema = StockIntradayPriceDeleteSchema()
 intraday_price_bulk_schema = StockIntradayPriceBulkSchema()
+
+# Read-only list responses, with the computed fields of the schema in SQL
+intraday_price_rows: RowSerializer = RowSerializer(
+    {
+        "id": StockIntradayPrice.id,
+        "stock_id": StockIntradayPrice.stock_id,
+        "timestamp": StockIntradayPrice.timestamp,
+        "interval": StockIntradayPrice.interval,
+        "open_price": StockIntradayPrice.open_price,
+        "high_price": StockIntradayPrice.high_price,
+        "low_price": StockIntradayPrice.low_price,
+        "close_price": StockIntradayPrice.close_price,
+        "volume": StockIntradayPrice.volume,
+        "source": StockIntradayPrice.source,
+        "change": StockIntradayPrice.close_price - StockIntradayPrice.open_price,
+        "change_percent": case(
+            (
+                StockIntradayPrice.open_price != 0,
+                (StockIntradayPrice.close_price - StockIntradayPrice.open_price)
+                / StockIntradayPrice.open_price
+                * 100,
+            ),
+        ),
+        "is_real_data": StockIntradayPrice.source.in_(PriceSource.real_values()),
+        "is_delayed": StockIntradayPrice.source == PriceSource.DELAYED.value,
+        "is_real_time": StockIntradayPrice.source == PriceSource.REAL_TIME.value,
+        "stock_symbol": select(Stock.symbol)
+        .where(Stock.id == StockIntradayPrice.stock_id)
+        .scalar_subquery(),
+    },
+)
@@ -5,6 +5,8 @@ This module contains the schemas for the Stock model.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from marshmallow import (
     ValidationError,
     fields,
@@ -14,11 +16,42 @@ from marshmallow import (
     validates_schema,
 )
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+from sqlalchemy import ColumnElement, exists, func, select
+from sqlalchemy.orm import object_session
 
 from app.api.schemas import Schema
-from app.models import Stock
+from app.models import (
+    Stock,
+    StockDailyPrice,
+    StockIntradayPrice,
+    TradingService,
+    TradingTransaction,
+)
 from app.utils.constants import StockConstants
 from app.utils.errors import StockError
+from app.utils.row_serializer import RowSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy.orm import Session
+
+# Related row aggregates correlated to the enclosing stock, so the computed
+# fields never load the related collections
+_has_services: ColumnElement[bool] = exists().where(TradingService.stock_id == Stock.id)
+_has_transactions: ColumnElement[bool] = exists().where(
+    TradingTransaction.stock_id == Stock.id,
+)
+_daily_count: ColumnElement[int] = (
+    select(func.count(StockDailyPrice.id))
+    .where(StockDailyPrice.stock_id == Stock.id)
+    .scalar_subquery()
+)
+_intraday_count: ColumnElement[int] = (
+    select(func.count(StockIntradayPrice.id))
+    .where(StockIntradayPrice.stock_id == Stock.id)
+    .scalar_subquery()
+)
 
 
 class StockSchema(SQLAlchemyAutoSchema):
@@ -40,18 +73,43 @@ class StockSchema(SQLAlchemyAutoSchema):
     )
     price_count: fields.Method = fields.Method("count_prices", dump_only=True)
 
+    @staticmethod
+    def _aggregate(obj: Stock, *columns: ColumnElement) -> tuple[any, ...] | None:
+        """Query related row aggregates of a stored stock, None if not stored."""
+        session: Session | None = object_session(obj)
+        if session is None or obj.id is None:
+            return None
+        return tuple(
+            session.execute(select(*columns).where(Stock.id == obj.id)).one(),
+        )
+
     def check_has_services(self, obj: Stock) -> bool:
         """Check if the stock has any associated services."""
-        return len(obj.services) > 0 if obj.services else False
+        result: tuple[bool] | None = self._aggregate(obj, _has_services)
+        if result is None:
+            return len(obj.services) > 0 if obj.services else False
+        return result[0]
 
     def check_has_transactions(self, obj: Stock) -> bool:
         """Check if the stock has any associated transactions."""
-        return len(obj.transactions) > 0 if obj.transactions else False
+        result: tuple[bool] | None = self._aggregate(obj, _has_transactions)
+        if result is None:
+            return len(obj.transactions) > 0 if obj.transactions else False
+        return result[0]
 
     def count_prices(self, obj: Stock) -> dict[str, int]:
         """Count the number of price data points available."""
-        daily_count: int = len(obj.daily_prices) if obj.daily_prices else 0
-        intraday_count: int = len(obj.intraday_prices) if obj.intraday_prices else 0
+        result: tuple[int, int] | None = self._aggregate(
+            obj,
+            _daily_count,
+            _intraday_count,
+        )
+        if result is None:
+            result = (
+                len(obj.daily_prices) if obj.daily_prices else 0,
+                len(obj.intraday_prices) if obj.intraday_prices else 0,
+            )
+        daily_count, intraday_count = result
         return {
             "daily": daily_count,
             "intraday": intraday_count,
@@ -105,6 +163,38 @@ stock_schema = StockSchema()
 stocks_schema = StockSchema(many=True)
 
 
+class _StockRowSerializer(RowSerializer):
+    """Row serializer that adds up the price counts of each stock.
+
+    The total is summed here rather than in SQL, which would count the price
+    rows of every stock a second time.
+    """
+
+    def dump(self, rows: Iterable[Sequence[any]]) -> list[dict[str, any]]:
+        """Serialize stock rows, including the total price count."""
+        items: list[dict[str, any]] = super().dump(rows)
+        for item in items:
+            counts: dict[str, int] = item["price_count"]
+            counts["total"] = counts["daily"] + counts["intraday"]
+        return items
+
+
+# Read-only list responses, with the computed fields of the schema in SQL
+stock_rows: RowSerializer = _StockRowSerializer(
+    {
+        "id": Stock.id,
+        "symbol": Stock.symbol,
+        "name": Stock.name,
+        "is_active": Stock.is_active,
+        "sector": Stock.sector,
+        "description": Stock.description,
+        "has_services": _has_services,
+        "has_transactions": _has_transactions,
+        "price_count": {"daily": _daily_count, "intraday": _intraday_count},
+    },
+)
+
+
 # Schema for creating/updating a stock with only necessary fields
 class StockInputSchema(Schema):
     """Schema for creating or updating a Stock."""
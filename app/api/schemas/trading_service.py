@@ -221,6 +221,67 @@ class TradingServiceActionSchema(Schema):
             raise ValidationError(TradingServiceError.SYMBOL_FORMAT)
 
 
+# Schema for a backtest parameter sweep
+class TradingServiceSweepSchema(Schema):
+    """Schema for a grid of backtest parameters to evaluate."""
+
+    days: fields.Integer = fields.Integer(
+        load_default=90,
+        validate=validate.Range(min=1),
+    )
+    buy_thresholds: fields.List = fields.List(
+        fields.Float(
+            validate=validate.Range(min=TradingServiceConstants.MIN_BUY_THRESHOLD),
+        ),
+        load_default=None,
+    )
+    allocation_percents: fields.List = fields.List(
+        fields.Float(
+            validate=validate.Range(
+                min=TradingServiceConstants.MIN_ALLOCATION_PERCENT,
+                max=TradingServiceConstants.MAX_ALLOCATION_PERCENT,
+            ),
+        ),
+        load_default=None,
+    )
+    sort_by: fields.String = fields.String(load_default="sharpe_ratio")
+
+
+# Schema for a multi-symbol portfolio backtest
+class PortfolioBacktestSchema(Schema):
+    """Schema for backtesting several stocks with one shared balance."""
+
+    symbols: fields.List = fields.List(
+        fields.String(
+            validate=validate.Length(
+                min=StockConstants.MIN_SYMBOL_LENGTH,
+                max=StockConstants.MAX_SYMBOL_LENGTH,
+            ),
+        ),
+        required=True,
+        validate=validate.Length(min=1),
+    )
+    initial_balance: fields.Float = fields.Float(
+        required=True,
+        validate=validate.Range(min=TradingServiceConstants.MIN_INITIAL_BALANCE),
+    )
+    days: fields.Integer = fields.Integer(
+        load_default=90,
+        validate=validate.Range(min=1),
+    )
+    buy_threshold: fields.Float = fields.Float(
+        load_default=TradingServiceConstants.DEFAULT_BUY_THRESHOLD,
+        validate=validate.Range(min=TradingServiceConstants.MIN_BUY_THRESHOLD),
+    )
+    allocation_percent: fields.Float = fields.Float(
+        load_default=TradingServiceConstants.DEFAULT_ALLOCATION_PERCENT,
+        validate=validate.Range(
+            min=TradingServiceConstants.MIN_ALLOCATION_PERCENT,
+            max=TradingServiceConstants.MAX_ALLOCATION_PERCENT,
+        ),
+    )
+
+
 # Schema for trading decision response
 class TradingDecisionResponseSchema(Schema):
     """Schema for trading decision responses."""
@@ -237,4 +298,6 @@ service_create_schema = TradingServiceCreateSchema()
 service_update_schema = TradingServiceUpdateSchema()
 service_delete_schema = TradingServiceDeleteSchema()
 service_action_schema = TradingServiceActionSchema()
+service_sweep_schema = TradingServiceSweepSchema()
+portfolio_backtest_schema = PortfolioBacktestSchema()
 decision_response_schema = TradingDecisionResponseSchema()
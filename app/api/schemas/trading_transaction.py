@@ -7,11 +7,13 @@ from typing import Literal
 
 from marshmallow import ValidationError, fields, validate, validates, validates_schema
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+from sqlalchemy import Float, and_, case, cast
 
 from app.api.schemas import Schema
 from app.models import TradingTransaction, TransactionState
 from app.utils.constants import StockConstants
 from app.utils.errors import StockError, TransactionError
+from app.utils.row_serializer import RowSerializer
 
 
 class TradingTransactionSchema(SQLAlchemyAutoSchema):
@@ -192,3 +194,56 @@ transaction_complete_schema = TransactionCompleteSchema()
 transaction_create_schema = TransactionCreateSchema()
 transaction_cancel_schema = TransactionCancelSchema()
 transaction_delete_schema = TransactionDeleteSchema()
+
+# Read-only list responses, with the computed fields of the schema in SQL;
+# prices are cast to floats so SQLite does not divide integral amounts as
+# integers
+_shares = cast(TradingTransaction.shares, Float)
+_purchase_price = cast(TradingTransaction.purchase_price, Float)
+_sale_price = cast(TradingTransaction.sale_price, Float)
+
+transaction_rows: RowSerializer = RowSerializer(
+    {
+        "id": TradingTransaction.id,
+        "service_id": TradingTransaction.service_id,
+        "stock_id": TradingTransaction.stock_id,
+        "stock_symbol": TradingTransaction.stock_symbol,
+        "shares": TradingTransaction.shares,
+        "state": TradingTransaction.state,
+        "purchase_price": TradingTransaction.purchase_price,
+        "sale_price": TradingTransaction.sale_price,
+        "gain_loss": TradingTransaction.gain_loss,
+        "purchase_date": TradingTransaction.purchase_date,
+        "sale_date": TradingTransaction.sale_date,
+        "notes": TradingTransaction.notes,
+        "is_complete": TradingTransaction.state == TransactionState.CLOSED.value,
+        "is_profitable": case(
+            (
+                and_(
+                    TradingTransaction.state == TransactionState.CLOSED.value,
+                    TradingTransaction.gain_loss > 0,
+                ),
+                True,
+            ),
+            else_=False,
+        ),
+        "total_cost": case(
+            (
+                and_(_purchase_price != 0, _shares != 0),
+                _purchase_price * _shares,
+            ),
+            else_=0.0,
+        ),
+        "total_revenue": case(
+            (and_(_sale_price != 0, _shares != 0), _sale_price * _shares),
+            else_=0.0,
+        ),
+        "profit_loss_pct": case(
+            (
+                and_(_purchase_price > 0, _sale_price != 0),
+                (_sale_price - _purchase_price) / _purchase_price * 100,
+            ),
+            else_=0.0,
+        ),
+    },
+)
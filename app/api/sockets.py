@@ -252,6 +252,14 @@ def register_stock_handlers(socketio: SocketIO) -> None:
         logger.debug("Client joined price updates room")
         emit("joined", {"room": room}, to=room)
 
+    @socketio.on("join_price_refresh")
+    @socketio_handler("join_price_refresh")
+    def join_price_refresh() -> None:
+        room: str = "price_refresh"
+        join_room(room)
+        logger.debug("Client joined price refresh room")
+        emit("joined", {"room": room}, to=room)
+
     @socketio.on("join_stocks")
     @socketio_handler("join_stocks")
     def join_stocks() -> None:
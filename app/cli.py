@@ -0,0 +1,120 @@
+"""Command line interface of the Day Trader application.
+
+This module provides Flask CLI commands, run as ``flask --app app prices ...``,
+for moving price histories between environments as Parquet or Arrow IPC
+archives without going through the paginated API.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import click
+from flask.cli import AppGroup
+
+from app.services.price_archive_service import PriceArchiveService
+from app.services.session_manager import SessionManager
+from app.utils.archive_utils import archive_format_for_path, read_archive, write_archive
+from app.utils.constants import ExportConstants
+from app.utils.errors import APIError
+
+# Commands run inside the application context, like the built-in ones
+prices_cli: AppGroup = AppGroup("prices", help="Export and import price archives.")
+
+
+@prices_cli.command("export")
+@click.argument("kind", type=click.Choice(list(PriceArchiveService.KINDS)))
+@click.argument("output", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--symbols",
+    "-s",
+    required=True,
+    help="Comma-separated stock symbols.",
+)
+@click.option("--start", type=click.DateTime(), help="First date or time to export.")
+@click.option("--end", type=click.DateTime(), help="Last date or time to export.")
+@click.option("--interval", type=int, help="Intraday interval in minutes.")
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(list(ExportConstants.ARCHIVE_MIMETYPES)),
+    help="Archive format, taken from the file suffix by default.",
+)
+def export_prices(  # noqa: PLR0913
+    kind: str,
+    output: str,
+    symbols: str,
+    start: datetime | None,
+    end: datetime | None,
+    interval: int | None,
+    export_format: str | None,
+) -> None:
+    """Export the KIND price history of a set of stocks to OUTPUT."""
+    if kind == "daily":
+        start = start.date() if start else None
+        end = end.date() if end else None
+
+    try:
+        export_format = archive_format_for_path(output, export_format)
+        with SessionManager(read_only=True) as session:
+            stocks: dict[str, int] = PriceArchiveService.resolve_stocks(
+                session,
+                symbols.split(","),
+            )
+            with click.open_file(output, "wb") as sink:
+                count: int = write_archive(
+                    PriceArchiveService.stream_price_partitions(
+                        session,
+                        kind,
+                        list(stocks.values()),
+                        start,
+                        end,
+                        interval,
+                    ),
+                    PriceArchiveService.archive_columns(kind),
+                    sink,
+                    export_format,
+                )
+    except APIError as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(f"Exported {count} {kind} price records to {output}")
+
+
+@prices_cli.command("import")
+@click.argument("kind", type=click.Choice(list(PriceArchiveService.KINDS)))
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(list(ExportConstants.ARCHIVE_MIMETYPES)),
+    help="Archive format, taken from the file suffix by default.",
+)
+@click.option(
+    "--update-existing",
+    is_flag=True,
+    help="Overwrite existing records instead of skipping them.",
+)
+def import_prices(
+    kind: str,
+    source: str,
+    export_format: str | None,
+    *,
+    update_existing: bool,
+) -> None:
+    """Import the KIND price archive SOURCE through the bulk price import."""
+    try:
+        export_format = archive_format_for_path(source, export_format)
+        with click.open_file(source, "rb") as archive, SessionManager() as session:
+            counts: dict[str, int] = PriceArchiveService.import_price_batches(
+                session,
+                kind,
+                read_archive(archive, export_format),
+                update_existing=update_existing,
+            )
+    except APIError as e:
+        raise click.ClickException(str(e)) from e
+
+    for symbol, count in counts.items():
+        click.echo(f"{symbol}: {count} {kind} price records")
+    click.echo(f"Imported {sum(counts.values())} {kind} price records from {source}")
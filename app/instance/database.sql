@@ -0,0 +1,152 @@
+
+CREATE TABLE IF NOT EXISTS stocks (
+	symbol VARCHAR(10) NOT NULL, 
+	name VARCHAR(200), 
+	is_active BOOLEAN NOT NULL, 
+	sector VARCHAR(100), 
+	description VARCHAR(1000), 
+	id INTEGER NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id)
+)
+
+;
+
+
+CREATE TABLE IF NOT EXISTS trading_services (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	stock_id INTEGER, 
+	active_transaction_id INTEGER, 
+	name VARCHAR(100) NOT NULL, 
+	description TEXT, 
+	stock_symbol VARCHAR(10) NOT NULL, 
+	state VARCHAR(20) NOT NULL, 
+	mode VARCHAR(20) NOT NULL, 
+	is_active BOOLEAN NOT NULL, 
+	initial_balance NUMERIC(18, 2) NOT NULL, 
+	current_balance NUMERIC(18, 2) NOT NULL, 
+	minimum_balance NUMERIC(18, 2) NOT NULL, 
+	allocation_percent NUMERIC(18, 2) NOT NULL, 
+	buy_threshold NUMERIC(18, 2) NOT NULL, 
+	sell_threshold NUMERIC(18, 2) NOT NULL, 
+	stop_loss_percent NUMERIC(18, 2) NOT NULL, 
+	take_profit_percent NUMERIC(18, 2) NOT NULL, 
+	current_shares INTEGER NOT NULL, 
+	buy_count INTEGER NOT NULL, 
+	sell_count INTEGER NOT NULL, 
+	total_gain_loss NUMERIC(18, 2) NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(stock_id) REFERENCES stocks (id), 
+	FOREIGN KEY(active_transaction_id) REFERENCES trading_transactions (id)
+)
+
+;
+
+
+CREATE TABLE IF NOT EXISTS trading_transactions (
+	id INTEGER NOT NULL, 
+	service_id INTEGER NOT NULL, 
+	stock_id INTEGER, 
+	stock_symbol VARCHAR(10) NOT NULL, 
+	shares NUMERIC(18, 2) NOT NULL, 
+	state VARCHAR(20) NOT NULL, 
+	purchase_price NUMERIC(18, 2) NOT NULL, 
+	sale_price NUMERIC(18, 2), 
+	gain_loss NUMERIC(18, 2), 
+	purchase_date DATETIME NOT NULL, 
+	sale_date DATETIME, 
+	notes TEXT, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(service_id) REFERENCES trading_services (id), 
+	FOREIGN KEY(stock_id) REFERENCES stocks (id)
+)
+
+;
+
+
+CREATE TABLE IF NOT EXISTS users (
+	id INTEGER NOT NULL, 
+	username VARCHAR(50) NOT NULL, 
+	email VARCHAR(120) NOT NULL, 
+	password_hash VARCHAR(128) NOT NULL, 
+	is_active BOOLEAN, 
+	is_admin BOOLEAN, 
+	last_login DATETIME, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	UNIQUE (username), 
+	UNIQUE (email)
+)
+
+;
+
+
+CREATE TABLE IF NOT EXISTS stock_daily_prices (
+	stock_id INTEGER NOT NULL, 
+	price_date DATE NOT NULL, 
+	open_price FLOAT, 
+	high_price FLOAT, 
+	low_price FLOAT, 
+	close_price FLOAT, 
+	adj_close FLOAT, 
+	volume INTEGER, 
+	source VARCHAR(20) NOT NULL, 
+	id INTEGER NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT uix_stock_daily_date UNIQUE (stock_id, price_date), 
+	FOREIGN KEY(stock_id) REFERENCES stocks (id)
+)
+
+;
+
+
+CREATE TABLE IF NOT EXISTS stock_intraday_prices (
+	stock_id INTEGER NOT NULL, 
+	timestamp DATETIME NOT NULL, 
+	interval INTEGER NOT NULL, 
+	open_price FLOAT, 
+	high_price FLOAT, 
+	low_price FLOAT, 
+	close_price FLOAT, 
+	volume INTEGER, 
+	source VARCHAR(20) NOT NULL, 
+	id INTEGER NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT uix_stock_intraday_time UNIQUE (stock_id, timestamp, interval), 
+	FOREIGN KEY(stock_id) REFERENCES stocks (id)
+)
+
+;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_stocks_symbol ON stocks (symbol);
+
+CREATE INDEX IF NOT EXISTS ix_trading_services_user_id ON trading_services (user_id);
+
+CREATE INDEX IF NOT EXISTS ix_trading_transactions_service_purchase_date ON trading_transactions (service_id, purchase_date);
+
+CREATE INDEX IF NOT EXISTS ix_trading_transactions_service_state ON trading_transactions (service_id, state);
+
+CREATE INDEX IF NOT EXISTS ix_trading_transactions_stock_symbol ON trading_transactions (stock_symbol);
+
+CREATE INDEX IF NOT EXISTS ix_stock_intraday_stock_interval_time ON stock_intraday_prices (stock_id, interval, timestamp);
+
+
+-- Create indexes for better performance
+
+CREATE INDEX IF NOT EXISTS idx_stock_transactions_service_id ON stock_transactions(service_id);
+
+CREATE INDEX IF NOT EXISTS idx_stock_services_symbol ON stock_services(stock_symbol);
+
+CREATE INDEX IF NOT EXISTS idx_stock_services_state ON stock_services(service_state);
\ No newline at end of file
@@ -344,7 +344,12 @@ class PriceSource(str, Enum):
     @classmethod
     def is_real(cls, source: str) -> bool:
         """Check if the given source is real data (not simulated or test)."""
-        return source in {cls.REAL_TIME.value, cls.DELAYED.value, cls.HISTORICAL.value}
+        return source in cls.real_values()
+
+    @classmethod
+    def real_values(cls) -> list[str]:
+        """Get the values of the sources of real data (not simulated or test)."""
+        return [cls.REAL_TIME.value, cls.DELAYED.value, cls.HISTORICAL.value]
 
     @classmethod
     def for_display(cls) -> dict[str, str]:
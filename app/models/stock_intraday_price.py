@@ -13,6 +13,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -70,14 +71,21 @@ class StockIntradayPrice(Base):
     #
     __tablename__: str = "stock_intraday_prices"
 
-    # Constraints
-    __table_args__: tuple[UniqueConstraint] = (
+    # Constraints and indexes
+    __table_args__: tuple[UniqueConstraint | Index, ...] = (
         UniqueConstraint(
             "stock_id",
             "timestamp",
             "interval",
             name="uix_stock_intraday_time",
         ),
+        # Range queries filter on the stock and interval and scan the timestamps
+        Index(
+            "ix_stock_intraday_stock_interval_time",
+            "stock_id",
+            "interval",
+            "timestamp",
+        ),
     )
 
     #
@@ -85,7 +85,12 @@ class TradingService(Base):
 
     # Identity and relationships
     id: Mapped[int] = Column(Integer, primary_key=True)
-    user_id: Mapped[int] = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[int] = Column(
+        Integer,
+        ForeignKey("users.id"),
+        nullable=False,
+        index=True,
+    )
     stock_id: Mapped[int | None] = Column(
         Integer,
         ForeignKey("stocks.id"),
@@ -8,7 +8,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, relationship, validates
 
 from app.models.base import Base
@@ -63,6 +72,16 @@ class TradingTransaction(Base):
     #
     __tablename__: str = "trading_transactions"
 
+    # Indexes for listing the transactions of a service
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_trading_transactions_service_state", "service_id", "state"),
+        Index(
+            "ix_trading_transactions_service_purchase_date",
+            "service_id",
+            "purchase_date",
+        ),
+    )
+
     #
     # Column definitions
     #
@@ -8,10 +8,14 @@ from app.services.backtest_service import BacktestService
 from app.services.daily_price_service import DailyPriceService
 from app.services.events import EventService
 from app.services.intraday_price_service import IntradayPriceService
+from app.services.price_archive_service import PriceArchiveService
+from app.services.price_refresh import PriceRefreshOrchestrator, TokenBucket
+from app.services.query_plan import FullScan, QueryPlanAuditor
 from app.services.session_manager import SessionManager
 from app.services.stock_service import StockService
 from app.services.system_service import SystemService
 from app.services.technical_analysis_service import TechnicalAnalysisService
+from app.services.trading_scheduler import LatencyHistogram, TradingScheduler
 from app.services.trading_service import TradingServiceService
 from app.services.trading_strategy_service import TradingStrategyService
 from app.services.transaction_service import TransactionService
@@ -21,11 +25,18 @@ __all__: list[str] = [
     "BacktestService",
     "DailyPriceService",
     "EventService",
+    "FullScan",
     "IntradayPriceService",
+    "LatencyHistogram",
+    "PriceArchiveService",
+    "PriceRefreshOrchestrator",
+    "QueryPlanAuditor",
     "SessionManager",
     "StockService",
     "SystemService",
     "TechnicalAnalysisService",
+    "TokenBucket",
+    "TradingScheduler",
     "TradingServiceService",
     "TradingStrategyService",
     "TransactionService",
@@ -6,22 +6,44 @@ historical price data and simulated trades.
 
 from __future__ import annotations
 
+import itertools
 import logging
-from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import TYPE_CHECKING
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, MutableSequence, Sequence
+
     from app.models.stock import Stock
     from app.models.stock_daily_price import StockDailyPrice
     from app.models.trading_service import TradingService
 
+from app.models.enums import IntradayInterval
+from app.services.intraday_price_service import IntradayPriceService
 from app.services.stock_service import StockService
-from app.services.technical_analysis_service import TechnicalAnalysisService
+from app.services.technical_analysis_service import (
+    IndicatorState,
+    TechnicalAnalysisService,
+)
 from app.services.trading_service import TradingServiceService
-from app.utils.constants import TradingServiceConstants
-from app.utils.current_datetime import get_current_date
-from app.utils.errors import ResourceNotFoundError
+from app.utils.constants import (
+    PriceAnalysisConstants,
+    TimeConstants,
+    TradingServiceConstants,
+)
+from app.utils.current_datetime import get_current_date, get_current_datetime
+from app.utils.errors import (
+    ResourceNotFoundError,
+    TradingServiceError,
+    ValidationError,
+)
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -41,182 +63,369 @@ class BacktestService:
     # Constants
     MIN_DAYS_FOR_SMA: int = TradingServiceConstants.MIN_DAYS_FOR_SMA
 
-    @dataclass
-    class BacktestDayParams:
-        """Parameters for processing a backtest day."""
+    # Parameter sweep limits and ranking
+    MAX_SWEEP_COMBINATIONS: ClassVar[int] = 1000
+    SWEEP_CHUNK_SIZE: ClassVar[int] = 16
+    DEFAULT_SWEEP_SORT_KEY: ClassVar[str] = "sharpe_ratio"
+    SWEEP_SORT_KEYS: ClassVar[tuple[str, ...]] = (
+        "total_return_pct",
+        "annualized_return_pct",
+        "max_drawdown_pct",
+        "max_drawdown_duration",
+        "volatility",
+        "sharpe_ratio",
+        "sortino_ratio",
+        "calmar_ratio",
+        "exposure_pct",
+    )
+    # Metrics where a lower value ranks higher
+    ASCENDING_SWEEP_SORT_KEYS: ClassVar[frozenset[str]] = frozenset(
+        {"max_drawdown_pct", "max_drawdown_duration", "volatility"},
+    )
+
+    # Window, in bars, for the rolling Sharpe ratio
+    ROLLING_SHARPE_WINDOW: ClassVar[int] = 63
+
+    # Portfolio backtest limits
+    MAX_PORTFOLIO_SYMBOLS: ClassVar[int] = 100
+
+    @dataclass(slots=True)
+    class BacktestState:
+        """Mutable simulation state carried from one bar to the next."""
 
-        price: StockDailyPrice
-        price_history: list[float]
         current_balance: float
-        shares_held: int
-        last_buy_price: float | None
         buy_threshold: float
-        sell_threshold: float
         allocation_percent: float
-        day_index: int
+        shares_held: float = 0
+        last_buy_price: float | None = None
+        bars_in_market: int = 0
+        indicators: IndicatorState = field(default_factory=IndicatorState)
 
     @staticmethod
-    def _process_backtest_day(
-        params: BacktestDayParams,
-    ) -> tuple[float, int, float | None, dict[str, any] | None]:
-        """Process a single day in the backtest simulation.
+    def _process_backtest_bar(
+        state: BacktestState,
+        bar_time: date | datetime,
+        current_price: float,
+    ) -> dict[str, any] | None:
+        """Process a single bar in the backtest simulation.
+
+        The indicator state is updated in O(1) and the account fields of the
+        state are updated in place.
 
         Args:
-            params: BacktestDayParams instance with simulation parameters
+            state: BacktestState instance with simulation state
+            bar_time: Date or timestamp of the bar
+            current_price: Closing price of the bar
 
         Returns:
-            Tuple of (updated_balance, updated_shares, last_buy_price, transaction_data)
+            Transaction data if a trade was made, None otherwise
 
         """
-        # Get the price for this day
-        current_price: float = float(params.price.close_price)
+        state.indicators.update(current_price)
 
-        # Add price to history
-        price_history: list[float] = params.price_history.copy()
-        price_history.append(current_price)
-
-        # If we don't have enough price history yet, just return updated values
-        if len(price_history) < BacktestService.MIN_DAYS_FOR_SMA:
-            return (
-                params.current_balance,
-                params.shares_held,
-                params.last_buy_price,
-                None,
-            )
+        # If we don't have enough price history yet, there is nothing to decide
+        if state.indicators.count < BacktestService.MIN_DAYS_FOR_SMA:
+            return None
 
         # Get price analysis
-        price_analysis: dict[str, any] = TechnicalAnalysisService.get_price_analysis(
-            price_history,
-        )
+        price_analysis: dict[str, any] = state.indicators.get_price_analysis()
 
-        transaction = None
+        transaction: dict[str, any] | None = None
 
         # If we don't have shares, check buy conditions
-        if params.shares_held == 0:
+        if state.shares_held == 0:
             should_buy: bool = BacktestService._should_buy_backtest(
                 price_analysis,
                 current_price,
-                params.current_balance,
-                params.buy_threshold,
-                params.allocation_percent,
+                state.current_balance,
+                state.buy_threshold,
             )
             if should_buy:
-                amount_to_spend: float = params.current_balance * (
-                    params.allocation_percent / 100.0
+                amount_to_spend: float = state.current_balance * (
+                    state.allocation_percent / 100.0
                 )
                 shares_to_buy: float = (
                     int((amount_to_spend / current_price) * 100) / 100.0
                 )
                 if shares_to_buy > 0:
                     cost: float = shares_to_buy * current_price
-                    if cost <= params.current_balance:
-                        params.current_balance -= cost
-                        params.shares_held = shares_to_buy
-                        params.last_buy_price = current_price
-                        transaction: dict[str, any] = {
+                    if cost <= state.current_balance:
+                        state.current_balance -= cost
+                        state.shares_held = shares_to_buy
+                        state.last_buy_price = current_price
+                        transaction = {
                             "type": "buy",
-                            "date": params.price.price_date.isoformat(),
+                            "date": bar_time.isoformat(),
                             "price": current_price,
-                            "shares": params.shares_held,
+                            "shares": state.shares_held,
                             "cost": cost,
-                            "balance": params.current_balance,
+                            "balance": state.current_balance,
                         }
         # If we have shares, check sell conditions
-        elif params.shares_held > 0:
-            should_sell: bool = BacktestService._should_sell_backtest(
-                price_analysis,
-                params.sell_threshold,
-            )
+        elif state.shares_held > 0:
+            should_sell: bool = BacktestService._should_sell_backtest(price_analysis)
             if should_sell:
-                revenue: float = params.shares_held * current_price
-                params.current_balance += revenue
+                revenue: float = state.shares_held * current_price
+                state.current_balance += revenue
                 gain_loss: float = (
-                    revenue - (params.shares_held * params.last_buy_price)
-                    if params.last_buy_price
+                    revenue - (state.shares_held * state.last_buy_price)
+                    if state.last_buy_price
                     else 0
                 )
-                params.shares_held = 0
-                params.last_buy_price = None
-                transaction: dict[str, any] = {
+                state.shares_held = 0
+                state.last_buy_price = None
+                transaction = {
                     "type": "sell",
-                    "date": params.price.price_date.isoformat(),
+                    "date": bar_time.isoformat(),
                     "price": current_price,
                     "revenue": revenue,
                     "gain_loss": gain_loss,
-                    "balance": params.current_balance,
+                    "balance": state.current_balance,
                 }
 
-        return (
-            params.current_balance,
-            params.shares_held,
-            params.last_buy_price,
-            transaction,
+        return transaction
+
+    @staticmethod
+    def _run_simulation(
+        state: BacktestState,
+        bars: Iterable[tuple[date | datetime, float]],
+        portfolio_values: MutableSequence[float] | None = None,
+    ) -> tuple[MutableSequence[float], list[dict[str, any]]]:
+        """Run the strategy over a stream of bars.
+
+        Bars are consumed one at a time, so a lazy iterable keeps memory use
+        bounded by the portfolio value sequence.
+
+        Args:
+            state: BacktestState instance, updated in place
+            bars: Iterable of (date or timestamp, close price), oldest first
+            portfolio_values: Sequence to append portfolio values to
+                (defaults to a new list)
+
+        Returns:
+            Tuple of (portfolio_values, transactions)
+
+        """
+        if portfolio_values is None:
+            portfolio_values = []
+        transactions: list[dict[str, any]] = []
+
+        for bar_time, current_price in bars:
+            transaction: dict[str, any] | None = BacktestService._process_backtest_bar(
+                state,
+                bar_time,
+                current_price,
+            )
+            if transaction:
+                transactions.append(transaction)
+
+            if state.shares_held > 0:
+                state.bars_in_market += 1
+            portfolio_values.append(
+                state.current_balance + state.shares_held * current_price,
+            )
+
+        return portfolio_values, transactions
+
+    @staticmethod
+    def _drawdown_statistics(values: np.ndarray) -> tuple[float, int]:
+        """Calculate the maximum drawdown and the longest time under water.
+
+        Args:
+            values: Portfolio values over time
+
+        Returns:
+            Tuple of (max drawdown as a fraction, longest drawdown in bars)
+
+        """
+        running_max: np.ndarray = np.maximum.accumulate(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdowns: np.ndarray = np.where(
+                running_max > 0,
+                (running_max - values) / running_max,
+                0.0,
+            )
+
+        # Bars since the most recent peak, including an unrecovered drawdown
+        positions: np.ndarray = np.arange(values.shape[0])
+        last_peak: np.ndarray = np.maximum.accumulate(
+            np.where(values >= running_max, positions, 0),
+        )
+        return float(drawdowns.max()), int((positions - last_peak).max())
+
+    @staticmethod
+    def _rolling_sharpe(
+        returns: np.ndarray,
+        window: int,
+        periods_per_year: float,
+    ) -> np.ndarray:
+        """Calculate the annualized Sharpe ratio over a rolling window.
+
+        Args:
+            returns: Per-bar returns
+            window: Window length in bars
+            periods_per_year: Number of bars in a trading year
+
+        Returns:
+            Array aligned to returns; positions without a full window are NaN
+
+        """
+        mean: np.ndarray = (
+            TechnicalAnalysisService._rolling_sum(returns, window) / window
+        )
+        mean_sq: np.ndarray = (
+            TechnicalAnalysisService._rolling_sum(returns * returns, window) / window
+        )
+        std_dev: np.ndarray = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe: np.ndarray = mean / std_dev * np.sqrt(periods_per_year)
+        return np.where(std_dev > 0, sharpe, np.where(np.isnan(mean), np.nan, 0.0))
+
+    @staticmethod
+    def _calculate_trade_statistics(
+        transactions: list[dict[str, any]],
+    ) -> dict[str, any]:
+        """Calculate statistics over closed trades.
+
+        Each sell closes a trade. Its cost basis is the sale revenue minus the
+        realised gain, so buys do not need to be paired with sells.
+
+        Args:
+            transactions: Backtest transactions
+
+        Returns:
+            Dictionary with trade-level statistics
+
+        """
+        sells: list[dict[str, any]] = [
+            tx for tx in transactions if tx["type"] == "sell"
+        ]
+        if not sells:
+            return {
+                "trade_count": 0,
+                "win_rate_pct": 0,
+                "average_win": 0,
+                "average_loss": 0,
+                "profit_factor": None,
+                "average_trade_return_pct": 0,
+                "best_trade_return_pct": 0,
+                "worst_trade_return_pct": 0,
+            }
+
+        gains: np.ndarray = np.fromiter(
+            (tx["gain_loss"] for tx in sells),
+            dtype=np.float64,
+            count=len(sells),
         )
+        revenues: np.ndarray = np.fromiter(
+            (tx["revenue"] for tx in sells),
+            dtype=np.float64,
+            count=len(sells),
+        )
+        cost_basis: np.ndarray = revenues - gains
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trade_returns: np.ndarray = np.where(
+                cost_basis > 0,
+                gains / cost_basis * 100,
+                0.0,
+            )
+
+        wins: np.ndarray = gains[gains > 0]
+        losses: np.ndarray = gains[gains < 0]
+        gross_loss: float = float(-losses.sum())
+
+        return {
+            "trade_count": len(sells),
+            "win_rate_pct": wins.size / len(sells) * 100,
+            "average_win": float(wins.mean()) if wins.size else 0,
+            "average_loss": float(losses.mean()) if losses.size else 0,
+            # No losing trades means the ratio is unbounded
+            "profit_factor": float(wins.sum()) / gross_loss if gross_loss > 0 else None,
+            "average_trade_return_pct": float(trade_returns.mean()),
+            "best_trade_return_pct": float(trade_returns.max()),
+            "worst_trade_return_pct": float(trade_returns.min()),
+        }
 
     @staticmethod
-    def _calculate_backtest_metrics(
-        portfolio_values: list[float],
+    def _calculate_backtest_metrics(  # noqa: PLR0913
+        portfolio_values: Sequence[float] | np.ndarray,
         initial_balance: float,
         days: int,
+        periods_per_year: float = TimeConstants.TRADING_DAYS_PER_YEAR,
+        transactions: list[dict[str, any]] | None = None,
+        bars_in_market: int | None = None,
     ) -> dict[str, any]:
         """Calculate performance metrics for a backtest.
 
+        All per-bar work is done on a single float64 array, so equity curves
+        of millions of points are handled without intermediate lists.
+
         Args:
-            portfolio_values: List of portfolio values over time
+            portfolio_values: Portfolio values over time, one per bar
             initial_balance: Initial account balance
-            days: Number of days in the simulation
+            days: Number of bars in the simulation
+            periods_per_year: Number of bars in a trading year (default: daily)
+            transactions: Backtest transactions, for trade-level statistics
+            bars_in_market: Number of bars a position was held, for exposure
 
         Returns:
             Dictionary with performance metrics
 
         """
-        if not portfolio_values:
+        values: np.ndarray = np.asarray(portfolio_values, dtype=np.float64)
+        trade_statistics: dict[str, any] = BacktestService._calculate_trade_statistics(
+            transactions or [],
+        )
+        rolling_window: int = BacktestService.ROLLING_SHARPE_WINDOW
+
+        if values.size == 0:
             return {
                 "total_return_pct": 0,
                 "annualized_return_pct": 0,
                 "max_drawdown_pct": 0,
+                "max_drawdown_duration": 0,
                 "volatility": 0,
                 "sharpe_ratio": 0,
+                "sortino_ratio": 0,
+                "calmar_ratio": 0,
+                "rolling_sharpe": {
+                    "window": rolling_window,
+                    "latest": None,
+                    "mean": None,
+                    "min": None,
+                    "max": None,
+                },
+                "exposure_pct": 0,
+                "trade_statistics": trade_statistics,
             }
 
         # Calculate returns
-        final_value: float = portfolio_values[-1]
+        final_value: float = float(values[-1])
         total_return: float = (final_value - initial_balance) / initial_balance
 
-        # Annualized return (assuming 252 trading days per year)
+        # Annualized return
         if days > 0:
-            years: float = days / 252
+            years: float = days / periods_per_year
             annualized_return: float = (
                 (1 + total_return) ** (1 / years) - 1 if years > 0 else 0
             )
         else:
             annualized_return: float = 0
 
-        # Max drawdown calculation
-        max_value: float = portfolio_values[0]
-        max_drawdown: float = 0
-
-        for value in portfolio_values:
-            max_value = max(max_value, value)
-            drawdown: float = (max_value - value) / max_value if max_value > 0 else 0
-            max_drawdown = max(max_drawdown, drawdown)
-
-        # Volatility (standard deviation of daily returns)
-        daily_returns: list[float] = [
-            (portfolio_values[i] / portfolio_values[i - 1]) - 1
-            for i in range(1, len(portfolio_values))
-        ]
+        max_drawdown: float
+        max_drawdown_duration: int
+        max_drawdown, max_drawdown_duration = BacktestService._drawdown_statistics(
+            values,
+        )
 
-        if daily_returns:
-            avg_return: float = sum(daily_returns) / len(daily_returns)
-            squared_diffs: list[float] = [(r - avg_return) ** 2 for r in daily_returns]
-            variance: float = (
-                sum(squared_diffs) / len(squared_diffs) if squared_diffs else 0
-            )
-            volatility: float = variance**0.5
+        # Per-bar returns
+        returns: np.ndarray = values[1:] / values[:-1] - 1
+        annualization: float = periods_per_year**0.5
 
-            # Annualized volatility
-            volatility_annualized: float = volatility * (252**0.5)
+        if returns.size:
+            # Volatility (population standard deviation of per-bar returns)
+            volatility: float = float(returns.std())
+            volatility_annualized: float = volatility * annualization
 
             # Sharpe ratio (assuming 0% risk-free rate)
             sharpe_ratio: float = (
@@ -224,16 +433,50 @@ class BacktestService:
                 if volatility_annualized > 0
                 else 0
             )
+
+            # Sortino ratio penalises only downside deviation
+            downside: np.ndarray = np.minimum(returns, 0.0)
+            downside_annualized: float = (
+                float(np.sqrt(np.mean(downside * downside))) * annualization
+            )
+            sortino_ratio: float = (
+                annualized_return / downside_annualized
+                if downside_annualized > 0
+                else 0
+            )
+
+            rolling: np.ndarray = BacktestService._rolling_sharpe(
+                returns,
+                rolling_window,
+                periods_per_year,
+            )
+            rolling = rolling[~np.isnan(rolling)]
         else:
             volatility: float = 0
             sharpe_ratio: float = 0
+            sortino_ratio: float = 0
+            rolling = returns
 
         return {
             "total_return_pct": total_return * 100,
             "annualized_return_pct": annualized_return * 100,
             "max_drawdown_pct": max_drawdown * 100,
+            "max_drawdown_duration": max_drawdown_duration,
             "volatility": volatility * 100,
             "sharpe_ratio": sharpe_ratio,
+            "sortino_ratio": sortino_ratio,
+            "calmar_ratio": annualized_return / max_drawdown if max_drawdown > 0 else 0,
+            "rolling_sharpe": {
+                "window": rolling_window,
+                "latest": float(rolling[-1]) if rolling.size else None,
+                "mean": float(rolling.mean()) if rolling.size else None,
+                "min": float(rolling.min()) if rolling.size else None,
+                "max": float(rolling.max()) if rolling.size else None,
+            },
+            "exposure_pct": (
+                bars_in_market / values.size * 100 if bars_in_market is not None else 0
+            ),
+            "trade_statistics": trade_statistics,
         }
 
     @staticmethod
@@ -250,7 +493,6 @@ class BacktestService:
             current_price: Current stock price
             current_balance: Current account balance
             buy_threshold: Buy threshold percentage
-            allocation_percent: Allocation percentage
 
         Returns:
             True if buy conditions are met, False otherwise
@@ -280,11 +522,11 @@ class BacktestService:
         # Condition 3: Price dropped but in uptrend
         moving_averages: dict[str, any] = price_analysis.get("moving_averages", {})
         short_ma: float | None = moving_averages.get(
-            TradingServiceConstants.SHORT_MA_PERIOD,
+            PriceAnalysisConstants.SHORT_MA_PERIOD,
         )
         if short_ma:
             percent_below_ma: float = ((short_ma - current_price) / short_ma) * 100
-            ma_buy_signal: bool = is_uptrend and percent_below_ma >= buy_threshold
+            ma_buy_signal: bool = bool(is_uptrend) and percent_below_ma >= buy_threshold
         else:
             ma_buy_signal = False
 
@@ -299,7 +541,6 @@ class BacktestService:
 
         Args:
             price_analysis: Price analysis data
-            sell_threshold: Sell threshold percentage
 
         Returns:
             True if sell conditions are met, False otherwise
@@ -332,33 +573,25 @@ class BacktestService:
         return rsi_sell_signal or bollinger_sell_signal or ma_crossover_sell_signal
 
     @staticmethod
-    def backtest_strategy(
+    def _load_price_series(
         session: Session,
-        service_id: int,
-        days: int = 90,
-    ) -> dict[str, any]:
-        """Backtest a trading strategy using historical price data.
+        service: TradingService,
+        days: int,
+    ) -> tuple[list[date], list[float]]:
+        """Load the closing price series a backtest runs over.
 
         Args:
             session: Database session
-            service_id: Trading service ID
-            days: Number of days to backtest (default: 90)
+            service: Trading service being backtested
+            days: Number of days of history to load
 
         Returns:
-            Dictionary with backtest results
+            Tuple of (dates, closing prices), oldest first
 
         Raises:
-            ResourceNotFoundError: If service or stock not found
-            ValueError: If insufficient price data available
+            ResourceNotFoundError: If the service's stock is not found
 
         """
-        # Get service
-        service: TradingService = TradingServiceService.get_or_404(
-            session,
-            service_id,
-        )
-
-        # Get stock
         stock: Stock | None = StockService.find_by_symbol(
             session,
             service.stock_symbol,
@@ -375,76 +608,265 @@ class BacktestService:
         start_date: date = end_date - timedelta(days=days)
 
         # Get historical daily prices
-        price_data: list[StockDailyPrice] | None = StockService.get_price_range(
+        price_data: list[StockDailyPrice] = [
+            price
+            for price in StockService.get_price_range(
+                session,
+                stock.id,
+                start_date,
+                end_date,
+            )
+            if price.close_price is not None
+        ]
+
+        dates: list[date] = [price.price_date for price in price_data]
+        prices: list[float] = [float(price.close_price) for price in price_data]
+        return dates, prices
+
+    @staticmethod
+    def _insufficient_data_result(days_available: int) -> dict[str, any]:
+        """Build the result returned when there is too little price history.
+
+        Args:
+            days_available: Number of price bars that were found
+
+        Returns:
+            Dictionary describing the failure
+
+        """
+        return {
+            "success": False,
+            "message": (
+                f"Insufficient price data for backtest. "
+                f"Need at least {BacktestService.MIN_DAYS_FOR_SMA} days."
+            ),
+            "days_available": days_available,
+        }
+
+    @staticmethod
+    def _evaluate_parameters(
+        dates: list[date],
+        prices: list[float],
+        initial_balance: float,
+        parameters: tuple[float, float],
+    ) -> dict[str, any]:
+        """Simulate one parameter combination and summarise the outcome.
+
+        Runs in a worker process during a sweep, so it only touches the
+        price series it is given.
+
+        Args:
+            dates: Bar dates, oldest first
+            prices: Closing prices aligned with dates
+            initial_balance: Starting account balance
+            parameters: Tuple of (buy_threshold, allocation_percent)
+
+        Returns:
+            Dictionary with the parameters, final value and metrics
+
+        """
+        buy_threshold, allocation_percent = parameters
+        state = BacktestService.BacktestState(
+            current_balance=initial_balance,
+            buy_threshold=buy_threshold,
+            allocation_percent=allocation_percent,
+        )
+
+        portfolio_values: list[float]
+        transactions: list[dict[str, any]]
+        portfolio_values, transactions = BacktestService._run_simulation(
+            state,
+            zip(dates, prices, strict=True),
+        )
+
+        return {
+            "buy_threshold": buy_threshold,
+            "allocation_percent": allocation_percent,
+            "final_portfolio_value": portfolio_values[-1],
+            "transaction_count": len(transactions),
+            "metrics": BacktestService._calculate_backtest_metrics(
+                portfolio_values,
+                initial_balance,
+                len(prices),
+                transactions=transactions,
+                bars_in_market=state.bars_in_market,
+            ),
+        }
+
+    @staticmethod
+    def sweep_parameters(  # noqa: PLR0913
+        session: Session,
+        service_id: int,
+        days: int = 90,
+        buy_thresholds: list[float] | None = None,
+        allocation_percents: list[float] | None = None,
+        sort_by: str = DEFAULT_SWEEP_SORT_KEY,
+        max_workers: int | None = None,
+    ) -> dict[str, any]:
+        """Backtest a grid of strategy parameters over one price series.
+
+        The price history is loaded once and every combination of the given
+        thresholds is simulated across a process pool. Any grid left as None
+        uses the value currently stored on the service. The sell rule, like
+        the live strategy, acts on indicator signals only, so the sell
+        threshold is not part of the grid.
+
+        Args:
+            session: Database session
+            service_id: Trading service ID
+            days: Number of days to backtest (default: 90)
+            buy_thresholds: Buy threshold percentages to try
+            allocation_percents: Allocation percentages to try
+            sort_by: Metric used to rank the results (default: sharpe_ratio)
+            max_workers: Worker process count (default: CPU count, 1 runs inline)
+
+        Returns:
+            Dictionary with the ranked results of every combination
+
+        Raises:
+            ResourceNotFoundError: If service or stock not found
+            TradingServiceError: If the grid or ranking metric is invalid
+
+        """
+        if sort_by not in BacktestService.SWEEP_SORT_KEYS:
+            raise TradingServiceError(
+                TradingServiceError.SWEEP_SORT_KEY.format(sort_by),
+            )
+
+        # Get service
+        service: TradingService = TradingServiceService.get_or_404(
             session,
-            stock.id,
-            start_date,
-            end_date,
+            service_id,
         )
 
-        if not price_data or len(price_data) < BacktestService.MIN_DAYS_FOR_SMA:
-            return {
-                "success": False,
-                "message": (
-                    f"Insufficient price data for backtest. "
-                    f"Need at least {BacktestService.MIN_DAYS_FOR_SMA} days."
+        grids: dict[str, list[float]] = {
+            "buy_thresholds": buy_thresholds
+            if buy_thresholds is not None
+            else [service.buy_threshold],
+            "allocation_percents": allocation_percents
+            if allocation_percents is not None
+            else [service.allocation_percent],
+        }
+        for key, values in grids.items():
+            if not values:
+                raise TradingServiceError(TradingServiceError.SWEEP_EMPTY.format(key))
+
+        combinations: list[tuple[float, float]] = [
+            tuple(float(value) for value in combination)
+            for combination in itertools.product(*grids.values())
+        ]
+        if len(combinations) > BacktestService.MAX_SWEEP_COMBINATIONS:
+            raise TradingServiceError(
+                TradingServiceError.SWEEP_TOO_LARGE.format(
+                    len(combinations),
+                    BacktestService.MAX_SWEEP_COMBINATIONS,
                 ),
-                "days_available": len(price_data) if price_data else 0,
-            }
+            )
 
-        # Initialize backtest parameters
-        initial_balance: float = service.initial_balance
-        current_balance: float = initial_balance
-        shares_held: int = 0
-        last_buy_price: float | None = None
-        price_history: list[float] = []
-        portfolio_values: list[float] = []
-        transactions: list[dict[str, any]] = []
-        transaction: dict[str, any] | None = None
+        dates: list[date]
+        prices: list[float]
+        dates, prices = BacktestService._load_price_series(session, service, days)
 
-        # Process each day
-        for i, price in enumerate(price_data):
-            # Process this day's activity
-            params = BacktestService.BacktestDayParams(
-                price=price,
-                price_history=price_history.copy(),
-                current_balance=current_balance,
-                shares_held=shares_held,
-                last_buy_price=last_buy_price,
-                buy_threshold=service.buy_threshold,
-                sell_threshold=service.sell_threshold,
-                allocation_percent=service.allocation_percent,
-                day_index=i,
-            )
+        if len(prices) < BacktestService.MIN_DAYS_FOR_SMA:
+            return BacktestService._insufficient_data_result(len(prices))
 
-            # Execute strategy for this day
-            (
-                current_balance,
-                shares_held,
-                last_buy_price,
-                transaction,
-            ) = BacktestService._process_backtest_day(params)
+        evaluate: partial[dict[str, any]] = partial(
+            BacktestService._evaluate_parameters,
+            dates,
+            prices,
+            float(service.initial_balance),
+        )
 
-            # Record transaction if any
-            if transaction:
-                transactions.append(transaction)
+        # Small grids are not worth the cost of starting worker processes
+        if max_workers == 1 or len(combinations) == 1:
+            results: list[dict[str, any]] = [
+                evaluate(combination) for combination in combinations
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        evaluate,
+                        combinations,
+                        chunksize=BacktestService.SWEEP_CHUNK_SIZE,
+                    ),
+                )
 
-            # Update price history
-            price_history.append(float(price.close_price))
+        results.sort(
+            key=lambda result: result["metrics"][sort_by],
+            reverse=sort_by not in BacktestService.ASCENDING_SWEEP_SORT_KEYS,
+        )
+        for rank, result in enumerate(results, start=1):
+            result["rank"] = rank
 
-            # Calculate portfolio value for this day
-            portfolio_value: float = current_balance
-            if shares_held > 0:
-                portfolio_value += shares_held * float(price.close_price)
+        return {
+            "success": True,
+            "service_id": service_id,
+            "stock_symbol": service.stock_symbol,
+            "initial_balance": float(service.initial_balance),
+            "days_simulated": len(prices),
+            "sort_by": sort_by,
+            "combinations": len(results),
+            "results": results,
+        }
 
-            # Record portfolio value
-            portfolio_values.append(portfolio_value)
+    @staticmethod
+    def backtest_strategy(
+        session: Session,
+        service_id: int,
+        days: int = 90,
+    ) -> dict[str, any]:
+        """Backtest a trading strategy using historical price data.
 
-        # Calculate final metrics
-        final_portfolio_value: float = current_balance + (
-            shares_held * float(price_data[-1].close_price) if shares_held > 0 else 0
+        Args:
+            session: Database session
+            service_id: Trading service ID
+            days: Number of days to backtest (default: 90)
+
+        Returns:
+            Dictionary with backtest results
+
+        Raises:
+            ResourceNotFoundError: If service or stock not found
+            ValueError: If insufficient price data available
+
+        """
+        # Get service
+        service: TradingService = TradingServiceService.get_or_404(
+            session,
+            service_id,
+        )
+
+        dates: list[date]
+        price_history: list[float]
+        dates, price_history = BacktestService._load_price_series(
+            session,
+            service,
+            days,
+        )
+
+        if len(price_history) < BacktestService.MIN_DAYS_FOR_SMA:
+            return BacktestService._insufficient_data_result(len(price_history))
+
+        # Initialize backtest state
+        initial_balance: float = float(service.initial_balance)
+        state = BacktestService.BacktestState(
+            current_balance=initial_balance,
+            buy_threshold=float(service.buy_threshold),
+            allocation_percent=float(service.allocation_percent),
+        )
+
+        # Process each day
+        portfolio_values: list[float]
+        transactions: list[dict[str, any]]
+        portfolio_values, transactions = BacktestService._run_simulation(
+            state,
+            zip(dates, price_history, strict=True),
         )
 
+        # Calculate final metrics
+        final_portfolio_value: float = portfolio_values[-1]
+
         gain_loss: float = final_portfolio_value - initial_balance
         gain_loss_pct: float = (
             (gain_loss / initial_balance) * 100 if initial_balance > 0 else 0
@@ -454,7 +876,9 @@ class BacktestService:
         metrics: dict[str, any] = BacktestService._calculate_backtest_metrics(
             portfolio_values,
             initial_balance,
-            len(price_data),
+            len(price_history),
+            transactions=transactions,
+            bars_in_market=state.bars_in_market,
         )
 
         # Prepare result
@@ -463,17 +887,467 @@ class BacktestService:
             "service_id": service_id,
             "stock_symbol": service.stock_symbol,
             "initial_balance": initial_balance,
-            "final_balance": current_balance,
-            "final_shares": shares_held,
+            "final_balance": state.current_balance,
+            "final_shares": state.shares_held,
             "final_portfolio_value": final_portfolio_value,
             "gain_loss": gain_loss,
             "gain_loss_pct": gain_loss_pct,
-            "days_simulated": len(price_data),
+            "days_simulated": len(price_history),
             "transactions": transactions,
             "portfolio_values": portfolio_values,
-            "price_history": [float(price.close_price) for price in price_data],
-            "dates": [price.price_date.isoformat() for price in price_data],
+            "price_history": price_history,
+            "dates": [price_date.isoformat() for price_date in dates],
             "metrics": metrics,
         }
 
         return result
+
+    @staticmethod
+    def _periods_per_year(interval: int) -> float:
+        """Get the number of intraday bars in a trading year.
+
+        Args:
+            interval: Bar interval in minutes
+
+        Returns:
+            Bars per year, counting a final partial bar in each session
+
+        """
+        bars_per_day: int = math.ceil(TimeConstants.TRADING_MINUTES_PER_DAY / interval)
+        return TimeConstants.TRADING_DAYS_PER_YEAR * bars_per_day
+
+    @staticmethod
+    def backtest_intraday(
+        session: Session,
+        service_id: int,
+        days: int = 5,
+        interval: int = IntradayInterval.ONE_MINUTE.value,
+    ) -> dict[str, any]:
+        """Backtest a trading strategy on intraday bars.
+
+        Bars are streamed from the database in chunks and evaluated one at a
+        time with incremental indicators, so memory use does not depend on
+        the number of bars. Metrics are annualized for the bar interval.
+        Indicator periods are counted in bars rather than days.
+
+        Args:
+            session: Database session
+            service_id: Trading service ID
+            days: Number of calendar days to backtest (default: 5)
+            interval: Bar interval in minutes (default: 1)
+
+        Returns:
+            Dictionary with backtest results (without per-bar history)
+
+        Raises:
+            ResourceNotFoundError: If service or stock not found
+            ValidationError: If the interval is not a stored intraday interval
+
+        """
+        if interval not in IntradayInterval.valid_values():
+            raise ValidationError(IntradayInterval.invalid_value_message(interval))
+
+        # Get service
+        service: TradingService = TradingServiceService.get_or_404(
+            session,
+            service_id,
+        )
+
+        stock: Stock | None = StockService.find_by_symbol(
+            session,
+            service.stock_symbol,
+        )
+
+        if not stock:
+            raise ResourceNotFoundError(
+                TradingServiceConstants.RESOURCE_STOCK,
+                service.stock_symbol,
+            )
+
+        # Initialize backtest state
+        initial_balance: float = float(service.initial_balance)
+        state = BacktestService.BacktestState(
+            current_balance=initial_balance,
+            buy_threshold=float(service.buy_threshold),
+            allocation_percent=float(service.allocation_percent),
+        )
+
+        # Stream bars through the simulation, keeping values in a compact array
+        end_time: datetime = get_current_datetime()
+        portfolio_values: array[float]
+        transactions: list[dict[str, any]]
+        portfolio_values, transactions = BacktestService._run_simulation(
+            state,
+            IntradayPriceService.stream_close_prices(
+                session,
+                stock.id,
+                end_time - timedelta(days=days),
+                end_time,
+                interval,
+            ),
+            array("d"),
+        )
+
+        bars_simulated: int = len(portfolio_values)
+        if bars_simulated < BacktestService.MIN_DAYS_FOR_SMA:
+            return BacktestService._insufficient_data_result(bars_simulated)
+
+        final_portfolio_value: float = portfolio_values[-1]
+        gain_loss: float = final_portfolio_value - initial_balance
+        gain_loss_pct: float = (
+            (gain_loss / initial_balance) * 100 if initial_balance > 0 else 0
+        )
+
+        return {
+            "success": True,
+            "service_id": service_id,
+            "stock_symbol": service.stock_symbol,
+            "interval": interval,
+            "initial_balance": initial_balance,
+            "final_balance": state.current_balance,
+            "final_shares": state.shares_held,
+            "final_portfolio_value": final_portfolio_value,
+            "gain_loss": gain_loss,
+            "gain_loss_pct": gain_loss_pct,
+            "bars_simulated": bars_simulated,
+            "transactions": transactions,
+            "metrics": BacktestService._calculate_backtest_metrics(
+                portfolio_values,
+                initial_balance,
+                bars_simulated,
+                BacktestService._periods_per_year(interval),
+                transactions=transactions,
+                bars_in_market=state.bars_in_market,
+            ),
+        }
+
+    @staticmethod
+    def _build_price_matrix(
+        rows: list[tuple[int, date, float]],
+        stock_ids: list[int],
+    ) -> tuple[list[date], np.ndarray]:
+        """Align per-stock price rows into a date-by-stock matrix.
+
+        Missing days after a stock's first price are forward-filled, so every
+        held position can be valued on every date. Dates before a stock's
+        first price stay NaN.
+
+        Args:
+            rows: (stock_id, price_date, close_price) tuples
+            stock_ids: Stock IDs in column order
+
+        Returns:
+            Tuple of (sorted dates, matrix of shape (len(dates), len(stock_ids)))
+
+        """
+        dates: list[date] = sorted({row[1] for row in rows})
+        date_index: dict[date, int] = {day: i for i, day in enumerate(dates)}
+        column_index: dict[int, int] = {
+            stock_id: j for j, stock_id in enumerate(stock_ids)
+        }
+
+        matrix: np.ndarray = np.full((len(dates), len(stock_ids)), np.nan)
+        if not rows:
+            return dates, matrix
+
+        row_stock_ids, row_dates, row_prices = zip(*rows, strict=True)
+        matrix[
+            [date_index[day] for day in row_dates],
+            [column_index[stock_id] for stock_id in row_stock_ids],
+        ] = row_prices
+
+        # Forward-fill each column from its most recent valid row
+        last_valid: np.ndarray = np.where(
+            ~np.isnan(matrix),
+            np.arange(len(dates))[:, None],
+            0,
+        )
+        np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+        return dates, matrix[last_valid, np.arange(len(stock_ids))]
+
+    @staticmethod
+    def _portfolio_signal_masks(
+        prices: np.ndarray,
+        buy_threshold: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate the backtest buy and sell rules for every date and stock.
+
+        This is the vectorized form of _should_buy_backtest and
+        _should_sell_backtest: each cell gives the decision those rules would
+        make from the stock's price history up to that date.
+
+        Args:
+            prices: Date-by-stock price matrix
+            buy_threshold: Buy threshold percentage
+
+        Returns:
+            Tuple of boolean (buy, sell) matrices shaped like prices
+
+        """
+        buy: np.ndarray = np.zeros(prices.shape, dtype=bool)
+        sell: np.ndarray = np.zeros(prices.shape, dtype=bool)
+
+        for column in range(prices.shape[1]):
+            valid: np.ndarray = np.flatnonzero(~np.isnan(prices[:, column]))
+            if valid.size < BacktestService.MIN_DAYS_FOR_SMA:
+                continue
+
+            start: int = int(valid[0])
+            history: np.ndarray = prices[start:, column]
+            short_ma: np.ndarray = TechnicalAnalysisService.calculate_sma_series(
+                history,
+                PriceAnalysisConstants.SHORT_MA_PERIOD,
+            )
+            long_ma: np.ndarray = TechnicalAnalysisService.calculate_sma_series(
+                history,
+                PriceAnalysisConstants.LONG_MA_PERIOD,
+            )
+            rsi: np.ndarray = TechnicalAnalysisService.calculate_rsi_series(history)
+            bands: dict[str, np.ndarray] = (
+                TechnicalAnalysisService.calculate_bollinger_series(history)
+            )
+
+            # Comparisons against NaN are False, so undefined indicators never
+            # produce a signal
+            with np.errstate(divide="ignore", invalid="ignore"):
+                percent_below_ma: np.ndarray = (short_ma - history) / short_ma * 100
+            ma_buy: np.ndarray = (
+                (short_ma != 0)
+                & (short_ma > long_ma)
+                & (percent_below_ma >= buy_threshold)
+            )
+            buy_signal: np.ndarray = (
+                (rsi < PriceAnalysisConstants.RSI_OVERSOLD)
+                | (history < bands["lower"])
+                | ma_buy
+            )
+            sell_signal: np.ndarray = (
+                (rsi > PriceAnalysisConstants.RSI_OVERBOUGHT)
+                | (history > bands["upper"])
+                | (short_ma <= long_ma)
+            )
+
+            # Decisions start once the minimum history is available
+            warmup: int = BacktestService.MIN_DAYS_FOR_SMA - 1
+            buy[start + warmup :, column] = buy_signal[warmup:]
+            sell[start + warmup :, column] = sell_signal[warmup:]
+
+        return buy, sell
+
+    @staticmethod
+    def _run_portfolio_simulation(  # noqa: PLR0913
+        symbols: list[str],
+        dates: list[date],
+        prices: np.ndarray,
+        buy_signals: np.ndarray,
+        sell_signals: np.ndarray,
+        initial_balance: float,
+        allocation_percent: float,
+    ) -> dict[str, any]:
+        """Trade every stock in the portfolio from one shared cash balance.
+
+        On each date, positions with a sell signal are closed first and the
+        freed cash is then available to stocks with a buy signal, which are
+        filled in symbol order.
+
+        Args:
+            symbols: Stock symbols in column order
+            dates: Dates in row order
+            prices: Date-by-stock price matrix
+            buy_signals: Boolean buy matrix
+            sell_signals: Boolean sell matrix
+            initial_balance: Starting cash balance
+            allocation_percent: Percentage of cash to spend per buy
+
+        Returns:
+            Dictionary with final cash, shares, portfolio values, transactions
+            and the number of bars with an open position
+
+        """
+        balance: float = initial_balance
+        shares: np.ndarray = np.zeros(len(symbols))
+        last_buy_prices: np.ndarray = np.zeros(len(symbols))
+        valuation_prices: np.ndarray = np.nan_to_num(prices)
+        portfolio_values: np.ndarray = np.empty(len(dates))
+        transactions: list[dict[str, any]] = []
+        bars_in_market: int = 0
+
+        for row, bar_date in enumerate(dates):
+            held: np.ndarray = shares > 0
+
+            for column in np.flatnonzero(held & sell_signals[row]).tolist():
+                current_price: float = float(prices[row, column])
+                revenue: float = float(shares[column]) * current_price
+                balance += revenue
+                transactions.append(
+                    {
+                        "type": "sell",
+                        "symbol": symbols[column],
+                        "date": bar_date.isoformat(),
+                        "price": current_price,
+                        "revenue": revenue,
+                        "gain_loss": revenue
+                        - float(shares[column] * last_buy_prices[column]),
+                        "balance": balance,
+                    },
+                )
+                shares[column] = 0
+
+            for column in np.flatnonzero(~held & buy_signals[row]).tolist():
+                if balance <= 0:
+                    break
+                current_price = float(prices[row, column])
+                amount_to_spend: float = balance * (allocation_percent / 100.0)
+                shares_to_buy: float = (
+                    int((amount_to_spend / current_price) * 100) / 100.0
+                )
+                cost: float = shares_to_buy * current_price
+                if shares_to_buy <= 0 or cost > balance:
+                    continue
+                balance -= cost
+                shares[column] = shares_to_buy
+                last_buy_prices[column] = current_price
+                transactions.append(
+                    {
+                        "type": "buy",
+                        "symbol": symbols[column],
+                        "date": bar_date.isoformat(),
+                        "price": current_price,
+                        "shares": shares_to_buy,
+                        "cost": cost,
+                        "balance": balance,
+                    },
+                )
+
+            if shares.any():
+                bars_in_market += 1
+            portfolio_values[row] = balance + float(
+                shares @ valuation_prices[row],
+            )
+
+        return {
+            "final_balance": balance,
+            "final_positions": {
+                symbol: float(held_shares)
+                for symbol, held_shares in zip(symbols, shares, strict=True)
+                if held_shares > 0
+            },
+            "portfolio_values": portfolio_values.tolist(),
+            "transactions": transactions,
+            "bars_in_market": bars_in_market,
+        }
+
+    @staticmethod
+    def backtest_portfolio(  # noqa: PLR0913
+        session: Session,
+        symbols: list[str],
+        initial_balance: float,
+        days: int = 90,
+        buy_threshold: float = TradingServiceConstants.DEFAULT_BUY_THRESHOLD,
+        allocation_percent: float = TradingServiceConstants.DEFAULT_ALLOCATION_PERCENT,
+    ) -> dict[str, any]:
+        """Backtest the trading strategy across several stocks at once.
+
+        Prices for every symbol are loaded in one query and aligned into a
+        date-by-symbol matrix. The buy and sell rules are evaluated for all
+        symbols as signal masks, and trades draw on one shared cash balance.
+
+        Args:
+            session: Database session
+            symbols: Stock symbols to trade
+            initial_balance: Starting cash balance shared by all positions
+            days: Number of days to backtest (default: 90)
+            buy_threshold: Buy threshold percentage
+            allocation_percent: Percentage of available cash to spend per buy
+
+        Returns:
+            Dictionary with backtest results for the combined portfolio
+
+        Raises:
+            ResourceNotFoundError: If any symbol is not found
+            TradingServiceError: If the number of symbols is invalid
+
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        if not 0 < len(symbols) <= BacktestService.MAX_PORTFOLIO_SYMBOLS:
+            raise TradingServiceError(
+                TradingServiceError.PORTFOLIO_SYMBOLS.format(
+                    BacktestService.MAX_PORTFOLIO_SYMBOLS,
+                    len(symbols),
+                ),
+            )
+
+        stocks_by_symbol: dict[str, Stock] = {
+            stock.symbol: stock
+            for stock in StockService.find_by_symbols(session, symbols)
+        }
+        for symbol in symbols:
+            if symbol not in stocks_by_symbol:
+                raise ResourceNotFoundError(
+                    TradingServiceConstants.RESOURCE_STOCK,
+                    symbol,
+                )
+        stock_ids: list[int] = [stocks_by_symbol[symbol].id for symbol in symbols]
+
+        # Load every symbol's history in one query
+        end_date: date = get_current_date()
+        start_date: date = end_date - timedelta(days=days)
+        dates: list[date]
+        prices: np.ndarray
+        dates, prices = BacktestService._build_price_matrix(
+            StockService.get_close_prices_for_stocks(
+                session,
+                stock_ids,
+                start_date,
+                end_date,
+            ),
+            stock_ids,
+        )
+
+        if len(dates) < BacktestService.MIN_DAYS_FOR_SMA:
+            return BacktestService._insufficient_data_result(len(dates))
+
+        buy_signals: np.ndarray
+        sell_signals: np.ndarray
+        buy_signals, sell_signals = BacktestService._portfolio_signal_masks(
+            prices,
+            buy_threshold,
+        )
+        simulation: dict[str, any] = BacktestService._run_portfolio_simulation(
+            symbols,
+            dates,
+            prices,
+            buy_signals,
+            sell_signals,
+            initial_balance,
+            allocation_percent,
+        )
+
+        portfolio_values: list[float] = simulation["portfolio_values"]
+        final_portfolio_value: float = portfolio_values[-1]
+        gain_loss: float = final_portfolio_value - initial_balance
+        gain_loss_pct: float = (
+            (gain_loss / initial_balance) * 100 if initial_balance > 0 else 0
+        )
+
+        return {
+            "success": True,
+            "symbols": symbols,
+            "initial_balance": initial_balance,
+            "final_balance": simulation["final_balance"],
+            "final_positions": simulation["final_positions"],
+            "final_portfolio_value": final_portfolio_value,
+            "gain_loss": gain_loss,
+            "gain_loss_pct": gain_loss_pct,
+            "days_simulated": len(dates),
+            "transactions": simulation["transactions"],
+            "portfolio_values": portfolio_values,
+            "dates": [price_date.isoformat() for price_date in dates],
+            "metrics": BacktestService._calculate_backtest_metrics(
+                portfolio_values,
+                initial_balance,
+                len(dates),
+                transactions=simulation["transactions"],
+                bars_in_market=simulation["bars_in_market"],
+            ),
+        }
@@ -7,23 +7,30 @@ providing a clean API for daily stock price data management operations.
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, ClassVar
 
-from sqlalchemy import Select, and_, select
+import numpy as np
+from sqlalchemy import Select, and_, func, select
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from sqlalchemy import Result, Row
     from sqlalchemy.orm import Session
 
+    from app.services.data_providers.base import PriceColumns
+    from app.utils.row_serializer import RowSerializer
+
 from app.api.schemas.daily_price import daily_price_schema
 from app.models.enums import PriceSource
 from app.models.stock import Stock
 from app.models.stock_daily_price import StockDailyPrice
-from app.services.data_providers.yfinance_provider import (
-    get_daily_data,
-    get_latest_daily_price,
-)
+from app.services.data_providers.base import resume_start
+from app.services.data_providers.registry import get_provider
 from app.services.events import EventService
+from app.services.price_cache import price_cache
+from app.utils.constants import ExportConstants
 from app.utils.current_datetime import get_current_date, get_current_datetime
 from app.utils.errors import (
     APIError,
@@ -33,7 +40,15 @@ from app.utils.errors import (
     StockPriceError,
     ValidationError,
 )
-from app.utils.query_utils import apply_filters, apply_pagination
+from app.utils.query_utils import (
+    apply_filters,
+    apply_pagination,
+    build_upsert,
+    cached_count,
+    count_rows,
+    iter_rows,
+    keyset_page,
+)
 
 # Set up logging
 logger: logging.Logger = logging.getLogger(__name__)
@@ -56,6 +71,19 @@ class DailyPriceService:
         "max",
     ]
 
+    # Columns accepted from bulk import data
+    PRICE_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "open_price",
+        "high_price",
+        "low_price",
+        "close_price",
+        "adj_close",
+    )
+    IMPORT_COLUMNS: ClassVar[tuple[str, ...]] = (*PRICE_COLUMNS, "volume", "source")
+
+    # Columns written by price history exports
+    EXPORT_COLUMNS: ClassVar[tuple[str, ...]] = ("price_date", *IMPORT_COLUMNS)
+
     # Helper methods for error handling
     @staticmethod
     def _raise_not_found(price_id: int, price_type: str = "Daily price record") -> None:
@@ -225,12 +253,57 @@ class DailyPriceService:
         # SQLAlchemy 2.0 returns Row objects which need to be unpacked
         return [row[0] for row in result.all()]
 
+    @staticmethod
+    def stream_daily_price_partitions(
+        session: Session,
+        stock_id: int,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        chunk_size: int = ExportConstants.YIELD_PER,
+    ) -> Iterator[Sequence[Row]]:
+        """Stream the daily price history of a stock as partitions of row tuples.
+
+        Rows are read as plain tuples of EXPORT_COLUMNS from a server-side
+        cursor in chunks of chunk_size, without loading ORM instances, so
+        memory use does not grow with the length of the history.
+
+        Args:
+            session: Database session (must stay open while iterating)
+            stock_id: Stock ID
+            start_date: Optional first date to export
+            end_date: Optional last date to export
+            chunk_size: Number of rows fetched per round trip and partition
+
+        Returns:
+            Iterator of lists of rows, oldest first
+
+        """
+        query: Select = select(
+            *(
+                getattr(StockDailyPrice, column)
+                for column in DailyPriceService.EXPORT_COLUMNS
+            ),
+        ).where(StockDailyPrice.stock_id == stock_id)
+        if start_date:
+            query = query.where(StockDailyPrice.price_date >= start_date)
+        if end_date:
+            query = query.where(StockDailyPrice.price_date <= end_date)
+
+        return session.execute(
+            query.order_by(StockDailyPrice.price_date).execution_options(
+                yield_per=chunk_size,
+            ),
+        ).partitions()
+
     @staticmethod
     def get_filtered_daily_prices(
         session: Session,
         filters: dict[str, any] | None = None,
         page: int = 1,
         per_page: int = 20,
+        cursor: str | None = None,
+        *,
+        serializer: RowSerializer | None = None,
     ) -> dict[str, any]:
         """Get daily prices with filtering and pagination.
 
@@ -239,13 +312,17 @@ class DailyPriceService:
             filters: Dictionary of filters, can include stock_id, start_date, end_date
             page: Page number for pagination
             per_page: Items per page
+            cursor: Cursor of the previous page to page through the prices by
+                date instead of by page number, empty for the first page
+            serializer: Select only the fields of this serializer and return
+                its dicts as items instead of StockDailyPrice instances
 
         Returns:
             Dictionary with paginated results and metadata
 
         """
         # Build base query
-        stmt: Select[tuple[StockDailyPrice]] = select(StockDailyPrice)
+        stmt: Select = serializer.select() if serializer else select(StockDailyPrice)
 
         # Create filter arguments dictionary
         filter_args: dict[str, any] = filters or {}
@@ -253,27 +330,42 @@ class DailyPriceService:
         # Apply filters using query_utils
         stmt = apply_filters(stmt, StockDailyPrice, filter_args)
 
+        # Cursor pages seek past the previous page and need no total count
+        if cursor is not None:
+            pagination_info: dict[str, any] = apply_pagination(
+                stmt,
+                per_page=per_page,
+                keyset=(StockDailyPrice.price_date, StockDailyPrice.id),
+                cursor=cursor,
+            )
+            result: Result = session.execute(pagination_info["query"])
+            page_result: dict[str, any] = keyset_page(
+                result.all() if serializer else result.scalars().all(),
+                pagination_info,
+            )
+            if serializer:
+                page_result["items"] = serializer.dump(page_result["items"])
+            return page_result
+
         # Add ordering - simply apply the ordering without checking
         stmt = stmt.order_by(StockDailyPrice.price_date.desc())
 
         # Use query_utils.apply_pagination
         pagination_info: dict[str, any] = apply_pagination(stmt, page, per_page)
+        per_page = pagination_info["per_page"]
 
-        # Create a count query to get total count efficiently
-        from sqlalchemy import func
-
+        # Count with the same filters, reusing the count of recent pages
         count_stmt: Select[tuple[int]] = select(func.count()).select_from(
             StockDailyPrice,
         )
         count_stmt = apply_filters(count_stmt, StockDailyPrice, filter_args)
-
-        # Execute count query
-        total: int = session.execute(count_stmt).scalar() or 0
+        total: int = cached_count(session, count_stmt)
 
         # Execute paginated query
-        items: list[StockDailyPrice] = [
-            row[0] for row in session.execute(pagination_info["query"]).all()
-        ]
+        rows: Sequence[Row] = session.execute(pagination_info["query"]).all()
+        items: list[StockDailyPrice] | list[dict[str, any]] = (
+            serializer.dump(rows) if serializer else [row[0] for row in rows]
+        )
 
         # Calculate pagination metadata
         total_pages: int = (total + per_page - 1) // per_page if total > 0 else 0
@@ -361,6 +453,7 @@ class DailyPriceService:
             price_record: StockDailyPrice = StockDailyPrice.from_dict(create_data)
             session.add(price_record)
             session.commit()
+            price_cache.invalidate(stock_id)
 
             # Prepare response data
             price_data: dict[str, any] = daily_price_schema.dump(price_record)
@@ -457,6 +550,7 @@ class DailyPriceService:
             if updated:
                 price_record.updated_at = get_current_datetime()
                 session.commit()
+                price_cache.invalidate(price_record.stock_id)
 
                 # Get stock symbol for event
                 stock_symbol: str = (
@@ -522,6 +616,7 @@ class DailyPriceService:
             # Delete price record
             session.delete(price_record)
             session.commit()
+            price_cache.invalidate(price_data["stock_id"])
 
             # Emit WebSocket event
             EventService.emit_price_update(
@@ -550,7 +645,10 @@ class DailyPriceService:
         stock_id: int,
         period: str = DEFAULT_DAILY_PERIOD,
     ) -> list[StockDailyPrice]:
-        """Update daily price records for a stock by fetching data from Yahoo Finance.
+        """Update daily price records for a stock from the data provider.
+
+        If the stored prices already cover the period, only the dates from the
+        last stored one on are fetched.
 
         Args:
             session: Database session
@@ -565,18 +663,12 @@ class DailyPriceService:
             ResourceNotFoundError: If stock not found
             StockPriceError: If period is invalid
             BusinessLogicError: For other business logic errors
-            APIError: If there's an error fetching data from Yahoo Finance
+            APIError: If there's an error fetching data from the data provider
 
         """
         try:
             # Validate period
-            if period not in DailyPriceService.VALID_DAILY_PERIODS:
-                DailyPriceService._raise_validation_error(
-                    StockPriceError.INVALID_PERIOD.format(
-                        period,
-                        ", ".join(DailyPriceService.VALID_DAILY_PERIODS),
-                    ),
-                )
+            DailyPriceService._validate_period(period)
 
             # Verify stock exists and get symbol
             stock: Stock | None = session.execute(
@@ -585,29 +677,23 @@ class DailyPriceService:
             if not stock:
                 DailyPriceService._raise_not_found(stock_id, "Stock")
 
-            # Fetch daily data from Yahoo Finance
-            daily_data: list[dict[str, any]] = get_daily_data(stock.symbol, period)
-            if not daily_data:
+            # Fetch the dates missing from the stored prices
+            start: date | None = DailyPriceService.get_resume_dates(
+                session,
+                [stock_id],
+                period,
+            ).get(stock_id)
+            price_data: PriceColumns = get_provider().get_daily_data(
+                stock.symbol,
+                period,
+                start=start,
+            )
+            if not count_rows(price_data):
                 logger.warning("No daily data returned for %s", stock.symbol)
                 return []
 
-            # Convert YFinance data format to our model format
-            price_data: list[dict[str, any]] = [
-                {
-                    "price_date": item["date"],
-                    "open_price": item["open"],
-                    "high_price": item["high"],
-                    "low_price": item["low"],
-                    "close_price": item["close"],
-                    "adj_close": item["adjusted_close"],
-                    "volume": item["volume"],
-                    "source": PriceSource.HISTORICAL.value,
-                }
-                for item in daily_data
-            ]
-
-            # Bulk import the price data
-            return DailyPriceService.bulk_import_daily_prices(
+            # Bulk import the price data, refreshing dates already stored
+            return DailyPriceService.import_daily_columns(
                 session,
                 stock_id,
                 price_data,
@@ -628,6 +714,79 @@ class DailyPriceService:
                 e,
             )
 
+    @staticmethod
+    def get_resume_dates(
+        session: Session,
+        stock_ids: list[int],
+        period: str,
+    ) -> dict[int, date]:
+        """Get the dates daily price fetches of a period can resume from.
+
+        The stored date range of every stock is read with one grouped query.
+
+        Args:
+            session: Database session
+            stock_ids: Stock IDs
+            period: Time period to fetch data for
+
+        Returns:
+            Last stored price date keyed by stock ID, for the stocks whose
+            stored prices cover the period
+
+        """
+        today: date = get_current_date()
+        stored: list[tuple[int, date, date]] = session.execute(
+            select(
+                StockDailyPrice.stock_id,
+                func.min(StockDailyPrice.price_date),
+                func.max(StockDailyPrice.price_date),
+            )
+            .where(StockDailyPrice.stock_id.in_(stock_ids))
+            .group_by(StockDailyPrice.stock_id),
+        ).all()
+        starts: dict[int, date] = {}
+        for stock_id, first, last in stored:
+            start: date | None = resume_start(first, last, period, today)
+            if start is not None:
+                starts[stock_id] = start
+        return starts
+
+    @staticmethod
+    def import_daily_columns(
+        session: Session,
+        stock_id: int,
+        price_data: PriceColumns,
+    ) -> list[StockDailyPrice]:
+        """Import daily price columns fetched from a data provider.
+
+        Args:
+            session: Database session
+            stock_id: Stock ID
+            price_data: Price columns as returned by the data providers
+
+        Returns:
+            List of created or updated StockDailyPrice instances
+
+        Raises:
+            ResourceNotFoundError: If stock not found
+            ValidationError: If price data is invalid
+            BusinessLogicError: For other business logic errors
+
+        """
+        price_data["source"] = np.full(
+            count_rows(price_data),
+            PriceSource.HISTORICAL.value,
+            dtype=object,
+        )
+
+        # Refresh dates already stored, as the latest bar changes during the day
+        return DailyPriceService.bulk_import_daily_prices(
+            session,
+            stock_id,
+            price_data,
+            update_existing=True,
+        )
+
     @staticmethod
     def update_latest_daily_price(
         session: Session,
@@ -635,9 +794,8 @@ class DailyPriceService:
     ) -> StockDailyPrice:
         """Update the latest daily price record for a stock.
 
-        This method fetches the latest daily price data from Yahoo Finance and updates
-        the database. It also handles the conversion of YFinance data format to our
-        model format.
+        This method fetches the latest daily price data from the data provider and
+        updates the database.
 
         Args:
             session: Database session
@@ -649,7 +807,7 @@ class DailyPriceService:
         Raises:
             ResourceNotFoundError: If stock not found
             BusinessLogicError: For other business logic errors
-            APIError: If there's an error fetching data from Yahoo Finance
+            APIError: If there's an error fetching data from the data provider
 
         """
         try:
@@ -660,8 +818,10 @@ class DailyPriceService:
             if not stock:
                 DailyPriceService._raise_not_found(stock_id, "Stock")
 
-            # Fetch latest daily price from Yahoo Finance
-            price_data: dict[str, any] = get_latest_daily_price(stock.symbol)
+            # Fetch latest daily price from the data provider
+            price_data: dict[str, any] = get_provider().get_latest_daily_price(
+                stock.symbol
+            )
             if not price_data:
                 DailyPriceService._raise_business_error(
                     StockPriceError.NO_DAILY_PRICE_DATA_ERROR,
@@ -672,17 +832,17 @@ class DailyPriceService:
                 DailyPriceService.get_daily_price_by_date(
                     session,
                     stock_id,
-                    price_data["date"],
+                    price_data["price_date"],
                 )
             )
 
             # Create data dictionary
             data: dict[str, any] = {
-                "open_price": price_data["open"],
-                "high_price": price_data["high"],
-                "low_price": price_data["low"],
-                "close_price": price_data["close"],
-                "adj_close": price_data["adjusted_close"],
+                "open_price": price_data["open_price"],
+                "high_price": price_data["high_price"],
+                "low_price": price_data["low_price"],
+                "close_price": price_data["close_price"],
+                "adj_close": price_data["adj_close"],
                 "volume": price_data["volume"],
                 "source": PriceSource.HISTORICAL.value,
             }
@@ -694,7 +854,7 @@ class DailyPriceService:
             return DailyPriceService.create_daily_price(
                 session,
                 stock_id,
-                price_data["date"],
+                price_data["price_date"],
                 data,
             )
 
@@ -715,87 +875,149 @@ class DailyPriceService:
 
     # Bulk import helper methods
     @staticmethod
-    def _validate_daily_price_data(item: dict[str, any]) -> None:
-        """Validate a single daily price data item."""
-        if "price_date" not in item:
+    def _validate_period(period: str) -> None:
+        """Raise a ValidationError if period is not a valid daily period."""
+        if period not in DailyPriceService.VALID_DAILY_PERIODS:
             DailyPriceService._raise_validation_error(
-                StockPriceError.MISSING_PRICE_DATE,
+                StockPriceError.INVALID_PERIOD.format(
+                    period,
+                    ", ".join(DailyPriceService.VALID_DAILY_PERIODS),
+                ),
             )
 
-        if (
-            "high_price" in item
-            and "low_price" in item
-            and item["high_price"] < item["low_price"]
-        ):
-            date_str: str = item["price_date"]
+    @staticmethod
+    def _parse_price_date(price_date: date | str) -> date:
+        """Parse a price date given as a date or a YYYY-MM-DD string."""
+        if not isinstance(price_date, str):
+            return price_date
+        try:
+            return datetime.strptime(price_date + " +0000", "%Y-%m-%d %z").date()
+        except ValueError:
             DailyPriceService._raise_validation_error(
-                StockPriceError.HIGH_LOW_PRICE.format(
-                    key="high_price",
-                    value=f"{item['high_price']} < {item['low_price']} on {date_str}",
-                ),
+                StockPriceError.INVALID_DATE_FORMAT.format(price_date),
             )
 
     @staticmethod
-    def _create_daily_price_record(
-        session: Session,
+    def _prepare_daily_price_rows(
         stock_id: int,
-        item: dict[str, any],
-    ) -> StockDailyPrice | None:
-        """Create a single daily price record."""
-        # Parse date if it's a string
-        price_date: date = item["price_date"]
-        if isinstance(price_date, str):
-            try:
-                from datetime import datetime
-
-                price_date = datetime.strptime(
-                    price_date + " +0000",
-                    "%Y-%m-%d %z",
-                ).date()
-            except ValueError:
+        price_data: list[dict[str, any]] | PriceColumns,
+    ) -> list[dict[str, any]]:
+        """Build insert rows from price data, keeping the last row per date.
+
+        Args:
+            stock_id: Stock ID
+            price_data: List of price data dictionaries or price columns
+
+        Returns:
+            List of row dictionaries restricted to StockDailyPrice columns
+
+        Raises:
+            ValidationError: If a row has no price date or an invalid date
+
+        """
+        rows: dict[date, dict[str, any]] = {}
+        for row in iter_rows(
+            price_data,
+            ("price_date", *DailyPriceService.IMPORT_COLUMNS),
+        ):
+            if "price_date" not in row:
                 DailyPriceService._raise_validation_error(
-                    StockPriceError.INVALID_DATE_FORMAT.format(price_date),
+                    StockPriceError.MISSING_PRICE_DATE,
                 )
+            row["stock_id"] = stock_id
+            row["price_date"] = DailyPriceService._parse_price_date(
+                row["price_date"],
+            )
+            row.setdefault("source", PriceSource.HISTORICAL.value)
+            rows[row["price_date"]] = row
+        return list(rows.values())
 
-        # Check if price already exists for this date
-        existing: StockDailyPrice | None = DailyPriceService.get_daily_price_by_date(
-            session,
-            stock_id,
-            price_date,
-        )
-        if existing:
-            logger.warning(
-                "Skipping existing price record for stock ID %s on %s",
-                stock_id,
-                price_date,
+    @staticmethod
+    def _validate_daily_price_rows(rows: list[dict[str, any]]) -> None:
+        """Validate insert rows in one pass per column.
+
+        Applies the same rules as the StockDailyPrice validators, which bulk
+        inserts bypass: dates are not in the future, prices that are given are
+        non-negative numbers, high is not below low and sources are known.
+
+        Args:
+            rows: Row dictionaries from _prepare_daily_price_rows
+
+        Raises:
+            StockPriceError: If any row is invalid
+
+        """
+        latest: date = max(row["price_date"] for row in rows)
+        if latest > get_current_date():
+            raise StockPriceError(
+                StockPriceError.FUTURE_DATE.format("price_date", latest),
             )
-            return None
 
-        # Create data dict
-        create_data: dict[str, any] = {
-            "stock_id": stock_id,
-            "price_date": price_date,
-        }
-        create_data.update({k: v for k, v in item.items() if k != "price_date"})
+        prices: dict[str, np.ndarray] = {}
+        for key in DailyPriceService.PRICE_COLUMNS:
+            # None becomes NaN and is rejected like the model validator does;
+            # missing columns become +inf, which passes every check
+            values: np.ndarray = np.array(
+                [row.get(key, np.inf) for row in rows],
+                dtype=float,
+            )
+            invalid: np.ndarray = np.isnan(values) | (values < 0)
+            if invalid.any():
+                bad_row: dict[str, any] = rows[int(np.argmax(invalid))]
+                raise StockPriceError(
+                    StockPriceError.NEGATIVE_PRICE.format(key, bad_row.get(key)),
+                )
+            prices[key] = values
+
+        high: np.ndarray = prices["high_price"]
+        low: np.ndarray = prices["low_price"]
+        inverted: np.ndarray = np.isfinite(high) & np.isfinite(low) & (high < low)
+        if inverted.any():
+            bad_row = rows[int(np.argmax(inverted))]
+            raise StockPriceError(
+                StockPriceError.HIGH_LOW_PRICE.format(
+                    "high_price",
+                    f"{bad_row['high_price']} < {bad_row['low_price']} "
+                    f"on {bad_row['price_date']}",
+                ),
+            )
 
-        # Create price record
-        return StockDailyPrice.from_dict(create_data)
+        invalid_sources: set[str] = {row["source"] for row in rows} - set(
+            PriceSource.values(),
+        )
+        if invalid_sources:
+            raise StockPriceError(
+                StockPriceError.INVALID_SOURCE.format(
+                    "source",
+                    sorted(invalid_sources)[0],
+                ),
+            )
 
     @staticmethod
     def bulk_import_daily_prices(
         session: Session,
         stock_id: int,
-        price_data: list[dict[str, any]],
+        price_data: list[dict[str, any]] | PriceColumns,
+        *,
+        update_existing: bool = False,
     ) -> list[StockDailyPrice]:
         """Bulk import daily price records.
 
+        Rows are validated column by column, existing dates are fetched with
+        one query and all rows are written with INSERT ... ON CONFLICT on the
+        (stock_id, price_date) unique constraint.
+
         Args:
             session: Database session
             stock_id: Stock ID
-            price_data: List of price data dictionaries
+            price_data: List of price data dictionaries, or price columns as
+                returned by the data providers
+            update_existing: Overwrite records that already exist for a date
+                instead of skipping them
 
         Returns:
-            List of created StockDailyPrice instances
+            List of created StockDailyPrice instances, plus the updated ones
+            if update_existing is set
 
         Raises:
             ResourceNotFoundError: If stock not found
@@ -812,33 +1034,84 @@ class DailyPriceService:
                 DailyPriceService._raise_not_found(stock_id, "Stock")
 
             # Validate all price data first
-            for item in price_data:
-                DailyPriceService._validate_daily_price_data(item)
-
-            # Create price records
-            created_records: list[StockDailyPrice] = []
-            for item in price_data:
-                price_record: StockDailyPrice | None = (
-                    DailyPriceService._create_daily_price_record(
-                        session,
+            rows: list[dict[str, any]] = DailyPriceService._prepare_daily_price_rows(
+                stock_id,
+                price_data,
+            )
+            if not rows:
+                return []
+            DailyPriceService._validate_daily_price_rows(rows)
+
+            # Fetch the dates that already exist in the imported range
+            existing_dates: set[date] = set(
+                session.execute(
+                    select(StockDailyPrice.price_date).where(
+                        StockDailyPrice.stock_id == stock_id,
+                        StockDailyPrice.price_date.between(
+                            min(row["price_date"] for row in rows),
+                            max(row["price_date"] for row in rows),
+                        ),
+                    ),
+                ).scalars(),
+            )
+
+            update_columns: list[str] | None = None
+            if update_existing:
+                now: datetime = get_current_datetime()
+                for row in rows:
+                    row["updated_at"] = now
+                update_columns = sorted(
+                    {key for row in rows for key in row} - {"stock_id", "price_date"},
+                )
+            else:
+                new_rows: list[dict[str, any]] = [
+                    row for row in rows if row["price_date"] not in existing_dates
+                ]
+                if len(new_rows) < len(rows):
+                    logger.warning(
+                        "Skipping %s existing price records for stock ID %s",
+                        len(rows) - len(new_rows),
                         stock_id,
-                        item,
                     )
+                rows = new_rows
+
+            # Write every row with a single upsert statement. Asking for the
+            # returned rows in parameter order would make SQLite run one
+            # INSERT per row, so they are put back in input order by date.
+            records: list[StockDailyPrice] = []
+            if rows:
+                records = session.scalars(
+                    build_upsert(
+                        session,
+                        StockDailyPrice,
+                        ["stock_id", "price_date"],
+                        update_columns,
+                    ).returning(StockDailyPrice),
+                    rows,
+                    execution_options={"populate_existing": True},
+                ).all()
+                positions: dict[date, int] = {
+                    row["price_date"]: position for position, row in enumerate(rows)
+                }
+                records.sort(key=lambda record: positions[record.price_date])
+
+            # Serialize before committing so records are not reloaded one by one
+            events: list[tuple[str, dict[str, any]]] = [
+                (
+                    "updated" if record.price_date in existing_dates else "created",
+                    daily_price_schema.dump(record),
                 )
-                if price_record:
-                    session.add(price_record)
-                    created_records.append(price_record)
+                for record in records
+            ]
 
             session.commit()
+            price_cache.invalidate(stock_id)
 
-            # Emit events for created records
-            for record in created_records:
-                dumped_data: dict[str, any] = daily_price_schema.dump(record)
+            # Emit events for created and updated records
+            for action, dumped_data in events:
                 EventService.emit_price_update(
-                    action="created",
-                    price_data=(
-                        dumped_data if isinstance(dumped_data, dict) else dumped_data[0]
-                    ),
+                    action=action,
+                    price_data=dumped_data,
                     stock_symbol=stock.symbol,
                 )
 
@@ -851,9 +1124,8 @@ class DailyPriceService:
                 StockPriceError.PROCESS_DAILY_DATA_ERROR,
                 e,
             )
-        return created_records
+        return records
 
-    # Technical analysis methods
     @staticmethod
     def get_price_analysis(session: Session, stock_id: int) -> dict[str, any]:
         """Get comprehensive price analysis for trading decisions.
@@ -1007,91 +1279,13 @@ class DailyPriceService:
         Returns:
             Dictionary with results for each operation
 
-        Raises:
-            ResourceNotFoundError: If stock not found
-            BusinessLogicError: For other business logic errors
-
         """
         from app.services.intraday_price_service import IntradayPriceService
 
-        result: dict[str, any] = {
-            "daily_prices": None,
-            "intraday_prices": None,
-            "latest_daily_price": None,
-            "latest_intraday_price": None,
-        }
-
-        # Update daily prices
-        try:
-            daily_prices: list[StockDailyPrice] = (
-                DailyPriceService.update_stock_daily_prices(
-                    session,
-                    stock_id,
-                    daily_period,
-                )
-            )
-            result["daily_prices"] = {
-                "success": True,
-                "count": len(daily_prices),
-            }
-        except Exception as e:
-            logger.exception("Error updating daily prices")
-            result["daily_prices"] = {
-                "success": False,
-                "error": str(e),
-            }
-
-        # Update intraday prices
-        try:
-            intraday_prices = IntradayPriceService.update_stock_intraday_prices(
-                session,
-                stock_id,
-                intraday_interval,
-                intraday_period,
-            )
-            result["intraday_prices"] = {
-                "success": True,
-                "count": len(intraday_prices),
-            }
-        except Exception as e:
-            logger.exception("Error updating intraday prices")
-            result["intraday_prices"] = {
-                "success": False,
-                "error": str(e),
-            }
-
-        # Update latest daily price
-        try:
-            latest_daily: StockDailyPrice = DailyPriceService.update_latest_daily_price(
-                session,
-                stock_id,
-            )
-            result["latest_daily_price"] = {
-                "success": True,
-                "date": latest_daily.price_date.isoformat(),
-            }
-        except Exception as e:
-            logger.exception("Error updating latest daily price")
-            result["latest_daily_price"] = {
-                "success": False,
-                "error": str(e),
-            }
-
-        # Update latest intraday price
-        try:
-            latest_intraday = IntradayPriceService.update_latest_intraday_price(
-                session,
-                stock_id,
-            )
-            result["latest_intraday_price"] = {
-                "success": True,
-                "timestamp": latest_intraday.timestamp.isoformat(),
-            }
-        except Exception as e:
-            logger.exception("Error updating latest intraday price")
-            result["latest_intraday_price"] = {
-                "success": False,
-                "error": str(e),
-            }
-
-        return result
+        return IntradayPriceService.update_all_prices(
+            session,
+            stock_id,
+            daily_period,
+            intraday_interval,
+            intraday_period,
+        )
@@ -1,20 +1,52 @@
 """Data provider services.
 
 This package contains services for retrieving market data from external sources.
+Providers implement the DataProvider protocol and are selected through the
+registry; yfinance is the default and recorded files can be replayed offline.
 """
 
+from app.services.data_providers.base import DataProvider, PriceColumns
+from app.services.data_providers.registry import (
+    available_providers,
+    create_provider,
+    get_provider,
+    register_provider,
+    set_provider,
+)
+from app.services.data_providers.replay_provider import (
+    ReplayProvider,
+    record_history,
+)
 from app.services.data_providers.yfinance_provider import (
+    YFinanceProvider,
     get_daily_data,
+    get_daily_data_batch,
     get_intraday_data,
+    get_intraday_data_batch,
     get_latest_daily_price,
     get_latest_price,
     get_stock_info,
 )
 
+register_provider(YFinanceProvider.name, YFinanceProvider)
+register_provider(ReplayProvider.name, ReplayProvider)
+
 __all__: list[str] = [
+    "DataProvider",
+    "PriceColumns",
+    "ReplayProvider",
+    "YFinanceProvider",
+    "available_providers",
+    "create_provider",
     "get_daily_data",
+    "get_daily_data_batch",
     "get_intraday_data",
+    "get_intraday_data_batch",
     "get_latest_daily_price",
     "get_latest_price",
+    "get_provider",
     "get_stock_info",
+    "record_history",
+    "register_provider",
+    "set_provider",
 ]
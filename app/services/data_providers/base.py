@@ -0,0 +1,273 @@
+"""Interface shared by all market data providers.
+
+A data provider fetches stock information and price history from one source,
+such as the Yahoo Finance API or recorded files, and returns it in the formats
+the price services import.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Protocol, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from app.utils.constants import DataProviderConstants
+
+# Price history as model column name -> values, one entry per bar
+PriceColumns = dict[str, np.ndarray]
+
+# Stored bar time, a date for daily and a datetime for intraday history
+T = TypeVar("T", date, datetime)
+
+# History frame columns, as written by yfinance -> (model column, value type)
+HISTORY_COLUMNS: dict[str, tuple[str, type]] = {
+    "Open": ("open_price", float),
+    "High": ("high_price", float),
+    "Low": ("low_price", float),
+    "Close": ("close_price", float),
+    "Volume": ("volume", int),
+}
+
+
+def history_to_columns(hist: pd.DataFrame) -> PriceColumns:
+    """Convert a history frame to nullable price columns.
+
+    Each column is converted in one vectorized pass: values are cast to Python
+    floats or ints and NaN becomes None.
+
+    Args:
+        hist: Frame with the yfinance history columns, one row per bar
+
+    Returns:
+        Price columns keyed by model column name, without the time column
+
+    """
+    # Frames without rows may come back without any columns
+    hist = hist.reindex(columns=list(HISTORY_COLUMNS))
+
+    columns: PriceColumns = {}
+    for source, (column, value_type) in HISTORY_COLUMNS.items():
+        values: np.ndarray = hist[source].to_numpy(dtype=float)
+        missing: np.ndarray = np.isnan(values)
+        nullable: np.ndarray = (
+            np.where(missing, 0, values).astype(value_type).astype(object)
+        )
+        nullable[missing] = None
+        columns[column] = nullable
+    return columns
+
+
+def intraday_columns(hist: pd.DataFrame) -> PriceColumns:
+    """Convert an intraday history frame to price columns.
+
+    Args:
+        hist: Intraday history frame indexed by bar timestamp
+
+    Returns:
+        Price columns with a 'timestamp' column
+
+    """
+    # Empty frames come without a DatetimeIndex
+    return {
+        "timestamp": pd.DatetimeIndex(hist.index).to_pydatetime(),
+        **history_to_columns(hist),
+    }
+
+
+def daily_columns(hist: pd.DataFrame) -> PriceColumns:
+    """Convert a daily history frame to price columns.
+
+    The history is adjusted, so the close also serves as the adjusted close.
+
+    Args:
+        hist: Daily history frame indexed by bar date
+
+    Returns:
+        Price columns with 'price_date' and 'adj_close' columns
+
+    """
+    # Empty frames come without a DatetimeIndex
+    columns: PriceColumns = {
+        "price_date": pd.DatetimeIndex(hist.index).date,
+        **history_to_columns(hist),
+    }
+    columns["adj_close"] = columns["close_price"]
+    return columns
+
+
+def last_row(columns: PriceColumns) -> dict[str, any] | None:
+    """Get the most recent bar of price columns as a dictionary.
+
+    Args:
+        columns: Price columns ordered from oldest to newest
+
+    Returns:
+        Dictionary of the last value of every column, or None if empty
+
+    """
+    if not len(next(iter(columns.values()))):
+        return None
+    return {column: values[-1] for column, values in columns.items()}
+
+
+def period_start(period: str, now: T) -> T | None:
+    """Get where the window of a provider period starts.
+
+    Args:
+        period: Provider period, e.g. '5d', '1y' or 'ytd'
+        now: End of the window
+
+    Returns:
+        Start of the window, None for 'max'
+
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        start: T = now.replace(month=1, day=1)
+        if isinstance(start, datetime):
+            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        return start
+    return now - timedelta(days=DataProviderConstants.PERIOD_DAYS.get(period, 1))
+
+
+def resume_start(first: T, last: T, period: str, now: T) -> T | None:
+    """Get where a fetch of a period can resume from stored history.
+
+    Stored history can be resumed if it reaches back to the start of the
+    period window, give or take weekends and holidays, and reaches into it.
+    The fetch then starts at the last stored bar, which is fetched again as
+    it may have been stored before it closed.
+
+    Args:
+        first: Time of the first stored bar
+        last: Time of the last stored bar
+        period: Provider period to fetch
+        now: Current time, comparable with the bar times
+
+    Returns:
+        The last stored bar time, or None if the whole period must be fetched
+
+    """
+    window_start: T | None = period_start(period, now)
+    if (
+        window_start is None
+        or last < window_start
+        or first
+        > window_start + timedelta(days=DataProviderConstants.RESUME_TOLERANCE_DAYS)
+    ):
+        return None
+    return last
+
+
+def batch_resume_start(starts: dict[str, T], symbols: list[str]) -> T | None:
+    """Get where a multi-ticker fetch can resume.
+
+    Args:
+        starts: Resume times keyed by symbol, for symbols that can resume
+        symbols: Symbols fetched together
+
+    Returns:
+        The earliest resume time, or None if any symbol must be fetched in full
+
+    """
+    if not symbols or any(symbol not in starts for symbol in symbols):
+        return None
+    return min(starts[symbol] for symbol in symbols)
+
+
+def trim_history(
+    history: dict[str, PriceColumns],
+    starts: dict[str, T],
+    time_column: str,
+) -> None:
+    """Drop fetched bars before the resume time of each symbol, in place.
+
+    A multi-ticker fetch resumes at the earliest resume time of its symbols,
+    so the other symbols receive bars they already store.
+
+    Args:
+        history: Price columns keyed by symbol
+        starts: Resume times keyed by symbol, for symbols that resumed
+        time_column: 'price_date' or 'timestamp'
+
+    """
+    for symbol, columns in history.items():
+        start: T | None = starts.get(symbol)
+        if start is None:
+            continue
+        times: np.ndarray = columns[time_column]
+        keep: np.ndarray = np.fromiter(
+            (value >= start for value in times),
+            dtype=bool,
+            count=len(times),
+        )
+        history[symbol] = {column: values[keep] for column, values in columns.items()}
+
+
+class DataProvider(Protocol):
+    """Source of stock information and price history.
+
+    Price history is returned as PriceColumns: NumPy object arrays keyed by
+    model column name, ordered from oldest to newest, with missing values as
+    None. Intraday history has a 'timestamp' column and daily history a
+    'price_date' and an 'adj_close' column.
+
+    History requests take an optional start, a date for daily and a
+    timezone-aware datetime for intraday history, that narrows the period to
+    the bars from that time on.
+    """
+
+    name: str
+
+    def get_stock_info(self, symbol: str) -> dict[str, any]:
+        """Get basic information about a stock."""
+        ...
+
+    def get_intraday_data(
+        self,
+        symbol: str,
+        interval: str = "1m",
+        period: str = "1d",
+        start: datetime | None = None,
+    ) -> PriceColumns:
+        """Get intraday price history of a stock."""
+        ...
+
+    def get_latest_price(self, symbol: str) -> dict[str, any]:
+        """Get the most recent one-minute bar of a stock."""
+        ...
+
+    def get_daily_data(
+        self,
+        symbol: str,
+        period: str = "1y",
+        start: date | None = None,
+    ) -> PriceColumns:
+        """Get daily price history of a stock."""
+        ...
+
+    def get_latest_daily_price(self, symbol: str) -> dict[str, any]:
+        """Get the most recent daily bar of a stock."""
+        ...
+
+    def get_intraday_data_batch(
+        self,
+        symbols: list[str],
+        interval: str = "1m",
+        period: str = "1d",
+        start: datetime | None = None,
+    ) -> dict[str, PriceColumns]:
+        """Get intraday price history of several stocks keyed by symbol."""
+        ...
+
+    def get_daily_data_batch(
+        self,
+        symbols: list[str],
+        period: str = "1y",
+        start: date | None = None,
+    ) -> dict[str, PriceColumns]:
+        """Get daily price history of several stocks keyed by symbol."""
+        ...
@@ -0,0 +1,117 @@
+"""Registry of the available market data providers.
+
+Providers are registered by name with a factory and the price services fetch
+through the active provider returned by get_provider. The active provider
+defaults to yfinance and can be switched with set_provider, for example to
+replay recorded prices offline.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.services.data_providers.base import DataProvider
+
+from app.utils.constants import DataProviderConstants
+
+# Set up logging
+logger: logging.Logger = logging.getLogger(__name__)
+
+_factories: dict[str, Callable[..., DataProvider]] = {}
+_active: DataProvider | None = None
+_lock: threading.Lock = threading.Lock()
+
+
+def register_provider(name: str, factory: Callable[..., DataProvider]) -> None:
+    """Register a data provider factory under a name.
+
+    Args:
+        name: Name used to select the provider
+        factory: Callable creating the provider from keyword options
+
+    """
+    with _lock:
+        _factories[name] = factory
+
+
+def available_providers() -> list[str]:
+    """Get the names of the registered data providers.
+
+    Returns:
+        Sorted list of provider names
+
+    """
+    with _lock:
+        return sorted(_factories)
+
+
+def create_provider(name: str, **options: any) -> DataProvider:
+    """Create a registered data provider.
+
+    Args:
+        name: Registered provider name
+        **options: Keyword options passed to the provider factory
+
+    Returns:
+        New provider instance
+
+    Raises:
+        ValueError: If no provider is registered under the name
+
+    """
+    with _lock:
+        factory: Callable[..., DataProvider] | None = _factories.get(name)
+    if factory is None:
+        msg = (
+            f"Unknown data provider: {name}. "
+            f"Available providers are: {', '.join(available_providers())}"
+        )
+        raise ValueError(msg)
+    return factory(**options)
+
+
+def get_provider() -> DataProvider:
+    """Get the active data provider, creating the default one if needed.
+
+    Returns:
+        The active provider
+
+    """
+    global _active
+    with _lock:
+        if _active is not None:
+            return _active
+    provider: DataProvider = create_provider(DataProviderConstants.DEFAULT_PROVIDER)
+    with _lock:
+        if _active is None:
+            _active = provider
+        return _active
+
+
+def set_provider(provider: DataProvider | str, **options: any) -> DataProvider | None:
+    """Make a provider the active one.
+
+    Args:
+        provider: Provider instance, or the registered name of one to create
+        **options: Keyword options for the factory if a name is given
+
+    Returns:
+        The previously active provider, None if there was none
+
+    Raises:
+        ValueError: If a name is given that no provider is registered under
+
+    """
+    global _active
+    if isinstance(provider, str):
+        provider = create_provider(provider, **options)
+    with _lock:
+        previous: DataProvider | None = _active
+        _active = provider
+    logger.info("Using the %s data provider", provider.name)
+    return previous
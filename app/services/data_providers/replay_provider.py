@@ -0,0 +1,459 @@
+"""Data provider that replays recorded price history from local files.
+
+Recordings are read from a directory holding one file per stock and data set,
+named ``<SYMBOL>_daily`` and ``<SYMBOL>_intraday`` with a ``.parquet`` or
+``.csv`` suffix. They use the layout of a yfinance history frame written with
+``to_csv`` or ``to_parquet``: a date or timestamp index and Open, High, Low,
+Close and Volume columns. Reading Parquet requires pyarrow.
+
+Bars are released on a replay clock that starts at the first recorded bar and
+advances ``speed`` recorded seconds per wall-clock second, so ingest and
+strategies can be exercised offline at faster-than-real-time rates.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from app.services.data_providers.base import (
+    PriceColumns,
+    daily_columns,
+    intraday_columns,
+    last_row,
+    period_start,
+)
+from app.utils.constants import DataProviderConstants
+from app.utils.current_datetime import TIMEZONE
+from app.utils.errors import APIError, StockError
+from app.utils.validators import validate_stock_symbol
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Aggregation of each history column when resampling to a longer interval
+RESAMPLE_AGGREGATION: dict[str, str] = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
+
+
+class ReplayProvider:
+    """Serve recorded price history on a replay clock.
+
+    Each recording replays from its own first bar unless a common start is
+    given. With speed None the clock is disabled and every recorded bar is
+    served at once.
+    """
+
+    name: str = "replay"
+
+    def __init__(
+        self,
+        data_dir: str | Path,
+        speed: float | None = DataProviderConstants.DEFAULT_REPLAY_SPEED,
+        start: datetime | None = None,
+    ) -> None:
+        """Initialize the provider and start the replay clock.
+
+        Args:
+            data_dir: Directory containing the recorded files
+            speed: Recorded seconds replayed per wall-clock second, or None
+                to serve every bar immediately
+            start: Recorded time the clock starts at; defaults to the first
+                bar of each recording. Naive values are in market time
+
+        Raises:
+            ValueError: If data_dir is not a directory or speed is not positive
+
+        """
+        self.data_dir: Path = Path(data_dir)
+        if not self.data_dir.is_dir():
+            msg = f"Replay data directory not found: {self.data_dir}"
+            raise ValueError(msg)
+        if speed is not None and speed <= 0:
+            msg = f"Replay speed must be positive, got {speed}"
+            raise ValueError(msg)
+
+        self.speed: float | None = speed
+        self.start: datetime | None = (
+            TIMEZONE.localize(start) if start and start.tzinfo is None else start
+        )
+        self._started_at: float = time.monotonic()
+        self._frames: dict[tuple[str, str], pd.DataFrame] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get_stock_info(self, symbol: str) -> dict[str, any]:
+        """Get basic stock information derived from the recordings.
+
+        Args:
+            symbol: The ticker symbol of the stock
+
+        Returns:
+            Dictionary in the format of the yfinance provider, with the symbol
+            as name and the latest replayed close as current price
+
+        Raises:
+            StockError: If the symbol is invalid
+
+        """
+        symbol = validate_stock_symbol(symbol, StockError)
+        latest: dict[str, any] | None = last_row(self.get_daily_data(symbol, "max"))
+        return {
+            "symbol": symbol,
+            "name": symbol,
+            "sector": "",
+            "industry": "",
+            "current_price": latest["close_price"] if latest else 0.0,
+            "market_cap": 0,
+            "beta": 0.0,
+            "pe_ratio": 0.0,
+            "dividend_yield": 0.0,
+        }
+
+    def get_intraday_data(
+        self,
+        symbol: str,
+        interval: str = "1m",
+        period: str = "1d",
+        start: datetime | None = None,
+    ) -> PriceColumns:
+        """Get the replayed intraday bars of a stock.
+
+        Recorded bars are resampled to the requested interval, which should be
+        a multiple of the recorded one.
+
+        Args:
+            symbol: The ticker symbol of the stock
+            interval: The time interval between data points, e.g. '5m' or '1h'
+            period: The time period before the replay clock to return
+            start: Timezone-aware time of the first bar to return, if later
+                than the start of the period
+
+        Returns:
+            Price columns in the format of get_intraday_data of the yfinance
+            provider; empty if the stock has no intraday recording
+
+        Raises:
+            StockError: If the symbol is invalid
+
+        """
+        symbol = validate_stock_symbol(symbol, StockError)
+        hist: pd.DataFrame = self._replay(symbol, "intraday", period, start)
+        if not hist.empty:
+            hist = (
+                hist.resample(ReplayProvider._resample_rule(interval))
+                .agg(RESAMPLE_AGGREGATION)
+                # Empty bins have no prices but a zero volume sum
+                .dropna(subset=["Open", "High", "Low", "Close"], how="all")
+            )
+        return intraday_columns(hist)
+
+    def get_latest_price(self, symbol: str) -> dict[str, any]:
+        """Get the latest replayed one-minute bar of a stock.
+
+        Args:
+            symbol: The ticker symbol of the stock
+
+        Returns:
+            Dictionary containing the latest price data
+
+        Raises:
+            StockError: If the symbol is invalid
+            APIError: If no bar has been replayed yet
+
+        """
+        latest: dict[str, any] | None = last_row(self.get_intraday_data(symbol))
+        if latest is None:
+            raise APIError(APIError.NO_PRICE_DATA_ERROR, payload={"symbol": symbol})
+        return latest
+
+    def get_daily_data(
+        self,
+        symbol: str,
+        period: str = "1y",
+        start: date | None = None,
+    ) -> PriceColumns:
+        """Get the replayed daily bars of a stock.
+
+        Args:
+            symbol: The ticker symbol of the stock
+            period: The time period before the replay clock to return
+            start: Date of the first bar to return, if later than the start of
+                the period
+
+        Returns:
+            Price columns in the format of get_daily_data of the yfinance
+            provider; empty if the stock has no daily recording
+
+        Raises:
+            StockError: If the symbol is invalid
+
+        """
+        symbol = validate_stock_symbol(symbol, StockError)
+        return daily_columns(self._replay(symbol, "daily", period, start))
+
+    def get_latest_daily_price(self, symbol: str) -> dict[str, any]:
+        """Get the latest replayed daily bar of a stock.
+
+        Args:
+            symbol: The ticker symbol of the stock
+
+        Returns:
+            Dictionary containing the latest daily price data
+
+        Raises:
+            StockError: If the symbol is invalid
+            APIError: If no bar has been replayed yet
+
+        """
+        latest: dict[str, any] | None = last_row(self.get_daily_data(symbol, "5d"))
+        if latest is None:
+            raise APIError(
+                APIError.NO_DAILY_PRICE_DATA_ERROR,
+                payload={"symbol": symbol},
+            )
+        return latest
+
+    def get_intraday_data_batch(
+        self,
+        symbols: list[str],
+        interval: str = "1m",
+        period: str = "1d",
+        start: datetime | None = None,
+    ) -> dict[str, PriceColumns]:
+        """Get the replayed intraday bars of several stocks.
+
+        Args:
+            symbols: The ticker symbols of the stocks
+            interval: The time interval between data points
+            period: The time period before the replay clock to return
+            start: Timezone-aware time of the first bar to return
+
+        Returns:
+            Dictionary mapping each normalized symbol to its price columns
+
+        Raises:
+            StockError: If a symbol is invalid
+
+        """
+        return {
+            validate_stock_symbol(symbol, StockError): self.get_intraday_data(
+                symbol,
+                interval,
+                period,
+                start,
+            )
+            for symbol in symbols
+        }
+
+    def get_daily_data_batch(
+        self,
+        symbols: list[str],
+        period: str = "1y",
+        start: date | None = None,
+    ) -> dict[str, PriceColumns]:
+        """Get the replayed daily bars of several stocks.
+
+        Args:
+            symbols: The ticker symbols of the stocks
+            period: The time period before the replay clock to return
+            start: Date of the first bar to return
+
+        Returns:
+            Dictionary mapping each normalized symbol to its price columns
+
+        Raises:
+            StockError: If a symbol is invalid
+
+        """
+        return {
+            validate_stock_symbol(symbol, StockError): self.get_daily_data(
+                symbol,
+                period,
+                start,
+            )
+            for symbol in symbols
+        }
+
+    def _replay(
+        self,
+        symbol: str,
+        kind: str,
+        period: str,
+        start: date | datetime | None = None,
+    ) -> pd.DataFrame:
+        """Get the recorded bars of a stock released by the replay clock.
+
+        Args:
+            symbol: Normalized ticker symbol
+            kind: 'daily' or 'intraday'
+            period: The time period before the replay clock to return
+            start: Time of the first bar to return, if later than the start of
+                the period
+
+        Returns:
+            History frame of the bars within the period, possibly empty
+
+        """
+        hist: pd.DataFrame = self._load(symbol, kind)
+        if hist.empty:
+            return hist
+
+        # Daily bars are indexed by naive dates, intraday bars by market time
+        first: datetime = hist.index[0].to_pydatetime()
+        if self.speed is None:
+            clock: datetime = hist.index[-1].to_pydatetime()
+        else:
+            clock_start: datetime = first if self.start is None else self.start
+            if kind == "daily" and self.start is not None:
+                clock_start = clock_start.replace(tzinfo=None)
+            elapsed: float = (time.monotonic() - self._started_at) * self.speed
+            clock = clock_start + timedelta(seconds=elapsed)
+
+        window_start: datetime = period_start(period, clock) or first
+        if start is not None:
+            window_start = max(window_start, pd.Timestamp(start))
+
+        return hist.loc[window_start:clock]
+
+    def _load(self, symbol: str, kind: str) -> pd.DataFrame:
+        """Load and cache the recording of a stock.
+
+        Args:
+            symbol: Normalized ticker symbol
+            kind: 'daily' or 'intraday'
+
+        Returns:
+            History frame ordered by time, empty if there is no recording
+
+        Raises:
+            APIError: If the recording cannot be read
+
+        """
+        key: tuple[str, str] = (symbol, kind)
+        with self._lock:
+            cached: pd.DataFrame | None = self._frames.get(key)
+        if cached is not None:
+            return cached
+
+        hist: pd.DataFrame = pd.DataFrame()
+        for suffix in DataProviderConstants.REPLAY_FILE_SUFFIXES:
+            path: Path = self.data_dir / f"{symbol}_{kind}{suffix}"
+            if path.exists():
+                hist = ReplayProvider._read_recording(path, kind)
+                break
+        else:
+            logger.warning("No %s recording for %s in %s", kind, symbol, self.data_dir)
+
+        with self._lock:
+            self._frames[key] = hist
+        return hist
+
+    @staticmethod
+    def _read_recording(path: Path, kind: str) -> pd.DataFrame:
+        """Read a recorded history file.
+
+        Args:
+            path: Path of the .parquet or .csv file
+            kind: 'daily' or 'intraday'
+
+        Returns:
+            History frame indexed by naive dates for daily recordings and by
+            market-time timestamps for intraday ones
+
+        Raises:
+            APIError: If the file cannot be read or parsed
+
+        """
+        error_type: str = (
+            APIError.PROCESS_DAILY_DATA_ERROR
+            if kind == "daily"
+            else APIError.PROCESS_INTRADAY_DATA_ERROR
+        )
+        try:
+            hist: pd.DataFrame = (
+                pd.read_parquet(path)
+                if path.suffix == ".parquet"
+                else pd.read_csv(path, index_col=0)
+            )
+            hist.index = ReplayProvider._parse_index(hist.index, kind)
+        except (OSError, ImportError, ValueError, TypeError) as e:
+            logger.exception("Error reading replay recording %s", path)
+            raise APIError(error_type, payload={"path": str(path)}) from e
+        return hist.sort_index()
+
+    @staticmethod
+    def _parse_index(raw: pd.Index, kind: str) -> pd.DatetimeIndex:
+        """Parse the time index of a recording.
+
+        Args:
+            raw: Index as read from the file
+            kind: 'daily' or 'intraday'
+
+        Returns:
+            Naive dates for daily recordings and market-time timestamps for
+            intraday ones; naive recorded times are taken as market time
+
+        """
+        index: pd.DatetimeIndex
+        try:
+            index = pd.DatetimeIndex(pd.to_datetime(raw))
+        except ValueError:
+            # Offsets differ across daylight saving changes
+            index = pd.DatetimeIndex(pd.to_datetime(raw, utc=True))
+        index = (
+            index.tz_localize(TIMEZONE)
+            if index.tz is None
+            else index.tz_convert(TIMEZONE)
+        )
+        if kind == "daily":
+            return index.tz_localize(None).normalize()
+        return index
+
+    @staticmethod
+    def _resample_rule(interval: str) -> str:
+        """Convert a provider interval such as '5m' or '1h' to a pandas rule."""
+        if interval.endswith("m"):
+            return f"{interval[:-1]}min"
+        if interval.endswith("h"):
+            return f"{int(interval[:-1]) * 60}min"
+        if interval.endswith("d"):
+            return f"{interval[:-1]}D"
+        msg = f"Unsupported replay interval: {interval}"
+        raise ValueError(msg)
+
+
+def record_history(
+    hist: pd.DataFrame,
+    data_dir: str | Path,
+    symbol: str,
+    kind: str,
+    file_format: str = "csv",
+) -> Path:
+    """Write a yfinance history frame as a recording the replay provider reads.
+
+    Args:
+        hist: History frame, e.g. from yf.Ticker.history
+        data_dir: Directory to write the recording to
+        symbol: The ticker symbol of the stock
+        kind: 'daily' or 'intraday'
+        file_format: 'csv' or 'parquet'
+
+    Returns:
+        Path of the written file
+
+    """
+    path: Path = Path(data_dir) / f"{symbol.upper()}_{kind}.{file_format}"
+    if file_format == "parquet":
+        hist.to_parquet(path)
+    else:
+        hist.to_csv(path)
+    return path
@@ -2,15 +2,26 @@
 
 This module provides functionality to retrieve current and historical stock data
 from the Yahoo Finance API and map it to the application's database models.
+
+Price history is returned as columns: a dictionary of NumPy object arrays keyed
+by model column name, with missing values as None, so whole frames are
+converted without iterating over their rows.
 """
 
 import logging
+from datetime import date, datetime
 from json.decoder import JSONDecodeError
 from urllib.error import HTTPError, URLError
 
 import pandas as pd
 import yfinance as yf
 
+from app.services.data_providers.base import (
+    PriceColumns,
+    daily_columns,
+    intraday_columns,
+    last_row,
+)
 from app.utils.errors import APIError, StockError
 from app.utils.validators import validate_stock_symbol
 
@@ -105,7 +116,8 @@ def get_intraday_data(
     symbol: str,
     interval: str = "1m",
     period: str = "1d",
-) -> list[dict[str, any]]:
+    start: datetime | None = None,
+) -> PriceColumns:
     """Get intraday price data for a stock from Yahoo Finance.
 
     Args:
@@ -115,9 +127,12 @@ def get_intraday_data(
         period: The time period to fetch data for (default: '1d')
                 Options: '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y',
                 'ytd', 'max'
+        start: Timezone-aware time of the first bar to fetch, if later than the
+               start of the period
 
     Returns:
-        List of dictionaries containing intraday price data
+        Price columns with timezone-aware 'timestamp' values and open, high,
+        low and close prices and volume, ordered from oldest to newest
 
     Raises:
         StockError: If the symbol is invalid or not found
@@ -137,23 +152,14 @@ def get_intraday_data(
 
         # Get intraday data from Yahoo Finance
         ticker: yf.Ticker = yf.Ticker(symbol)
-        hist: pd.DataFrame = ticker.history(period=period, interval=interval)
-
-        # Convert to list of dictionaries
-        result: list[dict[str, any]] = []
-        for timestamp, row in hist.iterrows():
-            result.append(
-                {
-                    "timestamp": timestamp.to_pydatetime(),
-                    "open": float(row["Open"]) if not pd.isna(row["Open"]) else None,
-                    "high": float(row["High"]) if not pd.isna(row["High"]) else None,
-                    "low": float(row["Low"]) if not pd.isna(row["Low"]) else None,
-                    "close": float(row["Close"]) if not pd.isna(row["Close"]) else None,
-                    "volume": (
-                        int(row["Volume"]) if not pd.isna(row["Volume"]) else None
-                    ),
-                },
-            )
+        hist: pd.DataFrame = ticker.history(
+            period=period if start is None else None,
+            interval=interval,
+            start=start,
+        )
+
+        # Convert to price columns
+        result: PriceColumns = intraday_columns(hist)
 
     except StockError:
         # Re-raise stock validation errors
@@ -193,15 +199,16 @@ def get_latest_price(symbol: str) -> dict[str, any]:
 
     try:
         # Get intraday data (most recent 1 minute)
-        intraday_data: list[dict[str, any]] = get_intraday_data(
+        intraday_data: PriceColumns = get_intraday_data(
             symbol,
             interval="1m",
             period="1d",
         )
 
         # Return the most recent data point
-        if intraday_data:
-            return intraday_data[-1]
+        latest: dict[str, any] | None = last_row(intraday_data)
+        if latest:
+            return latest
         raise _raise_api_error(
             APIError.NO_PRICE_DATA_ERROR,
             symbol,
@@ -224,16 +231,23 @@ def get_latest_price(symbol: str) -> dict[str, any]:
         )
 
 
-def get_daily_data(symbol: str, period: str = "1y") -> list[dict[str, any]]:
+def get_daily_data(
+    symbol: str,
+    period: str = "1y",
+    start: date | None = None,
+) -> PriceColumns:
     """Get daily price data for a stock from Yahoo Finance.
 
     Args:
         symbol: The ticker symbol of the stock
         period: The time period to fetch data for (default: '1y')
                 Options: '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'
+        start: Date of the first bar to fetch, if later than the start of the
+               period
 
     Returns:
-        List of dictionaries containing daily price data
+        Price columns with 'price_date' values, open, high, low, close and
+        adjusted close prices and volume, ordered from oldest to newest
 
     Raises:
         StockError: If the symbol is invalid or not found
@@ -248,26 +262,14 @@ def get_daily_data(symbol: str, period: str = "1y") -> list[dict[str, any]]:
 
         # Get daily data from Yahoo Finance
         ticker: yf.Ticker = yf.Ticker(symbol)
-        hist: pd.DataFrame = ticker.history(period=period, interval="1d")
-
-        # Convert to list of dictionaries
-        result: list[dict[str, any]] = []
-        for timestamp, row in hist.iterrows():
-            result.append(
-                {
-                    "date": timestamp.date(),
-                    "open": float(row["Open"]) if not pd.isna(row["Open"]) else None,
-                    "high": float(row["High"]) if not pd.isna(row["High"]) else None,
-                    "low": float(row["Low"]) if not pd.isna(row["Low"]) else None,
-                    "close": float(row["Close"]) if not pd.isna(row["Close"]) else None,
-                    "volume": (
-                        int(row["Volume"]) if not pd.isna(row["Volume"]) else None
-                    ),
-                    "adjusted_close": (
-                        float(row["Close"]) if not pd.isna(row["Close"]) else None
-                    ),
-                },
-            )
+        hist: pd.DataFrame = ticker.history(
+            period=period if start is None else None,
+            interval="1d",
+            start=start,
+        )
+
+        # Convert to price columns
+        result: PriceColumns = daily_columns(hist)
 
     except StockError:
         # Re-raise stock validation errors
@@ -307,11 +309,12 @@ def get_latest_daily_price(symbol: str) -> dict[str, any]:
 
     try:
         # Get daily data (most recent)
-        daily_data: list[dict[str, any]] = get_daily_data(symbol, period="5d")
+        daily_data: PriceColumns = get_daily_data(symbol, period="5d")
 
         # Return the most recent data point
-        if daily_data:
-            return daily_data[-1]
+        latest: dict[str, any] | None = last_row(daily_data)
+        if latest:
+            return latest
         raise _raise_api_error(
             APIError.NO_DAILY_PRICE_DATA_ERROR,
             symbol,
@@ -332,3 +335,197 @@ def get_latest_daily_price(symbol: str) -> dict[str, any]:
             e,
             "Data processing error for %s",
         )
+
+
+def _download_history(
+    symbols: list[str],
+    period: str,
+    interval: str,
+    start: date | datetime | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Download the price history of several stocks in one request.
+
+    Args:
+        symbols: Validated ticker symbols
+        period: The time period to fetch data for
+        interval: The time interval between data points
+        start: Time of the first bar to fetch; the period is ignored if given
+
+    Returns:
+        Dictionary mapping each symbol to its history frame; symbols without
+        data map to an empty frame
+
+    """
+    data: pd.DataFrame | None = yf.download(
+        symbols,
+        # A period given with a start is read as the length after the start
+        period=period if start is None else None,
+        interval=interval,
+        start=start,
+        group_by="ticker",
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+    )
+    if data is None or data.empty:
+        return {symbol: pd.DataFrame() for symbol in symbols}
+
+    if not isinstance(data.columns, pd.MultiIndex):
+        # Older yfinance versions return flat columns for a single ticker
+        return {symbols[0]: data.dropna(how="all")}
+
+    # Rows are aligned across tickers, so drop the ones each symbol lacks
+    downloaded: set[str] = set(data.columns.get_level_values(0))
+    return {
+        symbol: (
+            data[symbol].dropna(how="all") if symbol in downloaded else pd.DataFrame()
+        )
+        for symbol in symbols
+    }
+
+
+def get_intraday_data_batch(
+    symbols: list[str],
+    interval: str = "1m",
+    period: str = "1d",
+    start: datetime | None = None,
+) -> dict[str, PriceColumns]:
+    """Get intraday price data for several stocks in one multi-ticker download.
+
+    Args:
+        symbols: The ticker symbols of the stocks
+        interval: The time interval between data points (default: '1m')
+        period: The time period to fetch data for (default: '1d')
+        start: Timezone-aware time of the first bar to fetch, if later than the
+               start of the period
+
+    Returns:
+        Dictionary mapping each normalized symbol to its price columns, in the
+        format returned by get_intraday_data
+
+    Raises:
+        StockError: If a symbol is invalid
+        APIError: If there's an error fetching data from Yahoo Finance
+
+    """
+    logger.info(
+        "Fetching intraday data for %s symbols with interval %s for period %s",
+        len(symbols),
+        interval,
+        period,
+    )
+
+    try:
+        # Validate and normalize symbols
+        symbols = [validate_stock_symbol(symbol, StockError) for symbol in symbols]
+        if not symbols:
+            return {}
+
+        histories: dict[str, pd.DataFrame] = _download_history(
+            symbols,
+            period,
+            interval,
+            start,
+        )
+
+        # Convert each history to price columns
+        result: dict[str, PriceColumns] = {
+            symbol: intraday_columns(hist) for symbol, hist in histories.items()
+        }
+
+    except StockError:
+        # Re-raise stock validation errors
+        raise
+    except (HTTPError, URLError, ConnectionError) as e:
+        _raise_api_error(
+            APIError.FETCH_INTRADAY_DATA_ERROR,
+            ",".join(symbols),
+            e,
+            "Network error fetching intraday data for %s",
+        )
+    except (ValueError, KeyError, AttributeError, TypeError) as e:
+        _raise_api_error(
+            APIError.PROCESS_INTRADAY_DATA_ERROR,
+            ",".join(symbols),
+            e,
+            "Data processing error for %s",
+        )
+    return result
+
+
+def get_daily_data_batch(
+    symbols: list[str],
+    period: str = "1y",
+    start: date | None = None,
+) -> dict[str, PriceColumns]:
+    """Get daily price data for several stocks in one multi-ticker download.
+
+    Args:
+        symbols: The ticker symbols of the stocks
+        period: The time period to fetch data for (default: '1y')
+        start: Date of the first bar to fetch, if later than the start of the
+               period
+
+    Returns:
+        Dictionary mapping each normalized symbol to its price columns, in the
+        format returned by get_daily_data
+
+    Raises:
+        StockError: If a symbol is invalid
+        APIError: If there's an error fetching data from Yahoo Finance
+
+    """
+    logger.info(
+        "Fetching daily data for %s symbols for period %s", len(symbols), period
+    )
+
+    try:
+        # Validate and normalize symbols
+        symbols = [validate_stock_symbol(symbol, StockError) for symbol in symbols]
+        if not symbols:
+            return {}
+
+        histories: dict[str, pd.DataFrame] = _download_history(
+            symbols,
+            period,
+            "1d",
+            start,
+        )
+
+        # Convert each history to price columns
+        result: dict[str, PriceColumns] = {
+            symbol: daily_columns(hist) for symbol, hist in histories.items()
+        }
+
+    except StockError:
+        # Re-raise stock validation errors
+        raise
+    except (HTTPError, URLError, ConnectionError) as e:
+        _raise_api_error(
+            APIError.FETCH_DAILY_DATA_ERROR,
+            ",".join(symbols),
+            e,
+            "Network error fetching daily data for %s",
+        )
+    except (ValueError, KeyError, AttributeError, TypeError) as e:
+        _raise_api_error(
+            APIError.PROCESS_DAILY_DATA_ERROR,
+            ",".join(symbols),
+            e,
+            "Data processing error for %s",
+        )
+    return result
+
+
+class YFinanceProvider:
+    """Data provider backed by the Yahoo Finance API."""
+
+    name: str = "yfinance"
+
+    get_stock_info = staticmethod(get_stock_info)
+    get_intraday_data = staticmethod(get_intraday_data)
+    get_latest_price = staticmethod(get_latest_price)
+    get_daily_data = staticmethod(get_daily_data)
+    get_latest_daily_price = staticmethod(get_latest_daily_price)
+    get_intraday_data_batch = staticmethod(get_intraday_data_batch)
+    get_daily_data_batch = staticmethod(get_daily_data_batch)
@@ -8,18 +8,23 @@ application.
 import logging
 import os
 import re
+import sqlite3
+from collections.abc import Callable
 from pathlib import Path
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, Table, create_engine, event, make_url
 from sqlalchemy.orm import Session as SQLAlchemySession
 from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy.schema import CreateTable
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 # Import Base from the shared location
 from app.models import Base
 
 # Import EventService from the events module
 from app.services.events import EventService
+from app.services.price_cache import price_cache
+from app.utils.constants import DatabaseConstants
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -28,15 +33,161 @@ DATABASE_URL: str = os.environ.get(
     "DATABASE_URL",
     "sqlite:///app/instance/daytrader.db",
 )
+# Database read-only sessions query, such as a replica of the primary
+READ_DATABASE_URL: str = os.environ.get("READ_DATABASE_URL", DATABASE_URL)
 SQL_FILE_PATH: Path = Path(__file__).parent.parent / "instance" / "database.sql"
 
+
+def get_engine_profile(url: str = DATABASE_URL) -> dict[str, any]:
+    """Get the engine profile for a database URL.
+
+    SQLite databases are tuned with connection pragmas and server databases
+    get a sized connection pool. Every setting defaults to DatabaseConstants
+    and can be overridden with the environment variable of the same name
+    prefixed with ``DB_``, e.g. ``DB_SQLITE_BUSY_TIMEOUT_MS`` or
+    ``DB_POOL_SIZE``.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Dictionary with the 'backend' name and its settings
+
+    Raises:
+        ValueError: If an overriding value is not valid for its setting
+
+    """
+    backend: str = make_url(url).get_backend_name()
+    names: tuple[str, ...] = (
+        (
+            "SQLITE_JOURNAL_MODE",
+            "SQLITE_SYNCHRONOUS",
+            "SQLITE_MMAP_SIZE",
+            "SQLITE_BUSY_TIMEOUT_MS",
+            "SQLITE_CACHE_SIZE_KB",
+        )
+        if backend == "sqlite"
+        else ("POOL_SIZE", "MAX_OVERFLOW", "POOL_TIMEOUT", "POOL_RECYCLE")
+    )
+    profile: dict[str, any] = {"backend": backend}
+    for name in names:
+        default: str | int = getattr(DatabaseConstants, name)
+        value: str | None = os.environ.get(f"DB_{name}")
+        if value is None:
+            profile[name.lower()] = default
+        elif isinstance(default, str):
+            # Modes are written into the pragma statements
+            if not value.isalpha():
+                msg = f"Invalid DB_{name}: {value!r}"
+                raise ValueError(msg)
+            profile[name.lower()] = value.upper()
+        else:
+            profile[name.lower()] = int(value)
+    return profile
+
+
+def _apply_sqlite_pragmas(
+    profile: dict[str, any],
+    *,
+    read_only: bool = False,
+) -> Callable[[sqlite3.Connection, ConnectionPoolEntry], None]:
+    """Build a connect listener applying the SQLite pragmas of a profile.
+
+    Args:
+        profile: SQLite engine profile from get_engine_profile
+        read_only: Reject writes on the connections
+
+    Returns:
+        Listener for the engine's connect event
+
+    """
+
+    def on_connect(
+        dbapi_connection: sqlite3.Connection,
+        _connection_record: ConnectionPoolEntry,
+    ) -> None:
+        cursor: sqlite3.Cursor = dbapi_connection.cursor()
+        try:
+            # WAL lets readers run alongside a writer; it is kept in the file
+            cursor.execute(f"PRAGMA journal_mode={profile['sqlite_journal_mode']}")
+            cursor.execute(f"PRAGMA synchronous={profile['sqlite_synchronous']}")
+            cursor.execute(f"PRAGMA mmap_size={profile['sqlite_mmap_size']:d}")
+            cursor.execute(
+                f"PRAGMA busy_timeout={profile['sqlite_busy_timeout_ms']:d}",
+            )
+            # Negative cache sizes are in KiB rather than pages
+            cursor.execute(f"PRAGMA cache_size=-{profile['sqlite_cache_size_kb']:d}")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
+    return on_connect
+
+
+def create_database_engine(
+    url: str = DATABASE_URL, *, read_only: bool = False
+) -> Engine:
+    """Create an engine tuned with the profile of its database URL.
+
+    Args:
+        url: Database URL
+        read_only: Reject writes on SQLite connections; server replicas are
+            expected to be read-only themselves
+
+    Returns:
+        Engine: SQLAlchemy engine instance
+
+    """
+    profile: dict[str, any] = get_engine_profile(url)
+    if profile["backend"] != "sqlite":
+        return create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=profile["pool_size"],
+            max_overflow=profile["max_overflow"],
+            pool_timeout=profile["pool_timeout"],
+            pool_recycle=profile["pool_recycle"],
+            pool_pre_ping=True,
+        )
+
+    sqlite_engine: Engine = create_engine(url)
+    event.listen(
+        sqlite_engine,
+        "connect",
+        _apply_sqlite_pragmas(profile, read_only=read_only),
+    )
+    logger.info(
+        "SQLite engine profile: journal_mode=%s, synchronous=%s",
+        profile["sqlite_journal_mode"],
+        profile["sqlite_synchronous"],
+    )
+    return sqlite_engine
+
+
 # Create engine
-engine: Engine = create_engine(DATABASE_URL)
+engine: Engine = create_database_engine(DATABASE_URL)
+
+# Reads get their own pool, so analytics queries never wait on connections held
+# by writers; in-memory databases exist only in the primary engine's connection
+read_engine: Engine = (
+    engine
+    if make_url(READ_DATABASE_URL).database in (None, "", ":memory:")
+    else create_database_engine(READ_DATABASE_URL, read_only=True)
+)
 
-# Create session factory
+# Create session factories
 session_factory: sessionmaker = sessionmaker(bind=engine)
 Session: scoped_session = scoped_session(session_factory)
 
+# Read sessions never flush or commit, and keep loaded state once closed
+read_session_factory: sessionmaker = sessionmaker(
+    bind=read_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+ReadSession: scoped_session = scoped_session(read_session_factory)
+
 
 def generate_sql_schema() -> str:
     """Generate SQL DDL statements from SQLAlchemy models.
@@ -46,9 +197,10 @@ def generate_sql_schema() -> str:
 
     """
     sql_statements: list[str] = []
+    tables: list[Table] = Base.metadata.sorted_tables
 
     # Generate CREATE TABLE statements for all models
-    for table in Base.metadata.sorted_tables:
+    for table in tables:
         create_stmt: str = str(CreateTable(table).compile(engine))
         # Add IF NOT EXISTS to make it safer
         create_stmt: str = create_stmt.replace(
@@ -57,6 +209,13 @@ def generate_sql_schema() -> str:
         )
         sql_statements.append(create_stmt + ";")
 
+    # Generate CREATE INDEX statements for the indexes declared on the models
+    sql_statements.extend(
+        str(CreateIndex(index, if_not_exists=True).compile(engine)) + ";"
+        for table in tables
+        for index in sorted(table.indexes, key=lambda index: index.name)
+    )
+
     # Add index creation statements
     sql_statements.append("\n-- Create indexes for better performance")
     sql_statements.append(
@@ -175,6 +334,7 @@ def init_db(*, reset: bool = True) -> Engine:
 
         if reset:
             Base.metadata.drop_all(engine)
+            price_cache.clear()
 
         # Create all tables
         Base.metadata.create_all(engine)
@@ -215,6 +375,16 @@ def get_session() -> SQLAlchemySession:
     return Session()
 
 
+def get_read_session() -> SQLAlchemySession:
+    """Get a new session for read-only queries on the read engine.
+
+    Returns:
+        SQLAlchemySession: A new SQLAlchemy session without autoflush
+
+    """
+    return ReadSession()
+
+
 def check_and_update_schema() -> bool:
     """Check if SQL schema matches models and update if needed.
 
@@ -234,6 +404,11 @@ def check_and_update_schema() -> bool:
     # Always ensure database tables exist
     Base.metadata.create_all(engine)
 
+    # Tables created before an index was declared do not get it from create_all
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
     EventService.emit_database_event(operation="schema_check", status="completed")
 
     return True
@@ -252,6 +252,35 @@ class EventService:
             room="data_feeds",
         )
 
+    @classmethod
+    def emit_price_refresh_progress(
+        cls,
+        status: str,
+        completed: int,
+        total: int,
+        details: dict[str, any] | None = None,
+    ) -> None:
+        """Emit progress of a price refresh across many stocks.
+
+        Args:
+            status: The refresh status ('started', 'running', 'completed')
+            completed: Number of stocks processed so far
+            total: Number of stocks being refreshed
+            details: Optional additional details, such as failure counts
+
+        """
+        payload: dict[str, any] = {
+            "status": status,
+            "completed": completed,
+            "total": total,
+        }
+
+        if details:
+            payload["details"] = details
+
+        # Emit to price refresh room
+        cls.emit("price_refresh_progress", payload, room="price_refresh")
+
     @classmethod
     def emit_error(
         cls,
@@ -7,25 +7,37 @@ providing a clean API for intraday stock price data management operations.
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import time
+from datetime import date, datetime
 from typing import TYPE_CHECKING, ClassVar
 
-from sqlalchemy import Select, and_, select
+import numpy as np
+from sqlalchemy import Select, and_, func, select
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from sqlalchemy import Insert, Row
     from sqlalchemy.orm import Session
 
+    from app.models.stock_daily_price import StockDailyPrice
+    from app.services.data_providers.base import PriceColumns
+    from app.utils.row_serializer import RowSerializer
 
 from app.api.schemas.intraday_price import intraday_price_schema
 from app.models.enums import IntradayInterval, PriceSource
 from app.models.stock import Stock
 from app.models.stock_intraday_price import StockIntradayPrice
-from app.services.data_providers.yfinance_provider import (
-    get_intraday_data,
-    get_latest_price,
+from app.services.data_providers.base import (
+    batch_resume_start,
+    resume_start,
+    trim_history,
 )
+from app.services.data_providers.registry import get_provider
 from app.services.events import EventService
-from app.utils.current_datetime import get_current_datetime
+from app.services.price_cache import price_cache
+from app.utils.constants import ExportConstants
+from app.utils.current_datetime import TIMEZONE, get_current_datetime
 from app.utils.errors import (
     APIError,
     BusinessLogicError,
@@ -34,7 +46,14 @@ from app.utils.errors import (
     StockPriceError,
     ValidationError,
 )
-from app.utils.query_utils import apply_pagination
+from app.utils.query_utils import (
+    apply_pagination,
+    build_upsert,
+    cached_count,
+    count_rows,
+    iter_rows,
+    keyset_page,
+)
 
 # Set up logging
 logger: logging.Logger = logging.getLogger(__name__)
@@ -63,6 +82,30 @@ class IntradayPriceService:
         "3mo",
     ]
 
+    # Rows fetched per round trip when streaming prices
+    STREAM_CHUNK_SIZE: ClassVar[int] = 5000
+
+    # Rows committed together, and rows per INSERT statement, when importing
+    INGEST_CHUNK_SIZE: ClassVar[int] = 5000
+    INGEST_BATCH_SIZE: ClassVar[int] = 1000
+
+    # Columns accepted from bulk import data
+    PRICE_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "open_price",
+        "high_price",
+        "low_price",
+        "close_price",
+    )
+    IMPORT_COLUMNS: ClassVar[tuple[str, ...]] = (
+        *PRICE_COLUMNS,
+        "interval",
+        "volume",
+        "source",
+    )
+
+    # Columns written by price history exports
+    EXPORT_COLUMNS: ClassVar[tuple[str, ...]] = ("timestamp", *IMPORT_COLUMNS)
+
     # Mapping of YFinance intervals to our internal interval values
     INTERVAL_MAPPING: ClassVar[dict[str, int]] = {
         "1m": IntradayInterval.ONE_MINUTE.value,
@@ -226,6 +269,100 @@ class IntradayPriceService:
         result = session.execute(query).all()
         return [row[0] for row in result]
 
+    @staticmethod
+    def stream_close_prices(
+        session: Session,
+        stock_id: int,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        interval: int = 1,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[tuple[datetime, float]]:
+        """Stream intraday closing prices for a stock in a given time range.
+
+        Rows are fetched from a server-side cursor in chunks of chunk_size, so
+        memory use does not grow with the length of the range. Bars without a
+        closing price are skipped.
+
+        Args:
+            session: Database session (must stay open while iterating)
+            stock_id: Stock ID
+            start_time: Start timestamp
+            end_time: End timestamp (defaults to current time)
+            interval: Time interval in minutes
+            chunk_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator of (timestamp, close_price) tuples, oldest first
+
+        """
+        if end_time is None:
+            end_time = get_current_datetime()
+
+        query = (
+            select(StockIntradayPrice.timestamp, StockIntradayPrice.close_price)
+            .where(
+                and_(
+                    StockIntradayPrice.stock_id == stock_id,
+                    StockIntradayPrice.timestamp >= start_time,
+                    StockIntradayPrice.timestamp <= end_time,
+                    StockIntradayPrice.interval == interval,
+                    StockIntradayPrice.close_price.is_not(None),
+                ),
+            )
+            .order_by(StockIntradayPrice.timestamp)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        return iter(session.execute(query).tuples())
+
+    @staticmethod
+    def stream_intraday_price_partitions(  # noqa: PLR0913
+        session: Session,
+        stock_id: int,
+        interval: int | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        chunk_size: int = ExportConstants.YIELD_PER,
+    ) -> Iterator[Sequence[Row]]:
+        """Stream the intraday price history of a stock as partitions of row tuples.
+
+        Rows are read as plain tuples of EXPORT_COLUMNS from a server-side
+        cursor in chunks of chunk_size, without loading ORM instances, so
+        memory use does not grow with the length of the history.
+
+        Args:
+            session: Database session (must stay open while iterating)
+            stock_id: Stock ID
+            interval: Optional time interval in minutes, all intervals if None
+            start_time: Optional first timestamp to export
+            end_time: Optional last timestamp to export
+            chunk_size: Number of rows fetched per round trip and partition
+
+        Returns:
+            Iterator of lists of rows, ordered by interval and timestamp
+
+        """
+        query: Select = select(
+            *(
+                getattr(StockIntradayPrice, column)
+                for column in IntradayPriceService.EXPORT_COLUMNS
+            ),
+        ).where(StockIntradayPrice.stock_id == stock_id)
+        if interval:
+            query = query.where(StockIntradayPrice.interval == interval)
+        if start_time:
+            query = query.where(StockIntradayPrice.timestamp >= start_time)
+        if end_time:
+            query = query.where(StockIntradayPrice.timestamp <= end_time)
+
+        return session.execute(
+            query.order_by(
+                StockIntradayPrice.interval,
+                StockIntradayPrice.timestamp,
+            ).execution_options(yield_per=chunk_size),
+        ).partitions()
+
     @staticmethod
     def get_latest_intraday_prices(
         session: Session,
@@ -313,6 +450,7 @@ class IntradayPriceService:
             # Add to session and commit
             session.add(intraday_price)
             session.commit()
+            price_cache.invalidate_intraday(stock_id)
 
             # Emit event
             dumped_data: dict[str, any] = intraday_price_schema.dump(intraday_price)
@@ -396,6 +534,7 @@ class IntradayPriceService:
 
             # Commit changes
             session.commit()
+            price_cache.invalidate_intraday(price.stock_id)
 
             # Emit event
             dumped_data: dict[str, any] = intraday_price_schema.dump(price)
@@ -456,6 +595,7 @@ class IntradayPriceService:
             # Delete price record
             session.delete(price_record)
             session.commit()
+            price_cache.invalidate_intraday(price_data["stock_id"])
 
             # Emit WebSocket event
             EventService.emit_price_update(
@@ -486,9 +626,10 @@ class IntradayPriceService:
     ) -> list[StockIntradayPrice]:
         """Update intraday price records for a stock.
 
-        This method fetches intraday price data from Yahoo Finance and updates the
-        database. It also handles the conversion of YFinance data format to our model
-        format.
+        This method fetches intraday price data from the data provider and imports
+        it into the database. If the stored bars already cover the period, only
+        the bars from the last stored one on are fetched, and the last stored
+        bar is overwritten as it may have been stored before it closed.
 
         Args:
             session: Database session
@@ -505,25 +646,12 @@ class IntradayPriceService:
             ResourceNotFoundError: If stock not found
             StockPriceError: If interval or period is invalid
             BusinessLogicError: For other business logic errors
-            APIError: If there's an error fetching data from Yahoo Finance
+            APIError: If there's an error fetching data from the data provider
 
         """
         try:
-            # Validate interval
-            if interval not in IntradayPriceService.VALID_INTRADAY_INTERVALS:
-                IntradayPriceService._raise_validation_error(
-                    StockPriceError.INVALID_INTERVAL.format(
-                        key="interval",
-                        value=interval,
-                    ),
-                )
-
-            # Validate period
-            if period not in IntradayPriceService.VALID_INTRADAY_PERIODS:
-                IntradayPriceService._raise_validation_error(
-                    f"Invalid period: {period}. Valid options are: "
-                    f"{', '.join(IntradayPriceService.VALID_INTRADAY_PERIODS)}",
-                )
+            # Validate interval and period
+            IntradayPriceService._validate_fetch_options(interval, period)
 
             # Verify stock exists and get symbol
             stock: Stock | None = session.execute(
@@ -532,39 +660,30 @@ class IntradayPriceService:
             if not stock:
                 IntradayPriceService._raise_not_found(stock_id, "Stock")
 
-            # Fetch intraday data from Yahoo Finance
-            intraday_data: list[dict[str, any]] = get_intraday_data(
+            # Fetch the bars missing from the stored prices
+            start: datetime | None = IntradayPriceService.get_resume_timestamps(
+                session,
+                [stock_id],
+                interval,
+                period,
+            ).get(stock_id)
+            price_data: PriceColumns = get_provider().get_intraday_data(
                 stock.symbol,
                 interval=interval,
                 period=period,
+                start=start,
             )
-            if not intraday_data:
+            if not count_rows(price_data):
                 logger.warning("No intraday data returned for %s", stock.symbol)
                 return []
 
-            # Get the corresponding interval value from our mapping
-            interval_value: int = IntradayPriceService.INTERVAL_MAPPING.get(interval, 1)
-
-            # Convert YFinance data format to our model format
-            price_data: list[dict[str, any]] = [
-                {
-                    "timestamp": item["timestamp"],
-                    "interval": interval_value,
-                    "open_price": item["open"],
-                    "high_price": item["high"],
-                    "low_price": item["low"],
-                    "close_price": item["close"],
-                    "volume": item["volume"],
-                    "source": PriceSource.DELAYED.value,
-                }
-                for item in intraday_data
-            ]
-
             # Bulk import the price data
-            return IntradayPriceService.bulk_import_intraday_prices(
+            return IntradayPriceService.import_intraday_columns(
                 session,
                 stock_id,
                 price_data,
+                interval,
+                update_existing=start is not None,
             )
 
         except (StockError, APIError):
@@ -582,6 +701,104 @@ class IntradayPriceService:
                 e,
             )
 
+    @staticmethod
+    def get_resume_timestamps(
+        session: Session,
+        stock_ids: list[int],
+        interval: str,
+        period: str,
+    ) -> dict[int, datetime]:
+        """Get the times intraday price fetches of a period can resume from.
+
+        The stored time range of every stock is read with one grouped query.
+
+        Args:
+            session: Database session
+            stock_ids: Stock IDs
+            interval: Time interval the bars are fetched with
+            period: Time period to fetch data for
+
+        Returns:
+            Timezone-aware time of the last stored bar keyed by stock ID, for
+            the stocks whose stored bars of the interval cover the period
+
+        """
+        now: datetime = get_current_datetime()
+        stored: list[tuple[int, datetime, datetime]] = session.execute(
+            select(
+                StockIntradayPrice.stock_id,
+                func.min(StockIntradayPrice.timestamp),
+                func.max(StockIntradayPrice.timestamp),
+            )
+            .where(
+                StockIntradayPrice.stock_id.in_(stock_ids),
+                StockIntradayPrice.interval
+                == IntradayPriceService.INTERVAL_MAPPING.get(interval, 1),
+            )
+            .group_by(StockIntradayPrice.stock_id),
+        ).all()
+        starts: dict[int, datetime] = {}
+        for stock_id, first, last in stored:
+            # Bars are stored in naive market time
+            start: datetime | None = resume_start(
+                TIMEZONE.localize(first),
+                TIMEZONE.localize(last),
+                period,
+                now,
+            )
+            if start is not None:
+                starts[stock_id] = start
+        return starts
+
+    @staticmethod
+    def import_intraday_columns(
+        session: Session,
+        stock_id: int,
+        price_data: PriceColumns,
+        interval: str,
+        *,
+        update_existing: bool = False,
+    ) -> list[StockIntradayPrice]:
+        """Import intraday price columns fetched from a data provider.
+
+        Args:
+            session: Database session
+            stock_id: Stock ID
+            price_data: Price columns as returned by the data providers
+            interval: Provider interval the bars were fetched with, e.g. '5m'
+            update_existing: Overwrite bars that already exist instead of
+                skipping them
+
+        Returns:
+            List of created StockIntradayPrice instances, plus the updated ones
+            if update_existing is set
+
+        Raises:
+            ResourceNotFoundError: If stock not found
+            ValidationError: If price data is invalid
+            BusinessLogicError: For other business logic errors
+
+        """
+        # Tag the bars with our interval value and source
+        bar_count: int = count_rows(price_data)
+        price_data["interval"] = np.full(
+            bar_count,
+            IntradayPriceService.INTERVAL_MAPPING.get(interval, 1),
+            dtype=object,
+        )
+        price_data["source"] = np.full(
+            bar_count,
+            PriceSource.DELAYED.value,
+            dtype=object,
+        )
+
+        return IntradayPriceService.bulk_import_intraday_prices(
+            session,
+            stock_id,
+            price_data,
+            update_existing=update_existing,
+        )
+
     @staticmethod
     def update_latest_intraday_price(
         session: Session,
@@ -589,9 +806,8 @@ class IntradayPriceService:
     ) -> StockIntradayPrice:
         """Update the latest intraday price record for a stock.
 
-        This method fetches the latest intraday price data from Yahoo Finance and
-        updates the database. It also handles the conversion of YFinance data format
-        to our model format.
+        This method fetches the latest intraday price data from the data provider and
+        updates the database.
 
         Args:
             session: Database session
@@ -603,7 +819,7 @@ class IntradayPriceService:
         Raises:
             ResourceNotFoundError: If stock not found
             BusinessLogicError: For other business logic errors
-            APIError: If there's an error fetching data from Yahoo Finance
+            APIError: If there's an error fetching data from the data provider
 
         """
         try:
@@ -614,8 +830,8 @@ class IntradayPriceService:
             if not stock:
                 IntradayPriceService._raise_not_found(stock_id, "Stock")
 
-            # Fetch latest price from Yahoo Finance
-            price_data: dict[str, any] = get_latest_price(stock.symbol)
+            # Fetch latest price from the data provider
+            price_data: dict[str, any] = get_provider().get_latest_price(stock.symbol)
             if not price_data:
                 IntradayPriceService._raise_business_error(
                     StockPriceError.NO_PRICE_DATA_ERROR,
@@ -633,13 +849,8 @@ class IntradayPriceService:
 
             # Create data dictionary
             data: dict[str, any] = {
-                "open_price": price_data["open"],
-                "high_price": price_data["high"],
-                "low_price": price_data["low"],
-                "close_price": price_data["close"],
-                "volume": price_data["volume"],
+                **price_data,
                 "source": PriceSource.DELAYED.value,
-                "timestamp": price_data["timestamp"],
             }
 
             if existing:
@@ -676,32 +887,32 @@ class IntradayPriceService:
 
     # Bulk import helper methods
     @staticmethod
-    def _validate_intraday_price_data(item: dict[str, any]) -> None:
-        """Validate a single intraday price data item."""
-        if "timestamp" not in item:
+    def _validate_fetch_options(interval: str, period: str) -> None:
+        """Raise a ValidationError if interval or period is not supported."""
+        if interval not in IntradayPriceService.VALID_INTRADAY_INTERVALS:
             IntradayPriceService._raise_validation_error(
-                "Each price data item must include a 'timestamp'",
+                StockPriceError.INVALID_INTERVAL.format("interval", interval),
             )
-
-        if (
-            "high_price" in item
-            and "low_price" in item
-            and item["high_price"] < item["low_price"]
-        ):
-            time_str: str = item["timestamp"]
+        if period not in IntradayPriceService.VALID_INTRADAY_PERIODS:
             IntradayPriceService._raise_validation_error(
-                f"High price cannot be less than low price for timestamp {time_str}",
+                f"Invalid period: {period}. Valid options are: "
+                f"{', '.join(IntradayPriceService.VALID_INTRADAY_PERIODS)}",
             )
 
     @staticmethod
-    def _create_intraday_price_record(
-        session: Session,
-        stock_id: int,
-        item: dict[str, any],
-    ) -> StockIntradayPrice | None:
-        """Create a single intraday price record."""
-        # Parse timestamp if it's a string
-        timestamp: datetime = item["timestamp"]
+    def _parse_timestamp(timestamp: datetime | str) -> datetime:
+        """Parse a timestamp and normalize it to naive market time.
+
+        Args:
+            timestamp: Datetime or 'YYYY-MM-DD HH:MM:SS' string (UTC)
+
+        Returns:
+            Naive datetime in the application's timezone, as it is stored
+
+        Raises:
+            ValidationError: If the timestamp string cannot be parsed
+
+        """
         if isinstance(timestamp, str):
             try:
                 timestamp = datetime.strptime(
@@ -712,55 +923,228 @@ class IntradayPriceService:
                 IntradayPriceService._raise_validation_error(
                     f"Invalid timestamp format: {timestamp}",
                 )
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(TIMEZONE).replace(tzinfo=None)
+        return timestamp
 
-        # Get interval, default to 1 minute
-        interval: int = item.get("interval", 1)
+    @staticmethod
+    def _prepare_intraday_price_rows(
+        stock_id: int,
+        price_data: list[dict[str, any]] | PriceColumns,
+    ) -> list[dict[str, any]]:
+        """Build insert rows, keeping the last row per (timestamp, interval).
 
-        # Check if price already exists for this timestamp & interval
-        existing: StockIntradayPrice | None = (
-            IntradayPriceService.get_intraday_price_by_timestamp(
-                session,
-                stock_id,
-                timestamp,
-                interval,
+        Args:
+            stock_id: Stock ID
+            price_data: List of price data dictionaries or price columns
+
+        Returns:
+            List of row dictionaries restricted to StockIntradayPrice columns,
+            ordered by timestamp
+
+        Raises:
+            ValidationError: If a row has no timestamp or an invalid timestamp
+
+        """
+        rows: dict[tuple[datetime, int], dict[str, any]] = {}
+        for row in iter_rows(
+            price_data,
+            ("timestamp", *IntradayPriceService.IMPORT_COLUMNS),
+        ):
+            if "timestamp" not in row:
+                IntradayPriceService._raise_validation_error(
+                    "Each price data item must include a 'timestamp'",
+                )
+            row["stock_id"] = stock_id
+            row["timestamp"] = IntradayPriceService._parse_timestamp(row["timestamp"])
+            row.setdefault("interval", IntradayInterval.ONE_MINUTE.value)
+            row.setdefault("source", PriceSource.DELAYED.value)
+            rows[(row["timestamp"], row["interval"])] = row
+        return sorted(rows.values(), key=lambda row: row["timestamp"])
+
+    @staticmethod
+    def _validate_intraday_price_rows(rows: list[dict[str, any]]) -> None:
+        """Validate insert rows in one pass per column.
+
+        Applies the same rules as the StockIntradayPrice validators, which bulk
+        inserts bypass, plus the high/low check of the single-row path.
+
+        Args:
+            rows: Row dictionaries from _prepare_intraday_price_rows
+
+        Raises:
+            StockPriceError: If any row is invalid
+
+        """
+        now: datetime = get_current_datetime().replace(tzinfo=None)
+        if rows[-1]["timestamp"] > now:
+            raise StockPriceError(
+                StockPriceError.FUTURE_TIMESTAMP.format(
+                    "timestamp",
+                    rows[-1]["timestamp"],
+                ),
             )
+
+        invalid_intervals: set[int] = {row["interval"] for row in rows} - set(
+            IntradayInterval.valid_values(),
         )
-        if existing:
-            logger.warning(
-                "Skipping existing intraday price record for stock ID %s at %s",
-                stock_id,
-                timestamp,
+        if invalid_intervals:
+            raise StockPriceError(
+                StockPriceError.INVALID_INTERVAL.format(
+                    "interval",
+                    min(invalid_intervals),
+                ),
             )
-            return None
 
-        # Create data dict
-        create_data: dict[str, any] = {
-            "stock_id": stock_id,
-            "timestamp": timestamp,
-            "interval": interval,
-        }
-        create_data.update(
-            {k: v for k, v in item.items() if k not in ["timestamp", "interval"]},
+        prices: dict[str, np.ndarray] = {}
+        for key in IntradayPriceService.PRICE_COLUMNS:
+            # None becomes NaN and is rejected like the model validator does;
+            # missing columns become +inf, which passes every check
+            values: np.ndarray = np.array(
+                [row.get(key, np.inf) for row in rows],
+                dtype=float,
+            )
+            invalid: np.ndarray = np.isnan(values) | (values < 0)
+            if invalid.any():
+                bad_row: dict[str, any] = rows[int(np.argmax(invalid))]
+                raise StockPriceError(
+                    StockPriceError.NEGATIVE_PRICE.format(key, bad_row.get(key)),
+                )
+            prices[key] = values
+
+        high: np.ndarray = prices["high_price"]
+        low: np.ndarray = prices["low_price"]
+        inverted: np.ndarray = np.isfinite(high) & np.isfinite(low) & (high < low)
+        if inverted.any():
+            bad_row = rows[int(np.argmax(inverted))]
+            IntradayPriceService._raise_validation_error(
+                "High price cannot be less than low price for timestamp "
+                f"{bad_row['timestamp']}",
+            )
+
+        invalid_sources: set[str] = {row["source"] for row in rows} - set(
+            PriceSource.values(),
         )
+        if invalid_sources:
+            raise StockPriceError(
+                StockPriceError.INVALID_SOURCE.format(
+                    "source",
+                    sorted(invalid_sources)[0],
+                ),
+            )
+
+    @staticmethod
+    def _write_intraday_chunk(
+        session: Session,
+        stock_id: int,
+        rows: list[dict[str, any]],
+        batch_size: int,
+        *,
+        update_existing: bool,
+    ) -> list[tuple[StockIntradayPrice, bool]]:
+        """Upsert one chunk of rows without committing.
 
-        # Create price record
-        return StockIntradayPrice.from_dict(create_data)
+        Args:
+            session: Database session
+            stock_id: Stock ID
+            rows: Validated rows ordered by timestamp
+            batch_size: Rows per INSERT statement
+            update_existing: Overwrite existing bars instead of skipping them
+
+        Returns:
+            List of (record, existed) pairs for every written row
+
+        """
+        # One range query finds the bars already stored for this chunk
+        existing: set[tuple[datetime, int]] = {
+            (timestamp, interval)
+            for timestamp, interval in session.execute(
+                select(StockIntradayPrice.timestamp, StockIntradayPrice.interval).where(
+                    StockIntradayPrice.stock_id == stock_id,
+                    StockIntradayPrice.timestamp.between(
+                        rows[0]["timestamp"],
+                        rows[-1]["timestamp"],
+                    ),
+                ),
+            )
+        }
+
+        update_columns: list[str] | None = None
+        if update_existing:
+            now: datetime = get_current_datetime()
+            for row in rows:
+                row["updated_at"] = now
+            update_columns = sorted(
+                {key for row in rows for key in row}
+                - {"stock_id", "timestamp", "interval"},
+            )
+        else:
+            rows = [
+                row
+                for row in rows
+                if (row["timestamp"], row["interval"]) not in existing
+            ]
+
+        # Asking for the returned rows in parameter order would make SQLite run
+        # one INSERT per row, so they are put back in input order by key
+        stmt: Insert = build_upsert(
+            session,
+            StockIntradayPrice,
+            ["stock_id", "timestamp", "interval"],
+            update_columns,
+        ).returning(StockIntradayPrice)
+        positions: dict[tuple[datetime, int], int] = {
+            (row["timestamp"], row["interval"]): position
+            for position, row in enumerate(rows)
+        }
+
+        written: list[tuple[StockIntradayPrice, bool]] = []
+        for batch_start in range(0, len(rows), batch_size):
+            records: list[StockIntradayPrice] = session.scalars(
+                stmt,
+                rows[batch_start : batch_start + batch_size],
+                execution_options={"populate_existing": True},
+            ).all()
+            records.sort(
+                key=lambda record: positions[(record.timestamp, record.interval)],
+            )
+            written.extend(
+                (record, (record.timestamp, record.interval) in existing)
+                for record in records
+            )
+        return written
 
     @staticmethod
-    def bulk_import_intraday_prices(
+    def bulk_import_intraday_prices(  # noqa: PLR0913
         session: Session,
         stock_id: int,
-        price_data: list[dict[str, any]],
+        price_data: list[dict[str, any]] | PriceColumns,
+        *,
+        update_existing: bool = False,
+        chunk_size: int = INGEST_CHUNK_SIZE,
+        batch_size: int = INGEST_BATCH_SIZE,
     ) -> list[StockIntradayPrice]:
-        """Bulk import intraday price records.
+        """Bulk import intraday price records in chunks.
+
+        Rows are deduplicated by (timestamp, interval) and validated column by
+        column up front. Each chunk then fetches its stored bars with one range
+        query, writes with INSERT ... ON CONFLICT in batches of batch_size rows
+        and commits, so a failure only rolls back the current chunk. The
+        throughput in rows per second is logged and emitted as a metrics event.
 
         Args:
             session: Database session
             stock_id: Stock ID
-            price_data: List of price data dictionaries
+            price_data: List of price data dictionaries, or price columns as
+                returned by the data providers
+            update_existing: Overwrite bars that already exist instead of
+                skipping them
+            chunk_size: Rows per chunk, each committed separately
+            batch_size: Rows per INSERT statement
 
         Returns:
-            List of created StockIntradayPrice instances
+            List of created StockIntradayPrice instances, plus the updated ones
+            if update_existing is set
 
         Raises:
             ResourceNotFoundError: If stock not found
@@ -768,6 +1152,8 @@ class IntradayPriceService:
             BusinessLogicError: For other business logic errors
 
         """
+        started: float = time.perf_counter()
+        written: list[StockIntradayPrice] = []
         try:
             # Verify stock exists
             stock: Stock | None = session.execute(
@@ -776,36 +1162,43 @@ class IntradayPriceService:
             if not stock:
                 IntradayPriceService._raise_not_found(stock_id, "Stock")
 
-            # Validate all price data first
-            for item in price_data:
-                IntradayPriceService._validate_intraday_price_data(item)
+            # Deduplicate and validate all price data first
+            rows: list[dict[str, any]] = (
+                IntradayPriceService._prepare_intraday_price_rows(stock_id, price_data)
+            )
+            if rows:
+                IntradayPriceService._validate_intraday_price_rows(rows)
 
-            # Create price records
-            created_records: list[StockIntradayPrice] = []
-            for item in price_data:
-                price_record: StockIntradayPrice | None = (
-                    IntradayPriceService._create_intraday_price_record(
+            for chunk_start in range(0, len(rows), chunk_size):
+                chunk: list[tuple[StockIntradayPrice, bool]] = (
+                    IntradayPriceService._write_intraday_chunk(
                         session,
                         stock_id,
-                        item,
+                        rows[chunk_start : chunk_start + chunk_size],
+                        batch_size,
+                        update_existing=update_existing,
                     )
                 )
-                if price_record:
-                    session.add(price_record)
-                    created_records.append(price_record)
-
-            session.commit()
 
-            # Emit events for created records
-            for record in created_records:
-                dumped_data: dict[str, any] = intraday_price_schema.dump(record)
-                EventService.emit_price_update(
-                    action="created",
-                    price_data=(
-                        dumped_data if isinstance(dumped_data, dict) else dumped_data[0]
-                    ),
-                    stock_symbol=stock.symbol,
-                )
+                # Serialize before committing so records are not reloaded
+                events: list[tuple[str, dict[str, any]]] = [
+                    (
+                        "updated" if existed else "created",
+                        intraday_price_schema.dump(record),
+                    )
+                    for record, existed in chunk
+                ]
+                session.commit()
+                price_cache.invalidate_intraday(stock_id)
+                written.extend(record for record, _ in chunk)
+
+                # Emit events for created and updated records
+                for action, dumped_data in events:
+                    EventService.emit_price_update(
+                        action=action,
+                        price_data=dumped_data,
+                        stock_symbol=stock.symbol,
+                    )
 
         except Exception as e:
             logger.exception("Error bulk importing intraday prices")
@@ -817,7 +1210,30 @@ class IntradayPriceService:
                 e,
             )
 
-        return created_records
+        elapsed: float = time.perf_counter() - started
+        stats: dict[str, any] = {
+            "rows_received": count_rows(price_data),
+            "rows_unique": len(rows),
+            "rows_written": len(written),
+            "chunks": -(-len(rows) // chunk_size),
+            "seconds": elapsed,
+            "rows_per_second": len(rows) / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            "Imported %s of %s intraday prices for %s in %.3fs (%.0f rows/sec)",
+            stats["rows_written"],
+            stats["rows_received"],
+            stock.symbol,
+            elapsed,
+            stats["rows_per_second"],
+        )
+        EventService.emit_metrics_update(
+            "intraday_ingest",
+            stats,
+            resource_id=stock_id,
+            resource_type="stock",
+        )
+        return written
 
     # Other query methods
     @staticmethod
@@ -826,6 +1242,9 @@ class IntradayPriceService:
         filter_options: dict[str, any] | None = None,
         page: int = 1,
         per_page: int = 20,
+        cursor: str | None = None,
+        *,
+        serializer: RowSerializer | None = None,
     ) -> dict[str, any]:
         """Get intraday prices with filtering and pagination.
 
@@ -838,57 +1257,73 @@ class IntradayPriceService:
                 - end_time: Optional end time to filter by
             page: Page number for pagination
             per_page: Items per page
+            cursor: Cursor of the previous page to page through the prices by
+                timestamp instead of by page number, empty for the first page
+            serializer: Select only the fields of this serializer and return
+                its dicts as items instead of StockIntradayPrice instances
 
         Returns:
-            Paginated query result with intraday prices
+            Paginated query result with intraday prices, with next_cursor instead
+            of the page counts when paging by cursor
 
         """
         # Initialize filter options
         filter_options = filter_options or {}
 
         # Build query using SQLAlchemy 2.0 style
-        stmt = select(StockIntradayPrice)
+        stmt = serializer.select() if serializer else select(StockIntradayPrice)
+        count_stmt = select(func.count()).select_from(StockIntradayPrice)
 
-        # Apply filters
+        # Apply the same filters to the query and the count query
         stock_id = filter_options.get("stock_id")
         interval = filter_options.get("interval")
         start_time = filter_options.get("start_time")
         end_time = filter_options.get("end_time")
 
+        conditions: list[any] = []
         if stock_id:
-            stmt = stmt.where(StockIntradayPrice.stock_id == stock_id)
+            conditions.append(StockIntradayPrice.stock_id == stock_id)
         if interval:
-            stmt = stmt.where(StockIntradayPrice.interval == interval)
+            conditions.append(StockIntradayPrice.interval == interval)
         if start_time:
-            stmt = stmt.where(StockIntradayPrice.timestamp >= start_time)
+            conditions.append(StockIntradayPrice.timestamp >= start_time)
         if end_time:
-            stmt = stmt.where(StockIntradayPrice.timestamp <= end_time)
+            conditions.append(StockIntradayPrice.timestamp <= end_time)
+        stmt = stmt.where(*conditions)
+        count_stmt = count_stmt.where(*conditions)
+
+        # Cursor pages seek past the previous page and need no total count
+        if cursor is not None:
+            pagination_info = apply_pagination(
+                stmt,
+                per_page=per_page,
+                keyset=(StockIntradayPrice.timestamp, StockIntradayPrice.id),
+                cursor=cursor,
+            )
+            result = session.execute(pagination_info["query"])
+            page_result = keyset_page(
+                result.all() if serializer else result.scalars().all(),
+                pagination_info,
+            )
+            items = page_result["items"]
+            return {
+                "items": serializer.dump(items) if serializer else items,
+                **page_result["pagination"],
+            }
 
         # Add ordering
         stmt = stmt.order_by(StockIntradayPrice.timestamp.desc())
 
         # Apply pagination
         pagination_info = apply_pagination(stmt, page, per_page)
+        per_page = pagination_info["per_page"]
 
         # Execute query and get results
-        items = [row[0] for row in session.execute(pagination_info["query"]).all()]
-
-        # Calculate total count for pagination
-        from sqlalchemy import func
-
-        count_stmt = select(func.count()).select_from(StockIntradayPrice)
-
-        # Apply the same filters to the count query
-        if stock_id:
-            count_stmt = count_stmt.where(StockIntradayPrice.stock_id == stock_id)
-        if interval:
-            count_stmt = count_stmt.where(StockIntradayPrice.interval == interval)
-        if start_time:
-            count_stmt = count_stmt.where(StockIntradayPrice.timestamp >= start_time)
-        if end_time:
-            count_stmt = count_stmt.where(StockIntradayPrice.timestamp <= end_time)
+        rows = session.execute(pagination_info["query"]).all()
+        items = serializer.dump(rows) if serializer else [row[0] for row in rows]
 
-        total = session.execute(count_stmt).scalar() or 0
+        # Reuse the count of recent pages of the same listing
+        total = cached_count(session, count_stmt)
         total_pages = (total + per_page - 1) // per_page if total > 0 else 0
 
         return {
@@ -922,93 +1357,319 @@ class IntradayPriceService:
         Returns:
             Dictionary with results for each operation
 
-        Raises:
-            ResourceNotFoundError: If stock not found
-            BusinessLogicError: For other business logic errors
+        """
+        return IntradayPriceService.update_all_prices_batch(
+            session,
+            [stock_id],
+            daily_period,
+            intraday_interval,
+            intraday_period,
+        )[stock_id]
+
+    @staticmethod
+    def update_all_prices_batch(
+        session: Session,
+        stock_ids: list[int],
+        daily_period: str = "1y",  # Default from DailyPriceService
+        intraday_interval: str = DEFAULT_INTRADAY_INTERVAL,
+        intraday_period: str = DEFAULT_INTRADAY_PERIOD,
+    ) -> dict[int, dict[str, any]]:
+        """Update all price records (daily and intraday) for several stocks.
+
+        Daily and intraday history are each fetched for all stocks with one
+        multi-ticker request and imported per stock. If the stored prices of
+        every stock cover a period, the request resumes from the earliest last
+        stored bar, and each stock only imports the bars from its own last
+        stored one on. The latest daily price and intraday bar are taken from
+        that history rather than fetched again, and written over any stored
+        record.
+
+        Args:
+            session: Database session
+            stock_ids: Stock IDs
+            daily_period: Time period for daily data
+            intraday_interval: Time interval for intraday data
+            intraday_period: Time period for intraday data
+
+        Returns:
+            Dictionary mapping each stock ID to the results of each operation,
+            in the format returned by update_all_prices
 
         """
         from app.services.daily_price_service import DailyPriceService
 
-        result: dict[str, any] = {
-            "daily_prices": None,
-            "intraday_prices": None,
-            "latest_daily_price": None,
-            "latest_intraday_price": None,
-        }
-
-        # Update daily prices
+        stocks: list[Stock] = list(
+            session.scalars(select(Stock).where(Stock.id.in_(stock_ids))),
+        )
+        results: dict[int, dict[str, any]] = {}
+        for stock_id in stock_ids:
+            error: dict[str, any] = {
+                "success": False,
+                "error": str(ResourceNotFoundError("Stock", stock_id)),
+            }
+            results[stock_id] = {
+                "daily_prices": error,
+                "intraday_prices": error,
+                "latest_daily_price": error,
+                "latest_intraday_price": error,
+            }
+        if not stocks:
+            return results
+        symbols: dict[int, str] = {stock.id: stock.symbol for stock in stocks}
+
+        # Fetch the history of every stock with one request per data set
+        daily_data: dict[str, PriceColumns] | None = None
+        intraday_data: dict[str, PriceColumns] | None = None
+        intraday_starts: dict[str, datetime] = {}
+        daily_error: str | None = None
+        intraday_error: str | None = None
         try:
-            daily_prices = DailyPriceService.update_stock_daily_prices(
-                session,
-                stock_id,
+            DailyPriceService._validate_period(daily_period)
+            daily_starts: dict[str, date] = {
+                symbols[stock_id]: start
+                for stock_id, start in DailyPriceService.get_resume_dates(
+                    session,
+                    list(symbols),
+                    daily_period,
+                ).items()
+            }
+            daily_data = get_provider().get_daily_data_batch(
+                list(symbols.values()),
                 daily_period,
+                start=batch_resume_start(daily_starts, list(symbols.values())),
             )
-            result["daily_prices"] = {
-                "success": True,
-                "count": len(daily_prices),
-            }
+            trim_history(daily_data, daily_starts, "price_date")
         except Exception as e:
-            logger.exception("Error updating daily prices")
-            result["daily_prices"] = {
-                "success": False,
-                "error": str(e),
-            }
-
-        # Update intraday prices
+            logger.exception("Error fetching daily prices")
+            daily_error = str(e)
         try:
-            intraday_prices: list[StockIntradayPrice] = (
-                IntradayPriceService.update_stock_intraday_prices(
+            IntradayPriceService._validate_fetch_options(
+                intraday_interval,
+                intraday_period,
+            )
+            intraday_starts = {
+                symbols[stock_id]: start
+                for stock_id, start in IntradayPriceService.get_resume_timestamps(
                     session,
-                    stock_id,
+                    list(symbols),
                     intraday_interval,
                     intraday_period,
-                )
-            )
-            result["intraday_prices"] = {
-                "success": True,
-                "count": len(intraday_prices),
+                ).items()
             }
+            intraday_data = get_provider().get_intraday_data_batch(
+                list(symbols.values()),
+                interval=intraday_interval,
+                period=intraday_period,
+                start=batch_resume_start(intraday_starts, list(symbols.values())),
+            )
+            trim_history(intraday_data, intraday_starts, "timestamp")
         except Exception as e:
-            logger.exception("Error updating intraday prices")
-            result["intraday_prices"] = {
+            logger.exception("Error fetching intraday prices")
+            intraday_error = str(e)
+
+        # Fan the fetched history out to each stock
+        for stock in stocks:
+            results[stock.id] = IntradayPriceService.import_fetched_history(
+                session,
+                stock,
+                (daily_data, daily_error),
+                (intraday_data, intraday_error),
+                intraday_interval,
+                intraday_resumed=stock.symbol in intraday_starts,
+            )
+
+        return results
+
+    @staticmethod
+    def import_fetched_history(
+        session: Session,
+        stock: Stock,
+        daily: tuple[dict[str, PriceColumns] | None, str | None],
+        intraday: tuple[dict[str, PriceColumns] | None, str | None],
+        intraday_interval: str,
+        *,
+        intraday_resumed: bool = False,
+    ) -> dict[str, any]:
+        """Import the batch-fetched daily and intraday history of one stock.
+
+        Args:
+            session: Database session
+            stock: Stock to import the history of
+            daily: Daily history keyed by symbol, or None if the fetch failed,
+                and the fetch error message
+            intraday: Intraday history keyed by symbol, or None if the fetch
+                failed, and the fetch error message
+            intraday_interval: Time interval the intraday data was fetched with
+            intraday_resumed: Whether the intraday history resumed from the
+                last stored bar, which it then overwrites
+
+        Returns:
+            Results of each operation, in the format returned by
+            update_all_prices
+
+        """
+        result: dict[str, any] = {}
+        daily_data, daily_error = daily
+        if daily_data is None:
+            result["daily_prices"] = result["latest_daily_price"] = {
                 "success": False,
-                "error": str(e),
+                "error": daily_error,
             }
+        else:
+            result.update(
+                IntradayPriceService.import_daily_history(
+                    session,
+                    stock,
+                    daily_data.get(stock.symbol),
+                ),
+            )
 
-        # Update latest daily price
-        try:
-            latest_daily = DailyPriceService.update_latest_daily_price(
-                session,
-                stock_id,
+        intraday_data, intraday_error = intraday
+        if intraday_data is None:
+            result["intraday_prices"] = result["latest_intraday_price"] = {
+                "success": False,
+                "error": intraday_error,
+            }
+        else:
+            result.update(
+                IntradayPriceService.import_intraday_history(
+                    session,
+                    stock,
+                    intraday_data.get(stock.symbol),
+                    intraday_interval,
+                    update_existing=intraday_resumed,
+                ),
             )
+        return result
+
+    @staticmethod
+    def import_daily_history(
+        session: Session,
+        stock: Stock,
+        price_data: PriceColumns | None,
+    ) -> dict[str, any]:
+        """Import fetched daily history and report its latest price.
+
+        Args:
+            session: Database session
+            stock: Stock the history belongs to
+            price_data: Fetched daily price columns, None if nothing was returned
+
+        Returns:
+            Results of the daily_prices and latest_daily_price operations
+
+        """
+        from app.services.daily_price_service import DailyPriceService
+
+        result: dict[str, any] = {}
+        latest_date: date | None = None
+        try:
+            daily_prices: list[StockDailyPrice] = []
+            if price_data is not None and count_rows(price_data):
+                daily_prices = DailyPriceService.import_daily_columns(
+                    session,
+                    stock.id,
+                    price_data,
+                )
+                # Every fetched date is written, so take the latest one from the
+                # columns rather than reloading each record expired by the commit
+                latest_date = max(
+                    DailyPriceService._parse_price_date(price_date)
+                    for price_date in price_data["price_date"]
+                )
+            result["daily_prices"] = {"success": True, "count": len(daily_prices)}
+        except Exception as e:
+            logger.exception("Error updating daily prices for %s", stock.symbol)
+            session.rollback()
+            result["daily_prices"] = {"success": False, "error": str(e)}
+            daily_prices = []
+
+        # The import already refreshed the latest date, so only report it
+        if daily_prices:
             result["latest_daily_price"] = {
                 "success": True,
-                "date": latest_daily.price_date.isoformat(),
+                "date": latest_date.isoformat(),
             }
-        except Exception as e:
-            logger.exception("Error updating latest daily price")
+        else:
             result["latest_daily_price"] = {
                 "success": False,
-                "error": str(e),
+                "error": result["daily_prices"].get(
+                    "error",
+                    StockPriceError.NO_DAILY_PRICE_DATA_ERROR,
+                ),
+            }
+        return result
+
+    @staticmethod
+    def import_intraday_history(
+        session: Session,
+        stock: Stock,
+        price_data: PriceColumns | None,
+        interval: str,
+        *,
+        update_existing: bool = False,
+    ) -> dict[str, any]:
+        """Import fetched intraday history and refresh its latest bar.
+
+        Args:
+            session: Database session
+            stock: Stock the history belongs to
+            price_data: Fetched intraday price columns, None if nothing was
+                returned
+            interval: Provider interval the bars were fetched with
+            update_existing: Overwrite every stored bar, as when the history
+                resumed from the last stored bar
+
+        Returns:
+            Results of the intraday_prices and latest_intraday_price operations
+
+        """
+        result: dict[str, any] = {}
+        if price_data is None or not count_rows(price_data):
+            result["intraday_prices"] = {"success": True, "count": 0}
+            result["latest_intraday_price"] = {
+                "success": False,
+                "error": StockPriceError.NO_PRICE_DATA_ERROR,
             }
+            return result
 
-        # Update latest intraday price
+        # The latest bar may still be forming, so it overwrites a stored one
+        latest_data: PriceColumns = {
+            column: values[-1:] for column, values in price_data.items()
+        }
         try:
-            latest_intraday: StockIntradayPrice = (
-                IntradayPriceService.update_latest_intraday_price(
+            intraday_prices: list[StockIntradayPrice] = (
+                IntradayPriceService.import_intraday_columns(
                     session,
-                    stock_id,
+                    stock.id,
+                    price_data,
+                    interval,
+                    update_existing=update_existing,
                 )
             )
-            result["latest_intraday_price"] = {
+            result["intraday_prices"] = {
                 "success": True,
-                "timestamp": latest_intraday.timestamp.isoformat(),
+                "count": len(intraday_prices),
             }
-        except Exception as e:
-            logger.exception("Error updating latest intraday price")
+            latest: list[StockIntradayPrice] = (
+                intraday_prices[-1:]
+                if update_existing
+                else IntradayPriceService.import_intraday_columns(
+                    session,
+                    stock.id,
+                    latest_data,
+                    interval,
+                    update_existing=True,
+                )
+            )
             result["latest_intraday_price"] = {
-                "success": False,
-                "error": str(e),
+                "success": True,
+                "timestamp": latest[0].timestamp.isoformat(),
             }
-
+        except Exception as e:
+            logger.exception("Error updating intraday prices for %s", stock.symbol)
+            session.rollback()
+            error: dict[str, any] = {"success": False, "error": str(e)}
+            result.setdefault("intraday_prices", error)
+            result["latest_intraday_price"] = error
         return result
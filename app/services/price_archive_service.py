@@ -0,0 +1,237 @@
+"""Price archive service for bulk transfer of price histories.
+
+This service reads the daily or intraday price history of a set of stocks from
+the database in partitions, ready to be written as a columnar archive, and
+imports such archives back through the bulk import of the price services.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+from sqlalchemy import Select, select
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from datetime import date, datetime
+
+    from sqlalchemy import Row
+    from sqlalchemy.orm import Session
+
+    from app.services.data_providers.base import PriceColumns
+
+from app.models.stock import Stock
+from app.models.stock_daily_price import StockDailyPrice
+from app.models.stock_intraday_price import StockIntradayPrice
+from app.services.daily_price_service import DailyPriceService
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.stock_service import StockService
+from app.utils.constants import ExportConstants
+from app.utils.errors import ResourceNotFoundError, ValidationError
+
+# Set up logging
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PriceArchiveService:
+    """Service for exporting and importing price archives."""
+
+    # Archive kind -> (price model, time column, exported price columns)
+    KINDS: ClassVar[dict[str, tuple[type, str, tuple[str, ...]]]] = {
+        "daily": (StockDailyPrice, "price_date", DailyPriceService.EXPORT_COLUMNS),
+        "intraday": (
+            StockIntradayPrice,
+            "timestamp",
+            IntradayPriceService.EXPORT_COLUMNS,
+        ),
+    }
+
+    @staticmethod
+    def _validate_kind(kind: str) -> tuple[type, str, tuple[str, ...]]:
+        """Look up an archive kind or raise a ValidationError."""
+        if kind not in PriceArchiveService.KINDS:
+            raise ValidationError(
+                ValidationError.INVALID_ARCHIVE_KIND.format(
+                    kind,
+                    ", ".join(PriceArchiveService.KINDS),
+                ),
+            )
+        return PriceArchiveService.KINDS[kind]
+
+    @staticmethod
+    def archive_columns(kind: str) -> tuple[str, ...]:
+        """Get the columns of an archive, the stock symbol first.
+
+        Args:
+            kind: 'daily' or 'intraday'
+
+        Returns:
+            Column names of the archive rows
+
+        Raises:
+            ValidationError: If the kind is not supported
+
+        """
+        return ("symbol", *PriceArchiveService._validate_kind(kind)[2])
+
+    @staticmethod
+    def resolve_stocks(session: Session, symbols: Iterable[str]) -> dict[str, int]:
+        """Look up the stock IDs of a set of symbols in a single query.
+
+        Args:
+            session: Database session
+            symbols: Stock symbols (case-insensitive)
+
+        Returns:
+            Mapping of upper-case symbol to stock ID
+
+        Raises:
+            ValidationError: If no symbols are given
+            ResourceNotFoundError: If a symbol is not a known stock
+
+        """
+        wanted: set[str] = {symbol.strip().upper() for symbol in symbols} - {""}
+        if not wanted:
+            raise ValidationError(ValidationError.MISSING_SYMBOLS)
+
+        stocks: dict[str, int] = {
+            stock.symbol: stock.id
+            for stock in StockService.find_by_symbols(session, list(wanted))
+        }
+        missing: list[str] = sorted(wanted - stocks.keys())
+        if missing:
+            raise ResourceNotFoundError("Stock", f"symbol '{missing[0]}'")
+        return stocks
+
+    @staticmethod
+    def stream_price_partitions(  # noqa: PLR0913
+        session: Session,
+        kind: str,
+        stock_ids: Sequence[int],
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+        interval: int | None = None,
+        chunk_size: int = ExportConstants.YIELD_PER,
+    ) -> Iterator[Sequence[Row]]:
+        """Stream the price history of several stocks as partitions of row tuples.
+
+        Rows are read as plain tuples of archive_columns(kind) from a
+        server-side cursor in chunks of chunk_size, without loading ORM
+        instances, so each partition maps directly onto one record batch.
+
+        Args:
+            session: Database session (must stay open while iterating)
+            kind: 'daily' or 'intraday'
+            stock_ids: IDs of the stocks to export
+            start: Optional first date or timestamp to export
+            end: Optional last date or timestamp to export
+            interval: Optional intraday interval in minutes, all if None
+            chunk_size: Number of rows fetched per round trip and partition
+
+        Returns:
+            Iterator of lists of rows, ordered by symbol, interval and time
+
+        Raises:
+            ValidationError: If the kind is not supported
+
+        """
+        model, time_column, columns = PriceArchiveService._validate_kind(kind)
+        time: any = getattr(model, time_column)
+
+        query: Select = (
+            select(Stock.symbol, *(getattr(model, column) for column in columns))
+            .join(Stock, model.stock_id == Stock.id)
+            .where(model.stock_id.in_(stock_ids))
+        )
+        if start:
+            query = query.where(time >= start)
+        if end:
+            query = query.where(time <= end)
+
+        order: list[any] = [Stock.symbol]
+        if model is StockIntradayPrice:
+            if interval:
+                query = query.where(model.interval == interval)
+            order.append(model.interval)
+
+        return session.execute(
+            query.order_by(*order, time).execution_options(yield_per=chunk_size),
+        ).partitions()
+
+    @staticmethod
+    def import_price_batches(
+        session: Session,
+        kind: str,
+        batches: Iterable[PriceColumns],
+        *,
+        update_existing: bool = False,
+    ) -> dict[str, int]:
+        """Import price archive batches through the bulk import of each stock.
+
+        Each batch is split by symbol and every slice is handed to
+        bulk_import_daily_prices or bulk_import_intraday_prices as price
+        columns, so archived rows get the same validation as provider data.
+        Columns that are null in every row of a slice are dropped.
+
+        Args:
+            session: Database session
+            kind: 'daily' or 'intraday'
+            batches: Price columns including a symbol column, such as the
+                batches returned by read_archive
+            update_existing: Overwrite records that already exist instead of
+                skipping them
+
+        Returns:
+            Mapping of symbol to the number of records written
+
+        Raises:
+            ValidationError: If the kind is not supported or a batch has no
+                symbol column
+            ResourceNotFoundError: If a symbol is not a known stock
+            StockPriceError: If price data is invalid
+
+        """
+        PriceArchiveService._validate_kind(kind)
+        stocks: dict[str, int] = {}
+        counts: dict[str, int] = {}
+
+        for batch in batches:
+            if "symbol" not in batch:
+                raise ValidationError(
+                    ValidationError.INVALID_ARCHIVE.format("missing symbol column"),
+                )
+            symbols: np.ndarray = np.char.upper(batch["symbol"].astype(str))
+            present: list[str] = [str(symbol) for symbol in np.unique(symbols)]
+            unknown: set[str] = set(present) - stocks.keys()
+            if unknown:
+                stocks.update(PriceArchiveService.resolve_stocks(session, unknown))
+
+            for symbol in present:
+                rows: np.ndarray = symbols == symbol
+                # Columns without any value, such as adj_close of provider
+                # history, are left out so they count as missing, not invalid
+                columns: PriceColumns = {
+                    name: values[rows]
+                    for name, values in batch.items()
+                    if name != "symbol" and np.not_equal(values[rows], None).any()
+                }
+                if kind == "daily":
+                    written: list = DailyPriceService.bulk_import_daily_prices(
+                        session,
+                        stocks[symbol],
+                        columns,
+                        update_existing=update_existing,
+                    )
+                else:
+                    written = IntradayPriceService.bulk_import_intraday_prices(
+                        session,
+                        stocks[symbol],
+                        columns,
+                        update_existing=update_existing,
+                    )
+                counts[symbol] = counts.get(symbol, 0) + len(written)
+
+        logger.info("Imported %s price archive: %s", kind, counts)
+        return counts
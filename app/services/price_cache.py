@@ -0,0 +1,318 @@
+"""Process-wide cache of recent prices per stock.
+
+The cache keeps the most recent daily closing prices and the latest intraday
+bar of each stock so repeated reads of the same prices, such as dashboards
+polling service performance, do not query the database every time. Entries
+are evicted least-recently-used first once the entry count or the estimated
+memory size exceeds its cap. Price write paths invalidate the affected stock.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import Session
+
+from app.models.stock_daily_price import StockDailyPrice
+from app.models.stock_intraday_price import StockIntradayPrice
+from app.utils.constants import PriceCacheConstants
+from app.utils.current_datetime import get_current_date
+
+# Set up logging
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PriceCache:
+    """Thread-safe LRU cache of recent daily closes and latest intraday bars."""
+
+    @dataclass(slots=True)
+    class Entry:
+        """Cached prices of one stock."""
+
+        dates: tuple[date, ...]
+        closes: tuple[float, ...]
+        complete: bool  # True if the stock has no older daily prices
+        size: int
+        latest_bar: tuple[datetime, float] | None = None
+        intraday_loaded: bool = False
+
+    def __init__(
+        self,
+        max_closes: int = PriceCacheConstants.MAX_DAILY_CLOSES,
+        max_entries: int = PriceCacheConstants.MAX_ENTRIES,
+        max_bytes: int = PriceCacheConstants.MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_closes: Number of most recent daily closes kept per stock
+            max_entries: Maximum number of stocks cached at once
+            max_bytes: Maximum estimated memory size of all entries
+
+        """
+        self.max_closes: int = max_closes
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self._entries: OrderedDict[int, PriceCache.Entry] = OrderedDict()
+        self._generations: dict[int, int] = {}
+        self._bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get_recent_closes(
+        self,
+        session: Session,
+        stock_id: int,
+        days: int,
+    ) -> list[float] | None:
+        """Get the daily closes of a stock over the last number of days.
+
+        Args:
+            session: Database session used to load the stock on a cache miss
+            stock_id: Stock ID
+            days: Number of calendar days to look back from today
+
+        Returns:
+            Closing prices ordered from oldest to newest, or None if the
+            window reaches further back than the cached closes
+
+        """
+        entry: PriceCache.Entry = self._get_entry(session, stock_id)
+        start_date: date = get_current_date() - timedelta(days=days)
+        if not entry.complete and (not entry.dates or entry.dates[0] > start_date):
+            return None
+
+        end_date: date = get_current_date()
+        return [
+            close
+            for price_date, close in zip(entry.dates, entry.closes, strict=True)
+            if start_date <= price_date <= end_date
+        ]
+
+    def get_latest_close(self, session: Session, stock_id: int) -> float | None:
+        """Get the most recent daily close of a stock.
+
+        Args:
+            session: Database session used to load the stock on a cache miss
+            stock_id: Stock ID
+
+        Returns:
+            Latest closing price if available, None otherwise
+
+        """
+        entry: PriceCache.Entry = self._get_entry(session, stock_id)
+        return entry.closes[-1] if entry.closes else None
+
+    def get_latest_bar(
+        self,
+        session: Session,
+        stock_id: int,
+    ) -> tuple[datetime, float] | None:
+        """Get the timestamp and close of the latest intraday bar of a stock.
+
+        Args:
+            session: Database session used to load the bar on a cache miss
+            stock_id: Stock ID
+
+        Returns:
+            (timestamp, close_price) of the latest bar if available, None otherwise
+
+        """
+        entry: PriceCache.Entry = self._get_entry(session, stock_id)
+        if entry.intraday_loaded:
+            return entry.latest_bar
+
+        generation: int = self._generation(stock_id)
+        row: tuple[datetime, float] | None = session.execute(
+            select(StockIntradayPrice.timestamp, StockIntradayPrice.close_price)
+            .where(
+                StockIntradayPrice.stock_id == stock_id,
+                StockIntradayPrice.close_price.is_not(None),
+            )
+            .order_by(StockIntradayPrice.timestamp.desc())
+            .limit(1),
+        ).first()
+        latest_bar: tuple[datetime, float] | None = (
+            (row[0], float(row[1])) if row else None
+        )
+
+        with self._lock:
+            if self._generations.get(stock_id, 0) == generation and (
+                cached := self._entries.get(stock_id)
+            ):
+                cached.latest_bar = latest_bar
+                cached.intraday_loaded = True
+        return latest_bar
+
+    def invalidate(self, stock_id: int) -> None:
+        """Drop the cached prices of a stock after its prices changed.
+
+        Args:
+            stock_id: Stock ID
+
+        """
+        self.invalidate_many([stock_id])
+
+    def invalidate_many(self, stock_ids: Iterable[int]) -> None:
+        """Drop the cached prices of several stocks.
+
+        Args:
+            stock_ids: Stock IDs
+
+        """
+        with self._lock:
+            for stock_id in stock_ids:
+                # Bump the generation so loads already in flight are not cached
+                self._generations[stock_id] = self._generations.get(stock_id, 0) + 1
+                entry: PriceCache.Entry | None = self._entries.pop(stock_id, None)
+                if entry is not None:
+                    self._bytes -= entry.size
+
+    def invalidate_intraday(self, stock_id: int) -> None:
+        """Drop the cached latest intraday bar of a stock, keeping its closes.
+
+        Args:
+            stock_id: Stock ID
+
+        """
+        with self._lock:
+            self._generations[stock_id] = self._generations.get(stock_id, 0) + 1
+            entry: PriceCache.Entry | None = self._entries.get(stock_id)
+            if entry is not None:
+                entry.latest_bar = None
+                entry.intraday_loaded = False
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the statistics."""
+        with self._lock:
+            for stock_id in self._entries:
+                self._generations[stock_id] = self._generations.get(stock_id, 0) + 1
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def get_stats(self) -> dict[str, any]:
+        """Get cache size and hit statistics.
+
+        Returns:
+            Dictionary with entry count, estimated bytes, hits, misses and evictions
+
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _generation(self, stock_id: int) -> int:
+        """Get the invalidation generation of a stock."""
+        with self._lock:
+            return self._generations.get(stock_id, 0)
+
+    def _get_entry(self, session: Session, stock_id: int) -> PriceCache.Entry:
+        """Get the cache entry of a stock, loading it on a miss.
+
+        Args:
+            session: Database session
+            stock_id: Stock ID
+
+        Returns:
+            The cached entry
+
+        """
+        with self._lock:
+            entry: PriceCache.Entry | None = self._entries.get(stock_id)
+            if entry is not None:
+                self._entries.move_to_end(stock_id)
+                self._hits += 1
+                return entry
+            self._misses += 1
+            generation: int = self._generations.get(stock_id, 0)
+
+        # Load outside the lock so other stocks stay readable meanwhile
+        rows: list[tuple[date, float]] = session.execute(
+            select(StockDailyPrice.price_date, StockDailyPrice.close_price)
+            .where(
+                StockDailyPrice.stock_id == stock_id,
+                StockDailyPrice.close_price.is_not(None),
+            )
+            .order_by(StockDailyPrice.price_date.desc())
+            .limit(self.max_closes + 1),
+        ).all()
+        complete: bool = len(rows) <= self.max_closes
+        rows = rows[: self.max_closes][::-1]
+        dates: tuple[date, ...] = tuple(row[0] for row in rows)
+        closes: tuple[float, ...] = tuple(float(row[1]) for row in rows)
+        entry = PriceCache.Entry(
+            dates=dates,
+            closes=closes,
+            complete=complete,
+            size=PriceCache._estimate_size(dates, closes),
+        )
+
+        with self._lock:
+            # Skip caching if the stock was invalidated while loading
+            if self._generations.get(stock_id, 0) == generation:
+                previous: PriceCache.Entry | None = self._entries.pop(stock_id, None)
+                if previous is not None:
+                    self._bytes -= previous.size
+                self._entries[stock_id] = entry
+                self._bytes += entry.size
+                self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within both caps.
+
+        Must be called with the lock held.
+        """
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+
+    @staticmethod
+    def _estimate_size(dates: tuple[date, ...], closes: tuple[float, ...]) -> int:
+        """Estimate the memory used by an entry's prices.
+
+        Args:
+            dates: Cached price dates
+            closes: Cached closing prices
+
+        Returns:
+            Approximate size in bytes
+
+        """
+        item_size: int = (
+            sys.getsizeof(dates[0]) + sys.getsizeof(closes[0]) if dates else 0
+        )
+        return (
+            PriceCacheConstants.ENTRY_OVERHEAD_BYTES
+            + sys.getsizeof(dates)
+            + sys.getsizeof(closes)
+            + item_size * len(dates)
+        )
+
+
+# Shared cache instance used by the price services
+price_cache: PriceCache = PriceCache()
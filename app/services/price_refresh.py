@@ -0,0 +1,454 @@
+"""Concurrent price refresh across many stocks.
+
+The orchestrator fetches daily and intraday history in multi-ticker batches on
+a bounded thread pool. Requests to the data provider pass through a token
+bucket rate limiter and failed fetches are retried with exponential backoff.
+Fetched history is handed to a single writer thread that imports it, so the
+database only ever sees one writing session.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from flask import Flask
+    from sqlalchemy.orm import Session
+
+    from app.services.data_providers.base import DataProvider, PriceColumns
+
+from app.models.stock import Stock
+from app.services.daily_price_service import DailyPriceService
+from app.services.data_providers.base import batch_resume_start, trim_history
+from app.services.data_providers.registry import get_provider
+from app.services.events import EventService
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.session_manager import SessionManager
+from app.utils.constants import PriceRefreshConstants
+from app.utils.errors import StockError
+
+# Set up logging
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of provider requests."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens held, i.e. the allowed burst
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+
+        """
+        if rate <= 0 or capacity < 1:
+            msg = f"Invalid token bucket rate={rate}, capacity={capacity}"
+            raise ValueError(msg)
+
+        self.rate: float = rate
+        self.capacity: int = capacity
+        self._tokens: float = float(capacity)
+        self._updated_at: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting until one is available.
+
+        Returns:
+            Seconds spent waiting
+
+        """
+        waited: float = 0.0
+        while True:
+            with self._lock:
+                now: float = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay: float = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class PriceRefreshOrchestrator:
+    """Refresh daily and intraday prices of many stocks concurrently.
+
+    Symbols are split into batches of ``batch_size``; each batch is fetched
+    by one of ``max_workers`` threads with one multi-ticker request per data
+    set. Stocks whose stored prices cover a period are batched together so
+    their requests resume from the last stored bars. A single writer thread
+    imports the fetched history stock by stock and emits progress events.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        app: Flask,
+        *,
+        max_workers: int = PriceRefreshConstants.DEFAULT_MAX_WORKERS,
+        batch_size: int = PriceRefreshConstants.DEFAULT_BATCH_SIZE,
+        rate: float = PriceRefreshConstants.DEFAULT_RATE,
+        burst: int = PriceRefreshConstants.DEFAULT_BURST,
+        max_retries: int = PriceRefreshConstants.MAX_RETRIES,
+        backoff: float = PriceRefreshConstants.RETRY_BACKOFF,
+    ) -> None:
+        """Initialize the orchestrator.
+
+        Args:
+            app: Flask application whose context the writer runs in
+            max_workers: Maximum number of batches fetched concurrently
+            batch_size: Symbols per multi-ticker fetch
+            rate: Provider requests allowed per second
+            burst: Provider requests allowed at once after idling
+            max_retries: Retries of a failed fetch before giving up
+            backoff: Seconds before the first retry, doubled on each retry
+
+        Raises:
+            ValueError: If max_workers or batch_size is not positive
+
+        """
+        if max_workers < 1 or batch_size < 1:
+            msg = (
+                "max_workers and batch_size must be at least 1, "
+                f"got {max_workers} and {batch_size}"
+            )
+            raise ValueError(msg)
+
+        self.app: Flask = app
+        self.max_workers: int = max_workers
+        self.batch_size: int = batch_size
+        self.max_retries: int = max_retries
+        self.backoff: float = backoff
+        self.limiter: TokenBucket = TokenBucket(rate, burst)
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._retries: int = 0
+        self._throttled_seconds: float = 0.0
+
+    def refresh(
+        self,
+        stock_ids: list[int] | None = None,
+        daily_period: str = DailyPriceService.DEFAULT_DAILY_PERIOD,
+        intraday_interval: str = IntradayPriceService.DEFAULT_INTRADAY_INTERVAL,
+        intraday_period: str = IntradayPriceService.DEFAULT_INTRADAY_PERIOD,
+    ) -> dict[str, any]:
+        """Refresh the prices of the given stocks, or of all active stocks.
+
+        Args:
+            stock_ids: Stock IDs to refresh; all active stocks if None
+            daily_period: Time period for daily data
+            intraday_interval: Time interval for intraday data
+            intraday_period: Time period for intraday data
+
+        Returns:
+            Dictionary with counts, timing and the per-stock results in the
+            format returned by IntradayPriceService.update_all_prices
+
+        Raises:
+            ValidationError: If a period or the interval is invalid
+
+        """
+        DailyPriceService._validate_period(daily_period)
+        IntradayPriceService._validate_fetch_options(intraday_interval, intraday_period)
+
+        started: float = time.monotonic()
+        with SessionManager() as session:
+            stmt = select(Stock.id, Stock.symbol).order_by(Stock.id)
+            stmt = (
+                stmt.where(Stock.is_active.is_(True))
+                if stock_ids is None
+                else stmt.where(Stock.id.in_(stock_ids))
+            )
+            stocks: dict[str, int] = {
+                symbol: stock_id for stock_id, symbol in session.execute(stmt)
+            }
+            ids: dict[int, str] = {
+                stock_id: symbol for symbol, stock_id in stocks.items()
+            }
+            daily_starts: dict[str, date] = {
+                ids[stock_id]: start
+                for stock_id, start in DailyPriceService.get_resume_dates(
+                    session,
+                    list(ids),
+                    daily_period,
+                ).items()
+            }
+            intraday_starts: dict[str, datetime] = {
+                ids[stock_id]: start
+                for stock_id, start in IntradayPriceService.get_resume_timestamps(
+                    session,
+                    list(ids),
+                    intraday_interval,
+                    intraday_period,
+                ).items()
+            }
+
+        # Batch resumable stocks together so their requests can resume
+        symbols: list[str] = sorted(
+            stocks,
+            key=lambda symbol: (
+                symbol not in daily_starts,
+                symbol not in intraday_starts,
+            ),
+        )
+        batches: list[list[str]] = [
+            symbols[start : start + self.batch_size]
+            for start in range(0, len(symbols), self.batch_size)
+        ]
+        self._retries = 0
+        self._throttled_seconds = 0.0
+
+        results: dict[int, dict[str, any]] = {}
+        EventService.emit_price_refresh_progress("started", 0, len(symbols))
+
+        # Fetched batches are imported by a single writer thread
+        writes: queue.Queue = queue.Queue(PriceRefreshConstants.WRITE_QUEUE_SIZE)
+        writer: threading.Thread = threading.Thread(
+            target=self._write,
+            args=(writes, stocks, intraday_interval, intraday_starts, results),
+            name="price-refresh-writer",
+            daemon=True,
+        )
+        writer.start()
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="price-refresh",
+            ) as executor:
+                for batch in batches:
+                    executor.submit(
+                        self._fetch_batch,
+                        writes,
+                        batch,
+                        daily_period,
+                        intraday_interval,
+                        intraday_period,
+                        (daily_starts, intraday_starts),
+                    )
+        finally:
+            writes.put(None)
+            writer.join()
+
+        failed: int = sum(
+            1
+            for result in results.values()
+            if not all(operation["success"] for operation in result.values())
+        )
+        summary: dict[str, any] = {
+            "stocks": len(symbols),
+            "batches": len(batches),
+            "failed": failed,
+            "retries": self._retries,
+            "throttled_seconds": self._throttled_seconds,
+            "seconds": time.monotonic() - started,
+        }
+        EventService.emit_price_refresh_progress(
+            "completed",
+            len(results),
+            len(symbols),
+            summary,
+        )
+        logger.info(
+            "Refreshed prices of %s stocks in %.2fs (%s with failures)",
+            summary["stocks"],
+            summary["seconds"],
+            failed,
+        )
+        return {**summary, "results": results}
+
+    def _fetch_batch(  # noqa: PLR0913
+        self,
+        writes: queue.Queue,
+        symbols: list[str],
+        daily_period: str,
+        intraday_interval: str,
+        intraday_period: str,
+        starts: tuple[dict[str, date], dict[str, datetime]],
+    ) -> None:
+        """Fetch daily and intraday history of one batch and queue it for writing.
+
+        Args:
+            writes: Queue of the writer thread
+            symbols: Symbols of the batch
+            daily_period: Time period for daily data
+            intraday_interval: Time interval for intraday data
+            intraday_period: Time period for intraday data
+            starts: Daily and intraday resume times keyed by symbol
+
+        """
+        # Any failure outside the retried requests is recorded for the whole
+        # batch, so every stock of the refresh gets a result
+        try:
+            provider: DataProvider = get_provider()
+            daily_starts, intraday_starts = starts
+            daily: tuple[dict[str, PriceColumns] | None, str | None] = (
+                self._call_with_retry(
+                    lambda: provider.get_daily_data_batch(
+                        symbols,
+                        daily_period,
+                        start=batch_resume_start(daily_starts, symbols),
+                    ),
+                )
+            )
+            intraday: tuple[dict[str, PriceColumns] | None, str | None] = (
+                self._call_with_retry(
+                    lambda: provider.get_intraday_data_batch(
+                        symbols,
+                        interval=intraday_interval,
+                        period=intraday_period,
+                        start=batch_resume_start(intraday_starts, symbols),
+                    ),
+                )
+            )
+
+            # Drop the bars each stock already stores before the writer sees them
+            if daily[0] is not None:
+                trim_history(daily[0], daily_starts, "price_date")
+            if intraday[0] is not None:
+                trim_history(intraday[0], intraday_starts, "timestamp")
+        except Exception as e:
+            logger.exception("Price fetch failed for batch %s", symbols)
+            daily = intraday = (None, str(e))
+        writes.put((symbols, daily, intraday))
+
+    def _call_with_retry(
+        self,
+        call: Callable[[], dict[str, PriceColumns]],
+    ) -> tuple[dict[str, PriceColumns] | None, str | None]:
+        """Make a rate-limited provider request, retrying failures.
+
+        Args:
+            call: Provider request to make
+
+        Returns:
+            (result, None) on success, or (None, error message) once the
+            retries are exhausted or the request is invalid
+
+        """
+        for attempt in range(self.max_retries + 1):
+            waited: float = self.limiter.acquire()
+            with self._stats_lock:
+                self._throttled_seconds += waited
+            try:
+                return call(), None
+            except StockError as e:
+                # Invalid symbols fail the same way on every attempt
+                return None, str(e)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.exception("Price fetch failed after %s retries", attempt)
+                    return None, str(e)
+                delay: float = min(
+                    self.backoff * 2**attempt,
+                    PriceRefreshConstants.MAX_BACKOFF,
+                )
+                logger.warning("Price fetch failed (%s), retrying in %.1fs", e, delay)
+                with self._stats_lock:
+                    self._retries += 1
+                time.sleep(delay)
+        return None, None  # Not reached; the last attempt returns above
+
+    def _write(
+        self,
+        writes: queue.Queue,
+        stocks: dict[str, int],
+        intraday_interval: str,
+        intraday_starts: dict[str, datetime],
+        results: dict[int, dict[str, any]],
+    ) -> None:
+        """Import fetched batches until the end marker is received.
+
+        Args:
+            writes: Queue of (symbols, daily, intraday) tuples ended by None,
+                where daily and intraday are (history or None, error) pairs
+            stocks: Stock IDs keyed by symbol
+            intraday_interval: Time interval the intraday data was fetched with
+            intraday_starts: Intraday resume times keyed by symbol
+            results: Dictionary the per-stock results are stored in
+
+        """
+        with self.app.app_context(), SessionManager() as session:
+            while (item := writes.get()) is not None:
+                symbols, daily, intraday = item
+                for symbol in symbols:
+                    results[stocks[symbol]] = PriceRefreshOrchestrator._write_stock(
+                        session,
+                        stocks[symbol],
+                        daily,
+                        intraday,
+                        intraday_interval,
+                        intraday_resumed=symbol in intraday_starts,
+                    )
+                EventService.emit_price_refresh_progress(
+                    "running",
+                    len(results),
+                    len(stocks),
+                )
+
+    @staticmethod
+    def _write_stock(
+        session: Session,
+        stock_id: int,
+        daily: tuple[dict[str, PriceColumns] | None, str | None],
+        intraday: tuple[dict[str, PriceColumns] | None, str | None],
+        intraday_interval: str,
+        *,
+        intraday_resumed: bool = False,
+    ) -> dict[str, any]:
+        """Import the fetched history of one stock, never raising.
+
+        Args:
+            session: Writer session
+            stock_id: Stock ID
+            daily: Daily history keyed by symbol and the fetch error, if any
+            intraday: Intraday history keyed by symbol and the fetch error
+            intraday_interval: Time interval the intraday data was fetched with
+            intraday_resumed: Whether the intraday history resumed from the
+                last stored bar
+
+        Returns:
+            Results of each operation for the stock
+
+        """
+        try:
+            stock: Stock | None = session.get(Stock, stock_id)
+            if stock is None:
+                msg = f"Stock {stock_id} was deleted during the refresh"
+                raise LookupError(msg)
+            return IntradayPriceService.import_fetched_history(
+                session,
+                stock,
+                daily,
+                intraday,
+                intraday_interval,
+                intraday_resumed=intraday_resumed,
+            )
+        except Exception as e:
+            # Keep the writer alive so the fetch threads never block on it
+            logger.exception("Error writing prices of stock %s", stock_id)
+            session.rollback()
+            error: dict[str, any] = {"success": False, "error": str(e)}
+            return {
+                "daily_prices": error,
+                "intraday_prices": error,
+                "latest_daily_price": error,
+                "latest_intraday_price": error,
+            }
@@ -0,0 +1,158 @@
+"""Query plan audit of the statements run on the database.
+
+The auditor records the SELECT statements executed on the database engines
+while it is active, explains each distinct statement with the EXPLAIN of the
+database and reports the tables read with a full scan instead of through an
+index. Running service layer calls inside the auditor shows which access paths
+still need an index as the price and transaction history grows.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from sqlalchemy import Connection, Engine
+    from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+
+from app.services.database import engine, read_engine
+
+# Set up logging
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FullScan:
+    """A table read with a full scan by an audited statement."""
+
+    table: str
+    detail: str
+    statement: str
+
+
+class QueryPlanAuditor:
+    """Context manager explaining the queries run while it is active.
+
+    Example:
+        with QueryPlanAuditor() as auditor:
+            TransactionService.get_by_service(session, service_id)
+        scans = auditor.full_scans()
+
+    """
+
+    # EXPLAIN prefix and plan row pattern of a full table scan per dialect
+    EXPLAIN_PREFIXES: ClassVar[dict[str, str]] = {
+        "sqlite": "EXPLAIN QUERY PLAN ",
+        "postgresql": "EXPLAIN ",
+    }
+    FULL_SCAN_PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        "sqlite": re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$"),
+        "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    }
+
+    def __init__(
+        self,
+        engines: Iterable[Engine] | None = None,
+        ignore_tables: Iterable[str] = (),
+    ) -> None:
+        """Initialize an auditor of the given engines.
+
+        Args:
+            engines: Engines to audit, defaults to the read and write engines
+            ignore_tables: Tables whose full scans are expected, such as small
+                lookup tables
+
+        Raises:
+            ValueError: If an engine's database has no supported EXPLAIN
+
+        """
+        self.engines: list[Engine] = list(
+            dict.fromkeys(engines or (engine, read_engine)),
+        )
+        for bind in self.engines:
+            if bind.dialect.name not in self.EXPLAIN_PREFIXES:
+                msg: str = f"Cannot explain queries on {bind.dialect.name}"
+                raise ValueError(msg)
+        self.ignore_tables: set[str] = set(ignore_tables)
+        # Distinct statements with the engine and parameters of their first run
+        self.statements: dict[str, tuple[Engine, any]] = {}
+
+    def __enter__(self) -> QueryPlanAuditor:
+        """Start recording the statements executed on the engines."""
+        for bind in self.engines:
+            event.listen(bind, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop recording statements."""
+        for bind in self.engines:
+            event.remove(bind, "before_cursor_execute", self._record)
+
+    def _record(  # noqa: PLR0913
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """Record a SELECT statement the first time it is executed."""
+        if executemany or not statement.lstrip().upper().startswith("SELECT"):
+            return
+        self.statements.setdefault(statement, (conn.engine, parameters))
+
+    def explain(self, bind: Engine, statement: str, parameters: any = ()) -> list[str]:
+        """Explain a statement on an engine.
+
+        Args:
+            bind: Engine to explain the statement on
+            statement: SQL statement with driver parameter placeholders
+            parameters: Parameters of the statement
+
+        Returns:
+            list[str]: Lines of the query plan
+
+        """
+        prefix: str = self.EXPLAIN_PREFIXES[bind.dialect.name]
+        with bind.connect() as connection:
+            rows: list[tuple] = connection.exec_driver_sql(
+                prefix + statement,
+                parameters,
+            ).all()
+        # SQLite plans describe each step in their last column
+        return [str(row[-1]) for row in rows]
+
+    def full_scans(self) -> list[FullScan]:
+        """Explain the recorded statements and find their full table scans.
+
+        Returns:
+            list[FullScan]: Full scans of tables that are not ignored
+
+        """
+        scans: list[FullScan] = []
+        for statement, (bind, parameters) in self.statements.items():
+            pattern: re.Pattern[str] = self.FULL_SCAN_PATTERNS[bind.dialect.name]
+            for detail in self.explain(bind, statement, parameters):
+                match: re.Match[str] | None = pattern.search(detail)
+                if match and match.group(1) not in self.ignore_tables:
+                    scans.append(FullScan(match.group(1), detail, statement))
+                    logger.warning(
+                        "Full scan of %s: %s",
+                        match.group(1),
+                        " ".join(statement.split()),
+                    )
+        return scans
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 
     from sqlalchemy.orm import Session
 
-from app.services.database import get_session
+from app.services.database import get_read_session, get_session
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -30,6 +30,10 @@ class SessionManager:
     and rollback on exceptions. Use with the 'with' statement to ensure
     proper cleanup of session resources.
 
+    Read-only sessions are routed to the read engine, which may be a replica
+    of the primary database. They neither autoflush nor commit, and are
+    simply closed on exit.
+
     Example:
         with SessionManager() as session:
             user = session.execute(
@@ -37,13 +41,21 @@ class SessionManager:
             ).scalar_one_or_none()
             user.last_login = datetime.now()
 
+        with SessionManager(read_only=True) as session:
+            stocks = StockService.get_filtered_stocks(session)
+
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, read_only: bool = False) -> None:
         """Initialize a new SessionManager with no active session.
 
         The session will be created when entering the context manager.
+
+        Args:
+            read_only: Route the session to the read engine for queries only
+
         """
+        self.read_only: bool = read_only
         self.session: Session | None = None
 
     def __enter__(self) -> Session:
@@ -53,7 +65,7 @@ class SessionManager:
             The newly created session.
 
         """
-        self.session = get_session()
+        self.session = get_read_session() if self.read_only else get_session()
         return self.session
 
     def __exit__(
@@ -65,7 +77,8 @@ class SessionManager:
         """Exit the context manager and handle session cleanup.
 
         Commits the session if no exceptions occurred, otherwise rolls back.
-        Always closes the session at the end.
+        Always closes the session at the end. Read-only sessions are only
+        closed, which ends their transaction.
 
         Args:
             exc_type: Exception type if an exception was raised, None otherwise
@@ -73,7 +86,10 @@ class SessionManager:
             exc_tb: Exception traceback if an exception was raised, None otherwise
 
         """
-        if exc_type is not None:
+        if self.read_only:
+            if exc_type is not None:
+                logger.exception("Read session closed due to exception: %s", exc_val)
+        elif exc_type is not None:
             logger.exception("Session rolled back due to exception: %s", exc_val)
             if self.session:
                 self.session.rollback()
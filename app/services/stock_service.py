@@ -7,18 +7,25 @@ providing a clean API for stock management operations.
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Select, or_, select
 
 if TYPE_CHECKING:
+    from datetime import date
+
+    from sqlalchemy import Result
     from sqlalchemy.orm import Session
 
+    from app.utils.row_serializer import RowSerializer
+
 from app.api.schemas.stock import stock_schema
 from app.models.stock import Stock
 from app.models.stock_daily_price import StockDailyPrice
 from app.services.events import EventService
-from app.utils.current_datetime import get_current_datetime
+from app.services.price_cache import price_cache
+from app.utils.current_datetime import get_current_date, get_current_datetime
 from app.utils.errors import (
     BusinessLogicError,
     ResourceNotFoundError,
@@ -78,6 +85,31 @@ class StockService:
             select(Stock).where(Stock.symbol == symbol.upper()),
         ).scalar_one_or_none()
 
+    @staticmethod
+    def find_by_symbols(session: Session, symbols: list[str]) -> list[Stock]:
+        """Find several stocks by symbol in a single query.
+
+        Args:
+            session: Database session
+            symbols: Stock symbols to search for (case-insensitive)
+
+        Returns:
+            List of Stock instances that were found, in no particular order
+
+        """
+        if not symbols:
+            return []
+
+        return (
+            session.execute(
+                select(Stock).where(
+                    Stock.symbol.in_({symbol.upper() for symbol in symbols}),
+                ),
+            )
+            .scalars()
+            .all()
+        )
+
     @staticmethod
     def find_by_symbol_or_404(session: Session, symbol: str) -> Stock:
         """Find a stock by symbol or raise ResourceNotFoundError.
@@ -154,6 +186,8 @@ class StockService:
         filters: dict[str, any],
         page: int = 1,
         per_page: int = 10,
+        *,
+        serializer: RowSerializer | None = None,
     ) -> dict[str, any]:
         """Get filtered and paginated stocks.
 
@@ -162,12 +196,14 @@ class StockService:
             filters: Filter parameters dictionary
             page: Page number (1-indexed)
             per_page: Number of items per page
+            serializer: Select only the fields of this serializer and return
+                its dicts as items instead of Stock instances
 
         Returns:
             Dictionary containing items and pagination metadata
 
         """
-        query = select(Stock)
+        query = serializer.select() if serializer else select(Stock)
 
         # Apply filters
         if filters:
@@ -222,7 +258,10 @@ class StockService:
         query: Select[tuple[Stock]] = query.offset(offset).limit(per_page)
 
         # Execute query
-        stocks: list[Stock] = session.execute(query).scalars().all()
+        result: Result = session.execute(query)
+        stocks: list[Stock] | list[dict[str, any]] = (
+            serializer.dump(result.all()) if serializer else result.scalars().all()
+        )
 
         # Calculate pagination values
         total_pages: int = (
@@ -489,6 +528,7 @@ class StockService:
             # Delete the stock
             session.delete(stock)
             session.commit()
+            price_cache.invalidate(stock_id)
 
             # Emit WebSocket event
             EventService.emit_stock_update(
@@ -518,33 +558,163 @@ class StockService:
             Latest closing price if available, None otherwise
 
         """
-        if not stock.daily_prices:
-            return None
+        return price_cache.get_latest_close(session, stock.id)
 
-        # Query to get the most recent price
-        latest_price: StockDailyPrice | None = session.execute(
-            select(StockDailyPrice)
-            .where(StockDailyPrice.stock_id == stock.id)
-            .order_by(StockDailyPrice.price_date.desc()),
-        ).scalar_one_or_none()
+    @staticmethod
+    def get_price_range(
+        session: Session,
+        stock_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> list[StockDailyPrice]:
+        """Get daily prices for a stock within a date range.
+
+        Args:
+            session: Database session
+            stock_id: Stock ID
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
 
+        Returns:
+            List of StockDailyPrice instances ordered from oldest to newest
+
+        """
         return (
-            latest_price.close_price
-            if latest_price and latest_price.close_price is not None
-            else None
+            session.execute(
+                select(StockDailyPrice)
+                .where(
+                    StockDailyPrice.stock_id == stock_id,
+                    StockDailyPrice.price_date >= start_date,
+                    StockDailyPrice.price_date <= end_date,
+                )
+                .order_by(StockDailyPrice.price_date),
+            )
+            .scalars()
+            .all()
         )
 
     @staticmethod
-    def search_stocks(session: Session, query: str, limit: int = 10) -> list[Stock]:
+    def get_recent_prices(
+        session: Session,
+        stock_id: int,
+        days: int,
+    ) -> list[StockDailyPrice]:
+        """Get the daily prices for a stock over the last number of days.
+
+        Args:
+            session: Database session
+            stock_id: Stock ID
+            days: Number of calendar days to look back from today
+
+        Returns:
+            List of StockDailyPrice instances ordered from oldest to newest
+
+        """
+        end_date: date = get_current_date()
+        return StockService.get_price_range(
+            session,
+            stock_id,
+            end_date - timedelta(days=days),
+            end_date,
+        )
+
+    @staticmethod
+    def get_recent_closes(session: Session, stock_id: int, days: int) -> list[float]:
+        """Get the closing prices of a stock over the last number of days.
+
+        Served from the price cache when the window fits in the cached closes.
+
+        Args:
+            session: Database session
+            stock_id: Stock ID
+            days: Number of calendar days to look back from today
+
+        Returns:
+            Closing prices ordered from oldest to newest
+
+        """
+        closes: list[float] | None = price_cache.get_recent_closes(
+            session,
+            stock_id,
+            days,
+        )
+        if closes is not None:
+            return closes
+
+        end_date: date = get_current_date()
+        return [
+            close_price
+            for _, _, close_price in StockService.get_close_prices_for_stocks(
+                session,
+                [stock_id],
+                end_date - timedelta(days=days),
+                end_date,
+            )
+        ]
+
+    @staticmethod
+    def get_close_prices_for_stocks(
+        session: Session,
+        stock_ids: list[int],
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[int, date, float]]:
+        """Get daily closing prices for several stocks in a single query.
+
+        Only the columns needed to build a price matrix are loaded, and rows
+        without a closing price are skipped.
+
+        Args:
+            session: Database session
+            stock_ids: Stock IDs
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            List of (stock_id, price_date, close_price) tuples ordered by date
+
+        """
+        if not stock_ids:
+            return []
+
+        return (
+            session.execute(
+                select(
+                    StockDailyPrice.stock_id,
+                    StockDailyPrice.price_date,
+                    StockDailyPrice.close_price,
+                )
+                .where(
+                    StockDailyPrice.stock_id.in_(stock_ids),
+                    StockDailyPrice.price_date >= start_date,
+                    StockDailyPrice.price_date <= end_date,
+                    StockDailyPrice.close_price.is_not(None),
+                )
+                .order_by(StockDailyPrice.price_date),
+            )
+            .tuples()
+            .all()
+        )
+
+    @staticmethod
+    def search_stocks(
+        session: Session,
+        query: str,
+        limit: int = 10,
+        *,
+        serializer: RowSerializer | None = None,
+    ) -> list[Stock] | list[dict[str, any]]:
         """Search for stocks by symbol or name.
 
         Args:
             session: Database session
             query: Search query string
             limit: Maximum number of results to return
+            serializer: Select only the fields of this serializer and return
+                its dicts instead of Stock instances
 
         Returns:
-            List of matching Stock instances
+            List of matching Stock instances, or of dicts with a serializer
 
         """
         if not query:
@@ -552,14 +722,11 @@ class StockService:
 
         # Search by symbol or name (case insensitive)
         search_term: str = f"%{query}%"
-        return (
-            session.execute(
-                select(Stock)
-                .where(
-                    or_(Stock.symbol.ilike(search_term), Stock.name.ilike(search_term)),
-                )
-                .limit(limit),
+        result: Result = session.execute(
+            (serializer.select() if serializer else select(Stock))
+            .where(
+                or_(Stock.symbol.ilike(search_term), Stock.name.ilike(search_term)),
             )
-            .scalars()
-            .all()
+            .limit(limit),
         )
+        return serializer.dump(result.all()) if serializer else result.scalars().all()
@@ -9,9 +9,16 @@ from __future__ import annotations
 import logging
 import platform
 import sys
-from typing import cast
+from typing import TYPE_CHECKING, cast
+
+from flask import current_app
+
+if TYPE_CHECKING:
+    from app.services.trading_scheduler import TradingScheduler
 
 from app.services.events import EventService
+from app.services.price_cache import price_cache
+from app.services.price_refresh import PriceRefreshOrchestrator
 from app.utils.current_datetime import get_current_datetime
 
 # Set up logging
@@ -39,6 +46,46 @@ class SystemService:
             "timestamp": get_current_datetime(),
         }
 
+    @staticmethod
+    def get_scheduler_stats() -> dict[str, any]:
+        """Get counters and the tick latency histogram of the trading scheduler.
+
+        Returns:
+            Scheduler statistics, or only ``running: False`` if it is not enabled
+
+        """
+        scheduler: TradingScheduler | None = getattr(
+            current_app,
+            "trading_scheduler",
+            None,
+        )
+        if scheduler is None:
+            return {"running": False}
+        return scheduler.get_stats()
+
+    @staticmethod
+    def get_price_cache_stats() -> dict[str, any]:
+        """Get size and hit statistics of the shared price cache."""
+        return price_cache.get_stats()
+
+    @staticmethod
+    def refresh_prices(stock_ids: list[int] | None = None) -> dict[str, any]:
+        """Refresh the daily and intraday prices of many stocks concurrently.
+
+        Args:
+            stock_ids: Stock IDs to refresh; all active stocks if None
+
+        Returns:
+            Refresh summary without the per-stock results
+
+        """
+        orchestrator: PriceRefreshOrchestrator = PriceRefreshOrchestrator(
+            current_app._get_current_object(),
+        )
+        summary: dict[str, any] = orchestrator.refresh(stock_ids)
+        summary.pop("results")
+        return summary
+
     @staticmethod
     def test_websocket(message: str) -> dict[str, any]:
         """Emit a test WebSocket event and return the result.
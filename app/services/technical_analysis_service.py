@@ -8,11 +8,16 @@ directly with the database.
 from __future__ import annotations
 
 import logging
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
 
 from app.utils.constants import PriceAnalysisConstants
 from app.utils.current_datetime import get_current_date
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # Set up logging
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -32,14 +37,265 @@ class TechnicalAnalysisService:
     RSI_OVERSOLD: ClassVar[int] = PriceAnalysisConstants.RSI_OVERSOLD
     RSI_OVERBOUGHT: ClassVar[int] = PriceAnalysisConstants.RSI_OVERBOUGHT
     RSI_MIN_PERIODS: ClassVar[int] = PriceAnalysisConstants.RSI_MIN_PERIODS
+    RSI_PERIOD: ClassVar[int] = PriceAnalysisConstants.RSI_PERIOD
 
     # Constants for default periods
     DEFAULT_MA_PERIOD: ClassVar[int] = PriceAnalysisConstants.DEFAULT_MA_PERIOD
     DEFAULT_BB_PERIOD: ClassVar[int] = PriceAnalysisConstants.DEFAULT_BB_PERIOD
+    BB_NUM_STD: ClassVar[float] = PriceAnalysisConstants.BB_NUM_STD
+
+    # Lookback periods reported by calculate_price_changes
+    PRICE_CHANGE_PERIODS: ClassVar[tuple[int, ...]] = (
+        PriceAnalysisConstants.PRICE_CHANGE_PERIODS
+    )
+
+    #
+    # Vectorized series engine
+    #
+    @staticmethod
+    def _to_array(prices: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Convert a price sequence to a contiguous float64 array."""
+        return np.ascontiguousarray(prices, dtype=np.float64)
+
+    @staticmethod
+    def _last_value(series: np.ndarray) -> float | None:
+        """Return the last value of a series, or None if it is undefined."""
+        if series.size == 0 or np.isnan(series[-1]):
+            return None
+        return float(series[-1])
+
+    @staticmethod
+    def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+        """Calculate rolling window sums using cumulative sums.
+
+        Args:
+            values: Input array
+            window: Window length
+
+        Returns:
+            Array aligned to the input; positions without a full window are NaN
+
+        """
+        result: np.ndarray = np.full(values.shape[0], np.nan)
+        if window <= 0 or values.shape[0] < window:
+            return result
+
+        cumsum: np.ndarray = np.concatenate(([0.0], np.cumsum(values)))
+        result[window - 1 :] = cumsum[window:] - cumsum[:-window]
+        return result
+
+    @staticmethod
+    def calculate_sma_series(
+        prices: Sequence[float] | np.ndarray,
+        period: int = PriceAnalysisConstants.DEFAULT_MA_PERIOD,
+    ) -> np.ndarray:
+        """Calculate the simple moving average for every point of a price series.
+
+        Args:
+            prices: Prices (oldest to newest)
+            period: SMA period
+
+        Returns:
+            Array aligned to the input; the first period - 1 values are NaN
+
+        """
+        values: np.ndarray = TechnicalAnalysisService._to_array(prices)
+        return TechnicalAnalysisService._rolling_sum(values, period) / period
+
+    @staticmethod
+    def calculate_ema_series(
+        prices: Sequence[float] | np.ndarray,
+        period: int = PriceAnalysisConstants.DEFAULT_MA_PERIOD,
+    ) -> np.ndarray:
+        """Calculate the exponential moving average for every point of a series.
+
+        The EMA is seeded with the SMA of the first period values. The recursion
+        itself cannot be vectorized, so it runs as a single linear pass.
+
+        Args:
+            prices: Prices (oldest to newest)
+            period: EMA period
+
+        Returns:
+            Array aligned to the input; the first period - 1 values are NaN
+
+        """
+        values: np.ndarray = TechnicalAnalysisService._to_array(prices)
+        result: np.ndarray = np.full(values.shape[0], np.nan)
+        if period <= 0 or values.shape[0] < period:
+            return result
+
+        alpha: float = 2.0 / (period + 1)
+        ema: float = float(values[:period].mean())
+        result[period - 1] = ema
+        for i, value in enumerate(values[period:].tolist(), start=period):
+            ema += alpha * (value - ema)
+            result[i] = ema
+        return result
+
+    @staticmethod
+    def calculate_rsi_series(
+        prices: Sequence[float] | np.ndarray,
+        period: int = PriceAnalysisConstants.RSI_PERIOD,
+    ) -> np.ndarray:
+        """Calculate the Relative Strength Index for every point of a price series.
+
+        Average gains and losses are simple averages over the last period
+        changes, matching calculate_rsi.
+
+        Args:
+            prices: Prices (oldest to newest)
+            period: RSI period
+
+        Returns:
+            Array aligned to the input; the first period values are NaN
+
+        """
+        values: np.ndarray = TechnicalAnalysisService._to_array(prices)
+        result: np.ndarray = np.full(values.shape[0], np.nan)
+        if period <= 0 or values.shape[0] < period + 1:
+            return result
+
+        changes: np.ndarray = np.diff(values)
+        avg_gain: np.ndarray = (
+            TechnicalAnalysisService._rolling_sum(np.clip(changes, 0, None), period)
+            / period
+        )
+        avg_loss: np.ndarray = (
+            TechnicalAnalysisService._rolling_sum(np.clip(-changes, 0, None), period)
+            / period
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi: np.ndarray = 100 - (100 / (1 + avg_gain / avg_loss))
+        result[1:] = np.where(avg_loss == 0, 100.0, rsi)
+        return result
+
+    @staticmethod
+    def calculate_bollinger_series(
+        prices: Sequence[float] | np.ndarray,
+        period: int = PriceAnalysisConstants.DEFAULT_BB_PERIOD,
+        num_std: float = PriceAnalysisConstants.BB_NUM_STD,
+    ) -> dict[str, np.ndarray]:
+        """Calculate Bollinger Bands for every point of a price series.
+
+        The rolling variance is computed from cumulative sums of values shifted
+        by the first price, which keeps the subtraction well conditioned.
+
+        Args:
+            prices: Prices (oldest to newest)
+            period: Period for SMA calculation
+            num_std: Number of standard deviations for bands
+
+        Returns:
+            Dictionary with 'upper', 'middle', and 'lower' arrays aligned to the input
+
+        """
+        values: np.ndarray = TechnicalAnalysisService._to_array(prices)
+        shifted: np.ndarray = values - values[0] if values.size else values
+
+        mean: np.ndarray = (
+            TechnicalAnalysisService._rolling_sum(shifted, period) / period
+        )
+        mean_sq: np.ndarray = (
+            TechnicalAnalysisService._rolling_sum(shifted * shifted, period) / period
+        )
+        std_dev: np.ndarray = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+        middle: np.ndarray = mean + (values[0] if values.size else 0.0)
+
+        return {
+            "upper": middle + std_dev * num_std,
+            "middle": middle,
+            "lower": middle - std_dev * num_std,
+        }
+
+    @staticmethod
+    def calculate_price_change_series(
+        prices: Sequence[float] | np.ndarray,
+        period: int = 1,
+    ) -> np.ndarray:
+        """Calculate the percentage price change over a period for every point.
+
+        Args:
+            prices: Prices (oldest to newest)
+            period: Number of points to look back
+
+        Returns:
+            Array aligned to the input; the first period values are NaN
+
+        """
+        values: np.ndarray = TechnicalAnalysisService._to_array(prices)
+        result: np.ndarray = np.full(values.shape[0], np.nan)
+        if period <= 0 or values.shape[0] <= period:
+            return result
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[period:] = (
+                (values[period:] - values[:-period]) / values[:-period] * 100
+            )
+        return result
+
+    @staticmethod
+    def calculate_indicator_series(
+        close_prices: Sequence[float] | np.ndarray,
+        ma_periods: list[int] | None = None,
+    ) -> dict[str, any]:
+        """Calculate every indicator series for a full price history in one pass.
+
+        Args:
+            close_prices: Closing prices (oldest to newest)
+            ma_periods: Moving average periods (defaults to the standard set)
+
+        Returns:
+            Dictionary of arrays aligned to the input, with keys 'close',
+            'moving_averages', 'ema', 'rsi', 'bollinger_bands' and 'price_changes'
+
+        """
+        if ma_periods is None:
+            ma_periods = TechnicalAnalysisService._default_ma_periods()
+
+        values: np.ndarray = TechnicalAnalysisService._to_array(close_prices)
+
+        return {
+            "close": values,
+            "moving_averages": {
+                period: TechnicalAnalysisService.calculate_sma_series(values, period)
+                for period in ma_periods
+            },
+            "ema": {
+                period: TechnicalAnalysisService.calculate_ema_series(values, period)
+                for period in ma_periods
+            },
+            "rsi": TechnicalAnalysisService.calculate_rsi_series(values),
+            "bollinger_bands": TechnicalAnalysisService.calculate_bollinger_series(
+                values,
+            ),
+            "price_changes": {
+                f"{period}_day": TechnicalAnalysisService.calculate_price_change_series(
+                    values,
+                    period,
+                )
+                for period in TechnicalAnalysisService.PRICE_CHANGE_PERIODS
+            },
+        }
+
+    @staticmethod
+    def _default_ma_periods() -> list[int]:
+        """Get the standard moving average periods."""
+        return [
+            TechnicalAnalysisService.SHORT_MA_PERIOD,
+            TechnicalAnalysisService.MEDIUM_MA_PERIOD,
+            TechnicalAnalysisService.LONG_MA_PERIOD,
+            TechnicalAnalysisService.EXTENDED_MA_PERIOD,
+            TechnicalAnalysisService.MAX_MA_PERIOD,
+        ]
 
+    #
+    # Latest-value indicators
+    #
     @staticmethod
     def calculate_simple_moving_average(
-        prices: list[float],
+        prices: Sequence[float] | np.ndarray,
         period: int = PriceAnalysisConstants.DEFAULT_MA_PERIOD,
     ) -> float | None:
         """Calculate simple moving average for a list of prices.
@@ -55,11 +311,13 @@ class TechnicalAnalysisService:
         if len(prices) < period:
             return None
 
-        return sum(prices[-period:]) / period
+        return TechnicalAnalysisService._last_value(
+            TechnicalAnalysisService.calculate_sma_series(prices[-period:], period),
+        )
 
     @staticmethod
     def calculate_moving_averages(
-        close_prices: list[float],
+        close_prices: Sequence[float] | np.ndarray,
         periods: list[int] | None = None,
     ) -> dict[int, float | None]:
         """Calculate multiple moving averages.
@@ -73,13 +331,7 @@ class TechnicalAnalysisService:
 
         """
         if periods is None:
-            periods = [
-                TechnicalAnalysisService.SHORT_MA_PERIOD,
-                TechnicalAnalysisService.MEDIUM_MA_PERIOD,
-                TechnicalAnalysisService.LONG_MA_PERIOD,
-                TechnicalAnalysisService.EXTENDED_MA_PERIOD,
-                TechnicalAnalysisService.MAX_MA_PERIOD,
-            ]
+            periods = TechnicalAnalysisService._default_ma_periods()
 
         # Calculate MAs for each period
         result: dict[int, float | None] = {}
@@ -93,8 +345,8 @@ class TechnicalAnalysisService:
 
     @staticmethod
     def calculate_rsi(
-        prices: list[float],
-        period: int = 14,
+        prices: Sequence[float] | np.ndarray,
+        period: int = PriceAnalysisConstants.RSI_PERIOD,
     ) -> float | None:
         """Calculate Relative Strength Index (RSI) for a list of prices.
 
@@ -109,32 +361,18 @@ class TechnicalAnalysisService:
         if len(prices) < period + 1:
             return None
 
-        # Calculate price changes
-        changes: list[float] = [
-            prices[i + 1] - prices[i] for i in range(len(prices) - 1)
-        ]
-
-        # Separate gains and losses
-        gains: list[float] = [max(0, change) for change in changes]
-        losses: list[float] = [max(0, -change) for change in changes]
-
-        # Calculate average gain and loss
-        avg_gain: float = sum(gains[-period:]) / period
-        avg_loss: float = sum(losses[-period:]) / period
-
-        if avg_loss == 0:
-            return 100.0
-
-        rs: float = avg_gain / avg_loss
-        rsi: float = 100 - (100 / (1 + rs))
-
-        return rsi
+        return TechnicalAnalysisService._last_value(
+            TechnicalAnalysisService.calculate_rsi_series(
+                prices[-(period + 1) :],
+                period,
+            ),
+        )
 
     @staticmethod
     def calculate_bollinger_bands(
-        prices: list[float],
+        prices: Sequence[float] | np.ndarray,
         period: int = PriceAnalysisConstants.DEFAULT_BB_PERIOD,
-        num_std: float = 2.0,
+        num_std: float = PriceAnalysisConstants.BB_NUM_STD,
     ) -> dict[str, float | None]:
         """Calculate Bollinger Bands for a list of prices.
 
@@ -150,31 +388,22 @@ class TechnicalAnalysisService:
         if len(prices) < period:
             return {"upper": None, "middle": None, "lower": None}
 
-        # Calculate SMA
-        sma: float | None = TechnicalAnalysisService.calculate_simple_moving_average(
-            prices,
-            period,
+        bands: dict[str, np.ndarray] = (
+            TechnicalAnalysisService.calculate_bollinger_series(
+                prices[-period:],
+                period,
+                num_std,
+            )
         )
 
-        # Early return if SMA is None
-        if sma is None:
-            return {"upper": None, "middle": None, "lower": None}
-
-        # Calculate standard deviation
-        recent_prices: list[float] = prices[-period:]
-        std_dev: float = (
-            sum((price - sma) ** 2 for price in recent_prices) / period
-        ) ** 0.5
-
-        # Calculate bands
-        upper_band: float = sma + (std_dev * num_std)
-        lower_band: float = sma - (std_dev * num_std)
-
-        return {"upper": upper_band, "middle": sma, "lower": lower_band}
+        return {
+            key: TechnicalAnalysisService._last_value(series)
+            for key, series in bands.items()
+        }
 
     @staticmethod
     def is_price_trending_up(
-        close_prices: list[float],
+        close_prices: Sequence[float] | np.ndarray,
     ) -> bool:
         """Determine if a stock price is trending upward.
 
@@ -209,7 +438,7 @@ class TechnicalAnalysisService:
 
     @staticmethod
     def calculate_price_changes(
-        close_prices: list[float],
+        close_prices: Sequence[float] | np.ndarray,
     ) -> dict[str, float]:
         """Calculate price changes over different periods.
 
@@ -221,16 +450,17 @@ class TechnicalAnalysisService:
 
         """
         price_changes: dict[str, float] = {}
-        periods: list[int] = [1, 5, 10, 30, 90]
 
-        for period in periods:
+        for period in TechnicalAnalysisService.PRICE_CHANGE_PERIODS:
             if len(close_prices) > period:
-                change: float = (
-                    (close_prices[-1] - close_prices[-(period + 1)])
-                    / close_prices[-(period + 1)]
-                    * 100
+                change: float | None = TechnicalAnalysisService._last_value(
+                    TechnicalAnalysisService.calculate_price_change_series(
+                        close_prices[-(period + 1) :],
+                        period,
+                    ),
                 )
-                price_changes[f"{period}_day"] = change
+                if change is not None:
+                    price_changes[f"{period}_day"] = change
 
         return price_changes
 
@@ -299,7 +529,7 @@ class TechnicalAnalysisService:
 
     @staticmethod
     def get_price_analysis(
-        close_prices: list[float],
+        close_prices: Sequence[float] | np.ndarray,
     ) -> dict[str, any]:
         """Get comprehensive price analysis for trading decisions.
 
@@ -310,22 +540,16 @@ class TechnicalAnalysisService:
             Dictionary with various technical indicators and analysis results
 
         """
-        if not close_prices:
+        if len(close_prices) == 0:
             return {
                 "has_data": False,
                 "message": "No price data available for analysis",
             }
 
-        latest_price: float = close_prices[-1]
+        latest_price: float = float(close_prices[-1])
 
         # Calculate technical indicators
-        ma_periods: list[int] = [
-            TechnicalAnalysisService.SHORT_MA_PERIOD,
-            TechnicalAnalysisService.MEDIUM_MA_PERIOD,
-            TechnicalAnalysisService.LONG_MA_PERIOD,
-            TechnicalAnalysisService.EXTENDED_MA_PERIOD,
-            TechnicalAnalysisService.MAX_MA_PERIOD,
-        ]
+        ma_periods: list[int] = TechnicalAnalysisService._default_ma_periods()
 
         moving_averages: dict[int, float | None] = {
             period: TechnicalAnalysisService.calculate_simple_moving_average(
@@ -383,3 +607,236 @@ class TechnicalAnalysisService:
         }
 
         return analysis
+
+
+class IndicatorState:
+    """Incrementally maintained indicators for a stream of prices.
+
+    Moving averages, RSI gains and losses, and Bollinger Band variance are kept
+    as rolling sums over a fixed-size ring buffer, so each update costs O(1)
+    regardless of how much history has been seen. The definitions match
+    TechnicalAnalysisService.get_price_analysis.
+
+    Attributes:
+        count: Number of prices seen so far
+        latest_price: Most recent price, or None before the first update
+
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_bb_period",
+        "_bb_sum",
+        "_bb_sum_sq",
+        "_buffer",
+        "_gain_sum",
+        "_loss_sum",
+        "_ma_periods",
+        "_ma_sums",
+        "_reference",
+        "_rsi_period",
+        "_size",
+        "count",
+        "latest_price",
+    )
+
+    # Rolling sums are rebuilt from the buffer this often to bound float drift
+    RESYNC_INTERVAL: ClassVar[int] = 4096
+
+    def __init__(
+        self,
+        ma_periods: list[int] | None = None,
+        rsi_period: int = PriceAnalysisConstants.RSI_PERIOD,
+        bb_period: int = PriceAnalysisConstants.DEFAULT_BB_PERIOD,
+    ) -> None:
+        """Initialize an empty indicator state.
+
+        Args:
+            ma_periods: Moving average periods (defaults to the standard set)
+            rsi_period: RSI period
+            bb_period: Bollinger Band period
+
+        """
+        self._ma_periods: list[int] = (
+            ma_periods or TechnicalAnalysisService._default_ma_periods()
+        )
+        self._rsi_period: int = rsi_period
+        self._bb_period: int = bb_period
+        self._size: int = max(*self._ma_periods, rsi_period + 1, bb_period)
+        self._buffer: list[float] = [0.0] * self._size
+        self._ma_sums: dict[int, float] = dict.fromkeys(self._ma_periods, 0.0)
+        self._gain_sum: float = 0.0
+        self._loss_sum: float = 0.0
+        self._bb_sum: float = 0.0
+        self._bb_sum_sq: float = 0.0
+        self._reference: float = 0.0
+        self.count: int = 0
+        self.latest_price: float | None = None
+
+    def _price_ago(self, offset: int) -> float:
+        """Get the price recorded offset updates before the next one."""
+        return self._buffer[(self.count - offset) % self._size]
+
+    def update(self, price: float) -> None:
+        """Add a price to the stream.
+
+        Args:
+            price: Newest price
+
+        """
+        count: int = self.count
+        if count == 0:
+            self._reference = price
+
+        # Moving averages: add the new price, drop the one leaving each window
+        for period in self._ma_periods:
+            leaving: float = self._price_ago(period) if count >= period else 0.0
+            self._ma_sums[period] += price - leaving
+
+        # RSI: add the newest change, drop the change leaving the window
+        if count >= 1:
+            change: float = price - self._price_ago(1)
+            if change > 0:
+                self._gain_sum += change
+            else:
+                self._loss_sum -= change
+            if count > self._rsi_period:
+                old_change: float = self._price_ago(self._rsi_period) - (
+                    self._price_ago(self._rsi_period + 1)
+                )
+                if old_change > 0:
+                    self._gain_sum -= old_change
+                else:
+                    self._loss_sum += old_change
+
+        # Bollinger Bands: shifted sums keep the variance well conditioned
+        shifted: float = price - self._reference
+        self._bb_sum += shifted
+        self._bb_sum_sq += shifted * shifted
+        if count >= self._bb_period:
+            old_shifted: float = self._price_ago(self._bb_period) - self._reference
+            self._bb_sum -= old_shifted
+            self._bb_sum_sq -= old_shifted * old_shifted
+
+        self._buffer[count % self._size] = price
+        self.count = count + 1
+        self.latest_price = price
+
+        if self.count % self.RESYNC_INTERVAL == 0:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Rebuild all rolling sums from the buffered prices."""
+        recent: list[float] = [
+            self._buffer[(self.count - offset) % self._size]
+            for offset in range(min(self.count, self._size), 0, -1)
+        ]
+
+        for period in self._ma_periods:
+            self._ma_sums[period] = sum(recent[-period:])
+
+        changes: list[float] = [
+            recent[i] - recent[i - 1]
+            for i in range(len(recent) - self._rsi_period, len(recent))
+        ]
+        self._gain_sum = sum(change for change in changes if change > 0)
+        self._loss_sum = -sum(change for change in changes if change < 0)
+
+        window: list[float] = [
+            price - self._reference for price in recent[-self._bb_period :]
+        ]
+        self._bb_sum = sum(window)
+        self._bb_sum_sq = sum(value * value for value in window)
+
+    def moving_averages(self) -> dict[int, float]:
+        """Get the moving averages for every period with enough data."""
+        return {
+            period: self._ma_sums[period] / period
+            for period in self._ma_periods
+            if self.count >= period
+        }
+
+    def rsi(self) -> float | None:
+        """Get the current RSI, or None if there is not enough data."""
+        if self.count < max(
+            self._rsi_period + 1,
+            TechnicalAnalysisService.RSI_MIN_PERIODS,
+        ):
+            return None
+
+        avg_loss: float = max(self._loss_sum, 0.0) / self._rsi_period
+        if avg_loss == 0:
+            return 100.0
+
+        avg_gain: float = max(self._gain_sum, 0.0) / self._rsi_period
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def bollinger_bands(
+        self,
+        num_std: float = PriceAnalysisConstants.BB_NUM_STD,
+    ) -> dict[str, float | None]:
+        """Get the current Bollinger Bands.
+
+        Args:
+            num_std: Number of standard deviations for bands
+
+        Returns:
+            Dictionary with 'upper', 'middle', and 'lower' band values
+
+        """
+        if self.count < self._bb_period:
+            return {"upper": None, "middle": None, "lower": None}
+
+        mean: float = self._bb_sum / self._bb_period
+        variance: float = max(self._bb_sum_sq / self._bb_period - mean * mean, 0.0)
+        std_dev: float = variance**0.5
+        middle: float = mean + self._reference
+
+        return {
+            "upper": middle + std_dev * num_std,
+            "middle": middle,
+            "lower": middle - std_dev * num_std,
+        }
+
+    def get_price_analysis(self) -> dict[str, any]:
+        """Get the price analysis for the latest price.
+
+        Returns:
+            Dictionary with the indicator and signal keys produced by
+            TechnicalAnalysisService.get_price_analysis
+
+        """
+        if self.latest_price is None:
+            return {
+                "has_data": False,
+                "message": "No price data available for analysis",
+            }
+
+        moving_averages: dict[int, float] = self.moving_averages()
+        rsi: float | None = self.rsi()
+        bollinger_bands: dict[str, float | None] = self.bollinger_bands()
+
+        short_ma: float | None = moving_averages.get(
+            TechnicalAnalysisService.SHORT_MA_PERIOD,
+        )
+        long_ma: float | None = moving_averages.get(
+            TechnicalAnalysisService.LONG_MA_PERIOD,
+        )
+
+        return {
+            "has_data": True,
+            "latest_price": self.latest_price,
+            "moving_averages": moving_averages,
+            "rsi": rsi,
+            "bollinger_bands": bollinger_bands,
+            "is_uptrend": (
+                short_ma > long_ma
+                if short_ma is not None and long_ma is not None
+                else None
+            ),
+            "signals": TechnicalAnalysisService.analyze_signals(
+                rsi,
+                moving_averages,
+                bollinger_bands,
+                self.latest_price,
+            ),
+        }
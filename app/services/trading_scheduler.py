@@ -0,0 +1,263 @@
+"""In-process scheduler that drives trading strategies on a fixed cadence.
+
+The scheduler ticks every active trading service at a configurable interval,
+executing all strategies as one batch that analyzes each symbol once and
+commits every decision in a single transaction. Ticks that run past the next
+deadline cause the missed ticks to be skipped rather than queued, and tick
+latencies are recorded in a histogram.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+from app.services.session_manager import SessionManager
+from app.services.trading_strategy_service import TradingStrategyService
+from app.utils.constants import SchedulerConstants
+from app.utils.current_datetime import get_current_datetime
+
+# Set up logging
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Thread-safe histogram of latencies with fixed bucket bounds."""
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = SchedulerConstants.LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the buckets, in seconds
+
+        """
+        self.buckets: tuple[float, ...] = buckets
+        self._counts: list[int] = [0] * (len(buckets) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._max: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency observation.
+
+        Args:
+            seconds: Observed latency in seconds
+
+        """
+        index: int = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += seconds
+            self._max = max(self._max, seconds)
+
+    def snapshot(self) -> dict[str, any]:
+        """Get the current state of the histogram.
+
+        Returns:
+            Dictionary with cumulative bucket counts, count, sum, mean and max
+
+        """
+        with self._lock:
+            counts: list[int] = list(self._counts)
+            count: int = self._count
+            total: float = self._sum
+            maximum: float = self._max
+
+        cumulative: int = 0
+        buckets: list[dict[str, any]] = []
+        for bound, bucket_count in zip(
+            [*self.buckets, math.inf],
+            counts,
+            strict=True,
+        ):
+            cumulative += bucket_count
+            buckets.append(
+                {"le": "+Inf" if math.isinf(bound) else bound, "count": cumulative},
+            )
+
+        return {
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else 0.0,
+            "max": maximum,
+            "buckets": buckets,
+        }
+
+
+class TradingScheduler:
+    """Run trading strategies for all active services on a fixed cadence.
+
+    Each tick executes the strategies of all active services with
+    TradingStrategyService.execute_all_strategies, in one session and one
+    transaction, so concurrent ticks never compete for database writes.
+    Ticks are scheduled at a fixed rate; when a tick overruns one or more
+    following deadlines those ticks are skipped and counted.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        interval: float = SchedulerConstants.DEFAULT_TICK_INTERVAL,
+    ) -> None:
+        """Initialize a stopped scheduler.
+
+        Args:
+            app: Flask application whose context the strategies run in
+            interval: Seconds between tick deadlines
+
+        Raises:
+            ValueError: If interval is not positive
+
+        """
+        if interval <= 0:
+            msg = f"Tick interval must be positive, got {interval}"
+            raise ValueError(msg)
+
+        self.app: Flask = app
+        self.interval: float = interval
+        self.tick_latency: LatencyHistogram = LatencyHistogram()
+
+        self._thread: threading.Thread | None = None
+        self._stop_event: threading.Event = threading.Event()
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._ticks: int = 0
+        self._skipped_ticks: int = 0
+        self._failed_ticks: int = 0
+        self._service_runs: int = 0
+        self._trades: int = 0
+        self._last_tick_at: str | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the scheduler thread is running.
+
+        Returns:
+            True if the scheduler has been started and not yet stopped
+
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start ticking in a background thread.
+
+        Raises:
+            RuntimeError: If the scheduler is already running
+
+        """
+        if self.is_running:
+            msg = "Trading scheduler is already running"
+            raise RuntimeError(msg)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="trading-scheduler",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Trading scheduler started (interval=%ss)", self.interval)
+
+    def stop(self, timeout: float = SchedulerConstants.STOP_TIMEOUT) -> None:
+        """Stop ticking and wait for the running tick to finish.
+
+        Args:
+            timeout: Seconds to wait for the scheduler thread to exit
+
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Trading scheduler stopped")
+
+    def _run(self) -> None:
+        """Tick at a fixed rate until stopped, skipping overrun deadlines."""
+        next_deadline: float = time.monotonic()
+        while not self._stop_event.wait(max(0.0, next_deadline - time.monotonic())):
+            try:
+                self.tick()
+            except Exception:
+                logger.exception("Error running trading tick")
+
+            next_deadline += self.interval
+            overrun: float = time.monotonic() - next_deadline
+            if overrun >= 0:
+                skipped: int = math.floor(overrun / self.interval) + 1
+                next_deadline += skipped * self.interval
+                with self._stats_lock:
+                    self._skipped_ticks += skipped
+                logger.warning(
+                    "Trading tick overran its interval by %.3fs, skipping %s tick(s)",
+                    overrun,
+                    skipped,
+                )
+
+    def tick(self) -> dict[str, any]:
+        """Execute the strategy of every active service once, as one batch.
+
+        Returns:
+            Dictionary with whether the batch succeeded, the number of
+            services run, the trades made and the latency
+
+        """
+        started: float = time.monotonic()
+        summary: dict[str, any] | None = None
+        try:
+            with self.app.app_context(), SessionManager() as session:
+                summary = TradingStrategyService.execute_all_strategies(session)
+        except Exception:
+            logger.exception("Error executing trading strategies")
+
+        elapsed: float = time.monotonic() - started
+        self.tick_latency.observe(elapsed)
+        services: int = summary["services_processed"] if summary else 0
+        trades: int = (
+            summary["actions"]["buy"] + summary["actions"]["sell"] if summary else 0
+        )
+        with self._stats_lock:
+            self._ticks += 1
+            if summary is None:
+                self._failed_ticks += 1
+            self._service_runs += services
+            self._trades += trades
+            self._last_tick_at = get_current_datetime().isoformat()
+
+        return {
+            "success": summary is not None,
+            "services": services,
+            "trades": trades,
+            "latency": elapsed,
+        }
+
+    def get_stats(self) -> dict[str, any]:
+        """Get scheduler counters and the tick latency histogram.
+
+        Returns:
+            Dictionary with scheduler configuration, counters and histogram
+
+        """
+        with self._stats_lock:
+            stats: dict[str, any] = {
+                "running": self.is_running,
+                "interval": self.interval,
+                "ticks": self._ticks,
+                "skipped_ticks": self._skipped_ticks,
+                "failed_ticks": self._failed_ticks,
+                "service_runs": self._service_runs,
+                "trades": self._trades,
+                "last_tick_at": self._last_tick_at,
+            }
+        stats["tick_latency"] = self.tick_latency.snapshot()
+        return stats
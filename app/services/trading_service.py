@@ -18,6 +18,7 @@ from app.api.schemas.trading_service import service_schema
 from app.models.enums import ServiceState, TradingMode
 from app.models.trading_service import TradingService
 from app.services.events import EventService
+from app.services.price_cache import price_cache
 from app.services.stock_service import StockService
 from app.utils.constants import TradingServiceConstants
 from app.utils.current_datetime import get_current_datetime
@@ -229,6 +230,29 @@ class TradingServiceService:
             .all()
         )
 
+    @staticmethod
+    def get_active(session: Session) -> list[TradingService]:
+        """Get all trading services that are active and in the ACTIVE state.
+
+        Args:
+            session: Database session
+
+        Returns:
+            List of TradingService instances ordered by stock symbol
+
+        """
+        return (
+            session.query(TradingService)
+            .filter(
+                and_(
+                    TradingService.is_active.is_(True),
+                    TradingService.state == ServiceState.ACTIVE.value,
+                ),
+            )
+            .order_by(TradingService.stock_symbol, TradingService.id)
+            .all()
+        )
+
     @staticmethod
     def get_all(session: Session) -> list[TradingService]:
         """Get all trading services.
@@ -835,8 +859,13 @@ class TradingServiceService:
             if not stock:
                 return 0.0
 
-            # Use the stock's latest price
-            return StockService.get_latest_price(session, stock) or 0.0
+            # Use the stock's latest daily close, else its latest intraday bar
+            latest_price: float | None = StockService.get_latest_price(session, stock)
+            if latest_price is None and (
+                latest_bar := price_cache.get_latest_bar(session, stock.id)
+            ):
+                latest_price = latest_bar[1]
+            return latest_price or 0.0
         except Exception:
             logger.exception("Error getting current price for stock")
             return 0.0
@@ -7,6 +7,8 @@ providing methods for analyzing market data and generating buy/sell decisions.
 from __future__ import annotations
 
 import logging
+from collections import Counter, defaultdict
+from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,11 +20,11 @@ from app.services.stock_service import StockService
 from app.services.technical_analysis_service import TechnicalAnalysisService
 from app.services.trading_service import TradingServiceService
 from app.services.transaction_service import TransactionService
-from app.utils.constants import PriceAnalysisConstants, TradingServiceConstants
-from app.utils.current_datetime import get_current_datetime
+from app.utils.constants import PriceAnalysisConstants
+from app.utils.current_datetime import get_current_date, get_current_datetime
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import Session, SessionTransaction
 
     from app.models.trading_transaction import TradingTransaction
 
@@ -39,6 +41,7 @@ class TradingStrategyService:
 
     # Constants
     MIN_PRICE_DATA_POINTS: int = PriceAnalysisConstants.MIN_DATA_POINTS
+    PRICE_HISTORY_DAYS: int = 90
 
     @staticmethod
     def check_buy_condition(
@@ -179,7 +182,7 @@ class TradingStrategyService:
 
         # Condition 3: Price dropped but in uptrend
         moving_averages = price_analysis.get("moving_averages", {})
-        short_ma = moving_averages.get(TradingServiceConstants.SHORT_MA_PERIOD)
+        short_ma = moving_averages.get(PriceAnalysisConstants.SHORT_MA_PERIOD)
         if short_ma:
             percent_below_ma = ((short_ma - current_price) / short_ma) * 100
             ma_buy_signal = is_uptrend and percent_below_ma >= service.buy_threshold
@@ -241,6 +244,8 @@ class TradingStrategyService:
         price_analysis: dict[str, any],
         current_price: float,
         result: dict[str, any],
+        *,
+        commit: bool = True,
     ) -> dict[str, any]:
         """Execute buy strategy for a trading service.
 
@@ -250,6 +255,7 @@ class TradingStrategyService:
             price_analysis: Price analysis data
             current_price: Current stock price
             result: Base result dictionary to build upon
+            commit: Commit the trade; when False the caller owns the transaction
 
         Returns:
             Updated result dictionary with buy action information
@@ -269,11 +275,12 @@ class TradingStrategyService:
             return result
 
         # Calculate how many shares to buy
+        current_balance: float = float(service.current_balance)
         max_shares_affordable: int = (
-            int(service.current_balance / current_price) if current_price > 0 else 0
+            int(current_balance / current_price) if current_price > 0 else 0
         )
         allocation_amount: float = (
-            service.current_balance * service.allocation_percent
+            current_balance * float(service.allocation_percent)
         ) / 100
         shares_to_buy: int = int(allocation_amount / current_price)
         shares_to_buy = max(1, min(shares_to_buy, max_shares_affordable))
@@ -291,6 +298,7 @@ class TradingStrategyService:
                 stock_symbol=service.stock_symbol,
                 shares=shares_to_buy,
                 purchase_price=current_price,
+                commit=commit,
             )
 
             result["action"] = "buy"
@@ -303,7 +311,8 @@ class TradingStrategyService:
             service.buy_count = service.buy_count + 1
             service.current_shares = service.current_shares + shares_to_buy
             service.updated_at = get_current_datetime()
-            session.commit()
+            if commit:
+                session.commit()
         except Exception as e:
             logger.exception("Error executing buy transaction")
             result["success"] = False
@@ -319,6 +328,8 @@ class TradingStrategyService:
         price_analysis: dict[str, any],
         current_price: float,
         result: dict[str, any],
+        *,
+        commit: bool = True,
     ) -> dict[str, any]:
         """Execute sell strategy for a trading service.
 
@@ -328,6 +339,7 @@ class TradingStrategyService:
             price_analysis: Price analysis data
             current_price: Current stock price
             result: Base result dictionary to build upon
+            commit: Commit the trade; when False the caller owns the transaction
 
         Returns:
             Updated result dictionary with sell action information
@@ -353,10 +365,14 @@ class TradingStrategyService:
 
         try:
             # Execute sell transaction
-            for t in service.transactions:
-                if t.state == TransactionState.OPEN.value:
-                    transaction: TradingTransaction = t
-                    break
+            transaction: TradingTransaction | None = next(
+                (
+                    t
+                    for t in service.transactions
+                    if t.state == TransactionState.OPEN.value
+                ),
+                None,
+            )
 
             if not transaction:
                 result["action"] = "none"
@@ -367,6 +383,7 @@ class TradingStrategyService:
                 session=session,
                 transaction_id=transaction.id,
                 sale_price=current_price,
+                commit=commit,
             )
 
             # Calculate total revenue
@@ -384,7 +401,8 @@ class TradingStrategyService:
             service.sell_count = service.sell_count + 1
             service.current_shares = 0
             service.updated_at = get_current_datetime()
-            session.commit()
+            if commit:
+                session.commit()
         except Exception as e:
             logger.exception("Error executing sell transaction")
             result["success"] = False
@@ -423,16 +441,17 @@ class TradingStrategyService:
             result["message"] = f"Stock {service.stock_symbol} not found"
         # Price history validation
         elif (
-            not (price_history := StockService.get_recent_prices(session, stock.id, 90))
-            or len(price_history) < TradingStrategyService.MIN_PRICE_DATA_POINTS
+            len(
+                close_prices := StockService.get_recent_closes(
+                    session,
+                    stock.id,
+                    TradingStrategyService.PRICE_HISTORY_DAYS,
+                ),
+            )
+            < TradingStrategyService.MIN_PRICE_DATA_POINTS
         ):
             result["message"] = "Insufficient price data for analysis"
         else:
-            # Convert price history to list of float values
-            close_prices: list[float] = [
-                float(price.close_price) for price in price_history
-            ]
-
             # Get price analysis
             price_analysis: dict[str, any] = (
                 TechnicalAnalysisService.get_price_analysis(
@@ -502,10 +521,39 @@ class TradingStrategyService:
             close_prices,
         )
 
+        return TradingStrategyService._apply_strategy(
+            session,
+            service,
+            price_analysis,
+            current_price,
+        )
+
+    @staticmethod
+    def _apply_strategy(
+        session: Session,
+        service: TradingService,
+        price_analysis: dict[str, any],
+        current_price: float,
+        *,
+        commit: bool = True,
+    ) -> dict[str, any]:
+        """Apply the buy or sell strategy for a service's current mode.
+
+        Args:
+            session: Database session
+            service: TradingService instance
+            price_analysis: Price analysis data
+            current_price: Current stock price
+            commit: Commit any trade; when False the caller owns the transaction
+
+        Returns:
+            Dictionary with trading decision information and any actions taken
+
+        """
         # Trading decision
-        result = {
+        result: dict[str, any] = {
             "success": True,
-            "service_id": service_id,
+            "service_id": service.id,
             "stock_symbol": service.stock_symbol,
             "current_price": current_price,
             "current_balance": service.current_balance,
@@ -522,6 +570,7 @@ class TradingStrategyService:
                 price_analysis,
                 current_price,
                 result,
+                commit=commit,
             )
         if bool(service.mode == TradingMode.SELL.value):
             return TradingStrategyService.execute_sell_strategy(
@@ -530,6 +579,7 @@ class TradingStrategyService:
                 price_analysis,
                 current_price,
                 result,
+                commit=commit,
             )
         # Handle HOLD mode or any other mode
         if bool(service.mode == TradingMode.HOLD.value):
@@ -541,6 +591,132 @@ class TradingStrategyService:
 
         return result
 
+    @staticmethod
+    def _analyze_symbols(
+        session: Session,
+        symbols: set[str],
+    ) -> dict[str, dict[str, any]]:
+        """Analyze the recent price history of several stocks at once.
+
+        Stocks are looked up in one query and their price histories are loaded
+        with one windowed query, so each symbol is fetched and analyzed once no
+        matter how many services trade it.
+
+        Args:
+            session: Database session
+            symbols: Stock symbols to analyze
+
+        Returns:
+            Dictionary mapping each symbol with enough data to its price analysis
+
+        """
+        stocks: list[Stock] = StockService.find_by_symbols(session, list(symbols))
+        symbols_by_id: dict[int, str] = {stock.id: stock.symbol for stock in stocks}
+
+        end_date: date = get_current_date()
+        close_prices: dict[int, list[float]] = defaultdict(list)
+        for stock_id, _, close_price in StockService.get_close_prices_for_stocks(
+            session,
+            list(symbols_by_id),
+            end_date - timedelta(days=TradingStrategyService.PRICE_HISTORY_DAYS),
+            end_date,
+        ):
+            close_prices[stock_id].append(float(close_price))
+
+        return {
+            symbols_by_id[stock_id]: TechnicalAnalysisService.get_price_analysis(
+                prices,
+            )
+            for stock_id, prices in close_prices.items()
+            if len(prices) >= TradingStrategyService.MIN_PRICE_DATA_POINTS
+        }
+
+    @staticmethod
+    def execute_all_strategies(session: Session) -> dict[str, any]:
+        """Execute the trading strategy for every active service in one batch.
+
+        Active services are grouped by stock symbol, so each symbol's history
+        is loaded and analyzed once. Every service's decision is applied inside
+        one database transaction, with a savepoint per service so a failed
+        trade does not undo the others. Events are emitted after the commit.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Dictionary with per-service results and a summary of actions taken
+
+        """
+        services: list[TradingService] = TradingServiceService.get_active(session)
+        analyses: dict[str, dict[str, any]] = TradingStrategyService._analyze_symbols(
+            session,
+            {service.stock_symbol for service in services},
+        )
+
+        results: list[dict[str, any]] = []
+        traded: list[tuple[str, int, TradingService]] = []
+        for service in services:
+            price_analysis: dict[str, any] | None = analyses.get(service.stock_symbol)
+            current_price: float | None = (
+                price_analysis.get("latest_price") if price_analysis else None
+            )
+            if not current_price:
+                results.append(
+                    {
+                        "success": False,
+                        "service_id": service.id,
+                        "stock_symbol": service.stock_symbol,
+                        "action": "none",
+                        "message": "Insufficient price data for analysis",
+                    },
+                )
+                continue
+
+            savepoint: SessionTransaction = session.begin_nested()
+            result: dict[str, any] = TradingStrategyService._apply_strategy(
+                session,
+                service,
+                price_analysis,
+                current_price,
+                commit=False,
+            )
+            if not result.get("success", False):
+                savepoint.rollback()
+                results.append(result)
+                continue
+
+            savepoint.commit()
+            if result.get("action") in ("buy", "sell"):
+                event_action: str = (
+                    "created" if result["action"] == "buy" else "completed"
+                )
+                traded.append((event_action, result["transaction_id"], service))
+            results.append(result)
+
+        session.commit()
+
+        for event_action, transaction_id, service in traded:
+            TransactionService.emit_transaction_events(
+                event_action,
+                TransactionService.get_or_404(session, transaction_id),
+                service,
+            )
+
+        action_counts: Counter[str] = Counter(
+            result.get("action", "none") for result in results
+        )
+        return {
+            "success": True,
+            "services_processed": len(results),
+            "symbols_analyzed": len(analyses),
+            "actions": {
+                "buy": action_counts["buy"],
+                "sell": action_counts["sell"],
+                "none": action_counts["none"],
+            },
+            "results": results,
+        }
+
     @staticmethod
     def check_price_conditions(
         session: Session,
@@ -576,7 +752,7 @@ class TradingStrategyService:
                 price_history := StockService.get_recent_prices(
                     session,
                     stock.id,
-                    90,
+                    TradingStrategyService.PRICE_HISTORY_DAYS,
                 )
             )
             or len(price_history) < TradingStrategyService.MIN_PRICE_DATA_POINTS
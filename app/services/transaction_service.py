@@ -9,13 +9,16 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from sqlalchemy import Column, ColumnCollection, Result
     from sqlalchemy.orm import Session
 
+    from app.utils.row_serializer import RowSerializer
+
 from app.api.schemas.trading_service import service_schema
 from app.api.schemas.trading_transaction import transaction_schema
 from app.models.enums import TransactionState
@@ -23,6 +26,7 @@ from app.models.stock import Stock
 from app.models.trading_service import TradingService
 from app.models.trading_transaction import TradingTransaction
 from app.services.events import EventService
+from app.utils.constants import PaginationConstants
 from app.utils.current_datetime import get_current_datetime
 from app.utils.errors import (
     AuthorizationError,
@@ -32,6 +36,7 @@ from app.utils.errors import (
     TransactionError,
     ValidationError,
 )
+from app.utils.query_utils import apply_pagination, keyset_page
 
 # Set up logging
 logger: logging.Logger = logging.getLogger(__name__)
@@ -100,28 +105,27 @@ class TransactionService:
             ValidationError: If state is invalid
 
         """
-        try:
-            transactions: list[TradingTransaction] = (
-                session.execute(
-                    select(TradingTransaction).where(
-                        TradingTransaction.service_id == service_id,
-                    ),
-                )
-                .scalars()
-                .all()
+        if state and not TransactionState.is_valid(state):
+            TransactionService._raise_validation_error(
+                TransactionError.INVALID_STATE.format(state),
             )
 
-            if state and not TransactionState.is_valid(state):
-                TransactionService._raise_validation_error(
-                    TransactionError.INVALID_STATE.format(state),
-                )
-
-            if state:
-                transactions = [t for t in transactions if t.state == state]
+        query: Select[tuple[TradingTransaction]] = select(TradingTransaction).where(
+            TradingTransaction.service_id == service_id,
+        )
+        if state:
+            query = query.where(TradingTransaction.state == state)
 
-            return sorted(transactions, key=lambda x: x.purchase_date, reverse=True)
-        except ValueError as e:
-            TransactionService._raise_validation_error(str(e))
+        return (
+            session.execute(
+                query.order_by(
+                    TradingTransaction.purchase_date.desc(),
+                    TradingTransaction.id.desc(),
+                ),
+            )
+            .scalars()
+            .all()
+        )
 
     @staticmethod
     def get_open_transactions(
@@ -138,21 +142,23 @@ class TransactionService:
             List of open transactions
 
         """
-        transactions: list[TradingTransaction] = (
+        query: Select[tuple[TradingTransaction]] = select(TradingTransaction).where(
+            TradingTransaction.state == TransactionState.OPEN.value,
+        )
+        if service_id is not None:
+            query = query.where(TradingTransaction.service_id == service_id)
+
+        return (
             session.execute(
-                select(TradingTransaction).where(
-                    TradingTransaction.state == TransactionState.OPEN.value,
+                query.order_by(
+                    TradingTransaction.purchase_date.desc(),
+                    TradingTransaction.id.desc(),
                 ),
             )
             .scalars()
             .all()
         )
 
-        if service_id is not None:
-            transactions = [t for t in transactions if t.service_id == service_id]
-
-        return sorted(transactions, key=lambda x: x.purchase_date, reverse=True)
-
     @staticmethod
     def check_ownership(session: Session, transaction_id: int, user_id: int) -> bool:
         """Check if a user owns a transaction (through service ownership).
@@ -449,6 +455,45 @@ class TransactionService:
         return updated
 
     # Write operations
+    @staticmethod
+    def emit_transaction_events(
+        action: str,
+        transaction: TradingTransaction,
+        service: TradingService,
+    ) -> None:
+        """Emit the WebSocket events for a committed transaction change.
+
+        Args:
+            action: Transaction action (e.g., "created", "completed")
+            transaction: The changed transaction
+            service: The transaction's trading service
+
+        """
+        # Prepare response data
+        transaction_data: dict[str, any] = transaction_schema.dump(transaction)
+        transaction_data_dict: dict[str, any] = (
+            transaction_data
+            if isinstance(transaction_data, dict)
+            else transaction_data[0]
+        )
+
+        service_data: dict[str, any] = service_schema.dump(service)
+        service_data_dict: dict[str, any] = (
+            service_data if isinstance(service_data, dict) else service_data[0]
+        )
+
+        EventService.emit_transaction_update(
+            action=action,
+            transaction_data=transaction_data_dict,
+            service_id=service.id,
+        )
+
+        EventService.emit_service_update(
+            action="balance_updated",
+            service_data=service_data_dict,
+            service_id=service.id,
+        )
+
     @staticmethod
     def create_buy_transaction(
         session: Session,
@@ -456,6 +501,8 @@ class TransactionService:
         stock_symbol: str,
         shares: float,
         purchase_price: float,
+        *,
+        commit: bool = True,
     ) -> TradingTransaction:
         """Create a new buy transaction for a trading service.
 
@@ -465,6 +512,8 @@ class TransactionService:
             stock_symbol: Stock symbol to buy
             shares: Number of shares to buy
             purchase_price: Price per share
+            commit: Commit and emit events; when False the changes are only
+                flushed and the caller owns the transaction and events
 
         Returns:
             The created transaction instance
@@ -550,37 +599,23 @@ class TransactionService:
             service.updated_at = get_current_datetime()
             service.active_transaction_id = transaction.id
 
-            session.commit()
-
-            # Prepare response data
-            transaction_data: dict[str, any] = transaction_schema.dump(transaction)
-            transaction_data_dict: dict[str, any] = (
-                transaction_data
-                if isinstance(transaction_data, dict)
-                else transaction_data[0]
-            )
+            if not commit:
+                session.flush()
+                return transaction
 
-            service_data: dict[str, any] = service_schema.dump(service)
-            service_data_dict: dict[str, any] = (
-                service_data if isinstance(service_data, dict) else service_data[0]
-            )
+            session.commit()
 
             # Emit WebSocket events
-            EventService.emit_transaction_update(
-                action="created",
-                transaction_data=transaction_data_dict,
-                service_id=service_id,
-            )
-
-            EventService.emit_service_update(
-                action="balance_updated",
-                service_data=service_data_dict,
-                service_id=service_id,
+            TransactionService.emit_transaction_events(
+                "created",
+                transaction,
+                service,
             )
 
         except Exception as e:
             logger.exception("Error creating buy transaction")
-            session.rollback()
+            if commit:
+                session.rollback()
             TransactionService._reraise_or_convert_error(
                 e,
                 (ValidationError, ResourceNotFoundError, BusinessLogicError),
@@ -594,6 +629,8 @@ class TransactionService:
         session: Session,
         transaction_id: int,
         sale_price: float,
+        *,
+        commit: bool = True,
     ) -> TradingTransaction:
         """Complete (sell) an open transaction.
 
@@ -601,6 +638,8 @@ class TransactionService:
             session: Database session
             transaction_id: Transaction ID to complete
             sale_price: Sale price per share
+            commit: Commit and emit events; when False the changes are only
+                flushed and the caller owns the transaction and events
 
         Returns:
             Updated transaction instance
@@ -660,40 +699,23 @@ class TransactionService:
             # Set active transaction to None
             service.active_transaction_id = None
 
-            session.commit()
-
-            # Prepare response data
-            transaction_data: dict[str, any] = transaction_schema.dump(transaction)
-            transaction_data_dict: dict[str, any] = (
-                transaction_data
-                if isinstance(transaction_data, dict)
-                else transaction_data[0]
-            )
-
-            service_data: dict[str, any] = service_schema.dump(service)
-            service_data_dict: dict[str, any] = (
-                service_data if isinstance(service_data, dict) else service_data[0]
-            )
+            if not commit:
+                session.flush()
+                return transaction
 
-            # Store service ID for event emission
-            service_id_val: int = service.id
+            session.commit()
 
             # Emit WebSocket events
-            EventService.emit_transaction_update(
-                action="completed",
-                transaction_data=transaction_data_dict,
-                service_id=service_id_val,
-            )
-
-            EventService.emit_service_update(
-                action="balance_updated",
-                service_data=service_data_dict,
-                service_id=service_id_val,
+            TransactionService.emit_transaction_events(
+                "completed",
+                transaction,
+                service,
             )
 
         except Exception as e:
             logger.exception("Error completing transaction")
-            session.rollback()
+            if commit:
+                session.rollback()
             TransactionService._reraise_or_convert_error(
                 e,
                 (ValidationError, ResourceNotFoundError, BusinessLogicError),
@@ -1118,6 +1140,58 @@ class TransactionService:
             select(TradingService).where(TradingService.id == service_id),
         ).scalar_one_or_none()
 
+    @staticmethod
+    def _filter_transactions(query: Select, filters: dict[str, any]) -> Select:
+        """Apply the owner, service and state filters to a transaction query.
+
+        Args:
+            query: Select statement over TradingTransaction
+            filters: Filters to apply (user_id, service_id, state)
+
+        Returns:
+            The filtered select statement
+
+        """
+        if filters.get("user_id") is not None:
+            query = query.join(
+                TradingService,
+                TradingService.id == TradingTransaction.service_id,
+            ).where(TradingService.user_id == filters["user_id"])
+        if filters.get("service_id") is not None:
+            query = query.where(TradingTransaction.service_id == filters["service_id"])
+        if filters.get("state"):
+            query = query.where(TradingTransaction.state == filters["state"])
+        return query
+
+    @staticmethod
+    def _order_transactions(
+        query: Select[tuple[TradingTransaction]],
+        sort_field: str = "purchase_date",
+        sort_order: str = "desc",
+    ) -> Select[tuple[TradingTransaction]]:
+        """Order a transaction query by a column, newest first on ties.
+
+        Args:
+            query: Select statement over TradingTransaction
+            sort_field: Column to sort by, purchase_date if it is not a column
+            sort_order: Sort direction (asc/desc)
+
+        Returns:
+            The ordered select statement
+
+        """
+        columns: ColumnCollection = TradingTransaction.__table__.columns
+        column: Column = columns.get(sort_field, columns["purchase_date"])
+        descending: bool = sort_order.lower() == "desc"
+        return query.order_by(
+            column.desc() if descending else column.asc(),
+            # Rows without a value sort by purchase date, then by ID
+            TradingTransaction.purchase_date.desc()
+            if descending
+            else TradingTransaction.purchase_date.asc(),
+            TradingTransaction.id.desc() if descending else TradingTransaction.id.asc(),
+        )
+
     @staticmethod
     def get_transactions_for_user(
         session: Session,
@@ -1132,92 +1206,101 @@ class TransactionService:
             filters: Optional filters to apply (service_id, state)
 
         Returns:
-            List of filtered transactions owned by the user
+            List of filtered transactions owned by the user, newest first
 
         """
-        # Get all services owned by the user
-        user_services: list[TradingService] = TransactionService.get_services_by_user(
-            session,
-            user_id,
+        query: Select[tuple[TradingTransaction]] = (
+            TransactionService._filter_transactions(
+                select(TradingTransaction),
+                {**(filters or {}), "user_id": user_id},
+            )
+        )
+        return (
+            session.execute(TransactionService._order_transactions(query))
+            .scalars()
+            .all()
         )
-
-        if not user_services:
-            return []
-
-        service_ids: list[int] = [service.id for service in user_services]
-        filters = filters or {}
-
-        all_transactions: list[TradingTransaction] = []
-
-        # If filtering by specific service
-        if "service_id" in filters and filters["service_id"] in service_ids:
-            if "state" in filters:
-                transactions: list[TradingTransaction] = (
-                    TransactionService.get_by_service(
-                        session,
-                        filters["service_id"],
-                        filters["state"],
-                    )
-                )
-            else:
-                transactions: list[TradingTransaction] = (
-                    TransactionService.get_by_service(
-                        session,
-                        filters["service_id"],
-                    )
-                )
-            all_transactions.extend(transactions)
-        else:
-            # Get transactions for all user's services
-            for service_id in service_ids:
-                if "state" in filters:
-                    transactions: list[TradingTransaction] = (
-                        TransactionService.get_by_service(
-                            session,
-                            service_id,
-                            filters["state"],
-                        )
-                    )
-                else:
-                    transactions: list[TradingTransaction] = (
-                        TransactionService.get_by_service(
-                            session,
-                            service_id,
-                        )
-                    )
-                all_transactions.extend(transactions)
-
-        return all_transactions
 
     @staticmethod
-    def sort_transactions(
-        transactions: list[TradingTransaction],
-        sort_field: str = "purchase_date",
-        sort_order: str = "desc",
-    ) -> list[TradingTransaction]:
-        """Sort transactions by the specified field and order.
+    def get_filtered_transactions(
+        session: Session,
+        filters: dict[str, any] | None = None,
+        page: int = PaginationConstants.DEFAULT_PAGE,
+        per_page: int = PaginationConstants.DEFAULT_PER_PAGE,
+        cursor: str | None = None,
+        *,
+        serializer: RowSerializer | None = None,
+    ) -> dict[str, any]:
+        """Get one page of transactions, filtered, sorted and paginated in SQL.
 
         Args:
-            transactions: List of transactions to sort
-            sort_field: Field to sort by (default: purchase_date)
-            sort_order: Sort direction (asc/desc)
+            session: Database session
+            filters: Optional filters (user_id, service_id, state) and sorting
+                (sort, order)
+            page: Page number for pagination
+            per_page: Items per page
+            cursor: Cursor of the previous page to page through the transactions
+                by purchase date instead of by page number, empty for the first
+                page; the sort field is ignored when paging by cursor
+            serializer: Select only the fields of this serializer and return
+                its dicts as items instead of TradingTransaction instances
 
         Returns:
-            Sorted list of transactions
+            Dictionary with the transactions of the page and pagination metadata
 
         """
+        filters = filters or {}
+        base: Select = serializer.select() if serializer else select(TradingTransaction)
+
+        # Cursor pages seek past the previous page and need no total count
+        if cursor is not None:
+            pagination_info: dict[str, any] = apply_pagination(
+                TransactionService._filter_transactions(base, filters),
+                per_page=per_page,
+                keyset=(TradingTransaction.purchase_date, TradingTransaction.id),
+                cursor=cursor,
+                descending=(filters.get("order") or "desc").lower() == "desc",
+            )
+            result: Result = session.execute(pagination_info["query"])
+            page_result: dict[str, any] = keyset_page(
+                result.all() if serializer else result.scalars().all(),
+                pagination_info,
+            )
+            if serializer:
+                page_result["items"] = serializer.dump(page_result["items"])
+            return page_result
+
+        query: Select = TransactionService._order_transactions(
+            TransactionService._filter_transactions(base, filters),
+            filters.get("sort") or "purchase_date",
+            filters.get("order") or "desc",
+        )
+        pagination_info: dict[str, any] = apply_pagination(query, page, per_page)
+        per_page = pagination_info["per_page"]
 
-        def get_sort_key(t: TradingTransaction) -> any:
-            try:
-                val: any | None = getattr(t, sort_field, None)
-                if val is None:
-                    val = getattr(t, "purchase_date", None)
-            except AttributeError:
-                return None
-            return val
-
-        return sorted(
-            transactions,
-            key=get_sort_key,
-            reverse=(sort_order.lower() == "desc"),
+        total: int = (
+            session.execute(
+                TransactionService._filter_transactions(
+                    select(func.count()).select_from(TradingTransaction),
+                    filters,
+                ),
+            ).scalar()
+            or 0
+        )
+        result: Result = session.execute(pagination_info["query"])
+        items: list[TradingTransaction] | list[dict[str, any]] = (
+            serializer.dump(result.all()) if serializer else result.scalars().all()
         )
+        total_pages: int = (total + per_page - 1) // per_page if total > 0 else 0
+
+        return {
+            "items": items,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total_items": total,
+                "total_pages": total_pages,
+                "has_next": page < total_pages,
+                "has_prev": page > 1,
+            },
+        }
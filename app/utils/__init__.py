@@ -12,8 +12,14 @@ from app.utils.auth import (
 )
 from app.utils.constants import (
     ApiConstants,
+    DatabaseConstants,
+    DataProviderConstants,
+    ExportConstants,
     PaginationConstants,
     PriceAnalysisConstants,
+    PriceCacheConstants,
+    PriceRefreshConstants,
+    SchedulerConstants,
     StockConstants,
     TimeConstants,
     TradingServiceConstants,
@@ -37,6 +43,8 @@ from app.utils.errors import (
 from app.utils.query_utils import (
     apply_filters,
     apply_pagination,
+    cached_count,
+    keyset_page,
 )
 
 __all__: list[str] = [
@@ -44,9 +52,15 @@ __all__: list[str] = [
     "ApiConstants",
     "AuthorizationError",
     "BusinessLogicError",
+    "DatabaseConstants",
+    "DataProviderConstants",
+    "ExportConstants",
     "PaginationConstants",
     "PriceAnalysisConstants",
+    "PriceCacheConstants",
+    "PriceRefreshConstants",
     "ResourceNotFoundError",
+    "SchedulerConstants",
     "StockConstants",
     "TimeConstants",
     "TradingServiceConstants",
@@ -56,11 +70,13 @@ __all__: list[str] = [
     "api_error_handler",
     "apply_filters",
     "apply_pagination",
+    "cached_count",
     "get_current_date",
     "get_current_datetime",
     "get_current_time",
     "get_current_user",
     "handle_validation_error",
+    "keyset_page",
     "register_error_handlers",
     "require_ownership",
     "verify_resource_ownership",
@@ -0,0 +1,242 @@
+"""Columnar archive utilities for bulk price transfer.
+
+This module writes rows read in partitions from a database cursor as Arrow IPC
+streams or Parquet files, one record batch per partition, and reads such
+archives back as price columns. Archives are several times smaller and faster
+to parse than NDJSON, which suits moving whole histories between environments.
+Writing and reading archives requires the optional pyarrow package.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from app.services.data_providers.base import PriceColumns
+
+from app.utils.constants import ExportConstants
+from app.utils.errors import ValidationError
+
+
+def validate_archive_format(export_format: str | None) -> str:
+    """Validate an archive format, defaulting to Parquet.
+
+    Args:
+        export_format: Requested archive format, case-insensitive
+
+    Returns:
+        The normalized archive format
+
+    Raises:
+        ValidationError: If the format is not supported or pyarrow is missing
+
+    """
+    normalized: str = (export_format or ExportConstants.ARCHIVE_DEFAULT_FORMAT).lower()
+    if normalized not in ExportConstants.ARCHIVE_MIMETYPES:
+        raise ValidationError(
+            ValidationError.INVALID_EXPORT_FORMAT.format(
+                export_format,
+                ", ".join(ExportConstants.ARCHIVE_MIMETYPES),
+            ),
+        )
+    if pa is None:
+        raise ValidationError(ValidationError.ARCHIVE_UNAVAILABLE)
+    return normalized
+
+
+def archive_format_for_path(path: str | Path, export_format: str | None = None) -> str:
+    """Pick the archive format of a file from its suffix unless one is given.
+
+    Args:
+        path: Archive file path
+        export_format: Explicit archive format, which takes precedence
+
+    Returns:
+        The normalized archive format
+
+    Raises:
+        ValidationError: If the format is not supported or pyarrow is missing
+
+    """
+    if not export_format:
+        export_format = ExportConstants.ARCHIVE_SUFFIXES.get(Path(path).suffix.lower())
+    return validate_archive_format(export_format)
+
+
+def archive_schema(columns: Sequence[str]) -> pa.Schema:
+    """Build the Arrow schema of archive columns.
+
+    Args:
+        columns: Column names, each a key of ExportConstants.ARCHIVE_COLUMN_TYPES
+
+    Returns:
+        Schema with nullable fields in the order of the columns
+
+    """
+    return pa.schema(
+        [
+            (column, pa.type_for_alias(ExportConstants.ARCHIVE_COLUMN_TYPES[column]))
+            for column in columns
+        ],
+    )
+
+
+def _record_batch(rows: Sequence[Sequence[any]], schema: pa.Schema) -> pa.RecordBatch:
+    """Transpose row tuples into the column buffers of a record batch."""
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(values, type=field.type)
+            for values, field in zip(zip(*rows, strict=True), schema, strict=True)
+        ],
+        schema=schema,
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only stream that hands out the bytes written since the last drain.
+
+    The position keeps counting across drains, so writers that record offsets,
+    such as the Parquet footer, see the same positions as in a regular file.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position: int = 0
+
+    def writable(self) -> bool:
+        """Report that the sink accepts writes."""
+        return True
+
+    def write(self, data: bytes) -> int:
+        """Buffer written bytes until the next drain."""
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self._position
+
+    def drain(self) -> bytes:
+        """Return and forget the bytes written since the last drain."""
+        data: bytes = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _archive_writer(
+    sink: BinaryIO,
+    schema: pa.Schema,
+    export_format: str,
+) -> pa.ipc.RecordBatchStreamWriter | pq.ParquetWriter:
+    """Open an Arrow IPC stream or Parquet writer on a binary stream."""
+    if export_format == "arrow":
+        return pa.ipc.new_stream(sink, schema)
+    return pq.ParquetWriter(sink, schema)
+
+
+def write_archive(
+    partitions: Iterable[Sequence[Sequence[any]]],
+    columns: Sequence[str],
+    sink: BinaryIO,
+    export_format: str,
+) -> int:
+    """Write partitions of rows to a binary stream as an archive.
+
+    Each partition becomes one record batch, or one row group for Parquet, so
+    the memory used stays at a single partition however many rows are written.
+
+    Args:
+        partitions: Lists of row tuples, such as Result.partitions()
+        columns: Column names of the rows
+        sink: Writable binary stream, such as an open file
+        export_format: A format returned by validate_archive_format
+
+    Returns:
+        Number of rows written
+
+    """
+    schema: pa.Schema = archive_schema(columns)
+    count: int = 0
+    with _archive_writer(sink, schema, export_format) as writer:
+        for rows in partitions:
+            writer.write_batch(_record_batch(rows, schema))
+            count += len(rows)
+    return count
+
+
+def stream_archive(
+    partitions: Iterable[Sequence[Sequence[any]]],
+    columns: Sequence[str],
+    export_format: str,
+) -> Iterator[bytes]:
+    """Stream partitions of rows as chunks of an archive.
+
+    Args:
+        partitions: Lists of row tuples, such as Result.partitions()
+        columns: Column names of the rows
+        export_format: A format returned by validate_archive_format
+
+    Returns:
+        Iterator of byte chunks, one per partition plus the header and footer
+
+    """
+    schema: pa.Schema = archive_schema(columns)
+    sink: _ChunkSink = _ChunkSink()
+    with _archive_writer(sink, schema, export_format) as writer:
+        for rows in partitions:
+            writer.write_batch(_record_batch(rows, schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def read_archive(
+    source: bytes | BinaryIO,
+    export_format: str,
+    batch_size: int = ExportConstants.YIELD_PER,
+) -> Iterator[PriceColumns]:
+    """Read an archive as price columns, one record batch at a time.
+
+    Args:
+        source: Archive contents, or a readable binary stream such as an open file
+        export_format: A format returned by validate_archive_format
+        batch_size: Number of Parquet rows read per batch; Arrow streams keep
+            the batches they were written with
+
+    Returns:
+        Iterator of mappings of column name to values, with nulls as None
+
+    Raises:
+        ValidationError: If the archive cannot be read
+
+    """
+    if isinstance(source, bytes):
+        source = pa.BufferReader(source)
+    try:
+        batches: Iterable[pa.RecordBatch] = (
+            pa.ipc.open_stream(source)
+            if export_format == "arrow"
+            else pq.ParquetFile(source).iter_batches(batch_size=batch_size)
+        )
+        for batch in batches:
+            yield {
+                name: np.array(column.to_pylist(), dtype=object)
+                for name, column in zip(batch.schema.names, batch.columns, strict=True)
+            }
+    except (pa.ArrowInvalid, OSError) as e:
+        raise ValidationError(ValidationError.INVALID_ARCHIVE.format(e)) from e
@@ -91,10 +91,26 @@ class PriceAnalysisConstants:
     RSI_OVERSOLD: int = 30
     RSI_OVERBOUGHT: int = 70
     RSI_MIN_PERIODS: int = 15
+    RSI_PERIOD: int = 14
 
     # Constants for default periods
     DEFAULT_MA_PERIOD: int = 20
     DEFAULT_BB_PERIOD: int = 20
+    BB_NUM_STD: float = 2.0
+
+    # Lookback periods for price change reporting
+    PRICE_CHANGE_PERIODS: tuple[int, ...] = (1, 5, 10, 30, 90)
+
+
+# Price cache constants
+class PriceCacheConstants:
+    """Price cache related constants."""
+
+    # Enough closes for the longest moving average
+    MAX_DAILY_CLOSES: int = 250
+    MAX_ENTRIES: int = 1000
+    MAX_BYTES: int = 32 * 1024 * 1024
+    ENTRY_OVERHEAD_BYTES: int = 256  # Entry object, dict slot and bar
 
 
 # Time constants
@@ -105,6 +121,8 @@ class TimeConstants:
     TRADING_HOURS_START: str = "09:30"
     TRADING_HOURS_END: str = "16:00"
     MARKET_TIMEZONE: str = "America/New_York"
+    TRADING_MINUTES_PER_DAY: int = 390
+    TRADING_DAYS_PER_YEAR: int = 252
 
     # Time periods in seconds
     SECOND: int = 1
@@ -114,6 +132,127 @@ class TimeConstants:
     WEEK: int = 604800
 
 
+# Trading scheduler constants
+class SchedulerConstants:
+    """Trading scheduler related constants."""
+
+    DEFAULT_TICK_INTERVAL: float = 60.0  # Seconds between ticks
+    STOP_TIMEOUT: float = 30.0  # Seconds to wait for the running tick on stop
+
+    # Upper bounds (seconds) of the latency histogram buckets
+    LATENCY_BUCKETS: tuple[float, ...] = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    )
+
+
+# Price refresh constants
+class PriceRefreshConstants:
+    """Price refresh orchestrator related constants."""
+
+    DEFAULT_MAX_WORKERS: int = 4  # Provider fetches running concurrently
+    DEFAULT_BATCH_SIZE: int = 50  # Symbols per multi-ticker fetch
+    DEFAULT_RATE: float = 2.0  # Provider requests per second
+    DEFAULT_BURST: int = 4  # Requests allowed at once after idling
+    MAX_RETRIES: int = 3  # Retries of a failed fetch
+    RETRY_BACKOFF: float = 1.0  # Seconds before the first retry, then doubled
+    MAX_BACKOFF: float = 30.0  # Upper bound of a single retry delay
+    WRITE_QUEUE_SIZE: int = 16  # Fetched batches buffered for the writer
+
+
+# Data provider constants
+class DataProviderConstants:
+    """Market data provider related constants."""
+
+    DEFAULT_PROVIDER: str = "yfinance"
+    DEFAULT_REPLAY_SPEED: float = 1.0  # Recorded seconds replayed per second
+    REPLAY_FILE_SUFFIXES: tuple[str, ...] = (".parquet", ".csv")
+
+    # Length of the provider period strings in days; 'ytd' and 'max' are
+    # resolved against the end of the window
+    PERIOD_DAYS: dict[str, int] = {
+        "1d": 1,
+        "5d": 5,
+        "1mo": 30,
+        "3mo": 90,
+        "6mo": 182,
+        "1y": 365,
+        "2y": 730,
+        "5y": 1826,
+        "10y": 3652,
+    }
+
+    # Days stored history may start after a period window and still resume it,
+    # covering weekends and holidays
+    RESUME_TOLERANCE_DAYS: int = 4
+
+
+# Price history export constants
+class ExportConstants:
+    """Streaming price history export related constants."""
+
+    DEFAULT_FORMAT: str = "ndjson"
+    MIMETYPES: dict[str, str] = {
+        "ndjson": "application/x-ndjson",
+        "csv": "text/csv",
+    }
+    YIELD_PER: int = 5000  # Rows fetched from the cursor and written per chunk
+
+    # Columnar archives for bulk transfer, written with the optional pyarrow
+    ARCHIVE_DEFAULT_FORMAT: str = "parquet"
+    ARCHIVE_MIMETYPES: dict[str, str] = {
+        "arrow": "application/vnd.apache.arrow.stream",
+        "parquet": "application/vnd.apache.parquet",
+    }
+    ARCHIVE_SUFFIXES: dict[str, str] = {
+        ".arrow": "arrow",
+        ".arrows": "arrow",
+        ".parquet": "parquet",
+    }
+    # Arrow type of each archive column, as accepted by pyarrow.type_for_alias
+    ARCHIVE_COLUMN_TYPES: dict[str, str] = {
+        "symbol": "string",
+        "price_date": "date32",
+        "timestamp": "timestamp[us]",
+        "interval": "int32",
+        "open_price": "float64",
+        "high_price": "float64",
+        "low_price": "float64",
+        "close_price": "float64",
+        "adj_close": "float64",
+        "volume": "int64",
+        "source": "string",
+    }
+
+
+# Database engine constants
+class DatabaseConstants:
+    """Database engine profile defaults, overridable through the environment."""
+
+    # SQLite connection pragmas
+    SQLITE_JOURNAL_MODE: str = "WAL"  # Readers no longer block on writers
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # Safe with WAL, fsyncs at checkpoints
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # Bytes of the file memory-mapped
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait for locks instead of failing
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # Page cache per connection
+
+    # Connection pool of server databases such as PostgreSQL
+    POOL_SIZE: int = 10  # Connections kept open
+    MAX_OVERFLOW: int = 20  # Connections opened beyond the pool under load
+    POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+
+
 # API related constants
 class ApiConstants:
     """API related constants."""
@@ -142,3 +281,7 @@ class PaginationConstants:
     DEFAULT_PAGE: int = 1
     DEFAULT_PER_PAGE: int = 20
     MAX_PER_PAGE: int = 100
+
+    # Total counts of paginated listings are reused for a while between pages
+    COUNT_CACHE_TTL: float = 30.0  # Seconds before a count is run again
+    COUNT_CACHE_SIZE: int = 256  # Distinct count queries kept
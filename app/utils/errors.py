@@ -136,6 +136,14 @@ class ValidationError(APIError):
     INVALID_DATE_FORMAT: str = CommonErrorMessages.INVALID_DATE_FORMAT
     INVALID_DATETIME_FORMAT: str = CommonErrorMessages.INVALID_DATETIME_FORMAT
 
+    # Pagination validation
+    INVALID_CURSOR: str = "Invalid pagination cursor"
+    INVALID_EXPORT_FORMAT: str = "Invalid export format: {}. Valid options are: {}"
+    ARCHIVE_UNAVAILABLE: str = "Arrow and Parquet archives require pyarrow"
+    INVALID_ARCHIVE: str = "Invalid price archive: {}"
+    INVALID_ARCHIVE_KIND: str = "Invalid price archive kind: {}. Valid options are: {}"
+    MISSING_SYMBOLS: str = "At least one stock symbol is required"
+
     # Transaction validation specific messages
     SHARES_POSITIVE: str = "Shares must be greater than zero: key={}, value={}"
     PRICE_POSITIVE: str = CommonErrorMessages.PRICE_POSITIVE
@@ -397,6 +405,10 @@ class TradingServiceError(ValidationError):
     DELETE_SERVICE: str = "Could not delete trading service: {}"
     TOGGLE_ERROR: str = "Could not toggle trading service: {}"
     BACKTEST_FAILED: str = "Backtest failed: {}"
+    SWEEP_TOO_LARGE: str = "Parameter sweep has {} combinations; the maximum is {}"
+    SWEEP_EMPTY: str = "Parameter sweep grid must not be empty: key={}"
+    SWEEP_SORT_KEY: str = "Cannot rank parameter sweep by unknown metric: {}"
+    PORTFOLIO_SYMBOLS: str = "Portfolio backtest needs 1 to {} symbols, got {}"
     NO_SELL_NO_SHARES: str = "Cannot set mode to SELL when no shares are held"
     NO_BUY_MIN_BALANCE: str = (
         "Cannot set mode to BUY when balance is at or below minimum"
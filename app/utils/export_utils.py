@@ -0,0 +1,130 @@
+"""Export utilities for streaming query results.
+
+This module turns rows read in partitions from a database cursor into chunks
+of NDJSON or CSV text, so large price histories can be streamed to clients
+without building the whole response in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+from typing import TYPE_CHECKING
+
+from flask import Response
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+from app.utils.constants import ExportConstants
+from app.utils.errors import ValidationError
+
+
+def validate_export_format(export_format: str | None) -> str:
+    """Validate an export format, defaulting to NDJSON.
+
+    Args:
+        export_format: Requested export format, case-insensitive
+
+    Returns:
+        The normalized export format
+
+    Raises:
+        ValidationError: If the format is not supported
+
+    """
+    normalized: str = (export_format or ExportConstants.DEFAULT_FORMAT).lower()
+    if normalized not in ExportConstants.MIMETYPES:
+        raise ValidationError(
+            ValidationError.INVALID_EXPORT_FORMAT.format(
+                export_format,
+                ", ".join(ExportConstants.MIMETYPES),
+            ),
+        )
+    return normalized
+
+
+def _json_default(value: any) -> any:
+    """Serialize dates and timestamps as ISO strings."""
+    if isinstance(value, date):
+        return value.isoformat()
+    msg: str = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _ndjson_chunk(rows: Sequence[Sequence[any]], columns: Sequence[str]) -> str:
+    """Format rows as newline-delimited JSON objects."""
+    return "".join(
+        json.dumps(dict(zip(columns, row, strict=True)), default=_json_default) + "\n"
+        for row in rows
+    )
+
+
+def _csv_chunk(rows: Iterable[Sequence[any]]) -> str:
+    """Format rows as CSV lines."""
+    buffer: io.StringIO = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+def stream_export(
+    partitions: Iterable[Sequence[Sequence[any]]],
+    columns: Sequence[str],
+    export_format: str,
+) -> Iterator[str]:
+    """Stream partitions of rows as chunks of NDJSON or CSV text.
+
+    Each partition becomes one chunk, so the memory used stays at a single
+    partition however many rows are exported.
+
+    Args:
+        partitions: Lists of row tuples, such as Result.partitions()
+        columns: Column names of the rows
+        export_format: A format returned by validate_export_format
+
+    Returns:
+        Iterator of text chunks, starting with the header line for CSV
+
+    """
+    if export_format == "csv":
+        yield _csv_chunk([columns])
+        for rows in partitions:
+            yield _csv_chunk(rows)
+    else:
+        for rows in partitions:
+            yield _ndjson_chunk(rows, columns)
+
+
+def export_response(
+    chunks: Iterator[str] | Iterator[bytes],
+    export_format: str,
+    filename: str,
+) -> Response:
+    """Build a streaming attachment response from export chunks.
+
+    Args:
+        chunks: Iterator of text or byte chunks, such as a stream_export or
+            stream_archive generator that opens its own session; it runs after
+            the request has been handled, so it must not use the request context
+        export_format: A format returned by validate_export_format or
+            validate_archive_format
+        filename: Attachment file name without the extension
+
+    Returns:
+        Response streaming the chunks
+
+    """
+    return Response(
+        chunks,
+        mimetype=(
+            ExportConstants.MIMETYPES.get(export_format)
+            or ExportConstants.ARCHIVE_MIMETYPES[export_format]
+        ),
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format}"'
+            ),
+        },
+    )
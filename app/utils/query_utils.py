@@ -6,35 +6,88 @@ filtering.
 
 from __future__ import annotations
 
-from typing import Callable, TypeVar
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 from flask import request
-from sqlalchemy import Column, asc, desc, select
+from sqlalchemy import Column, asc, desc, literal, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from app.utils.constants import PaginationConstants
+from app.utils.errors import ValidationError
 
 T = TypeVar("T")
 
 
-def apply_pagination(
+def apply_pagination(  # noqa: PLR0913
     query: select,
     page: int = 1,
     per_page: int = PaginationConstants.DEFAULT_PER_PAGE,
+    *,
+    keyset: Sequence[InstrumentedAttribute] | None = None,
+    cursor: str | None = None,
+    descending: bool = True,
 ) -> dict[str, any]:
     """Apply pagination to a SQLAlchemy select statement or a Python list.
 
+    Select statements are paginated with LIMIT/OFFSET unless keyset columns are
+    given. Keyset pagination orders the statement by those columns and seeks
+    past the row the cursor points at, so deep pages cost as much as the first.
+    Pass the executed rows to keyset_page to get the page and its next cursor.
+
     Args:
         query: The SQLAlchemy select statement or Python list to paginate
-        page: Page number for pagination
+        page: Page number for pagination, ignored with a keyset
         per_page: Number of items per page
+        keyset: Non-null columns that order the rows uniquely, such as the
+            natural sort column followed by the primary key
+        cursor: Cursor of the last row of the previous page, None for the
+            first page of a keyset
+        descending: Whether the keyset is ordered in descending order
 
     Returns:
         dict: Contains paginated results and metadata
 
+    Raises:
+        ValidationError: If the cursor is invalid
+
     """
     # Limit page size to avoid overloading
     per_page = min(per_page, PaginationConstants.MAX_PER_PAGE)
 
+    if keyset is not None:
+        order_func: Callable = desc if descending else asc
+        query = query.order_by(None).order_by(*(order_func(key) for key in keyset))
+        if cursor:
+            values: list[any] = decode_cursor(cursor, keyset)
+            key: any = tuple_(*keyset)
+            after: any = tuple_(
+                *(
+                    literal(value, column.type)
+                    for column, value in zip(keyset, values, strict=True)
+                ),
+            )
+            query = query.where(key < after if descending else key > after)
+
+        # Fetch one extra row to know whether there is a next page
+        return {
+            "query": query.limit(per_page + 1),
+            "keyset": keyset,
+            "cursor": cursor,
+            "per_page": per_page,
+        }
+
     # Handle Python list
     if isinstance(query, list):
         # Calculate start and end indices
@@ -77,6 +130,146 @@ def apply_pagination(
     return {"items": items, "pagination": pagination}
 
 
+def keyset_page(rows: Sequence[any], pagination_info: dict[str, any]) -> dict[str, any]:
+    """Build a page and its metadata from the rows of a keyset query.
+
+    Args:
+        rows: Rows returned by the query of apply_pagination with a keyset
+        pagination_info: The result of apply_pagination with a keyset
+
+    Returns:
+        dict: Items of the page and pagination metadata with the next cursor
+
+    """
+    per_page: int = pagination_info["per_page"]
+    items: list[any] = list(rows[:per_page])
+    has_next: bool = len(rows) > per_page
+
+    return {
+        "items": items,
+        "pagination": {
+            "per_page": per_page,
+            "next_cursor": encode_cursor(
+                [getattr(items[-1], key.key) for key in pagination_info["keyset"]],
+            )
+            if has_next
+            else None,
+            "has_next": has_next,
+            "has_prev": bool(pagination_info["cursor"]),
+        },
+    }
+
+
+def encode_cursor(values: Sequence[any]) -> str:
+    """Encode the keyset values of a row as an opaque cursor.
+
+    Args:
+        values: Values of the keyset columns of the row
+
+    Returns:
+        URL-safe cursor string
+
+    """
+    payload: str = json.dumps(
+        [value.isoformat() if isinstance(value, date) else value for value in values],
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keyset: Sequence[InstrumentedAttribute]) -> list[any]:
+    """Decode a cursor into the values of the keyset columns.
+
+    Args:
+        cursor: Cursor returned by encode_cursor
+        keyset: Columns the cursor was encoded for
+
+    Returns:
+        Values of the keyset columns, converted to the column types
+
+    Raises:
+        ValidationError: If the cursor is malformed or does not match the keyset
+
+    """
+    try:
+        values: any = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)),
+        )
+        if not isinstance(values, list) or len(values) != len(keyset):
+            raise TypeError(cursor)
+
+        decoded: list[any] = []
+        for column, value in zip(keyset, values, strict=True):
+            python_type: type = column.type.python_type
+            if python_type in (date, datetime):
+                decoded.append(python_type.fromisoformat(value))
+            elif isinstance(value, python_type):
+                decoded.append(value)
+            else:
+                raise TypeError(value)
+    except (TypeError, ValueError) as e:
+        raise ValidationError(ValidationError.INVALID_CURSOR) from e
+    return decoded
+
+
+class _CountCache:
+    """Thread-safe cache of recent row counts, keyed by the count query."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._counts: OrderedDict[tuple[str, str], tuple[float, int]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def count(self, session: Session, count_query: select, ttl: float) -> int:
+        """Return a cached count younger than ttl, or run the count query."""
+        compiled: any = count_query.compile(dialect=session.get_bind().dialect)
+        key: tuple[str, str] = (str(compiled), repr(sorted(compiled.params.items())))
+        now: float = time.monotonic()
+        with self._lock:
+            cached: tuple[float, int] | None = self._counts.get(key)
+            if cached and now - cached[0] < ttl:
+                self._counts.move_to_end(key)
+                return cached[1]
+
+        total: int = session.execute(count_query).scalar() or 0
+        with self._lock:
+            self._counts[key] = (now, total)
+            self._counts.move_to_end(key)
+            while len(self._counts) > PaginationConstants.COUNT_CACHE_SIZE:
+                self._counts.popitem(last=False)
+        return total
+
+    def clear(self) -> None:
+        """Remove all cached counts."""
+        with self._lock:
+            self._counts.clear()
+
+
+_count_cache: _CountCache = _CountCache()
+
+
+def cached_count(
+    session: Session,
+    count_query: select,
+    ttl: float = PaginationConstants.COUNT_CACHE_TTL,
+) -> int:
+    """Count rows, reusing the result of the same count for up to ttl seconds.
+
+    Listings paged through one page after another run the same count on every
+    page. The cached total may lag behind rows written within the last ttl
+    seconds, which is acceptable for pagination metadata.
+
+    Args:
+        session: Database session
+        count_query: Select statement returning a single count
+        ttl: Seconds a count is reused for
+
+    Returns:
+        Number of rows counted by the query
+
+    """
+    return _count_cache.count(session, count_query, ttl)
+
+
 def _apply_range_filter(
     query: select,
     model_column: Column,
@@ -181,3 +374,88 @@ def apply_filters(
         )
 
     return query
+
+
+def build_upsert(
+    session: Session,
+    model: type[T],
+    conflict_columns: list[str],
+    update_columns: list[str] | None = None,
+) -> sqlite.Insert | postgresql.Insert:
+    """Build an INSERT ... ON CONFLICT statement for the session's database.
+
+    Rows are passed when executing the statement, so SQLAlchemy batches them
+    into multi-row INSERTs.
+
+    Args:
+        session: Database session whose dialect the statement is built for
+        model: Model class to insert into
+        conflict_columns: Columns of the unique constraint that detects conflicts
+        update_columns: Columns to overwrite on conflict; conflicting rows are
+            left unchanged if None
+
+    Returns:
+        Dialect-specific insert statement with an ON CONFLICT clause
+
+    Raises:
+        NotImplementedError: If the database does not support ON CONFLICT
+
+    """
+    dialect_name: str = session.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        stmt: sqlite.Insert | postgresql.Insert = sqlite.insert(model)
+    elif dialect_name == "postgresql":
+        stmt = postgresql.insert(model)
+    else:
+        msg = f"Upsert is not supported for the {dialect_name} dialect"
+        raise NotImplementedError(msg)
+
+    if update_columns is None:
+        return stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+    return stmt.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+
+
+def count_rows(data: Sequence[Mapping[str, any]] | Mapping[str, Sequence]) -> int:
+    """Count the rows of row-wise or columnar data.
+
+    Args:
+        data: List of row dictionaries, or a mapping of column name to values
+
+    Returns:
+        Number of rows
+
+    """
+    if isinstance(data, Mapping):
+        return len(next(iter(data.values()))) if data else 0
+    return len(data)
+
+
+def iter_rows(
+    data: Sequence[Mapping[str, any]] | Mapping[str, Sequence],
+    columns: Sequence[str],
+) -> Iterator[dict[str, any]]:
+    """Iterate over row-wise or columnar data as row dictionaries.
+
+    Columnar data, such as the NumPy arrays returned by the data providers, is
+    zipped into rows directly instead of being converted row by row.
+
+    Args:
+        data: List of row dictionaries, or a mapping of column name to values
+        columns: Columns to keep; columns missing from the data are left out
+
+    Returns:
+        Iterator of row dictionaries restricted to the given columns
+
+    """
+    if isinstance(data, Mapping):
+        present: list[str] = [column for column in columns if column in data]
+        return (
+            dict(zip(present, values, strict=True))
+            for values in zip(*(data[column] for column in present), strict=True)
+        )
+    return (
+        {column: row[column] for column in columns if column in row} for row in data
+    )
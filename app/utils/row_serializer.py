@@ -0,0 +1,118 @@
+"""Row serializer for read-only list responses.
+
+This module provides a column-driven alternative to dumping ORM instances
+through marshmallow schemas. The response fields, computed ones included, are
+SQL expressions selected by the list query itself, so each page is read as
+plain row tuples and turned into dicts without loading instances or calling a
+field method per row. Marshmallow stays in charge of validating input.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, DateTime, Select, select
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import ColumnElement, Label
+
+
+class RowSerializer:
+    """Precompiled serializer that turns row tuples into response dicts.
+
+    Dates and datetimes become ISO strings, as marshmallow dumps them; all
+    other values are emitted as read from the database. A field may map to a
+    nested object of columns, which is selected as flat columns and emitted
+    as a dict.
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, ColumnElement | Mapping[str, ColumnElement]],
+    ) -> None:
+        """Compile the selected columns and the conversions of a response.
+
+        Args:
+            fields: Mapping of response field name to the column or SQL
+                expression that computes it, or to a mapping of such for a
+                nested object, in response order
+
+        """
+        self.keys: tuple[str, ...] = tuple(fields)
+        columns: list[Label] = []
+        # Response field -> nested field names, None for a plain column
+        layout: list[tuple[str, tuple[str, ...] | None]] = []
+        for name, expression in fields.items():
+            if isinstance(expression, Mapping):
+                columns.extend(
+                    column.label(f"{name}_{key}") for key, column in expression.items()
+                )
+                layout.append((name, tuple(expression)))
+            else:
+                columns.append(expression.label(name))
+                layout.append((name, None))
+
+        self.columns: tuple[Label, ...] = tuple(columns)
+        self._layout: tuple[tuple[str, tuple[str, ...] | None], ...] | None = (
+            tuple(layout) if any(nested for _, nested in layout) else None
+        )
+        self._temporal: tuple[int, ...] = tuple(
+            index
+            for index, column in enumerate(self.columns)
+            if isinstance(column.type, (Date, DateTime))
+        )
+
+    def select(self) -> Select:
+        """Build a select statement of the response fields.
+
+        Returns:
+            Select statement to filter, order and paginate like a model select
+
+        """
+        return select(*self.columns)
+
+    def dump(self, rows: Iterable[Sequence[any]]) -> list[dict[str, any]]:
+        """Serialize rows of the response fields.
+
+        Args:
+            rows: Rows of a statement built from select()
+
+        Returns:
+            List of response dicts, one per row
+
+        """
+        keys: tuple[str, ...] = self.keys
+        temporal: tuple[int, ...] = self._temporal
+        if not temporal and self._layout is None:
+            return [dict(zip(keys, row, strict=True)) for row in rows]
+
+        items: list[dict[str, any]] = []
+        for row in rows:
+            values: list[any] = list(row)
+            for index in temporal:
+                if values[index] is not None:
+                    values[index] = values[index].isoformat()
+            items.append(
+                dict(zip(keys, values, strict=True))
+                if self._layout is None
+                else self._nest(values),
+            )
+        return items
+
+    def _nest(self, values: Sequence[any]) -> dict[str, any]:
+        """Build a response dict with nested objects from flat column values."""
+        item: dict[str, any] = {}
+        position: int = 0
+        for name, nested in self._layout:
+            if nested is None:
+                item[name] = values[position]
+                position += 1
+            else:
+                item[name] = dict(
+                    zip(nested, values[position : position + len(nested)], strict=True),
+                )
+                position += len(nested)
+        return item
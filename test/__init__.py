@@ -11,9 +11,21 @@ __all__: list[str] = [
     "app",
     "client",
     "db_session",
+    "test_backtest_service",
     "test_daily_price_api",
+    "test_daily_price_service",
+    "test_database",
     "test_intraday_price_api",
+    "test_intraday_price_service",
+    "test_price_archive_cli",
+    "test_price_cache",
+    "test_price_refresh",
+    "test_query_plan",
+    "test_replay_provider",
+    "test_row_serializer",
     "test_stock_api",
+    "test_technical_analysis",
+    "test_trading_scheduler",
     "test_trading_service_api",
     "test_transaction_api",
     "test_user_api",
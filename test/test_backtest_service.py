@@ -0,0 +1,156 @@
+"""Tests for the backtest simulation engine in BacktestService.
+
+This module checks the portfolio backtest against the single-stock simulation
+and the alignment of multi-stock price histories.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.backtest_service import BacktestService
+
+
+class TestBacktestService:
+    """Tests for backtest simulations that do not need the database."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        """Build a deterministic price series."""
+        self.dates: list[date] = [
+            date(2024, 1, 1) + timedelta(days=i) for i in range(200)
+        ]
+        self.prices: list[float] = [
+            100 + 8 * math.sin(i / 6) + (i % 4) * 0.5 for i in range(200)
+        ]
+
+    def test_single_stock_portfolio_matches_backtest(self) -> None:
+        """A one-stock portfolio trades exactly like the single-stock backtest."""
+        state = BacktestService.BacktestState(
+            current_balance=10000.0,
+            buy_threshold=1.0,
+            allocation_percent=50.0,
+        )
+        portfolio_values: list[float]
+        transactions: list[dict[str, any]]
+        portfolio_values, transactions = BacktestService._run_simulation(
+            state,
+            zip(self.dates, self.prices, strict=True),
+        )
+
+        dates: list[date]
+        prices: np.ndarray
+        dates, prices = BacktestService._build_price_matrix(
+            [
+                (1, day, price)
+                for day, price in zip(self.dates, self.prices, strict=True)
+            ],
+            [1],
+        )
+        buy_signals: np.ndarray
+        sell_signals: np.ndarray
+        buy_signals, sell_signals = BacktestService._portfolio_signal_masks(
+            prices,
+            1.0,
+        )
+        result: dict[str, any] = BacktestService._run_portfolio_simulation(
+            ["TEST"],
+            dates,
+            prices,
+            buy_signals,
+            sell_signals,
+            10000.0,
+            50.0,
+        )
+
+        assert transactions
+        assert result["portfolio_values"] == pytest.approx(portfolio_values)
+        assert [tx["type"] for tx in result["transactions"]] == [
+            tx["type"] for tx in transactions
+        ]
+
+    def test_price_matrix_forward_fills_gaps(self) -> None:
+        """Missing days are forward-filled after each stock's first price."""
+        rows: list[tuple[int, date, float]] = [
+            (1, self.dates[0], 10.0),
+            (1, self.dates[2], 12.0),
+            (2, self.dates[1], 20.0),
+        ]
+
+        dates: list[date]
+        prices: np.ndarray
+        dates, prices = BacktestService._build_price_matrix(rows, [1, 2])
+
+        assert dates == self.dates[:3]
+        assert prices[:, 0].tolist() == [10.0, 10.0, 12.0]
+        assert np.isnan(prices[0, 1])
+        assert prices[1:, 1].tolist() == [20.0, 20.0]
+
+    def test_intraday_annualization(self) -> None:
+        """Bars per year scale with the number of bars in a session."""
+        assert BacktestService._periods_per_year(1) == 252 * 390
+        assert BacktestService._periods_per_year(60) == 252 * 7
+
+        daily: dict[str, any] = BacktestService._calculate_backtest_metrics(
+            self.prices,
+            self.prices[0],
+            len(self.prices),
+        )
+        intraday: dict[str, any] = BacktestService._calculate_backtest_metrics(
+            self.prices,
+            self.prices[0],
+            len(self.prices),
+            BacktestService._periods_per_year(1),
+        )
+        assert intraday["volatility"] == pytest.approx(daily["volatility"])
+        assert intraday["total_return_pct"] == pytest.approx(
+            daily["total_return_pct"],
+        )
+        assert abs(intraday["annualized_return_pct"]) > abs(
+            daily["annualized_return_pct"],
+        )
+
+    def test_drawdown_duration_counts_bars_under_water(self) -> None:
+        """Drawdown duration is the longest run of bars below a prior peak."""
+        metrics: dict[str, any] = BacktestService._calculate_backtest_metrics(
+            [100.0, 120.0, 90.0, 110.0, 130.0, 125.0],
+            100.0,
+            6,
+        )
+
+        assert metrics["max_drawdown_pct"] == pytest.approx(25.0)
+        assert metrics["max_drawdown_duration"] == 2
+        assert metrics["calmar_ratio"] == pytest.approx(
+            metrics["annualized_return_pct"] / 100 / 0.25,
+        )
+
+    def test_trade_statistics_and_exposure(self) -> None:
+        """Closed trades and time in the market are summarised."""
+        transactions: list[dict[str, any]] = [
+            {"type": "buy", "cost": 100.0},
+            {"type": "sell", "revenue": 110.0, "gain_loss": 10.0},
+            {"type": "buy", "cost": 100.0},
+            {"type": "sell", "revenue": 95.0, "gain_loss": -5.0},
+        ]
+
+        metrics: dict[str, any] = BacktestService._calculate_backtest_metrics(
+            self.prices,
+            self.prices[0],
+            len(self.prices),
+            transactions=transactions,
+            bars_in_market=50,
+        )
+        trades: dict[str, any] = metrics["trade_statistics"]
+
+        assert metrics["exposure_pct"] == pytest.approx(25.0)
+        assert trades["trade_count"] == 2
+        assert trades["win_rate_pct"] == pytest.approx(50.0)
+        assert trades["profit_factor"] == pytest.approx(2.0)
+        assert trades["best_trade_return_pct"] == pytest.approx(10.0)
+        assert trades["worst_trade_return_pct"] == pytest.approx(-5.0)
@@ -7,6 +7,8 @@ This module contains integration tests for the Daily Price API endpoints.
 
 from __future__ import annotations
 
+import io
+import json
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
@@ -199,6 +201,64 @@ class TestDailyPriceAPI:
         if len(data["items"]) > 0:
             assert data["items"][0]["stock_id"] == self.test_stock["id"]
 
+    def test_export_daily_prices(self) -> None:
+        """Test streaming the daily price history as NDJSON and CSV."""
+        # Export the history of the test stock in both formats
+        url: str = f"{self.base_url}/stock/{self.test_stock['id']}/export"
+        ndjson: Response = self.client.get(url)
+        csv: Response = self.client.get(f"{url}?format=csv")
+        invalid: Response = self.client.get(f"{url}?format=xml")
+
+        rows: list[dict[str, object]] = [
+            json.loads(line) for line in ndjson.get_data(as_text=True).splitlines()
+        ]
+        lines: list[str] = csv.get_data(as_text=True).splitlines()
+
+        # Verify both formats stream every stored day, oldest first
+        assert ndjson.status_code == ApiConstants.HTTP_OK
+        assert ndjson.mimetype == "application/x-ndjson"
+        assert get_current_date().isoformat() in [row["price_date"] for row in rows]
+        assert [row["price_date"] for row in rows] == sorted(
+            row["price_date"] for row in rows
+        )
+        assert csv.mimetype == "text/csv"
+        assert lines[0].startswith("price_date,open_price,")
+        assert len(lines) == len(rows) + 1
+        assert invalid.status_code == ApiConstants.HTTP_BAD_REQUEST
+
+    def test_archive_daily_prices(self) -> None:
+        """Test exporting daily prices as Parquet and importing them back."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        # Export the history of the test stock, then post the archive back
+        url: str = f"{self.base_url}/archive"
+        archive: Response = self.client.get(
+            f"{url}?symbols={self.test_stock['symbol'].lower()}",
+        )
+        imported: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{url}?format=parquet&update_existing=true",
+            admin=True,
+            data=archive.get_data(),
+            headers={"Content-Type": "application/vnd.apache.parquet"},
+        )
+        unknown: Response = self.client.get(f"{url}?symbols=NOSUCH")
+        missing: Response = self.client.get(url)
+
+        table = pq.read_table(io.BytesIO(archive.get_data()))
+
+        # Verify the archive holds every stored day and imports in full
+        assert archive.status_code == ApiConstants.HTTP_OK
+        assert archive.mimetype == "application/vnd.apache.parquet"
+        assert table.column_names[:2] == ["symbol", "price_date"]
+        assert set(table.column("symbol").to_pylist()) == {self.test_stock["symbol"]}
+        assert get_current_date() in table.column("price_date").to_pylist()
+        assert imported.status_code == ApiConstants.HTTP_OK
+        assert imported.get_json()["count"] == table.num_rows
+        assert unknown.status_code == ApiConstants.HTTP_NOT_FOUND
+        assert missing.status_code == ApiConstants.HTTP_BAD_REQUEST
+
     def test_create_daily_price_unauthorized(self) -> None:
         """Test creating a daily price without authentication."""
         # Define test data
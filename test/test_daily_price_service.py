@@ -0,0 +1,299 @@
+"""Tests for bulk daily price imports in DailyPriceService.
+
+This module checks that bulk imports insert new dates, skip or overwrite
+existing ones, and reject invalid rows without writing anything. It also
+checks cursor pagination and cached counts of the filtered price listing and
+the row partitions read by price history exports.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+import string
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+import pytest
+from sqlalchemy import Select, func, select
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from flask import Flask
+
+from app.models.stock import Stock
+from app.models.stock_daily_price import StockDailyPrice
+from app.services.daily_price_service import DailyPriceService
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import get_current_date
+from app.utils.errors import ValidationError
+from app.utils.query_utils import cached_count
+from test.utils import record_statements
+
+
+class TestDailyPriceBulkImport:
+    """Tests for DailyPriceService.bulk_import_daily_prices."""
+
+    symbol_suffixes: ClassVar[Iterator[str]] = iter(string.ascii_uppercase)
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Create a stock without prices for each test."""
+        self.app: Flask = app
+        self.start: date = get_current_date() - timedelta(days=30)
+        symbol: str = f"BULK{next(TestDailyPriceBulkImport.symbol_suffixes)}"
+        with SessionManager() as session:
+            stock: Stock = StockService.find_by_symbol(
+                session,
+                symbol,
+            ) or StockService.create_stock(
+                session,
+                {"symbol": symbol, "name": "Bulk Import Test"},
+            )
+            self.stock_id: int = stock.id
+
+    def _rows(self, count: int, offset: float = 0.0) -> list[dict[str, any]]:
+        """Build price rows for consecutive days from the start date."""
+        return [
+            {
+                "price_date": (self.start + timedelta(days=i)).isoformat(),
+                "open_price": 10.0 + i + offset,
+                "high_price": 11.0 + i + offset,
+                "low_price": 9.0 + i + offset,
+                "close_price": 10.5 + i + offset,
+                "volume": 1000 + i,
+            }
+            for i in range(count)
+        ]
+
+    def _count(self) -> int:
+        """Count the stored prices of the test stock."""
+        with SessionManager() as session:
+            return session.execute(
+                select(func.count()).where(StockDailyPrice.stock_id == self.stock_id),
+            ).scalar_one()
+
+    def test_import_skips_existing_dates(self) -> None:
+        """A second import only inserts the dates that are not stored yet."""
+        with SessionManager() as session:
+            first: list[StockDailyPrice] = DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(5),
+            )
+            second: list[StockDailyPrice] = DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(8, offset=100.0),
+            )
+            closes: list[float] = [record.close_price for record in second]
+
+        assert len(first) == 5
+        assert closes == [115.5, 116.5, 117.5]
+        assert self._count() == 8
+
+    def test_import_updates_existing_dates(self) -> None:
+        """With update_existing, stored dates are overwritten with new values."""
+        with SessionManager() as session:
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(3),
+            )
+            records: list[StockDailyPrice] = DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(4, offset=100.0),
+                update_existing=True,
+            )
+            closes: list[float] = [record.close_price for record in records]
+
+        assert closes == [110.5, 111.5, 112.5, 113.5]
+        assert self._count() == 4
+
+    def test_import_writes_one_insert(self) -> None:
+        """All rows of an import are written by one INSERT, returned in order."""
+        self.start = get_current_date() - timedelta(days=600)
+        with SessionManager() as session, record_statements() as statements:
+            records: list[StockDailyPrice] = DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(500),
+            )
+            dates: list[date] = [record.price_date for record in records]
+
+        inserts: list[str] = [
+            statement
+            for statement in statements
+            if statement.startswith("INSERT INTO stock_daily_prices")
+        ]
+        assert len(inserts) == 1
+        assert dates == [self.start + timedelta(days=i) for i in range(500)]
+        assert self._count() == 500
+
+    def test_duplicate_dates_keep_last_row(self) -> None:
+        """Rows repeating a date collapse to the last one."""
+        rows: list[dict[str, any]] = self._rows(2) + self._rows(1, offset=50.0)
+        with SessionManager() as session:
+            records: list[StockDailyPrice] = DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                rows,
+            )
+            closes: list[float] = [record.close_price for record in records]
+
+        assert sorted(closes) == [11.5, 60.5]
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("low_price", 50.0), ("close_price", -1.0), ("source", "UNKNOWN")],
+    )
+    def test_invalid_rows_are_rejected(self, key: str, value: object) -> None:
+        """One invalid row rejects the whole import."""
+        rows: list[dict[str, any]] = self._rows(5)
+        rows[3][key] = value
+        with SessionManager() as session, pytest.raises(ValidationError):
+            DailyPriceService.bulk_import_daily_prices(session, self.stock_id, rows)
+
+        assert self._count() == 0
+
+    def test_import_accepts_price_columns(self) -> None:
+        """Columnar price data is imported like the equivalent rows."""
+        rows: list[dict[str, any]] = self._rows(3)
+        columns: dict[str, np.ndarray] = {
+            key: np.array([row[key] for row in rows], dtype=object) for key in rows[0]
+        }
+        columns["volume"][1] = None
+        with SessionManager() as session:
+            records: list[StockDailyPrice] = DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                columns,
+            )
+            volumes: list[int | None] = [record.volume for record in records]
+
+        assert volumes == [1000, None, 1002]
+        assert self._count() == 3
+
+    def test_resume_dates_cover_period(self) -> None:
+        """Fetches resume from the last stored date only if it covers the period."""
+        with SessionManager() as session:
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(30),
+            )
+            month: dict[int, date] = DailyPriceService.get_resume_dates(
+                session,
+                [self.stock_id],
+                "1mo",
+            )
+            year: dict[int, date] = DailyPriceService.get_resume_dates(
+                session,
+                [self.stock_id],
+                "1y",
+            )
+
+        assert month == {self.stock_id: self.start + timedelta(days=29)}
+        assert year == {}
+
+    def test_filtered_prices_page_by_cursor(self) -> None:
+        """Cursor pages walk the prices newest first without totals or overlaps."""
+        filters: dict[str, any] = {"stock_id": self.stock_id}
+        with self.app.test_request_context(), SessionManager() as session:
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(5),
+            )
+            pages: list[dict[str, any]] = [
+                DailyPriceService.get_filtered_daily_prices(
+                    session,
+                    filters,
+                    per_page=2,
+                    cursor="",
+                ),
+            ]
+            while pages[-1]["pagination"]["has_next"]:
+                pages.append(
+                    DailyPriceService.get_filtered_daily_prices(
+                        session,
+                        filters,
+                        per_page=2,
+                        cursor=pages[-1]["pagination"]["next_cursor"],
+                    ),
+                )
+            dates: list[date] = [
+                price.price_date for page in pages for price in page["items"]
+            ]
+            with pytest.raises(ValidationError, match="Invalid pagination cursor"):
+                DailyPriceService.get_filtered_daily_prices(
+                    session,
+                    filters,
+                    cursor="not-a-cursor",
+                )
+
+        assert dates == [self.start + timedelta(days=i) for i in range(4, -1, -1)]
+        assert [len(page["items"]) for page in pages] == [2, 2, 1]
+        assert "total_items" not in pages[0]["pagination"]
+        assert pages[-1]["pagination"]["next_cursor"] is None
+
+    def test_filtered_prices_reuse_recent_count(self) -> None:
+        """Page counts are reused until the count cache expires."""
+        filters: dict[str, any] = {"stock_id": self.stock_id}
+        count_query: Select[tuple[int]] = (
+            select(func.count())
+            .select_from(StockDailyPrice)
+            .where(StockDailyPrice.stock_id == self.stock_id)
+        )
+        with self.app.test_request_context(), SessionManager() as session:
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(3),
+            )
+            first: dict[str, any] = DailyPriceService.get_filtered_daily_prices(
+                session,
+                filters,
+            )
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(5),
+            )
+            second: dict[str, any] = DailyPriceService.get_filtered_daily_prices(
+                session,
+                filters,
+                page=2,
+            )
+            fresh: int = cached_count(session, count_query, ttl=0)
+
+        assert first["pagination"]["total_items"] == 3
+        assert second["pagination"]["total_items"] == 3
+        assert fresh == 5
+
+    def test_stream_partitions_read_row_tuples(self) -> None:
+        """Exports read the history as row tuples in partitions of chunk_size."""
+        with SessionManager() as session:
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                self.stock_id,
+                self._rows(5),
+            )
+        with SessionManager(read_only=True) as session:
+            partitions: list[list[tuple]] = [
+                [tuple(row) for row in rows]
+                for rows in DailyPriceService.stream_daily_price_partitions(
+                    session,
+                    self.stock_id,
+                    start_date=self.start + timedelta(days=1),
+                    chunk_size=2,
+                )
+            ]
+
+        assert [len(rows) for rows in partitions] == [2, 2]
+        assert partitions[0][0][:2] == (self.start + timedelta(days=1), 11.0)
+        assert len(partitions[0][0]) == len(DailyPriceService.EXPORT_COLUMNS)
@@ -0,0 +1,145 @@
+"""Tests for the database engine profiles and session routing.
+
+This module checks that SQLite connections get the tuning pragmas of their
+profile, that server databases are profiled with a sized connection pool, and
+that read-only sessions are routed to the read engine.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from flask import Flask
+    from sqlalchemy import Connection, Engine
+    from sqlalchemy.orm import Session
+
+from app.models.stock import Stock
+from app.services import database
+from app.services.database import create_database_engine, get_engine_profile
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.constants import DatabaseConstants
+
+
+class TestEngineProfile:
+    """Tests for get_engine_profile and create_database_engine."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path) -> None:
+        """Point a SQLite URL at a temporary file."""
+        self.sqlite_url: str = f"sqlite:///{tmp_path / 'profile.db'}"
+
+    def test_sqlite_connections_apply_pragmas(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Every connection runs in WAL mode with the profile's settings."""
+        monkeypatch.setenv("DB_SQLITE_BUSY_TIMEOUT_MS", "1234")
+        engine: Engine = create_database_engine(self.sqlite_url)
+        try:
+            connection: Connection
+            with engine.connect() as connection:
+                pragmas: dict[str, any] = {
+                    name: connection.execute(text(f"PRAGMA {name}")).scalar()
+                    for name in (
+                        "journal_mode",
+                        "synchronous",
+                        "busy_timeout",
+                        "cache_size",
+                    )
+                }
+        finally:
+            engine.dispose()
+
+        assert pragmas == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "busy_timeout": 1234,
+            "cache_size": -DatabaseConstants.SQLITE_CACHE_SIZE_KB,
+        }
+
+    def test_server_databases_get_a_sized_pool(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Server URLs are profiled with pool settings instead of pragmas."""
+        monkeypatch.setenv("DB_POOL_SIZE", "3")
+
+        profile: dict[str, any] = get_engine_profile(
+            "postgresql://trader@localhost/daytrader",
+        )
+
+        assert profile == {
+            "backend": "postgresql",
+            "pool_size": 3,
+            "max_overflow": DatabaseConstants.MAX_OVERFLOW,
+            "pool_timeout": DatabaseConstants.POOL_TIMEOUT,
+            "pool_recycle": DatabaseConstants.POOL_RECYCLE,
+        }
+
+    def test_invalid_modes_are_rejected(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Mode overrides must be plain pragma keywords."""
+        monkeypatch.setenv("DB_SQLITE_JOURNAL_MODE", "WAL; DROP TABLE stocks")
+
+        with pytest.raises(ValueError, match="DB_SQLITE_JOURNAL_MODE"):
+            get_engine_profile(self.sqlite_url)
+
+
+class TestSessionRouting:
+    """Tests for read-only sessions of SessionManager."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Create a stock to read back."""
+        self.app: Flask = app
+        with SessionManager() as session:
+            self.stock_id: int = (
+                StockService.find_by_symbol(session, "ROUTE")
+                or StockService.create_stock(
+                    session,
+                    {"symbol": "ROUTE", "name": "Routing Test"},
+                )
+            ).id
+
+    def test_read_sessions_use_the_read_engine(self) -> None:
+        """Read sessions see committed writes through the read engine."""
+        session: Session
+        with SessionManager(read_only=True) as session:
+            symbol: str = session.scalar(
+                select(Stock.symbol).where(Stock.id == self.stock_id),
+            )
+            bind: Engine = session.get_bind()
+
+        assert symbol == "ROUTE"
+        assert bind is database.read_engine
+        assert not session.autoflush
+
+    @pytest.mark.skipif(
+        database.read_engine is database.engine,
+        reason="The read engine is shared with an in-memory primary",
+    )
+    def test_read_sessions_reject_writes(self) -> None:
+        """Writes through a SQLite read session fail instead of committing."""
+        with (
+            pytest.raises(OperationalError, match="readonly"),
+            SessionManager(read_only=True) as session,
+        ):
+            session.execute(
+                text("UPDATE stocks SET name = 'Changed' WHERE id = :id"),
+                {"id": self.stock_id},
+            )
+
+        with SessionManager() as session:
+            assert session.get(Stock, self.stock_id).name == "Routing Test"
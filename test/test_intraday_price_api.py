@@ -125,6 +125,89 @@ class TestIntradayPriceAPI:
             assert data["items"][0]["stock_id"] == self.test_stock["id"]
             assert data["items"][0]["stock_symbol"] == self.test_stock["symbol"]
 
+    def test_get_intraday_prices_by_cursor(self) -> None:
+        """Test paging through intraday prices with a cursor."""
+        # Get the first cursor page and a page with a malformed cursor
+        url: str = f"{self.base_url}?stock_id={self.test_stock['id']}&per_page=1"
+        response: Response = authenticated_request(
+            self.client,
+            "get",
+            f"{url}&cursor=",
+            admin=False,
+        )
+        data: dict[str, object] = response.get_json()
+        invalid: Response = authenticated_request(
+            self.client,
+            "get",
+            f"{url}&cursor=invalid",
+            admin=False,
+        )
+
+        # Verify cursor pages have no totals and bad cursors are rejected
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert "total_items" not in data["pagination"]
+        assert "next_cursor" in data["pagination"]
+        assert invalid.status_code == ApiConstants.HTTP_BAD_REQUEST
+
+    def test_export_intraday_prices(self) -> None:
+        """Test streaming the intraday price history as CSV."""
+        # Export the one-minute bars of the test stock
+        response: Response = self.client.get(
+            f"{self.base_url}/stock/{self.test_stock['id']}/export"
+            f"?format=csv&interval={IntradayInterval.ONE_MINUTE.value}",
+        )
+        missing: Response = self.client.get(f"{self.base_url}/stock/999999/export")
+        lines: list[str] = response.get_data(as_text=True).splitlines()
+
+        # Verify the header, the attachment name and a row per stored bar
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert response.mimetype == "text/csv"
+        disposition: str = response.headers["Content-Disposition"]
+        assert f"{self.test_stock['symbol']}_intraday.csv" in disposition
+        assert lines[0].startswith("timestamp,open_price,")
+        assert len(lines) > 1
+        assert missing.status_code == ApiConstants.HTTP_NOT_FOUND
+
+    def test_archive_intraday_prices(self) -> None:
+        """Test exporting intraday prices as Arrow IPC and importing them back."""
+        pa = pytest.importorskip("pyarrow")
+
+        # Export the one-minute bars, then post the archive and a broken one back
+        url: str = f"{self.base_url}/archive?format=arrow"
+        archive: Response = self.client.get(
+            f"{url}&symbols={self.test_stock['symbol']}"
+            f"&interval={IntradayInterval.ONE_MINUTE.value}",
+        )
+        imported: Response = authenticated_request(
+            self.client,
+            "post",
+            url,
+            admin=True,
+            data=archive.get_data(),
+            headers={"Content-Type": "application/vnd.apache.arrow.stream"},
+        )
+        broken: Response = authenticated_request(
+            self.client,
+            "post",
+            url,
+            admin=True,
+            data=b"not an archive",
+            headers={"Content-Type": "application/vnd.apache.arrow.stream"},
+        )
+
+        table = pa.ipc.open_stream(archive.get_data()).read_all()
+
+        # Verify the bars round-trip and existing bars are skipped on import
+        assert archive.status_code == ApiConstants.HTTP_OK
+        assert archive.mimetype == "application/vnd.apache.arrow.stream"
+        assert table.num_rows > 0
+        assert set(table.column("interval").to_pylist()) == {
+            IntradayInterval.ONE_MINUTE.value,
+        }
+        assert imported.status_code == ApiConstants.HTTP_OK
+        assert imported.get_json()["counts"] == {self.test_stock["symbol"]: 0}
+        assert broken.status_code == ApiConstants.HTTP_BAD_REQUEST
+
     def test_get_intraday_price_by_id(self) -> None:
         """Test getting an intraday price by ID."""
         # Get price by ID with authentication
@@ -0,0 +1,415 @@
+"""Tests for chunked intraday price imports in IntradayPriceService.
+
+This module checks deduplication, chunked and batched writes, skipping and
+overwriting of stored bars, and rejection of invalid rows.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+import string
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import func, select
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from flask import Flask
+
+from app.models.stock import Stock
+from app.models.stock_intraday_price import StockIntradayPrice
+from app.services.data_providers import yfinance_provider
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import (
+    TIMEZONE,
+    get_current_date,
+    get_current_datetime,
+)
+from app.utils.errors import ValidationError
+from test.utils import record_statements
+
+
+class TestIntradayPriceBulkImport:
+    """Tests for IntradayPriceService.bulk_import_intraday_prices."""
+
+    symbol_suffixes: ClassVar[Iterator[str]] = iter(string.ascii_uppercase)
+
+    class FakeTicker:
+        """Stand-in for yf.Ticker serving a fixed history frame."""
+
+        history_frame: ClassVar[pd.DataFrame | None] = None
+
+        def __init__(self, symbol: str) -> None:
+            """Store the ticker symbol."""
+            self.symbol: str = symbol
+
+        def history(self, **_kwargs: any) -> pd.DataFrame:
+            """Return the configured history frame."""
+            return self.history_frame
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Create a stock without prices for each test."""
+        self.app: Flask = app
+        self.start: datetime = (get_current_datetime() - timedelta(days=2)).replace(
+            hour=10,
+            minute=0,
+            second=0,
+            microsecond=0,
+            tzinfo=None,
+        )
+        symbol: str = f"INTR{next(TestIntradayPriceBulkImport.symbol_suffixes)}"
+        with SessionManager() as session:
+            stock: Stock = StockService.find_by_symbol(
+                session,
+                symbol,
+            ) or StockService.create_stock(
+                session,
+                {"symbol": symbol, "name": "Intraday Import Test"},
+            )
+            self.stock_id: int = stock.id
+
+    def _rows(self, count: int, offset: float = 0.0) -> list[dict[str, any]]:
+        """Build one-minute bars starting at the start time."""
+        return [
+            {
+                "timestamp": self.start + timedelta(minutes=i),
+                "interval": 1,
+                "open_price": 10.0 + i + offset,
+                "high_price": 11.0 + i + offset,
+                "low_price": 9.0 + i + offset,
+                "close_price": 10.5 + i + offset,
+                "volume": 100 + i,
+            }
+            for i in range(count)
+        ]
+
+    def _count(self) -> int:
+        """Count the stored bars of the test stock."""
+        with SessionManager() as session:
+            return session.execute(
+                select(func.count()).where(
+                    StockIntradayPrice.stock_id == self.stock_id,
+                ),
+            ).scalar_one()
+
+    def test_chunked_import_writes_every_row(self) -> None:
+        """Rows spread over several chunks and batches are all written."""
+        with SessionManager() as session:
+            records: list[StockIntradayPrice] = (
+                IntradayPriceService.bulk_import_intraday_prices(
+                    session,
+                    self.stock_id,
+                    self._rows(10),
+                    chunk_size=4,
+                    batch_size=3,
+                )
+            )
+            timestamps: list[datetime] = [record.timestamp for record in records]
+
+        assert timestamps == [row["timestamp"] for row in self._rows(10)]
+        assert self._count() == 10
+
+    def test_import_writes_one_insert_per_batch(self) -> None:
+        """Each batch of an import is written by one INSERT, returned in order."""
+        with SessionManager() as session, record_statements() as statements:
+            records: list[StockIntradayPrice] = (
+                IntradayPriceService.bulk_import_intraday_prices(
+                    session,
+                    self.stock_id,
+                    self._rows(500),
+                    batch_size=200,
+                )
+            )
+            timestamps: list[datetime] = [record.timestamp for record in records]
+
+        inserts: list[str] = [
+            statement
+            for statement in statements
+            if statement.startswith("INSERT INTO stock_intraday_prices")
+        ]
+        assert len(inserts) == 3
+        assert timestamps == [row["timestamp"] for row in self._rows(500)]
+        assert self._count() == 500
+
+    def test_daily_history_import_reloads_no_records(self) -> None:
+        """The latest imported date is reported without reading records back."""
+        first: date = get_current_date() - timedelta(days=600)
+        columns: dict[str, np.ndarray] = {
+            "price_date": np.array(
+                [first + timedelta(days=i) for i in range(500)],
+                dtype=object,
+            ),
+            "open_price": np.full(500, 10.0),
+            "high_price": np.full(500, 11.0),
+            "low_price": np.full(500, 9.0),
+            "close_price": np.full(500, 10.5),
+            "volume": np.full(500, 100, dtype=object),
+        }
+        with SessionManager() as session, record_statements() as statements:
+            result: dict[str, any] = IntradayPriceService.import_daily_history(
+                session,
+                session.get(Stock, self.stock_id),
+                columns,
+            )
+
+        reads: list[str] = [
+            statement
+            for statement in statements
+            if statement.startswith("SELECT") and "FROM stock_daily_prices" in statement
+        ]
+        assert result["daily_prices"] == {"success": True, "count": 500}
+        assert result["latest_daily_price"] == {
+            "success": True,
+            "date": (first + timedelta(days=499)).isoformat(),
+        }
+        assert len(reads) == 1
+
+    def test_import_skips_stored_bars(self) -> None:
+        """Bars already stored are skipped, even with an aware timestamp."""
+        rows: list[dict[str, any]] = self._rows(3)
+        with SessionManager() as session:
+            IntradayPriceService.bulk_import_intraday_prices(
+                session,
+                self.stock_id,
+                rows[:2],
+            )
+            rows[0]["timestamp"] = TIMEZONE.localize(rows[0]["timestamp"])
+            records: list[StockIntradayPrice] = (
+                IntradayPriceService.bulk_import_intraday_prices(
+                    session,
+                    self.stock_id,
+                    rows,
+                )
+            )
+            timestamps: list[datetime] = [record.timestamp for record in records]
+
+        assert timestamps == [self.start + timedelta(minutes=2)]
+        assert self._count() == 3
+
+    def test_import_updates_stored_bars(self) -> None:
+        """With update_existing, stored bars take the new values."""
+        with SessionManager() as session:
+            IntradayPriceService.bulk_import_intraday_prices(
+                session,
+                self.stock_id,
+                self._rows(2),
+            )
+            records: list[StockIntradayPrice] = (
+                IntradayPriceService.bulk_import_intraday_prices(
+                    session,
+                    self.stock_id,
+                    self._rows(3, offset=100.0) + self._rows(1, offset=200.0),
+                    update_existing=True,
+                    chunk_size=2,
+                )
+            )
+            closes: list[float] = [record.close_price for record in records]
+
+        assert closes == [210.5, 111.5, 112.5]
+        assert self._count() == 3
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("interval", 7), ("low_price", 50.0), ("open_price", None)],
+    )
+    def test_invalid_rows_are_rejected(self, key: str, value: object) -> None:
+        """One invalid row rejects every chunk of the import."""
+        rows: list[dict[str, any]] = self._rows(6)
+        rows[5][key] = value
+        with SessionManager() as session, pytest.raises(ValidationError):
+            IntradayPriceService.bulk_import_intraday_prices(
+                session,
+                self.stock_id,
+                rows,
+                chunk_size=2,
+            )
+
+        assert self._count() == 0
+
+    def test_update_imports_provider_columns(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Provider history is converted to columns and imported as bars."""
+        index: pd.DatetimeIndex = pd.date_range(
+            self.start,
+            periods=3,
+            freq="5min",
+            tz=TIMEZONE.zone,
+        )
+        self.FakeTicker.history_frame = pd.DataFrame(
+            {
+                "Open": [10.0, 11.0, np.nan],
+                "High": [11.0, 12.0, 13.0],
+                "Low": [9.0, 10.0, 11.0],
+                "Close": [10.5, 11.5, 12.5],
+                "Volume": [100.0, np.nan, 300.0],
+            },
+            index=index,
+        )
+        monkeypatch.setattr(yfinance_provider.yf, "Ticker", self.FakeTicker)
+
+        columns: yfinance_provider.PriceColumns = yfinance_provider.get_intraday_data(
+            "FAKE",
+            interval="5m",
+        )
+        assert columns["open_price"].tolist() == [10.0, 11.0, None]
+        assert columns["volume"].tolist() == [100, None, 300]
+        assert type(columns["volume"][0]) is int
+
+        # The bar with a missing open price fails validation, so drop it
+        self.FakeTicker.history_frame = self.FakeTicker.history_frame.iloc[:2]
+        with SessionManager() as session:
+            records: list[StockIntradayPrice] = (
+                IntradayPriceService.update_stock_intraday_prices(
+                    session,
+                    self.stock_id,
+                    interval="5m",
+                )
+            )
+            bars: list[tuple[datetime, int, int | None]] = [
+                (record.timestamp, record.interval, record.volume) for record in records
+            ]
+
+        assert bars == [
+            (self.start, 5, 100),
+            (self.start + timedelta(minutes=5), 5, None),
+        ]
+
+
+class TestBatchedPriceRefresh:
+    """Tests for IntradayPriceService.update_all_prices_batch."""
+
+    symbols: ClassVar[tuple[str, ...]] = ("BATCHA", "BATCHB")
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Create two stocks and serve their history from a fake download."""
+        self.app: Flask = app
+        self.downloads: list[tuple[tuple[str, ...], str]] = []
+        self.starts: list[datetime | None] = []
+        with SessionManager() as session:
+            self.stock_ids: list[int] = [
+                (
+                    StockService.find_by_symbol(session, symbol)
+                    or StockService.create_stock(
+                        session,
+                        {"symbol": symbol, "name": "Batch Refresh Test"},
+                    )
+                ).id
+                for symbol in self.symbols
+            ]
+        monkeypatch.setattr(yfinance_provider.yf, "download", self._download)
+
+    def _download(
+        self,
+        tickers: list[str],
+        period: str,
+        interval: str,
+        start: datetime | None = None,
+        **_kwargs: any,
+    ) -> pd.DataFrame:
+        """Return two bars for the first symbol and one for the second."""
+        self.downloads.append((tuple(tickers), interval))
+        self.starts.append(start)
+        now: datetime = get_current_datetime().replace(second=0, microsecond=0)
+        if interval == "1d":
+            index: pd.DatetimeIndex = pd.DatetimeIndex(
+                [now.date() - timedelta(days=2), now.date() - timedelta(days=1)],
+            )
+        else:
+            index = pd.DatetimeIndex(
+                [now - timedelta(minutes=10), now - timedelta(minutes=5)],
+            )
+        frames: dict[str, pd.DataFrame] = {
+            symbol: pd.DataFrame(
+                {
+                    "Open": [10.0, 11.0],
+                    "High": [11.0, 12.0],
+                    "Low": [9.0, 10.0],
+                    "Close": [10.5, 11.5],
+                    "Volume": [100.0, 200.0],
+                },
+                index=index,
+            )
+            for symbol in tickers
+        }
+        # The second symbol has no first bar, like a late listing
+        frames[tickers[-1]].iloc[0] = np.nan
+        return pd.concat(frames, axis=1)
+
+    def test_refresh_fetches_all_stocks_at_once(self) -> None:
+        """One download per data set feeds the imports of every stock."""
+        with SessionManager() as session:
+            results: dict[int, dict[str, any]] = (
+                IntradayPriceService.update_all_prices_batch(
+                    session,
+                    [*self.stock_ids, 999999],
+                    daily_period="1mo",
+                    intraday_interval="5m",
+                )
+            )
+
+        assert self.downloads == [(self.symbols, "1d"), (self.symbols, "5m")]
+        first, second, missing = (results[key] for key in [*self.stock_ids, 999999])
+        assert first["daily_prices"] == {"success": True, "count": 2}
+        assert second["daily_prices"] == {"success": True, "count": 1}
+        assert first["intraday_prices"]["count"] == 2
+        assert second["intraday_prices"]["count"] == 1
+        assert first["latest_daily_price"]["success"]
+        assert second["latest_intraday_price"]["success"]
+        assert not missing["daily_prices"]["success"]
+
+    def test_invalid_period_fails_only_its_data_set(self) -> None:
+        """An invalid daily period still lets the intraday refresh run."""
+        with SessionManager() as session:
+            result: dict[str, any] = IntradayPriceService.update_all_prices(
+                session,
+                self.stock_ids[0],
+                daily_period="7d",
+                intraday_interval="5m",
+            )
+
+        assert self.downloads == [((self.symbols[0],), "5m")]
+        assert not result["daily_prices"]["success"]
+        assert not result["latest_daily_price"]["success"]
+        assert result["latest_intraday_price"]["success"]
+
+    def test_refresh_resumes_from_stored_bars(self) -> None:
+        """A second refresh only fetches and writes bars from the last stored one."""
+        with SessionManager() as session:
+            IntradayPriceService.update_all_prices_batch(
+                session,
+                self.stock_ids,
+                daily_period="1mo",
+                intraday_interval="5m",
+            )
+            last: datetime = session.scalar(
+                select(func.max(StockIntradayPrice.timestamp)).where(
+                    StockIntradayPrice.stock_id == self.stock_ids[0],
+                    StockIntradayPrice.interval == 5,
+                ),
+            )
+            results: dict[int, dict[str, any]] = (
+                IntradayPriceService.update_all_prices_batch(
+                    session,
+                    self.stock_ids,
+                    daily_period="1mo",
+                    intraday_interval="5m",
+                )
+            )
+
+        # The stored daily prices start within the month, so it is fetched again
+        assert self.starts[2:] == [None, TIMEZONE.localize(last)]
+        for result in results.values():
+            assert result["intraday_prices"] == {"success": True, "count": 1}
+            assert result["latest_intraday_price"]["success"]
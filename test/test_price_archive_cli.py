@@ -0,0 +1,132 @@
+"""Tests for the price archive CLI commands.
+
+This module checks that the ``prices export`` and ``prices import`` commands
+move the daily price history of a set of stocks through a Parquet archive and
+report unknown symbols as command errors.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete, func, select
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import Result
+    from flask import Flask
+    from flask.testing import FlaskCliRunner
+
+from app.models.stock import Stock
+from app.models.stock_daily_price import StockDailyPrice
+from app.services.daily_price_service import DailyPriceService
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import get_current_date
+
+pytest.importorskip("pyarrow")
+
+
+class TestPriceArchiveCli:
+    """Tests for the prices CLI group."""
+
+    symbols: tuple[str, ...] = ("ARCHA", "ARCHB")
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Create stocks with ten days of prices each."""
+        self.runner: FlaskCliRunner = app.test_cli_runner()
+        self.start: date = get_current_date() - timedelta(days=20)
+        self.stock_ids: dict[str, int] = {}
+        with SessionManager() as session:
+            for symbol in self.symbols:
+                stock: Stock = StockService.find_by_symbol(
+                    session,
+                    symbol,
+                ) or StockService.create_stock(
+                    session,
+                    {"symbol": symbol, "name": "Archive Test"},
+                )
+                DailyPriceService.bulk_import_daily_prices(
+                    session,
+                    stock.id,
+                    [
+                        {
+                            "price_date": self.start + timedelta(days=i),
+                            "open_price": 10.0 + i,
+                            "high_price": 11.0 + i,
+                            "low_price": 9.0 + i,
+                            "close_price": 10.5 + i,
+                            "volume": 1000 + i,
+                        }
+                        for i in range(10)
+                    ],
+                )
+                self.stock_ids[symbol] = stock.id
+
+    def _count(self, symbol: str) -> int:
+        """Count the stored daily prices of a stock."""
+        with SessionManager(read_only=True) as session:
+            return session.execute(
+                select(func.count()).where(
+                    StockDailyPrice.stock_id == self.stock_ids[symbol],
+                ),
+            ).scalar_one()
+
+    def test_export_and_import_daily_prices(self, tmp_path: Path) -> None:
+        """Exported prices are restored by importing the archive."""
+        archive: Path = tmp_path / "prices.parquet"
+        exported: Result = self.runner.invoke(
+            args=[
+                "prices",
+                "export",
+                "daily",
+                str(archive),
+                "--symbols",
+                ",".join(self.symbols),
+                "--start",
+                self.start.isoformat(),
+                "--end",
+                (self.start + timedelta(days=4)).isoformat(),
+            ],
+        )
+
+        # Drop the exported days of one stock, then import the archive
+        with SessionManager() as session:
+            session.execute(
+                delete(StockDailyPrice).where(
+                    StockDailyPrice.stock_id == self.stock_ids["ARCHA"],
+                    StockDailyPrice.price_date < self.start + timedelta(days=5),
+                ),
+            )
+        imported: Result = self.runner.invoke(
+            args=["prices", "import", "daily", str(archive)],
+        )
+
+        assert exported.exit_code == 0, exported.output
+        assert "Exported 10 daily price records" in exported.output
+        assert imported.exit_code == 0, imported.output
+        assert "ARCHA: 5 daily price records" in imported.output
+        assert "ARCHB: 0 daily price records" in imported.output
+        assert self._count("ARCHA") == 10
+
+    def test_unknown_symbol_fails(self, tmp_path: Path) -> None:
+        """Unknown symbols stop the export with an error message."""
+        result: Result = self.runner.invoke(
+            args=[
+                "prices",
+                "export",
+                "intraday",
+                str(tmp_path / "prices.arrow"),
+                "--symbols",
+                "ARCHA,NOSUCH",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "NOSUCH" in result.output
@@ -0,0 +1,136 @@
+"""Tests for the process-wide price cache.
+
+This module checks that cached prices match the database, that price writes
+invalidate the cache, and that entries are evicted by count and memory size.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+from app.models.stock import Stock
+from app.services.daily_price_service import DailyPriceService
+from app.services.price_cache import PriceCache
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import get_current_date
+
+
+class TestPriceCache:
+    """Tests for PriceCache."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Create two stocks with ten days of prices each."""
+        self.app: Flask = app
+        self.today: date = get_current_date()
+        self.stock_ids: list[int] = []
+        with SessionManager() as session:
+            for symbol in ("CACHEA", "CACHEB"):
+                stock: Stock | None = StockService.find_by_symbol(session, symbol)
+                if stock is None:
+                    stock = StockService.create_stock(
+                        session,
+                        {"symbol": symbol, "name": f"{symbol} Inc"},
+                    )
+                    DailyPriceService.bulk_import_daily_prices(
+                        session,
+                        stock.id,
+                        [
+                            {
+                                "price_date": self.today - timedelta(days=10 - i),
+                                "open_price": 100.0 + i,
+                                "high_price": 101.0 + i,
+                                "low_price": 99.0 + i,
+                                "close_price": 100.0 + i,
+                                "volume": 1000,
+                            }
+                            for i in range(10)
+                        ],
+                    )
+                self.stock_ids.append(stock.id)
+
+    def test_recent_closes_are_cached(self) -> None:
+        """The second read of a stock's closes is served from the cache."""
+        cache: PriceCache = PriceCache()
+        with SessionManager() as session:
+            first: list[float] | None = cache.get_recent_closes(
+                session,
+                self.stock_ids[0],
+                30,
+            )
+            second: list[float] | None = cache.get_recent_closes(
+                session,
+                self.stock_ids[0],
+                5,
+            )
+            latest: float | None = cache.get_latest_close(session, self.stock_ids[0])
+
+        assert first == [100.0 + i for i in range(10)]
+        assert second == [105.0 + i for i in range(5)]
+        assert latest == pytest.approx(109.0)
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hits"] == 2
+
+    def test_window_beyond_cached_closes(self) -> None:
+        """Windows older than a truncated history are not answered."""
+        cache: PriceCache = PriceCache(max_closes=3)
+        with SessionManager() as session:
+            assert cache.get_recent_closes(session, self.stock_ids[0], 30) is None
+            assert cache.get_recent_closes(session, self.stock_ids[0], 2) == [
+                108.0,
+                109.0,
+            ]
+
+    def test_lru_eviction_by_entry_count(self) -> None:
+        """The least recently used stock is evicted once the cap is reached."""
+        cache: PriceCache = PriceCache(max_entries=1)
+        with SessionManager() as session:
+            cache.get_latest_close(session, self.stock_ids[0])
+            cache.get_latest_close(session, self.stock_ids[1])
+            cache.get_latest_close(session, self.stock_ids[0])
+
+        stats: dict[str, any] = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["evictions"] == 2
+        assert stats["misses"] == 3
+
+    def test_eviction_by_memory_cap(self) -> None:
+        """Entries are evicted to keep the estimated size under the cap."""
+        cache: PriceCache = PriceCache(max_bytes=1)
+        with SessionManager() as session:
+            assert cache.get_latest_close(session, self.stock_ids[0]) == 109.0
+
+        assert cache.get_stats()["entries"] == 0
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_price_writes_invalidate_cache(self) -> None:
+        """Creating a daily price is visible through the shared cache."""
+        stock_id: int = self.stock_ids[1]
+        with SessionManager() as session:
+            stock: Stock = StockService.get_or_404(session, stock_id)
+            before: float | None = StockService.get_latest_price(session, stock)
+            DailyPriceService.create_daily_price(
+                session,
+                stock_id,
+                self.today,
+                {
+                    "open_price": 150.0,
+                    "high_price": 151.0,
+                    "low_price": 149.0,
+                    "close_price": 150.0,
+                    "volume": 1000,
+                },
+            )
+            after: float | None = StockService.get_latest_price(session, stock)
+
+        assert before == pytest.approx(109.0)
+        assert after == pytest.approx(150.0)
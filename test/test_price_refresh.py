@@ -0,0 +1,204 @@
+"""Tests for the concurrent price refresh orchestrator.
+
+This module checks the token bucket rate limiter and that the orchestrator
+imports the history of many stocks in batches, retries failed fetches and
+reports stocks whose fetches keep failing.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+import time
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+from sqlalchemy import func, select
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from flask import Flask
+
+from app.models.stock_daily_price import StockDailyPrice
+from app.models.stock_intraday_price import StockIntradayPrice
+from app.services import price_refresh
+from app.services.data_providers import (
+    PriceColumns,
+    ReplayProvider,
+    record_history,
+    set_provider,
+)
+from app.services.price_refresh import PriceRefreshOrchestrator, TokenBucket
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import TIMEZONE
+
+SYMBOLS: list[str] = ["RFA", "RFB", "RFC"]
+
+
+class FlakyProvider(ReplayProvider):
+    """Replay provider whose batch daily fetches fail a number of times."""
+
+    def __init__(self, data_dir: Path, failures: int) -> None:
+        """Replay every bar of data_dir, failing the first daily fetches."""
+        super().__init__(data_dir, speed=None)
+        self.failures: int = failures
+
+    def get_daily_data_batch(
+        self,
+        symbols: list[str],
+        period: str = "1y",
+        start: date | None = None,
+    ) -> dict[str, PriceColumns]:
+        """Fail while failures remain, then replay the daily history."""
+        if self.failures > 0:
+            self.failures -= 1
+            msg = "Too many requests"
+            raise ConnectionError(msg)
+        return super().get_daily_data_batch(symbols, period, start)
+
+
+class TestPriceRefresh:
+    """Tests for TokenBucket and PriceRefreshOrchestrator."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask, tmp_path: Path) -> Generator[None, None, None]:
+        """Record daily and intraday history of three stocks."""
+        self.app: Flask = app
+        self.data_dir: Path = tmp_path
+        start: datetime = TIMEZONE.localize(datetime(2024, 3, 8, 9, 30))
+        days: pd.DatetimeIndex = pd.date_range(start.date(), periods=3, freq="D")
+        minutes: pd.DatetimeIndex = pd.date_range(start, periods=4, freq="1min")
+        for symbol in SYMBOLS:
+            for kind, index in (("daily", days), ("intraday", minutes)):
+                record_history(
+                    pd.DataFrame(
+                        {
+                            "Open": [10.0] * len(index),
+                            "High": [11.0] * len(index),
+                            "Low": [9.0] * len(index),
+                            "Close": [10.5] * len(index),
+                            "Volume": [100] * len(index),
+                        },
+                        index=index,
+                    ),
+                    tmp_path,
+                    symbol,
+                    kind,
+                )
+
+        with SessionManager() as session:
+            self.stock_ids: list[int] = [
+                (
+                    StockService.find_by_symbol(session, symbol)
+                    or StockService.create_stock(
+                        session,
+                        {"symbol": symbol, "name": f"Refresh {symbol}"},
+                    )
+                ).id
+                for symbol in SYMBOLS
+            ]
+        yield
+        set_provider("yfinance")
+
+    def count_prices(self, model: type) -> int:
+        """Count the stored prices of the test stocks."""
+        with SessionManager() as session:
+            return session.scalar(
+                select(func.count())
+                .select_from(model)
+                .where(model.stock_id.in_(self.stock_ids)),
+            )
+
+    def test_token_bucket_limits_rate(self) -> None:
+        """Requests beyond the burst wait for tokens to refill."""
+        bucket: TokenBucket = TokenBucket(rate=20.0, capacity=2)
+
+        started: float = time.monotonic()
+        waits: list[float] = [bucket.acquire() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+        assert time.monotonic() - started >= 0.09
+
+    def test_refresh_imports_all_stocks_in_batches(self) -> None:
+        """Every stock is imported with one batched fetch per data set."""
+        set_provider(ReplayProvider(self.data_dir, speed=None))
+        orchestrator: PriceRefreshOrchestrator = PriceRefreshOrchestrator(
+            self.app,
+            max_workers=2,
+            batch_size=2,
+            rate=100.0,
+        )
+
+        summary: dict[str, any] = orchestrator.refresh(
+            self.stock_ids,
+            daily_period="1mo",
+            intraday_interval="1m",
+            intraday_period="5d",
+        )
+
+        assert summary["stocks"] == 3
+        assert summary["batches"] == 2
+        assert summary["failed"] == 0
+        assert sorted(summary["results"]) == sorted(self.stock_ids)
+        assert self.count_prices(StockDailyPrice) == 9
+        assert self.count_prices(StockIntradayPrice) == 12
+
+    def test_refresh_retries_failed_fetches(self) -> None:
+        """Failed fetches are retried until the retries run out."""
+        set_provider(FlakyProvider(self.data_dir, failures=1))
+        recovered: dict[str, any] = PriceRefreshOrchestrator(
+            self.app,
+            batch_size=len(SYMBOLS),
+            rate=100.0,
+            backoff=0.0,
+        ).refresh(self.stock_ids, daily_period="1mo", intraday_period="5d")
+
+        set_provider(FlakyProvider(self.data_dir, failures=2))
+        exhausted: dict[str, any] = PriceRefreshOrchestrator(
+            self.app,
+            batch_size=len(SYMBOLS),
+            rate=100.0,
+            max_retries=1,
+            backoff=0.0,
+        ).refresh(self.stock_ids, daily_period="1mo", intraday_period="5d")
+
+        assert recovered["retries"] == 1
+        assert recovered["failed"] == 0
+        assert exhausted["failed"] == 3
+        result: dict[str, any] = exhausted["results"][self.stock_ids[0]]
+        assert result["daily_prices"] == {
+            "success": False,
+            "error": "Too many requests",
+        }
+        assert result["intraday_prices"]["success"]
+
+    def test_refresh_records_failed_batches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Stocks of a batch failing outside the fetches are reported as failed."""
+
+        def broken_trim(*_args: object) -> None:
+            msg = "Malformed history"
+            raise ValueError(msg)
+
+        set_provider(ReplayProvider(self.data_dir, speed=None))
+        monkeypatch.setattr(price_refresh, "trim_history", broken_trim)
+        summary: dict[str, any] = PriceRefreshOrchestrator(
+            self.app,
+            batch_size=2,
+            rate=100.0,
+        ).refresh(self.stock_ids, daily_period="1mo", intraday_period="5d")
+
+        assert summary["failed"] == 3
+        assert sorted(summary["results"]) == sorted(self.stock_ids)
+        assert summary["results"][self.stock_ids[0]]["daily_prices"] == {
+            "success": False,
+            "error": "Malformed history",
+        }
@@ -0,0 +1,80 @@
+"""Tests for the query plan auditor.
+
+This module checks that the transaction listing and intraday range queries of
+the service layer are served by the model indexes and that the auditor flags
+queries reading a table with a full scan.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+from app.models.trading_transaction import TradingTransaction
+from app.services.database import engine
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.query_plan import FullScan, QueryPlanAuditor
+from app.services.session_manager import SessionManager
+from app.services.transaction_service import TransactionService
+
+
+class TestQueryPlan:
+    """Tests for QueryPlanAuditor."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Use the test app so the tables and indexes exist."""
+        self.app: Flask = app
+
+    def test_service_queries_use_indexes(self) -> None:
+        """Transaction listings and intraday ranges are read through indexes."""
+        with QueryPlanAuditor() as auditor, SessionManager() as session:
+            TransactionService.get_by_service(session, 1, state="OPEN")
+            TransactionService.get_services_by_user(session, 1)
+            IntradayPriceService.get_intraday_prices_by_time_range(
+                session,
+                1,
+                datetime(2024, 3, 8, 9, 30),
+                datetime(2024, 3, 8, 16),
+                interval=5,
+            )
+
+        scans: list[FullScan] = auditor.full_scans()
+        plans: list[str] = [
+            detail
+            for statement, (bind, parameters) in auditor.statements.items()
+            for detail in auditor.explain(bind, statement, parameters)
+        ]
+
+        assert len(auditor.statements) == 3
+        assert scans == []
+        assert any("ix_stock_intraday_stock_interval_time" in plan for plan in plans)
+        assert any("ix_trading_services_user_id" in plan for plan in plans)
+
+    def test_unindexed_filters_are_flagged(self) -> None:
+        """Filters on columns without an index are reported as full scans."""
+        query = select(TradingTransaction).where(TradingTransaction.notes == "audit")
+        with QueryPlanAuditor([engine]) as auditor, SessionManager() as session:
+            session.execute(query).all()
+        with (
+            QueryPlanAuditor(
+                [engine],
+                ignore_tables=["trading_transactions"],
+            ) as ignoring,
+            SessionManager() as session,
+        ):
+            session.execute(query).all()
+
+        scans: list[FullScan] = auditor.full_scans()
+
+        assert [scan.table for scan in scans] == ["trading_transactions"]
+        assert scans[0].detail.startswith("SCAN")
+        assert ignoring.full_scans() == []
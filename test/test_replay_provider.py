@@ -0,0 +1,164 @@
+"""Tests for the replay data provider and the provider registry.
+
+This module checks that recorded history is served on the replay clock,
+resampled to the requested interval, and imported through the price services
+when the replay provider is active.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from flask import Flask
+
+from app.models.stock import Stock
+from app.models.stock_intraday_price import StockIntradayPrice
+from app.services.data_providers import (
+    DataProvider,
+    PriceColumns,
+    ReplayProvider,
+    create_provider,
+    record_history,
+    set_provider,
+)
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import TIMEZONE
+
+
+class TestReplayProvider:
+    """Tests for ReplayProvider and the provider registry."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask, tmp_path: Path) -> Generator[None, None, None]:
+        """Record ten one-minute bars and two daily bars of a stock."""
+        self.app: Flask = app
+        self.data_dir: Path = tmp_path
+        self.start: datetime = TIMEZONE.localize(datetime(2024, 3, 8, 9, 30))
+        minutes: pd.DatetimeIndex = pd.date_range(
+            self.start,
+            periods=10,
+            freq="1min",
+        )
+        record_history(
+            pd.DataFrame(
+                {
+                    "Open": [float(10 + i) for i in range(10)],
+                    "High": [float(11 + i) for i in range(10)],
+                    "Low": [float(9 + i) for i in range(10)],
+                    "Close": [10.5 + i for i in range(10)],
+                    "Volume": [100] * 10,
+                },
+                index=minutes,
+            ),
+            tmp_path,
+            "REPL",
+            "intraday",
+        )
+
+        # Daily recordings written across a daylight saving change mix offsets
+        (tmp_path / "REPL_daily.csv").write_text(
+            "Date,Open,High,Low,Close,Volume\n"
+            "2024-03-08 00:00:00-05:00,10,11,9,10.5,1000\n"
+            "2024-03-11 00:00:00-04:00,11,12,10,11.5,\n",
+        )
+        yield
+        set_provider("yfinance")
+
+    def test_unclocked_replay_serves_every_bar(self) -> None:
+        """Without a speed every recorded bar is served, resampled on request."""
+        provider: ReplayProvider = ReplayProvider(self.data_dir, speed=None)
+
+        minutes: PriceColumns = provider.get_intraday_data("REPL", "1m", "max")
+        bars: PriceColumns = provider.get_intraday_data("repl", "5m", "max")
+        daily: PriceColumns = provider.get_daily_data("REPL", "max")
+
+        assert len(minutes["timestamp"]) == 10
+        assert minutes["timestamp"][0] == self.start
+        assert bars["open_price"].tolist() == [10.0, 15.0]
+        assert bars["high_price"].tolist() == [15.0, 20.0]
+        assert bars["volume"].tolist() == [500, 500]
+        assert [str(day) for day in daily["price_date"]] == ["2024-03-08", "2024-03-11"]
+        assert daily["volume"].tolist() == [1000, None]
+        assert provider.get_latest_daily_price("REPL")["close_price"] == 11.5
+
+    def test_replay_clock_releases_bars_over_time(self) -> None:
+        """At a finite speed only the bars up to the replay clock are served."""
+        provider: ReplayProvider = ReplayProvider(self.data_dir, speed=1.0)
+        first: PriceColumns = provider.get_intraday_data("REPL", "1m", "max")
+
+        # Move the clock five recorded minutes ahead
+        provider._started_at -= 300
+        later: PriceColumns = provider.get_intraday_data("REPL", "1m", "max")
+
+        assert len(first["timestamp"]) == 1
+        assert len(later["timestamp"]) == 6
+        assert provider.get_latest_price("REPL")["close_price"] == 15.5
+
+    def test_replay_clock_resumes_from_start(self) -> None:
+        """At a finite speed a resume start still narrows the served bars."""
+        provider: ReplayProvider = ReplayProvider(self.data_dir, speed=1.0)
+        provider._started_at -= 300
+
+        bars: PriceColumns = provider.get_intraday_data(
+            "REPL",
+            "1m",
+            "max",
+            start=self.start + timedelta(minutes=3),
+        )
+
+        assert len(bars["timestamp"]) == 3
+        assert bars["timestamp"][0] == self.start + timedelta(minutes=3)
+
+    def test_missing_recording_returns_no_bars(self) -> None:
+        """Stocks without a recording have empty history."""
+        provider: ReplayProvider = ReplayProvider(self.data_dir, speed=None)
+
+        assert provider.get_daily_data_batch(["NONE"])["NONE"]["price_date"].size == 0
+
+    def test_registry_rejects_unknown_providers(self) -> None:
+        """Only registered providers can be created."""
+        provider: DataProvider = create_provider(
+            "replay",
+            data_dir=self.data_dir,
+            speed=None,
+        )
+
+        assert provider.name == "replay"
+        with pytest.raises(ValueError, match="Unknown data provider"):
+            create_provider("missing")
+
+    def test_price_services_fetch_from_active_provider(self) -> None:
+        """The price services import the history of the active provider."""
+        set_provider("replay", data_dir=self.data_dir, speed=None)
+        with SessionManager() as session:
+            stock: Stock = StockService.find_by_symbol(
+                session,
+                "REPL",
+            ) or StockService.create_stock(
+                session,
+                {"symbol": "REPL", "name": "Replay Test"},
+            )
+            records: list[StockIntradayPrice] = (
+                IntradayPriceService.update_stock_intraday_prices(
+                    session,
+                    stock.id,
+                    interval="5m",
+                    period="5d",
+                )
+            )
+            timestamps: list[datetime] = [record.timestamp for record in records]
+
+        start: datetime = self.start.replace(tzinfo=None)
+        assert timestamps == [start, start + timedelta(minutes=5)]
@@ -0,0 +1,259 @@
+"""Tests for the row serializers of read-only list responses.
+
+This module checks that the daily price, intraday price, transaction and stock
+row serializers emit the same dicts as the marshmallow schemas they replace in
+list endpoints, computed fields included.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+    from app.utils.row_serializer import RowSerializer
+
+from app.api.schemas.daily_price import daily_price_rows, daily_prices_schema
+from app.api.schemas.intraday_price import intraday_price_rows, intraday_prices_schema
+from app.api.schemas.stock import stock_rows, stocks_schema
+from app.api.schemas.trading_transaction import transaction_rows, transactions_schema
+from app.models.enums import PriceSource, TransactionState
+from app.models.stock import Stock
+from app.models.stock_daily_price import StockDailyPrice
+from app.models.stock_intraday_price import StockIntradayPrice
+from app.models.trading_service import TradingService
+from app.models.trading_transaction import TradingTransaction
+from app.services.daily_price_service import DailyPriceService
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.current_datetime import get_current_date, get_current_datetime
+from test.utils import create_test_user
+
+
+class TestRowSerializer:
+    """Tests for RowSerializer against the marshmallow list schemas."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask) -> None:
+        """Create a stock with prices and transactions, once per session."""
+        self.app: Flask = app
+        with SessionManager() as session:
+            stock: Stock | None = StockService.find_by_symbol(session, "ROWS")
+            if stock is None:
+                stock = StockService.create_stock(
+                    session,
+                    {"symbol": "ROWS", "name": "Row Serializer Test"},
+                )
+            self.stock_id: int = stock.id
+            if not session.execute(
+                select(StockDailyPrice.id).where(
+                    StockDailyPrice.stock_id == self.stock_id,
+                ),
+            ).first():
+                self._create_prices(session, self.stock_id)
+                self._create_transactions(session, self.stock_id)
+
+    @staticmethod
+    def _create_prices(session: any, stock_id: int) -> None:
+        """Store prices with zero and missing values next to regular ones."""
+        today: date = get_current_date()
+        DailyPriceService.bulk_import_daily_prices(
+            session,
+            stock_id,
+            [
+                {
+                    "price_date": today - timedelta(days=2),
+                    "open_price": 10.0,
+                    "high_price": 12.5,
+                    "low_price": 9.75,
+                    "close_price": 11.2,
+                    "adj_close": 11.1,
+                    "volume": 1000,
+                    "source": PriceSource.HISTORICAL.value,
+                },
+                {
+                    "price_date": today - timedelta(days=1),
+                    "open_price": 0.0,
+                    "high_price": 1.0,
+                    "low_price": 0.0,
+                    "close_price": 0.5,
+                    "volume": 10,
+                    "source": PriceSource.TEST.value,
+                },
+            ],
+        )
+        now: datetime = get_current_datetime().replace(microsecond=0)
+        IntradayPriceService.bulk_import_intraday_prices(
+            session,
+            stock_id,
+            [
+                {
+                    "timestamp": now - timedelta(minutes=minutes),
+                    "interval": 1,
+                    "open_price": 20.0 + minutes,
+                    "high_price": 21.5 + minutes,
+                    "low_price": 19.25 + minutes,
+                    "close_price": 20.75 + minutes,
+                    "volume": 100 * minutes,
+                    "source": source.value,
+                }
+                for minutes, source in (
+                    (1, PriceSource.DELAYED),
+                    (2, PriceSource.REAL_TIME),
+                    (3, PriceSource.SIMULATED),
+                )
+            ],
+        )
+
+    @staticmethod
+    def _create_transactions(session: any, stock_id: int) -> None:
+        """Store an open, a profitable and a losing transaction."""
+        service: TradingService = TradingService(
+            user_id=create_test_user(),
+            stock_id=stock_id,
+            name="Row Serializer Service",
+            stock_symbol="ROWS",
+            initial_balance=10000.0,
+            current_balance=10000.0,
+        )
+        session.add(service)
+        session.flush()
+
+        now: datetime = get_current_datetime()
+        for shares, purchase, sale in (
+            ("10", "100", None),
+            ("4", "100", "110"),
+            ("2.5", "80.40", "75.10"),
+        ):
+            sale_price: Decimal | None = Decimal(sale) if sale else None
+            session.add(
+                TradingTransaction(
+                    service_id=service.id,
+                    stock_id=stock_id,
+                    stock_symbol="ROWS",
+                    shares=Decimal(shares),
+                    purchase_price=Decimal(purchase),
+                    purchase_date=now,
+                    sale_price=sale_price,
+                    sale_date=now if sale else None,
+                    gain_loss=(sale_price - Decimal(purchase)) * Decimal(shares)
+                    if sale
+                    else None,
+                    state=TransactionState.CLOSED.value
+                    if sale
+                    else TransactionState.OPEN.value,
+                ),
+            )
+
+    def _dump_both(
+        self,
+        serializer: RowSerializer,
+        schema: any,
+        model: type,
+        stock_column: any,
+    ) -> tuple[list[dict[str, any]], list[dict[str, any]]]:
+        """Serialize the rows of the test stock with a serializer and a schema."""
+        with SessionManager(read_only=True) as session:
+            rows: list[dict[str, any]] = serializer.dump(
+                session.execute(
+                    serializer.select()
+                    .where(stock_column == self.stock_id)
+                    .order_by(model.id),
+                ).all(),
+            )
+            expected: list[dict[str, any]] = schema.dump(
+                session.execute(
+                    select(model)
+                    .where(stock_column == self.stock_id)
+                    .order_by(model.id),
+                )
+                .scalars()
+                .all(),
+            )
+        return rows, expected
+
+    def test_daily_price_rows_match_schema(self) -> None:
+        """Daily price rows equal the schema dump, zero open prices included."""
+        rows, expected = self._dump_both(
+            daily_price_rows,
+            daily_prices_schema,
+            StockDailyPrice,
+            StockDailyPrice.stock_id,
+        )
+
+        assert len(rows) == 2
+        assert rows == expected
+        assert rows[1]["change_percent"] is None
+        assert rows[1]["adj_close"] is None
+
+    def test_intraday_price_rows_match_schema(self) -> None:
+        """Intraday price rows equal the schema dump, source flags included."""
+        rows, expected = self._dump_both(
+            intraday_price_rows,
+            intraday_prices_schema,
+            StockIntradayPrice,
+            StockIntradayPrice.stock_id,
+        )
+
+        assert len(rows) == 3
+        assert rows == expected
+        assert {row["source"]: row["is_delayed"] for row in rows} == {
+            PriceSource.DELAYED.value: True,
+            PriceSource.REAL_TIME.value: False,
+            PriceSource.SIMULATED.value: False,
+        }
+
+    def test_transaction_rows_match_schema(self) -> None:
+        """Transaction rows equal the schema dump, computed totals included.
+
+        The schema computes the percentage in Decimal and the query in floating
+        point, so it may differ in the last digit.
+        """
+        rows, expected = self._dump_both(
+            transaction_rows,
+            transactions_schema,
+            TradingTransaction,
+            TradingTransaction.stock_id,
+        )
+        percentages: list[float] = [row.pop("profit_loss_pct") for row in rows]
+
+        assert len(rows) == 3
+        assert percentages[:2] == [0.0, 10.0]
+        assert percentages == pytest.approx(
+            [row.pop("profit_loss_pct") for row in expected],
+        )
+        assert rows == expected
+        assert [row["is_profitable"] for row in rows] == [False, True, False]
+
+    def test_stock_rows_match_schema(self) -> None:
+        """Stock rows equal the schema dump, related row aggregates included."""
+        rows, expected = self._dump_both(stock_rows, stocks_schema, Stock, Stock.id)
+
+        assert rows == expected
+        assert rows[0]["has_services"] is True
+        assert rows[0]["has_transactions"] is True
+        assert rows[0]["price_count"] == {"daily": 2, "intraday": 3, "total": 5}
+
+    def test_stock_schema_counts_without_loading_relations(self) -> None:
+        """The schema counts related rows without loading the collections."""
+        with SessionManager(read_only=True) as session:
+            stock: Stock = session.get(Stock, self.stock_id)
+            data: dict[str, any] = stocks_schema.dump([stock])[0]
+            loaded: set[str] = set(stock.__dict__)
+
+        assert data["price_count"]["total"] == 5
+        assert not loaded & {
+            "daily_prices",
+            "intraday_prices",
+            "services",
+            "transactions",
+        }
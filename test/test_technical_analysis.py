@@ -0,0 +1,120 @@
+"""Tests for the vectorized indicator engine in TechnicalAnalysisService.
+
+This module checks that the full-series indicators are aligned to their input and
+that the latest-value methods agree with the series they are built on.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from app.services.technical_analysis_service import (
+    IndicatorState,
+    TechnicalAnalysisService,
+)
+
+
+class TestTechnicalAnalysisSeries:
+    """Tests for full-series indicator calculations."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        """Build a deterministic price series."""
+        self.prices: list[float] = [
+            100 + 10 * math.sin(i / 7) + (i % 5) * 0.3 for i in range(250)
+        ]
+
+    def test_series_are_aligned_to_input(self) -> None:
+        """Every indicator series has one value per input price."""
+        series: dict[str, any] = TechnicalAnalysisService.calculate_indicator_series(
+            self.prices,
+        )
+
+        assert len(series["rsi"]) == len(self.prices)
+        for values in series["moving_averages"].values():
+            assert len(values) == len(self.prices)
+        for values in series["bollinger_bands"].values():
+            assert len(values) == len(self.prices)
+
+        # Warm-up positions are undefined
+        assert np.isnan(series["moving_averages"][20][18])
+        assert not np.isnan(series["moving_averages"][20][19])
+        assert np.isnan(series["rsi"][13])
+        assert not np.isnan(series["rsi"][14])
+
+    def test_sma_series_matches_window_mean(self) -> None:
+        """Rolling SMA values equal the mean of each window."""
+        sma: np.ndarray = TechnicalAnalysisService.calculate_sma_series(
+            self.prices,
+            10,
+        )
+
+        for i in (9, 100, 249):
+            expected: float = sum(self.prices[i - 9 : i + 1]) / 10
+            assert sma[i] == pytest.approx(expected)
+
+    def test_scalar_methods_match_series(self) -> None:
+        """Latest-value methods return the last value of the full series."""
+        rsi: np.ndarray = TechnicalAnalysisService.calculate_rsi_series(self.prices)
+        bands: dict[str, np.ndarray] = (
+            TechnicalAnalysisService.calculate_bollinger_series(self.prices)
+        )
+
+        assert TechnicalAnalysisService.calculate_rsi(self.prices) == pytest.approx(
+            rsi[-1],
+        )
+        scalar_bands: dict[str, float | None] = (
+            TechnicalAnalysisService.calculate_bollinger_bands(self.prices)
+        )
+        for key in ("upper", "middle", "lower"):
+            assert scalar_bands[key] == pytest.approx(bands[key][-1])
+
+    def test_insufficient_data_returns_none(self) -> None:
+        """Latest-value methods keep returning None for short histories."""
+        short: list[float] = self.prices[:5]
+
+        assert TechnicalAnalysisService.calculate_simple_moving_average(short) is None
+        assert TechnicalAnalysisService.calculate_rsi(short) is None
+        assert TechnicalAnalysisService.calculate_bollinger_bands(short) == {
+            "upper": None,
+            "middle": None,
+            "lower": None,
+        }
+
+    def test_flat_prices_give_max_rsi(self) -> None:
+        """RSI is 100 when there are no losses in the window."""
+        assert TechnicalAnalysisService.calculate_rsi([50.0] * 30) == 100.0
+
+
+class TestIndicatorState:
+    """Tests for the streaming indicator state."""
+
+    def test_streaming_matches_batch_analysis(self) -> None:
+        """Incremental updates agree with a full recomputation at every step."""
+        prices: list[float] = [
+            100 + 10 * math.sin(i / 5) + (i % 7) * 0.4 for i in range(300)
+        ]
+        state: IndicatorState = IndicatorState()
+
+        for i, price in enumerate(prices):
+            state.update(price)
+            if i % 25 != 0 and i != len(prices) - 1:
+                continue
+
+            streamed: dict[str, any] = state.get_price_analysis()
+            batch: dict[str, any] = TechnicalAnalysisService.get_price_analysis(
+                prices[: i + 1],
+            )
+            assert streamed["signals"] == batch["signals"]
+            assert streamed["is_uptrend"] == batch["is_uptrend"]
+            for period, value in batch["moving_averages"].items():
+                assert streamed["moving_averages"][period] == pytest.approx(value)
+            if batch["rsi"] is None:
+                assert streamed["rsi"] is None
+            else:
+                assert streamed["rsi"] == pytest.approx(batch["rsi"])
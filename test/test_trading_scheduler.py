@@ -0,0 +1,160 @@
+"""Tests for the in-process trading scheduler.
+
+This module checks latency histogram bucketing, batched tick execution against
+active services, failed ticks and skipping of overrun ticks.
+"""
+
+# ruff: noqa: S101  # Allow assert usage in tests
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from flask import Flask
+    from flask.testing import FlaskClient
+    from requests import Response
+
+from app.services.trading_scheduler import LatencyHistogram, TradingScheduler
+from app.services.trading_strategy_service import TradingStrategyService
+from app.utils.constants import ApiConstants
+from test.utils import authenticated_request, create_test_stock
+
+
+class TestTradingScheduler:
+    """Tests for TradingScheduler and LatencyHistogram."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, app: Flask, client: FlaskClient) -> None:
+        """Create an active trading service to tick."""
+        self.app: Flask = app
+        self.client: FlaskClient = client
+        self.base_url: str = "/api/v1/services"
+        self.test_stock: dict[str, object] = create_test_stock()
+
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            self.base_url,
+            admin=False,
+            json={
+                "name": "Scheduled Service",
+                "stock_symbol": self.test_stock["symbol"],
+                "initial_balance": 10000.0,
+                "minimum_balance": 1000.0,
+                "allocation_percent": 10.0,
+                "is_active": True,
+            },
+        )
+        self.test_service: dict[str, object] = response.get_json()
+        authenticated_request(
+            self.client,
+            "put",
+            f"{self.base_url}/{self.test_service['id']}/state",
+            admin=False,
+            json={"state": "ACTIVE"},
+        )
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Observations land in the first bucket whose bound they do not exceed."""
+        histogram: LatencyHistogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(seconds)
+
+        snapshot: dict[str, any] = histogram.snapshot()
+
+        assert snapshot["count"] == 4
+        assert snapshot["max"] == pytest.approx(2.0)
+        assert snapshot["mean"] == pytest.approx(2.65 / 4)
+        assert snapshot["buckets"] == [
+            {"le": 0.1, "count": 2},
+            {"le": 1.0, "count": 3},
+            {"le": "+Inf", "count": 4},
+        ]
+
+    def test_invalid_configuration(self) -> None:
+        """Non-positive intervals are rejected."""
+        with pytest.raises(ValueError, match="interval"):
+            TradingScheduler(self.app, interval=0)
+
+    def test_tick_runs_active_services(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A tick executes every active service in one batch."""
+        batches: list[dict[str, any]] = []
+        execute_all_strategies: any = TradingStrategyService.execute_all_strategies
+
+        def record_batch(session: any) -> dict[str, any]:
+            batches.append(execute_all_strategies(session))
+            return batches[-1]
+
+        monkeypatch.setattr(
+            TradingStrategyService,
+            "execute_all_strategies",
+            record_batch,
+        )
+        scheduler: TradingScheduler = TradingScheduler(self.app)
+
+        result: dict[str, any] = scheduler.tick()
+        stats: dict[str, any] = scheduler.get_stats()
+
+        assert len(batches) == 1
+        assert result["success"]
+        assert result["services"] == batches[0]["services_processed"] >= 1
+        assert stats["ticks"] == 1
+        assert stats["failed_ticks"] == 0
+        assert stats["service_runs"] == result["services"]
+        assert stats["tick_latency"]["count"] == 1
+
+    def test_failed_tick_is_counted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A batch that raises counts as a failed tick and is still timed."""
+
+        def failing_batch(_session: any) -> dict[str, any]:
+            msg = "database is locked"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(
+            TradingStrategyService,
+            "execute_all_strategies",
+            failing_batch,
+        )
+        scheduler: TradingScheduler = TradingScheduler(self.app)
+
+        result: dict[str, any] = scheduler.tick()
+        stats: dict[str, any] = scheduler.get_stats()
+
+        assert not result["success"]
+        assert result["services"] == 0
+        assert stats["failed_ticks"] == 1
+        assert stats["tick_latency"]["count"] == 1
+
+    def test_overrunning_ticks_are_skipped(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Ticks that outlast the interval skip the deadlines they missed."""
+        scheduler: TradingScheduler = TradingScheduler(self.app, interval=0.02)
+
+        def slow_tick() -> dict[str, any]:
+            time.sleep(0.05)
+            return {}
+
+        monkeypatch.setattr(scheduler, "tick", slow_tick)
+        scheduler.start()
+        time.sleep(0.2)
+        scheduler.stop()
+
+        stats: dict[str, any] = scheduler.get_stats()
+        assert not stats["running"]
+        assert stats["skipped_ticks"] > 0
+
+    def test_scheduler_stats_endpoint(self) -> None:
+        """The stats endpoint reports a disabled scheduler."""
+        response: Response = self.client.get("/api/v1/system/scheduler")
+
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert response.get_json() == {"running": False}
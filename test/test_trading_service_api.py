@@ -7,6 +7,9 @@ This module contains integration tests for the Trading Service API endpoints.
 
 from __future__ import annotations
 
+import itertools
+import math
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import pytest
@@ -16,7 +19,13 @@ if TYPE_CHECKING:
     from flask.testing import FlaskClient
     from requests import Response
 
-from app.utils.constants import ApiConstants
+from app.models.stock import Stock
+from app.services.daily_price_service import DailyPriceService
+from app.services.intraday_price_service import IntradayPriceService
+from app.services.session_manager import SessionManager
+from app.services.stock_service import StockService
+from app.utils.constants import ApiConstants, TimeConstants
+from app.utils.current_datetime import get_current_date, get_current_datetime
 from test.utils import authenticated_request, create_test_stock
 
 
@@ -56,6 +65,56 @@ class TestTradingServiceAPI:
 
         self.test_service: dict[str, object] = response.get_json()
 
+    @staticmethod
+    def _oscillating_prices(count: int) -> list[dict[str, float]]:
+        """Build prices swinging around 100, so the indicators give signals."""
+        prices: list[dict[str, float]] = []
+        for i in range(count):
+            close: float = 100.0 + 10.0 * math.sin(i / 3)
+            prices.append(
+                {
+                    "open_price": close,
+                    "high_price": close + 1.0,
+                    "low_price": close - 1.0,
+                    "close_price": close,
+                    "volume": 1000,
+                },
+            )
+        return prices
+
+    def _create_service(self, symbol: str) -> tuple[int, int]:
+        """Create a stock and a trading service on it.
+
+        Returns:
+            Tuple of (stock ID, service ID)
+
+        """
+        with SessionManager() as session:
+            stock: Stock = StockService.find_by_symbol(
+                session,
+                symbol,
+            ) or StockService.create_stock(
+                session,
+                {"symbol": symbol, "name": "Backtest Test"},
+            )
+            stock_id: int = stock.id
+
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            self.base_url,
+            admin=False,
+            json={
+                "name": f"{symbol} Backtest Service",
+                "stock_symbol": symbol,
+                "initial_balance": 10000.0,
+                "allocation_percent": 50.0,
+                "buy_threshold": 0.02,
+                "sell_threshold": 0.03,
+            },
+        )
+        return stock_id, response.get_json()["id"]
+
     def test_get_services(self) -> None:
         """Test getting a list of trading services."""
         # Make request to get services
@@ -321,6 +380,186 @@ class TestTradingServiceAPI:
         assert "service_id" in data
         assert data["service_id"] == self.test_service["id"]
 
+    def test_backtest_sweep(self) -> None:
+        """Test backtesting a grid of strategy parameters."""
+        stock_id, service_id = self._create_service("SWEEP")
+        today: date = get_current_date()
+        with SessionManager() as session:
+            DailyPriceService.bulk_import_daily_prices(
+                session,
+                stock_id,
+                [
+                    {"price_date": today - timedelta(days=59 - i), **price}
+                    for i, price in enumerate(self._oscillating_prices(60))
+                ],
+            )
+
+        # Make request to sweep three buy thresholds against two allocations
+        buy_thresholds: list[float] = [0.02, 1.0, 5.0]
+        allocation_percents: list[float] = [10.0, 50.0]
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/{service_id}/backtest/sweep",
+            admin=False,
+            json={
+                "days": 59,
+                "buy_thresholds": buy_thresholds,
+                "allocation_percents": allocation_percents,
+            },
+        )
+        data: dict[str, object] = response.get_json()
+        results: list[dict[str, object]] = data["results"]
+        sharpe_ratios: list[float] = [
+            result["metrics"]["sharpe_ratio"] for result in results
+        ]
+
+        # Verify response
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert data["success"]
+        assert data["days_simulated"] == 60
+        assert data["sort_by"] == "sharpe_ratio"
+        assert data["combinations"] == len(results) == 6
+        assert [result["rank"] for result in results] == list(range(1, 7))
+        assert sharpe_ratios == sorted(sharpe_ratios, reverse=True)
+        assert {
+            (result["buy_threshold"], result["allocation_percent"])
+            for result in results
+        } == set(itertools.product(buy_thresholds, allocation_percents))
+        assert all(result["transaction_count"] > 0 for result in results)
+
+    def test_backtest_sweep_invalid_sort_key(self) -> None:
+        """Test ranking a parameter sweep by an unknown metric."""
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/{self.test_service['id']}/backtest/sweep",
+            admin=False,
+            json={"sort_by": "not_a_metric"},
+        )
+
+        # Verify response
+        assert response.status_code == ApiConstants.HTTP_BAD_REQUEST
+
+    def test_backtest_intraday(self) -> None:
+        """Test backtesting a trading service on intraday bars."""
+        stock_id, service_id = self._create_service("INTRA")
+        now: datetime = get_current_datetime().replace(second=0, microsecond=0)
+        with SessionManager() as session:
+            IntradayPriceService.bulk_import_intraday_prices(
+                session,
+                stock_id,
+                [
+                    {
+                        "timestamp": now - timedelta(minutes=5 * (300 - i)),
+                        "interval": 5,
+                        **price,
+                    }
+                    for i, price in enumerate(self._oscillating_prices(300))
+                ],
+            )
+
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/{service_id}/backtest/intraday?days=2&interval=5",
+            admin=False,
+        )
+        data: dict[str, object] = response.get_json()
+        metrics: dict[str, object] = data["metrics"]
+
+        # Metrics are annualized over the 5-minute bars of a trading year
+        periods_per_year: float = TimeConstants.TRADING_DAYS_PER_YEAR * math.ceil(
+            TimeConstants.TRADING_MINUTES_PER_DAY / 5,
+        )
+        total_return: float = metrics["total_return_pct"] / 100
+
+        # Verify response
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert data["success"]
+        assert data["interval"] == 5
+        assert data["bars_simulated"] == 300
+        assert data["transactions"]
+        assert total_return != 0
+        assert metrics["annualized_return_pct"] == pytest.approx(
+            ((1 + total_return) ** (periods_per_year / 300) - 1) * 100,
+        )
+
+    def test_backtest_intraday_invalid_interval(self) -> None:
+        """Test backtesting on an interval that is never stored."""
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/{self.test_service['id']}/backtest/intraday?interval=7",
+            admin=False,
+        )
+
+        # Verify response
+        assert response.status_code == ApiConstants.HTTP_BAD_REQUEST
+
+    def test_backtest_portfolio(self) -> None:
+        """Test backtesting several stocks with one shared balance."""
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/backtest/portfolio",
+            admin=False,
+            json={
+                "symbols": [self.test_stock["symbol"]],
+                "initial_balance": 10000.0,
+                "days": 30,
+            },
+        )
+        data: dict[str, object] = response.get_json()
+
+        # Verify response (the test stock may not have enough price history)
+        assert response.status_code == ApiConstants.HTTP_OK
+        if data["success"]:
+            assert data["symbols"] == [self.test_stock["symbol"]]
+            assert len(data["portfolio_values"]) == data["days_simulated"]
+        else:
+            assert "days_available" in data
+
+    def test_backtest_portfolio_unknown_symbol(self) -> None:
+        """Test backtesting a portfolio containing an unknown stock."""
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/backtest/portfolio",
+            admin=False,
+            json={"symbols": ["NOPE"], "initial_balance": 10000.0},
+        )
+
+        # Verify response
+        assert response.status_code == ApiConstants.HTTP_NOT_FOUND
+
+    def test_execute_all_strategies(self) -> None:
+        """Test executing strategies for all active services."""
+        authenticated_request(
+            self.client,
+            "put",
+            f"{self.base_url}/{self.test_service['id']}/state",
+            admin=False,
+            json={"state": "ACTIVE"},
+        )
+
+        response: Response = authenticated_request(
+            self.client,
+            "post",
+            f"{self.base_url}/execute-all",
+            admin=True,
+        )
+        data: dict[str, object] = response.get_json()
+
+        # Verify response
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert data["success"] is True
+        assert data["services_processed"] == len(data["results"])
+        assert sum(data["actions"].values()) == data["services_processed"]
+        assert self.test_service["id"] in {
+            result["service_id"] for result in data["results"]
+        }
+
     def test_delete_service_unauthorized(self) -> None:
         """Test deleting a trading service without authentication."""
         # Create a temporary service to delete
@@ -151,6 +151,46 @@ class TestTransactionAPI:
                 break
         assert transaction_found is True
 
+    def test_get_transactions_sorted_and_paginated(self) -> None:
+        """Test filtering, sorting and paginating the transaction list."""
+        # Add a smaller purchase to the test service
+        authenticated_request(
+            self.client,
+            "post",
+            self.base_url,
+            admin=False,
+            json={
+                "service_id": self.test_service["id"],
+                "stock_symbol": self.test_stock["symbol"],
+                "shares": 5.0,
+                "purchase_price": 110.0,
+            },
+        )
+
+        # Make requests for the first page and the closed transactions
+        query: str = f"service_id={self.test_service['id']}&sort=shares&order=asc"
+        response: Response = authenticated_request(
+            self.client,
+            "get",
+            f"{self.base_url}?{query}&page=1&page_size=1",
+            admin=False,
+        )
+        closed: Response = authenticated_request(
+            self.client,
+            "get",
+            f"{self.base_url}?{query}&state={TransactionState.CLOSED.value}",
+            admin=False,
+        )
+        data: dict[str, object] = response.get_json()
+
+        # Verify only the smallest purchase is on the first of two pages
+        assert response.status_code == ApiConstants.HTTP_OK
+        assert [item["shares"] for item in data["items"]] == [5.0]
+        assert data["pagination"]["total_items"] == 2
+        assert data["pagination"]["total_pages"] == 2
+        assert data["pagination"]["has_next"] is True
+        assert closed.get_json()["items"] == []
+
     def test_create_transaction_unauthorized(self) -> None:
         """Test creating a transaction without authentication."""
         # Prepare test data
@@ -6,14 +6,20 @@ This module contains helper functions for testing.
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Callable
 
+from sqlalchemy import event
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from flask.testing import FlaskClient
     from requests import Response
 
     from app.models import Stock, User
 
+from app.services.database import engine
 from app.services.session_manager import SessionManager
 from app.services.stock_service import StockService
 from app.services.user_service import UserService
@@ -37,6 +43,29 @@ class AuthTokenError(RuntimeError):
         self.status_code = status_code
 
 
+@contextmanager
+def record_statements() -> Iterator[list[str]]:
+    """Record the SQL statements executed on the write engine.
+
+    Each round trip to the database is recorded once, so a batched
+    executemany counts as a single statement.
+
+    Returns:
+        Iterator of the list the executed statements are appended to
+
+    """
+    statements: list[str] = []
+
+    def record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 def create_test_user(*, admin: bool = False) -> int:
     """Create a test user for authentication.
 